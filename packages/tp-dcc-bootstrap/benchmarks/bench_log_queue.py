@@ -0,0 +1,158 @@
+"""
+Benchmark that measures the main thread logging cost of a mocked rig build that runs many actions, each one of them
+logging several records through a JSON lines file handler and a slow script editor like handler.
+
+Synchronous logging, where handlers run within the calling thread, is compared against the queued pipeline started by
+LogsManager.start_queue, where handlers run within the queue listener thread. Build data is generated from a fixed
+seed, so results are reproducible.
+
+Usage:
+    python bench_log_queue.py [--actions 10000] [--handler-latency 0.05] [--queue-size 10000]
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import glob
+import time
+import random
+import logging
+import argparse
+import tempfile
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+    if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+        sys.path.append(_package_root)
+
+from tp.bootstrap import log
+
+
+class ScriptEditorHandler(logging.StreamHandler):
+    """
+    Stream handler that simulates the latency of writing records into a DCC script editor.
+    """
+
+    def __init__(self, latency: float):
+        super().__init__(io.StringIO())
+
+        self._latency = latency
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        end_time = time.perf_counter() + self._latency
+        while time.perf_counter() < end_time:
+            pass
+
+
+class MockAction:
+    """
+    Build action that only logs, as rig build actions do while being executed.
+    """
+
+    def __init__(self, name: str, joints: list[str]):
+        self.name = name
+        self.joints = joints
+
+    def run(self, logger: logging.Logger):
+        logger.info('Running action %s', self.name)
+        logger.debug('Action %s joints: %s', self.name, self.joints)
+        for joint in self.joints:
+            logger.info('Created control for %s', joint)
+        if len(self.joints) > 3:
+            logger.warning('Action %s has %d joints', self.name, len(self.joints))
+
+
+def create_build(action_count: int, seed: int = 0) -> list[MockAction]:
+    """
+    Returns a list of mocked build actions.
+
+    :param int action_count: number of actions to create.
+    :param int seed: random seed used to generate actions.
+    :return: build actions.
+    :rtype: list[MockAction]
+    """
+
+    generator = random.Random(seed)
+    return [MockAction(f'action{i:05d}', [f'joint{i:05d}_{j}' for j in range(generator.randint(1, 4))])
+            for i in range(action_count)]
+
+
+def run_build(
+        actions: list[MockAction], logger: logging.Logger, queued: bool, queue_size: int) -> tuple[float, float, int]:
+    """
+    Runs the given build actions and returns the main thread time and the time spent waiting for queued records to
+    be handled, both in milliseconds, and the number of dropped records.
+
+    :param list[MockAction] actions: build actions to run.
+    :param logging.Logger logger: logger actions log with.
+    :param bool queued: whether to route records through the logs manager queue.
+    :param int queue_size: maximum number of queued records.
+    :return: main thread time, drain time and dropped records.
+    :rtype: tuple[float, float, int]
+    """
+
+    if queued:
+        log.LogsManager().start_queue(max_size=queue_size)
+    start = time.perf_counter()
+    for action in actions:
+        action.run(logger)
+    build_time = time.perf_counter() - start
+    dropped = log.LogsManager().dropped_records
+    start = time.perf_counter()
+    log.LogsManager().stop_queue()
+
+    return build_time * 1000, (time.perf_counter() - start) * 1000, dropped
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    :param list[str] or None args: command line arguments.
+    :return: exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks main thread logging cost of a mocked rig build')
+    parser.add_argument('--actions', type=int, default=10000, help='number of build actions')
+    parser.add_argument(
+        '--handler-latency', type=float, default=0.05, help='script editor handler latency in milliseconds')
+    parser.add_argument('--queue-size', type=int, default=log.LOG_QUEUE_MAX_SIZE, help='maximum queued records')
+    parsed_args = parser.parse_args(args)
+
+    actions = create_build(parsed_args.actions)
+    logs_manager = log.LogsManager()
+    logs_manager.stop_queue()
+    logger = log.rigLogger
+    logger.setLevel(logging.INFO)
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for name, queued in (('synchronous', False), ('queued', True)):
+            logs_manager.remove_handlers(logger.name)
+            file_handler = logs_manager.add_json_file_handler(
+                logger.name, os.path.join(temp_directory, f'{name}.jsonl'))
+            editor_handler = logs_manager.add_handler(
+                logger.name, ScriptEditorHandler(parsed_args.handler_latency / 1000))
+            build_time, drain_time, dropped = run_build(actions, logger, queued, parsed_args.queue_size)
+            handled = editor_handler.stream.getvalue().count('\n')
+            results.append((name, build_time, drain_time, handled, dropped))
+            file_handler.close()
+
+    print(f'mocked build of {parsed_args.actions} actions')
+    for name, build_time, drain_time, handled, dropped in results:
+        print(
+            f'  {name:>11}: main thread {build_time:9.2f} ms '
+            f'({build_time * 1000 / parsed_args.actions:6.2f} us/action), drain {drain_time:9.2f} ms, '
+            f'{handled} records handled, {dropped} dropped')
+    print(f'  main thread speed up: {results[0][1] / results[1][1]:.1f}x')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,7 +8,13 @@ Module that contains tpDcc log manager
 from __future__ import annotations
 
 import os
+import json
+import time
+import queue
+import atexit
 import logging
+import threading
+import logging.handlers
 
 main = __import__('__main__')
 
@@ -18,6 +24,12 @@ RIG_LOGGER_NAME = 'tp.dcc.rig'
 ANIM_LOGGER_NAME = 'tp.dcc.anim'
 MODEL_LOGGER_NAME = 'tp.dcc.modeling'
 LOG_LEVEL_ENV_NAME = 'TPDCC_LOG_LEVEL'
+LOG_QUEUE_ENV_NAME = 'TPDCC_LOG_QUEUE'
+LOG_QUEUE_MAX_SIZE = 10000
+RATE_LIMIT_INTERVAL = 1.0
+RATE_LIMIT_BURST = 20
+JSON_LOG_MAX_BYTES = 5 * 1024 * 1024
+JSON_LOG_BACKUP_COUNT = 5
 
 
 def log_levels() -> map:
@@ -88,9 +100,11 @@ def logging_wrapper(method, source_name, *args, **kwargs):
     """
 
     def method_wrap(*args, **kwargs):
-        print_args = [x for x in args if (not type(x) == dict) and (not type(x) == list)]
-        tpLogger.info('{} -----> {}.{} ~~ Args:{} Kwargs:{}'.format(
-            source_name, method.__module__, method.__name__, print_args, kwargs))
+        if tpLogger.isEnabledFor(logging.INFO):
+            print_args = [x for x in args if (not type(x) == dict) and (not type(x) == list)]
+            tpLogger.info(
+                '%s -----> %s.%s ~~ Args:%s Kwargs:%s', source_name, method.__module__, method.__name__, print_args,
+                kwargs)
         return method(*args, **kwargs)
 
     return method_wrap, args, kwargs
@@ -119,6 +133,146 @@ def add_metaclass(metaclass):
     return wrapper
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Logging filter that drops repeated messages. Messages are considered repeated when they are logged by the same
+    logger, with the same level and the same message template. Only the first messages of each burst within the given
+    interval are kept, and the next kept message reports how many repeated messages were dropped.
+    """
+
+    MAX_TRACKED_MESSAGES = 1000
+
+    def __init__(self, interval: float = RATE_LIMIT_INTERVAL, burst: int = RATE_LIMIT_BURST):
+        super().__init__()
+
+        self._interval = interval
+        self._burst = burst
+        self._windows = {}              # type: dict[tuple, list[float | int]]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, record.msg if isinstance(record.msg, str) else id(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self._interval:
+                suppressed = window[2] if window is not None else 0
+                if len(self._windows) >= self.MAX_TRACKED_MESSAGES:
+                    self._windows.clear()
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                    if isinstance(record.msg, str):
+                        record.msg = f'{record.msg} [{suppressed} repeated messages suppressed]'
+                return True
+            window[1] += 1
+            if window[1] <= self._burst:
+                return True
+            window[2] += 1
+
+        return False
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Logging formatter that formats each record as a single line JSON object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': self.formatTime(record),
+            'name': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+            'module': record.module,
+            'funcName': record.funcName,
+            'lineno': record.lineno,
+            'process': record.process,
+            'thread': record.threadName
+        }
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            data['suppressed'] = suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+
+        return json.dumps(data, default=str)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the logging thread. Records are dropped when the queue is full and records are not
+    formatted before being queued, so message formatting happens within the listener thread.
+    """
+
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def enqueue(self, record: logging.LogRecord):
+        # records propagated through several routed loggers are only queued once, because the dispatch handler
+        # already calls the handlers of all routed loggers within record logger hierarchy
+        if getattr(record, '_tp_queued', False):
+            return
+        record._tp_queued = True
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that waits for a free queue slot to enqueue its stop sentinel, so it can be stopped while the queue
+    is full of records.
+    """
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class _LoggerDispatchHandler(logging.Handler):
+    """
+    Handler used by the queue listener that dispatches each record to the handlers of the logger that created it and,
+    as logging.Logger.callHandlers does, to the handlers of its ancestors while loggers propagate records.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._handlers = {}             # type: dict[str, list[logging.Handler]]
+
+    @property
+    def handlers(self) -> dict[str, list[logging.Handler]]:
+        return self._handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # handlers of loggers that are not routed through the queue were already called within the logging thread
+        logger = logging.getLogger(record.name)
+        while logger is not None:
+            for handler in self._handlers.get(logger.name, ()):
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            if not logger.propagate:
+                break
+            logger = logger.parent
+
+        return True
+
+    def emit(self, record: logging.LogRecord):
+        self.handle(record)
+
+
 class Singleton(type):
     """
     Singleton decorator as metaclass. Should be used in conjunction with add_metaclass function of this module
@@ -155,6 +309,20 @@ class LogsManager:
         self.shell_formatter = "[%(levelname)1.1s|%(name)s|%(module)s:%(funcName)s:%(lineno)s] > %(message)s"
         self.gui_formatter = "[%(name)s]: %(message)s"
 
+        self._queue_handler = None                  # type: BoundedQueueHandler | None
+        self._queue_listener = None                 # type: _DrainingQueueListener | None
+        self._dispatch_handler = None               # type: _LoggerDispatchHandler | None
+        self._rate_limit_filter = None              # type: RateLimitFilter | None
+        self._exit_registered = False
+
+    @property
+    def is_queued(self) -> bool:
+        return self._queue_listener is not None
+
+    @property
+    def dropped_records(self) -> int:
+        return self._queue_handler.dropped if self._queue_handler is not None else 0
+
     def add_log(self, logger):
         """
         Adds a logger into this manager instance.
@@ -164,6 +332,10 @@ class LogsManager:
 
         if logger.name not in self._logs:
             self._logs[logger.name] = logger
+            if self._dispatch_handler is not None:
+                self._route_to_queue(logger)
+            if self._rate_limit_filter is not None:
+                logger.addFilter(self._rate_limit_filter)
 
         global_log_level_override(logger)
 
@@ -210,7 +382,7 @@ class LogsManager:
             return None
         handler = logging.StreamHandler()
         handler.setFormatter(logging.Formatter(self.shell_formatter))
-        found_log.addHandler(handler)
+        self._add_logger_handler(found_log, handler)
 
         return handler
 
@@ -230,10 +402,107 @@ class LogsManager:
 
         formatter = logging.Formatter(self.shell_formatter)
         handler.setFormatter(formatter)
-        found_log.addHandler(handler)
+        self._add_logger_handler(found_log, handler)
 
         return handler
 
+    def add_json_file_handler(
+            self, logger_name: str, file_path: str, max_bytes: int = JSON_LOG_MAX_BYTES,
+            backup_count: int = JSON_LOG_BACKUP_COUNT) -> logging.handlers.RotatingFileHandler | None:
+        """
+        Adds a rotating file handler that writes records as JSON lines to the log with given name.
+
+        :param str logger_name: name of the logger to which the handler will be added.
+        :param str file_path: path of the log file.
+        :param int max_bytes: maximum size in bytes of the log file before it is rotated.
+        :param int backup_count: number of rotated log files to keep.
+        :return: rotating file handler that was added to the logger.
+        :rtype: logging.handlers.RotatingFileHandler or None
+        """
+
+        found_log = self._logs.get(logger_name)
+        if found_log is None:
+            return None
+
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        handler = logging.handlers.RotatingFileHandler(
+            file_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        handler.setFormatter(JsonLinesFormatter())
+        self._add_logger_handler(found_log, handler)
+
+        return handler
+
+    def start_queue(self, max_size: int = LOG_QUEUE_MAX_SIZE):
+        """
+        Routes all loggers handled by this manager through a bounded queue, so handlers are executed within a
+        background thread and logging calls do not block the calling thread. Records are dropped if the queue is
+        full. Message arguments are formatted within the background thread, so mutable arguments should not be
+        modified after being logged.
+
+        :param int max_size: maximum number of records waiting to be handled.
+        """
+
+        if self._queue_listener is not None:
+            return
+
+        self._dispatch_handler = _LoggerDispatchHandler()
+        record_queue = queue.Queue(maxsize=max_size)
+        self._queue_handler = BoundedQueueHandler(record_queue)
+        self._queue_listener = _DrainingQueueListener(record_queue, self._dispatch_handler)
+        for found_log in self._logs.values():
+            self._route_to_queue(found_log)
+        self._queue_listener.start()
+        if not self._exit_registered:
+            atexit.register(self.stop_queue)
+            self._exit_registered = True
+
+    def stop_queue(self):
+        """
+        Handles all queued records and restores the handlers of all loggers handled by this manager.
+        """
+
+        if self._queue_listener is None:
+            return
+
+        self._queue_listener.stop()
+        for logger_name, handlers in self._dispatch_handler.handlers.items():
+            found_log = self._logs.get(logger_name)
+            if found_log is None:
+                continue
+            found_log.removeHandler(self._queue_handler)
+            for handler in handlers:
+                found_log.addHandler(handler)
+        self._queue_listener = None
+        self._queue_handler = None
+        self._dispatch_handler = None
+
+    def set_rate_limit(self, interval: float = RATE_LIMIT_INTERVAL, burst: int = RATE_LIMIT_BURST):
+        """
+        Drops repeated messages of all loggers handled by this manager.
+
+        :param float interval: time window, in seconds, in which repeated messages are counted.
+        :param int burst: number of repeated messages kept within each time window.
+        """
+
+        self.remove_rate_limit()
+        self._rate_limit_filter = RateLimitFilter(interval=interval, burst=burst)
+        for found_log in self._logs.values():
+            found_log.addFilter(self._rate_limit_filter)
+
+    def remove_rate_limit(self):
+        """
+        Stops dropping repeated messages.
+        """
+
+        if self._rate_limit_filter is None:
+            return
+
+        for found_log in self._logs.values():
+            found_log.removeFilter(self._rate_limit_filter)
+        self._rate_limit_filter = None
+
     def remove_handlers(self, logger_name: str):
         """
         Removes all handlers from the log with given name.
@@ -247,7 +516,10 @@ class LogsManager:
         if found_log is None:
             return False
 
-        found_log.handlers = []
+        if self._dispatch_handler is not None and logger_name in self._dispatch_handler.handlers:
+            self._dispatch_handler.handlers[logger_name] = []
+        else:
+            found_log.handlers = []
 
         return True
 
@@ -256,10 +528,39 @@ class LogsManager:
         Clears all logs.
         """
 
+        self.stop_queue()
+        self.remove_rate_limit()
         for _, found_log in self._logs.items():
             found_log.handlers = []
         self._logs.clear()
 
+    def _add_logger_handler(self, logger: logging.Logger, handler: logging.Handler):
+        """
+        Internal function that adds given handler to the given logger, taking into account whether records of the
+        logger are routed through the queue.
+
+        :param logging.Logger logger: logger to add handler to.
+        :param logging.Handler handler: handler to add.
+        """
+
+        if self._dispatch_handler is not None and logger.name in self._dispatch_handler.handlers:
+            handlers = self._dispatch_handler.handlers[logger.name]
+            if handler not in handlers:
+                handlers.append(handler)
+        else:
+            logger.addHandler(handler)
+
+    def _route_to_queue(self, logger: logging.Logger):
+        """
+        Internal function that moves the handlers of the given logger to the queue listener.
+
+        :param logging.Logger logger: logger to route through the queue.
+        """
+
+        handlers = [handler for handler in logger.handlers if handler is not self._queue_handler]
+        self._dispatch_handler.handlers[logger.name] = handlers
+        logger.handlers = [self._queue_handler]
+
 
 tpLogger = get_logger(LOGGER_NAME)
 bootstrapLogger = get_logger(BOOTSTRAP_LOGGER_NAME)
@@ -271,3 +572,5 @@ for logger in [tpLogger, bootstrapLogger, rigLogger, animLogger, modelLogger]:
     handlers = logger.handlers
     if not handlers:
         LogsManager().add_shell_handler(logger.name)
+if os.environ.get(LOG_QUEUE_ENV_NAME, '').lower() in ('1', 'true'):
+    LogsManager().start_queue()
@@ -0,0 +1,84 @@
+"""
+Benchmark that measures populating a data source with many children and looking up child rows, which tree models do
+for every parent index request. Runs offscreen, so no display is needed.
+
+Cached rows are compared against the previous behaviour, which checked children membership and rows with linear list
+searches. Linear searches are quadratic, so they are measured with a smaller number of children.
+
+Usage:
+	python bench_datasources.py [--children 100000] [--linear-children 5000]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+	if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+		sys.path.append(_package_root)
+
+from tp.common.qt.models import datasources
+
+
+def populate_cached(root: datasources.BaseDataSource, children: list[datasources.BaseDataSource]):
+	for child in children:
+		root.add_child(child)
+
+
+def populate_linear(root: datasources.BaseDataSource, children: list[datasources.BaseDataSource]):
+	for child in children:
+		if child not in root.children:
+			root.children.append(child)
+
+
+def _timed(function) -> float:
+	"""
+	Internal function that returns the time, in milliseconds, the given function takes.
+	"""
+
+	start = time.perf_counter()
+	function()
+	return (time.perf_counter() - start) * 1000
+
+
+def main(args: list[str] | None = None) -> int:
+	"""
+	Command line entry point.
+
+	:param list[str] or None args: command line arguments.
+	:return: exit code.
+	:rtype: int
+	"""
+
+	parser = argparse.ArgumentParser(description='Benchmarks data source populate and child row lookups')
+	parser.add_argument('--children', type=int, default=100000, help='number of children using cached rows')
+	parser.add_argument('--linear-children', type=int, default=5000, help='number of children using linear searches')
+	parsed_args = parser.parse_args(args)
+
+	results = []
+	for name, count, populate, lookup in (
+			('cached rows', parsed_args.children, populate_cached, lambda root, child: root.child_row(child)),
+			('linear search', parsed_args.linear_children, populate_linear,
+				lambda root, child: root.children.index(child))):
+		root = datasources.BaseDataSource()
+		children = [datasources.BaseDataSource() for _ in range(count)]
+		populate_time = _timed(lambda: populate(root, children))
+		lookup_time = _timed(lambda: [lookup(root, child) for child in children])
+		results.append((name, count, populate_time, lookup_time))
+
+	for name, count, populate_time, lookup_time in results:
+		print(f'{name:>13}: {count:7d} children, populate {populate_time:9.1f} ms, row lookups {lookup_time:9.1f} ms')
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Benchmark that measures reading and writing the descriptor, template, preference and naming files shipped with tpDcc
+packages through jsonio and yamlio.
+
+Default serialization backends (orjson and libyaml, when available) are compared against the previous pure Python
+ones (standard json module and PyYAML Python loaders and dumpers). Writing files with fileio.atomic_write is
+compared against writing them in place.
+
+Usage:
+    python bench_serialization.py [--iterations 20]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+import yaml
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+    if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+        sys.path.append(_package_root)
+
+from tp.common.python import fileio, jsonio, yamlio, yamlordereddictloader
+
+JSON_EXTENSIONS = ('.json', '.namingcfg', '.namingpreset')
+YAML_EXTENSIONS = ('.yml', '.yaml', '.descriptor', '.template', '.pref')
+_SKIPPED_DIRECTORIES = ('vendor', 'templates', '__pycache__', '.git')
+
+
+def find_files(extensions: tuple[str, ...]) -> list[str]:
+    """
+    Returns all files with given extensions shipped with tpDcc packages, skipping vendored ones and text templates
+    (such as component editor descriptor templates), which are rendered before being loaded.
+
+    :param tuple[str, ...] extensions: file extensions to find.
+    :return: sorted file paths.
+    :rtype: list[str]
+    """
+
+    found_files = []
+    for root, directories, file_names in os.walk(_PACKAGES_PATH):
+        directories[:] = [directory for directory in directories if directory not in _SKIPPED_DIRECTORIES]
+        found_files.extend(
+            os.path.join(root, file_name) for file_name in file_names if file_name.endswith(extensions))
+
+    return sorted(found_files)
+
+
+@contextlib.contextmanager
+def python_backends():
+    """
+    Context manager that makes jsonio and yamlio use pure Python serialization backends.
+    """
+
+    yaml_backends = yamlio.SafeLoader, yamlio.SafeDumper, yamlio.Dumper, yamlio.OrderedLoader
+    yamlio.SafeLoader, yamlio.SafeDumper, yamlio.Dumper = yaml.SafeLoader, yaml.SafeDumper, yaml.Dumper
+    yamlio.OrderedLoader = yamlordereddictloader.Loader
+    jsonio.set_backend(jsonio.StdJsonBackend.name)
+    try:
+        yield
+    finally:
+        yamlio.SafeLoader, yamlio.SafeDumper, yamlio.Dumper, yamlio.OrderedLoader = yaml_backends
+        jsonio.set_backend()
+
+
+def _timed(function, iterations: int) -> float:
+    """
+    Internal function that returns the average time, in milliseconds, the given function takes.
+    """
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def _write_in_place(file_name: str, data: bytes):
+    with open(file_name, 'wb') as open_file:
+        open_file.write(data)
+
+
+def _write_atomic(file_name: str, data: bytes):
+    with fileio.atomic_write(file_name, 'wb') as open_file:
+        open_file.write(data)
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    :param list[str] or None args: command line arguments.
+    :return: exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks JSON and YAML serialization of package files')
+    parser.add_argument('--iterations', type=int, default=20, help='number of times all files are read and written')
+    parsed_args = parser.parse_args(args)
+    iterations = parsed_args.iterations
+
+    json_files = find_files(JSON_EXTENSIONS)
+    yaml_files = find_files(YAML_EXTENSIONS)
+    json_data = [jsonio.read_file(file_path) for file_path in json_files]
+    yaml_data = [yamlio.read_file(file_path) for file_path in yaml_files]
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        json_copies = [os.path.join(temp_directory, f'{i}.json') for i in range(len(json_files))]
+        yaml_copies = [os.path.join(temp_directory, f'{i}.yaml') for i in range(len(yaml_files))]
+        for file_path, copy_path in zip(json_files + yaml_files, json_copies + yaml_copies):
+            shutil.copyfile(file_path, copy_path)
+
+        cases = {
+            'json read': lambda: [jsonio.read_file(file_path) for file_path in json_files],
+            'json write': lambda: [
+                jsonio.write_to_file(data, file_path) for data, file_path in zip(json_data, json_copies)],
+            'yaml read': lambda: [yamlio.read_file(file_path) for file_path in yaml_files],
+            'yaml ordered read': lambda: [
+                yamlio.read_file(file_path, maintain_order=True) for file_path in yaml_files],
+            'yaml write': lambda: [
+                yamlio.write_to_file(data, file_path) for data, file_path in zip(yaml_data, yaml_copies)],
+        }
+        results = []
+        with python_backends():
+            previous_times = {name: _timed(function, iterations) for name, function in cases.items()}
+        for name, function in cases.items():
+            results.append((name, previous_times[name], _timed(function, iterations)))
+
+        contents = []
+        for file_path in json_files + yaml_files:
+            with open(file_path, 'rb') as open_file:
+                contents.append(open_file.read())
+        copies = json_copies + yaml_copies
+        in_place_time = _timed(
+            lambda: [_write_in_place(file_path, data) for file_path, data in zip(copies, contents)], iterations)
+        atomic_time = _timed(
+            lambda: [_write_atomic(file_path, data) for file_path, data in zip(copies, contents)], iterations)
+
+    print(f'average time of {iterations} iterations over {len(json_files)} JSON and {len(yaml_files)} YAML files')
+    print(f'  json backend: {jsonio.backend().name}, yaml loader: {yamlio.SafeLoader.__name__}')
+    for name, previous_time, current_time in results:
+        print(f'  {name:>17}: python {previous_time:8.2f} ms, default {current_time:8.2f} ms '
+              f'({previous_time / current_time:.1f}x)')
+    print(f'  {"raw write":>17}: in place {in_place_time:8.2f} ms, atomic {atomic_time:8.2f} ms')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,9 @@
+import os
+import sys
+import glob
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+    if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+        sys.path.append(_package_root)
@@ -0,0 +1,25 @@
+import math
+
+import pytest
+
+from tp.common.python import jsonio
+
+
+@pytest.fixture(params=[backend_class.name for backend_class in jsonio.BACKENDS if backend_class.available()])
+def backend_name(request):
+    jsonio.set_backend(request.param)
+    yield request.param
+    jsonio.set_backend(None)
+
+
+def test_non_finite_floats_round_trip(backend_name):
+    data = {'nan': float('nan'), 'values': [1.5, float('inf'), {'negative': float('-inf')}], 'none': None}
+    result = jsonio.loads(jsonio.dumps(data, indent=None))
+    assert math.isnan(result['nan'])
+    assert result['values'] == [1.5, float('inf'), {'negative': float('-inf')}]
+    assert result['none'] is None
+
+
+def test_round_trip(backend_name):
+    data = {'a': [1, 2.5, 'x'], 'b': {'c': None, 'd': True}}
+    assert jsonio.loads(jsonio.dumps(data)) == data
@@ -0,0 +1,50 @@
+import io
+import json
+
+import pytest
+
+from tp.common.python import jsonstream
+
+DOCUMENTS = [
+    '{"v": 10.5, "w": 3e10}',
+    '{"a": -0.25e-3, "b": [1, 22.75, 3E+2, -4], "c": {"d": 1.0}, "e": true, "f": null, "g": "x, y"}',
+    '{ "nodes" : [ {"id": 1, "pos": [0.5, 12.125]} , {"id": 2, "pos": [1e3, -2.5]} ] , "count" : 2 }',
+    '{"nodes": [], "edges": [], "version": 123456789}',
+    '{}',
+]
+
+
+def _read(document, chunk_size, stream_keys=()):
+    reader = jsonstream.JsonStreamReader(io.StringIO(document), chunk_size=chunk_size)
+    entries = {}
+    for key, value in reader.entries(stream_keys):
+        if key in stream_keys:
+            entries.setdefault(key, []).append(value)
+        else:
+            entries[key] = value
+    return entries
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_chunk_sizes(document):
+    expected = json.loads(document)
+    for chunk_size in range(1, len(document) + 2):
+        assert _read(document, chunk_size) == expected, f'chunk size: {chunk_size}'
+
+
+@pytest.mark.parametrize('document', DOCUMENTS[2:4])
+def test_chunk_sizes_streamed_keys(document):
+    expected = json.loads(document)
+    stream_keys = ('nodes', 'edges')
+    for chunk_size in range(1, len(document) + 2):
+        entries = _read(document, chunk_size, stream_keys=stream_keys)
+        for key in stream_keys:
+            assert entries.pop(key, []) == expected.get(key, []), f'chunk size: {chunk_size}'
+        assert entries == {k: v for k, v in expected.items() if k not in stream_keys}, f'chunk size: {chunk_size}'
+
+
+@pytest.mark.parametrize('document', ['{"v": 10.}', '{"v": 1 2}', '{"v": 1'])
+def test_invalid_documents(document):
+    for chunk_size in range(1, len(document) + 2):
+        with pytest.raises(json.JSONDecodeError):
+            _read(document, chunk_size)
@@ -0,0 +1,79 @@
+import pytest
+
+from tp.common.python import memoize
+
+
+def test_freeze_preserves_types():
+    assert memoize.freeze({1: 'a'}) != memoize.freeze({'1': 'a'})
+    assert memoize.freeze([1, 2]) != memoize.freeze((1, 2))
+    assert memoize.freeze([1, 2]) != memoize.freeze({1, 2})
+    assert memoize.freeze({'a': [1, {'b': 2}]}) == memoize.freeze({'a': [1, {'b': 2}]})
+    assert memoize.freeze({1: 'a', 'b': 2}) == memoize.freeze({'b': 2, 1: 'a'})
+
+
+def test_freeze_unsupported_type():
+    class Unhashable:
+        __hash__ = None
+
+    with pytest.raises(TypeError):
+        memoize.freeze([Unhashable()])
+
+
+def test_memoize_unhashable_arguments():
+    calls = []
+
+    @memoize.memoize()
+    def function(value):
+        calls.append(value)
+        return repr(value)
+
+    assert function({1: 'a'}) == "{1: 'a'}"
+    assert function({'1': 'a'}) == "{'1': 'a'}"
+    assert function({1: 'a'}) == "{1: 'a'}"
+    assert function({1: 'a', 'b': [1]}) == "{1: 'a', 'b': [1]}"
+    assert len(calls) == 3
+
+
+def test_memoize_bypasses_cache_for_unfreezable_arguments():
+    class Unhashable:
+        __hash__ = None
+
+    calls = []
+
+    @memoize.memoize()
+    def function(value):
+        calls.append(value)
+        return len(calls)
+
+    value = Unhashable()
+    assert function(value) == 1
+    assert function(value) == 2
+    assert len(function.cache) == 0
+    assert function.invalidate(value) is False
+
+
+def test_get_or_compute_without_cache_size(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('{}')
+    cache = memoize.MemoCache(max_size=0)
+    calls = []
+
+    def _compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute('key', _compute, paths=[str(file_path)]) == 1
+    assert cache.get_or_compute('key', _compute, paths=[str(file_path)]) == 2
+    assert len(cache) == 0
+    assert cache.stats.evictions == 2
+
+
+def test_get_or_compute_stamps_paths(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('{}')
+    cache = memoize.MemoCache()
+
+    assert cache.get_or_compute('key', lambda: 'first', paths=[str(file_path)]) == 'first'
+    assert cache.get_or_compute('key', lambda: 'second', paths=[str(file_path)]) == 'first'
+    file_path.write_text('{"changed": true}')
+    assert cache.get_or_compute('key', lambda: 'third', paths=[str(file_path)]) == 'third'
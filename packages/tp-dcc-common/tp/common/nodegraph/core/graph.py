@@ -9,7 +9,7 @@ from typing import Iterator, Any
 
 from tp.core import log
 from tp.common.qt import api as qt
-from tp.common.python import jsonio
+from tp.common.python import jsonstream
 from tp.common.nodegraph import registers
 from tp.common.nodegraph.core import (
     utils, consts, errors, factory, history, clipboard, node, edge, vars, executor, serializer
@@ -655,12 +655,9 @@ class NodeGraph(qt.QObject):
         """
 
         try:
-            data = serializer.serialize_graph(self)
-            if not jsonio.validate_json(data):
-                logger.error('Scene data is not valid')
-                logger.info(data)
-                return
-            result = jsonio.write_to_file(data, file_path, sort_keys=False)
+            # entries are streamed to disk as they are serialized, file is only replaced if all of them are valid
+            result = jsonstream.write_entries(
+                serializer.iterate_graph_entries(self), file_path, stream_keys=serializer.GRAPH_STREAM_KEYS)
             if not result:
                 logger.error('Was not possible to save build')
                 return
@@ -681,8 +678,9 @@ class NodeGraph(qt.QObject):
         try:
             self.clear()
             start_time = timeit.default_timer()
-            data = jsonio.read_file(file_path)
-            serializer.deserialize_graph(self, data)
+            # nodes are created while the file is being read, so whole file contents are never held in memory
+            serializer.deserialize_graph_entries(
+                self, jsonstream.iterate_entries(file_path, stream_keys=serializer.GRAPH_STREAM_KEYS))
             logger.info("Rig build loaded in {0:.2f}s".format(timeit.default_timer() - start_time))
             self.history.clear()
             self.executor.reset_stepped_execution()
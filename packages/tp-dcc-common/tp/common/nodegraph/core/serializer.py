@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing
+from typing import Iterator, Iterable, Any
 
 from tp.core import log
 from tp.common.nodegraph import datatypes
@@ -16,6 +17,9 @@ if typing.TYPE_CHECKING:
 
 logger = log.tpLogger
 
+# top-level graph entries whose items are serialized/deserialized one by one
+GRAPH_STREAM_KEYS = ('nodes', 'edges')
+
 
 def serialize_socket(socket_to_serialize: Socket) -> dict:
     value = socket_to_serialize.value() if not socket_to_serialize.is_runtime_data() else None
@@ -138,25 +142,20 @@ def deserialize_edge(edge_instance: edge.Edge, data: dict, hashmap: dict | None
     edge_instance.update_edge_graphics_type()
 
 
-def serialize_graph(graph_to_serialize: NodeGraph) -> dict:
-    nodes: list[dict] = []
-    edges: list[dict] = []
-    for n in graph_to_serialize.nodes:
-        nodes.append(serialize_node(n))
-    for e in graph_to_serialize.edges:
-        if not e.start_socket or not e.end_socket:
-            continue
-        edges.append(serialize_edge(e))
+def iterate_graph_entries(graph_to_serialize: NodeGraph) -> Iterator[tuple[str, Any]]:
+    yield 'id', graph_to_serialize.uuid
+    yield 'vars', serialize_vars(graph_to_serialize.vars)
+    yield 'scene_width', graph_to_serialize._scene_width
+    yield 'scene_height', graph_to_serialize._scene_height
+    yield 'nodes', (serialize_node(n) for n in graph_to_serialize.nodes)
+    yield 'edges', (serialize_edge(e) for e in graph_to_serialize.edges if e.start_socket and e.end_socket)
+    yield 'edge_type', graph_to_serialize.edge_type.name
+
 
+def serialize_graph(graph_to_serialize: NodeGraph) -> dict:
     return {
-        'id': graph_to_serialize.uuid,
-        'vars': serialize_vars(graph_to_serialize.vars),
-        'scene_width': graph_to_serialize._scene_width,
-        'scene_height': graph_to_serialize._scene_height,
-        'nodes': nodes,
-        'edges': edges,
-        'edge_type': graph_to_serialize.edge_type.name
-    }
+        key: list(value) if key in GRAPH_STREAM_KEYS else value for key, value in
+        iterate_graph_entries(graph_to_serialize)}
 
 
 def serialize_vars(vars_instance: SceneVars) -> dict:
@@ -181,46 +180,65 @@ def deserialize_vars(vars_instance: SceneVars, data: dict):
 
 
 def deserialize_graph(graph_instance: NodeGraph, data: dict, hashmap: dict | None = None, restore_id: bool = True):
-    hashmap = hashmap or {}
+    entries = [('id', data.get('id')), ('vars', data.get('vars', {}))]
+    entries.extend(('nodes', node_data) for node_data in data['nodes'])
+    entries.extend(('edges', edge_data) for edge_data in data['edges'])
+    entries.append(('edge_type', data.get('edge_type', edge.Edge.Type.BEZIER)))
+    deserialize_graph_entries(graph_instance, entries, hashmap=hashmap, restore_id=restore_id)
 
-    if restore_id:
-        graph_instance.uuid = data['id']
 
-    # Deserialize variables
-    deserialize_vars(graph_instance.vars, data.get('vars', {}))
+def deserialize_graph_entries(
+        graph_instance: NodeGraph, entries: Iterable[tuple[str, Any]], hashmap: dict | None = None,
+        restore_id: bool = True):
+    """
+    Deserializes graph from (key, value) entries, as yielded by iterate_graph_entries or by a streaming JSON reader
+    (with nodes and edges yielded one by one), so nodes are created while the rest of the file is still being read.
+    """
 
-    # Deserialize nodes
+    hashmap = hashmap or {}
     all_nodes = graph_instance.nodes[:]
-    for node_data in data['nodes']:
-        found = False
-        for scene_node in all_nodes:
-            if scene_node.uuid == node_data['id']:
-                found = scene_node
-                break
-        if not found:
-            new_node = graph_instance.class_from_node_data(node_data)(graph_instance)
-            deserialize_node(new_node, node_data, hashmap, restore_id=restore_id)
-        else:
-            deserialize_node(found, node_data, hashmap, restore_id=restore_id)
-            all_nodes.remove(found)
-    while all_nodes:
-        node_to_remove = all_nodes.pop()
-        node_to_remove.remove()
-
-    # Deserialize edges
     all_edges = graph_instance.edges[:]
-    for edge_data in data['edges']:
-        found = False
-        for scene_edge in all_edges:
-            if scene_edge.uuid == edge_data['id']:
-                found = scene_edge
-                break
-        if not found:
-            new_edge = edge.Edge(graph_instance)
-            deserialize_edge(new_edge, edge_data, hashmap, restore_id)
-        else:
-            deserialize_edge(found, edge_data, hashmap, restore_id)
-            all_edges.remove(found)
+    pending_edges: list[dict] = []
+    nodes_started = False
+    nodes_finished = False
+    vars_found = False
+    edge_type = edge.Edge.Type.BEZIER
+
+    def _finish_nodes():
+        while all_nodes:
+            node_to_remove = all_nodes.pop()
+            node_to_remove.remove()
+        for pending_edge_data in pending_edges:
+            _deserialize_graph_edge(graph_instance, pending_edge_data, all_edges, hashmap, restore_id)
+        pending_edges.clear()
+
+    for key, value in entries:
+        if key == 'nodes':
+            nodes_started = True
+            _deserialize_graph_node(graph_instance, value, all_nodes, hashmap, restore_id)
+            continue
+        if nodes_started and not nodes_finished:
+            nodes_finished = True
+            _finish_nodes()
+        if key == 'edges':
+            if nodes_finished:
+                _deserialize_graph_edge(graph_instance, value, all_edges, hashmap, restore_id)
+            else:
+                # edges can only be connected once their nodes exist
+                pending_edges.append(value)
+        elif key == 'id':
+            if restore_id:
+                graph_instance.uuid = value
+        elif key == 'vars':
+            vars_found = True
+            deserialize_vars(graph_instance.vars, value)
+        elif key == 'edge_type':
+            edge_type = value
+
+    if not vars_found:
+        deserialize_vars(graph_instance.vars, {})
+    if not nodes_finished:
+        _finish_nodes()
     while all_edges:
         edge_to_delete = all_edges.pop()
         try:
@@ -230,4 +248,34 @@ def deserialize_graph(graph_instance: NodeGraph, data: dict, hashmap: dict | Non
         edge_to_delete.remove()
 
     # Set edge type
-    graph_instance.edge_type = data.get('edge_type', edge.Edge.Type.BEZIER)
+    graph_instance.edge_type = edge_type
+
+
+def _deserialize_graph_node(
+        graph_instance: NodeGraph, node_data: dict, all_nodes: list[Node], hashmap: dict, restore_id: bool):
+    found = False
+    for scene_node in all_nodes:
+        if scene_node.uuid == node_data['id']:
+            found = scene_node
+            break
+    if not found:
+        new_node = graph_instance.class_from_node_data(node_data)(graph_instance)
+        deserialize_node(new_node, node_data, hashmap, restore_id=restore_id)
+    else:
+        deserialize_node(found, node_data, hashmap, restore_id=restore_id)
+        all_nodes.remove(found)
+
+
+def _deserialize_graph_edge(
+        graph_instance: NodeGraph, edge_data: dict, all_edges: list[edge.Edge], hashmap: dict, restore_id: bool):
+    found = False
+    for scene_edge in all_edges:
+        if scene_edge.uuid == edge_data['id']:
+            found = scene_edge
+            break
+    if not found:
+        new_edge = edge.Edge(graph_instance)
+        deserialize_edge(new_edge, edge_data, hashmap, restore_id)
+    else:
+        deserialize_edge(found, edge_data, hashmap, restore_id)
+        all_edges.remove(found)
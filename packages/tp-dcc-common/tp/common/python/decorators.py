@@ -19,7 +19,7 @@ from functools import wraps, update_wrapper
 from overrides import override
 
 from tp.core import log
-from tp.common.python import debug
+from tp.common.python import debug, memoize
 
 logger = log.tpLogger
 
@@ -305,19 +305,31 @@ def repeater(interval, limit=-1):
     return actual_decorator
 
 
-def cached(fn):
-    cache = {}
+def cached(
+        fn: Callable | None = None, max_size: int | None = memoize.DEFAULT_MAX_SIZE, ttl: float | None = None,
+        **kwargs) -> Callable:
+    """
+    Decorator that caches the results of the decorated function within a bounded, thread-safe LRU cache.
+    Can be used both with and without arguments. Extra keyword arguments are passed to memoize.memoize decorator.
 
-    @wraps(fn)
-    def wrapper(*args):
-        try:
-            return cache[args]
-        except KeyError:
-            rv = fn(*args)
-            cache[args] = rv
-            return rv
+    :param Callable or None fn: decorated function.
+    :param int or None max_size: maximum number of cached results. If None, cache is unbounded.
+    :param float or None ttl: seconds results are valid for. If None, results never expire.
+    :return: decorated function or decorator.
+    :rtype: Callable
 
-    return wrapper
+    ..code-block:: python
+        @cached
+        def find_paths(root):
+            ...
+
+        @cached(max_size=32, ttl=60.0)
+        def find_other_paths(root):
+            ...
+    """
+
+    decorator = memoize.memoize(max_size=max_size, ttl=ttl, **kwargs)
+    return decorator(fn) if fn is not None else decorator
 
 
 def add_method(cls):
@@ -463,6 +475,24 @@ class LazyProperty(property):
             setattr(instance, self.cache_name, result)
         return result
 
+    def __delete__(self, instance):
+        if self.fdel is None:
+            self.reset(instance)
+        else:
+            self.fdel(instance)
+
+    def reset(self, instance: Any):
+        """
+        Removes the cached value of the given instance, so it is computed again the next time it is accessed.
+
+        :param Any instance: instance whose cached value will be removed.
+        """
+
+        try:
+            delattr(instance, self.cache_name)
+        except AttributeError:
+            pass
+
 
 class LazyWritableProperty(LazyProperty):
     """
@@ -15,6 +15,7 @@ import getpass
 import datetime
 import traceback
 import subprocess
+import contextlib
 from tempfile import mkstemp
 from shutil import move
 
@@ -204,6 +205,42 @@ def write_to_file(file_name, text_to_write):
         file.write(text_to_write)
 
 
+@contextlib.contextmanager
+def atomic_write(file_name, mode='w', **kwargs):
+    """
+    Context manager that opens a temporary file next to the given file and, when the context exits without errors,
+    moves it over the given file. Readers never see a partially written file and, if writing fails, the original file
+    is kept untouched.
+
+    :param str file_name: path of the file to write.
+    :param str mode: open mode ('w' or 'wb').
+    :param kwargs: extra open keyword arguments (such as encoding).
+    :return: opened temporary file.
+    :rtype: io.IOBase
+
+    ..code-block:: python
+        with atomic_write('settings.json') as settings_file:
+            settings_file.write(text)
+    """
+
+    directory = os.path.dirname(os.path.abspath(file_name))
+    file_descriptor, temp_path = mkstemp(dir=directory, prefix='.{}.'.format(os.path.basename(file_name)), suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, mode, **kwargs) as temp_file:
+            yield temp_file
+        if os.path.exists(file_name):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(file_name).st_mode) | stat.S_IWRITE)
+        else:
+            current_umask = os.umask(0)
+            os.umask(current_umask)
+            os.chmod(temp_path, 0o666 & ~current_umask)
+        os.replace(temp_path, file_name)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def append_to_file(file_name, text_to_add):
     """
     Open a file and add new context to its existing text
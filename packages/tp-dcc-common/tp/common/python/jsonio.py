@@ -6,11 +6,214 @@ from __future__ import annotations
 
 import os
 import json
+import math
+from typing import Any
 
 from tp.core import log
+from tp.common.python import fileio
 
 logger = log.tpLogger
 
+# environment variable that forces a JSON backend ('json', 'orjson')
+JSON_BACKEND_ENV = 'TPDCC_JSON_BACKEND'
+
+
+class JsonBackend:
+    """
+    Base class for JSON serialization backends. Backends read and write UTF-8 encoded bytes.
+    """
+
+    name = ''
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Returns whether this backend can be used within current environment.
+
+        :return: True if backend is available; False otherwise.
+        :rtype: bool
+        """
+
+        return True
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserializes given JSON data.
+
+        :param bytes data: UTF-8 encoded JSON data.
+        :return: deserialized data.
+        :rtype: Any
+        :raises ValueError: if given data is not valid JSON.
+        """
+
+        raise NotImplementedError
+
+    def dumps(self, data: Any, indent: int | None = 2, sort_keys: bool = False) -> bytes:
+        """
+        Serializes given data.
+
+        :param Any data: data to serialize.
+        :param int or None indent: indentation. If None, data is serialized in compact form.
+        :param bool sort_keys: whether to sort dictionary keys.
+        :return: UTF-8 encoded JSON data.
+        :rtype: bytes
+        :raises TypeError: if given data or options are not supported by this backend.
+        """
+
+        raise NotImplementedError
+
+
+class StdJsonBackend(JsonBackend):
+    """
+    JSON backend that uses Python standard json module. Always available.
+    """
+
+    name = 'json'
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, data: Any, indent: int | None = 2, sort_keys: bool = False, **kwargs) -> bytes:
+        if indent is None:
+            kwargs.setdefault('separators', (',', ':'))
+        return json.dumps(data, indent=indent, sort_keys=sort_keys, **kwargs).encode('utf-8')
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    JSON backend that uses orjson library. Only supports 2 spaces indentation or compact form.
+    Output is UTF-8 (non-ASCII characters are not escaped). orjson writes NaN/infinite floats as null, so data
+    containing them is not supported and is serialized by standard json module instead.
+    """
+
+    name = 'orjson'
+
+    @classmethod
+    def available(cls) -> bool:
+        try:
+            import orjson
+        except ImportError:
+            return False
+        return orjson is not None
+
+    def __init__(self):
+        super().__init__()
+
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, data: Any, indent: int | None = 2, sort_keys: bool = False) -> bytes:
+        if indent not in (None, 2):
+            raise TypeError(f'Indentation not supported by {self.name} backend: {indent}')
+        options = self._orjson.OPT_NON_STR_KEYS
+        if indent:
+            options |= self._orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= self._orjson.OPT_SORT_KEYS
+        result = self._orjson.dumps(data, option=options)
+        # non-finite floats are written as null, so data is only checked if output contains null values
+        if b'null' in result and _has_non_finite_floats(data):
+            raise TypeError(f'NaN and infinite floats are not supported by {self.name} backend')
+        return result
+
+
+def _has_non_finite_floats(data: Any) -> bool:
+    """
+    Internal function that returns whether given data contains NaN or infinite float values.
+
+    :param Any data: data to check.
+    :return: True if data contains non-finite floats; False otherwise.
+    :rtype: bool
+    """
+
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_floats(key) or _has_non_finite_floats(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_floats(item) for item in data)
+
+    return False
+
+
+# backends sorted by preference
+BACKENDS = [OrjsonBackend, StdJsonBackend]          # type: list[type[JsonBackend]]
+_BACKEND = None                                     # type: JsonBackend | None
+_FALLBACK_BACKEND = StdJsonBackend()
+
+
+def register_backend(backend_class: type[JsonBackend], preferred: bool = True):
+    """
+    Registers a new JSON backend.
+
+    :param type[JsonBackend] backend_class: backend class to register.
+    :param bool preferred: whether backend should be preferred over already registered ones.
+    """
+
+    global _BACKEND
+
+    if backend_class in BACKENDS:
+        BACKENDS.remove(backend_class)
+    if preferred:
+        BACKENDS.insert(0, backend_class)
+    else:
+        # standard json backend is always kept as the last one
+        BACKENDS.insert(len(BACKENDS) - 1, backend_class)
+    _BACKEND = None
+
+
+def backend() -> JsonBackend:
+    """
+    Returns current JSON backend: the one forced by TPDCC_JSON_BACKEND environment variable or the first available one.
+
+    :return: JSON backend instance.
+    :rtype: JsonBackend
+    """
+
+    global _BACKEND
+
+    if _BACKEND is not None:
+        return _BACKEND
+
+    forced_name = os.getenv(JSON_BACKEND_ENV, '')
+    for backend_class in BACKENDS:
+        if forced_name and backend_class.name != forced_name:
+            continue
+        if backend_class.available():
+            _BACKEND = backend_class()
+            break
+    else:
+        if forced_name:
+            logger.warning(f'JSON backend "{forced_name}" is not available. Using default one.')
+        _BACKEND = _FALLBACK_BACKEND
+
+    return _BACKEND
+
+
+def set_backend(name: str | None = None):
+    """
+    Sets the JSON backend to use.
+
+    :param str or None name: backend name. If None, preferred available backend will be used.
+    :raises ValueError: if no available backend with given name is registered.
+    """
+
+    global _BACKEND
+
+    if name is None:
+        _BACKEND = None
+        return
+
+    for backend_class in BACKENDS:
+        if backend_class.name == name and backend_class.available():
+            _BACKEND = backend_class()
+            return
+
+    raise ValueError(f'JSON backend "{name}" is not available')
+
 
 def validate_json(dictionary_to_validate: dict) -> bool:
     """
@@ -44,18 +247,64 @@ def convert_dict_to_string(input_dict: dict) -> str:
     return json.dumps(input_dict)
 
 
+def dumps(data: Any, indent: int | None = 2, sort_keys: bool = False, **kwargs) -> bytes:
+    """
+    Serializes given data into UTF-8 encoded JSON using current backend. If current backend does not support given
+    data or options, standard json module is used.
+
+    :param Any data: data to serialize.
+    :param int or None indent: indentation. If None, data is serialized in compact form.
+    :param bool sort_keys: whether to sort dictionary keys.
+    :param kwargs: extra standard json module keyword arguments. If given, standard json module is used.
+    :return: UTF-8 encoded JSON data.
+    :rtype: bytes
+    """
+
+    if not kwargs:
+        try:
+            return backend().dumps(data, indent=indent, sort_keys=sort_keys)
+        except TypeError:
+            pass
+
+    return _FALLBACK_BACKEND.dumps(data, indent=indent, sort_keys=sort_keys, **kwargs)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserializes given JSON data using current backend. If current backend cannot decode the data (for example, because
+    it contains non-standard NaN values), standard json module is used.
+
+    :param bytes or str data: JSON data.
+    :return: deserialized data.
+    :rtype: Any
+    :raises ValueError: if given data is not valid JSON.
+    """
+
+    try:
+        return backend().loads(data)
+    except ValueError:
+        return _FALLBACK_BACKEND.loads(data)
+
+
 def write_to_file(data: dict, filename: str, **kwargs) -> str | None:
     """
     Writes data to JSON file.
+    File is written atomically: data is written into a temporary file that replaces the target one once finished, so
+    readers never see a partially written file.
 
     :param dict data: data to store into JSON file.
     :param str filename: name of the JSON file we want to store data into.
     :return: file name of the stored file.
     :rtype: str or None
+
+    ..note:: compact keyword argument can be used to skip indentation for files that are only read by tools.
     """
 
     indent = kwargs.pop('indent', 2)
     validate_data = kwargs.pop('validate_data', False)
+    sort_keys = kwargs.pop('sort_keys', False)
+    if kwargs.pop('compact', False):
+        indent = None
 
     if validate_data:
         if not validate_json(data):
@@ -63,8 +312,8 @@ def write_to_file(data: dict, filename: str, **kwargs) -> str | None:
             return None
 
     try:
-        with open(filename, 'w') as json_file:
-            json.dump(data, json_file, indent=indent, **kwargs)
+        with fileio.atomic_write(filename, 'wb') as json_file:
+            json_file.write(dumps(data, indent=indent, sort_keys=sort_keys, **kwargs))
     except IOError:
         logger.error(f'Data not saved to file {filename}')
         return None
@@ -87,8 +336,8 @@ def read_file(filename: str) -> dict | None:
         return None
 
     try:
-        with open(filename, 'r') as json_file:
-            data = json.load(json_file)
+        with open(filename, 'rb') as json_file:
+            data = loads(json_file.read())
     except Exception as err:
         logger.exception(f'Could not read {filename}', exc_info=True)
         raise err
@@ -0,0 +1,340 @@
+"""
+Utility methods to read/write large JSON files incrementally.
+Readers yield the top-level entries of a JSON object as soon as they are parsed (and the items of selected top-level
+arrays one by one), so memory usage is bounded by the size of the largest entry instead of the size of the whole file.
+Writers stream entries out without building the whole document first.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Iterator, Iterable, Any, IO
+
+from tp.core import log
+from tp.common.python import fileio, jsonio
+
+logger = log.tpLogger
+
+# default number of characters read from disk each time the reader needs more data
+DEFAULT_CHUNK_SIZE = 1 << 16
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',:]}'
+
+
+class JsonStreamReader:
+    """
+    Class that incrementally parses a JSON document whose root is an object.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Constructor.
+
+        :param IO[str] stream: text stream to read JSON data from.
+        :param int chunk_size: number of characters to read from the stream each time more data is needed.
+        """
+
+        super().__init__()
+
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def entries(self, stream_keys: Iterable[str] = ()) -> Iterator[tuple[str, Any]]:
+        """
+        Generator function that yields the top-level entries of the JSON object as they are parsed.
+
+        :param Iterable[str] stream_keys: keys of the top-level arrays whose items should be yielded one by one (as
+            (key, item) tuples) instead of as a single list.
+        :return: iterated (key, value) tuples.
+        :rtype: Iterator[tuple[str, Any]]
+        :raises json.JSONDecodeError: if data is not a valid JSON object.
+        """
+
+        stream_keys = set(stream_keys)
+        self._expect('{')
+        if self._peek() == '}':
+            self._position += 1
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise self._error('Expecting property name enclosed in double quotes')
+            self._expect(':')
+            if key in stream_keys and self._peek() == '[':
+                for item in self._items():
+                    yield key, item
+            else:
+                yield key, self._decode_value()
+            if self._next_delimiter('}'):
+                break
+
+    def _items(self) -> Iterator[Any]:
+        """
+        Internal generator function that yields the items of the array at current position.
+
+        :return: iterated array items.
+        :rtype: Iterator[Any]
+        """
+
+        self._expect('[')
+        if self._peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._next_delimiter(']'):
+                break
+
+    def _fill(self) -> bool:
+        """
+        Internal function that reads more data from the stream, discarding already parsed data.
+
+        :return: True if new data was read; False if stream is exhausted.
+        :rtype: bool
+        """
+
+        if self._eof:
+            return False
+        chunk = self._stream.read(max(self._chunk_size, len(self._buffer) - self._position))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        """
+        Internal function that skips whitespaces and returns the next character without consuming it.
+
+        :return: next character or an empty string if stream is exhausted.
+        :rtype: str
+        """
+
+        while True:
+            buffer_size = len(self._buffer)
+            while self._position < buffer_size and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+            if self._position < buffer_size:
+                return self._buffer[self._position]
+            if not self._fill():
+                return ''
+
+    def _expect(self, character: str):
+        """
+        Internal function that consumes the given character.
+
+        :param str character: expected character.
+        :raises json.JSONDecodeError: if next character is not the expected one.
+        """
+
+        if self._peek() != character:
+            raise self._error(f'Expecting {character!r}')
+        self._position += 1
+
+    def _next_delimiter(self, closing: str) -> bool:
+        """
+        Internal function that consumes the delimiter after an entry.
+
+        :param str closing: closing character of the current container.
+        :return: True if the container was closed; False if there are more entries.
+        :rtype: bool
+        :raises json.JSONDecodeError: if next character is neither a comma nor the closing character.
+        """
+
+        character = self._peek()
+        if character == ',':
+            self._position += 1
+            return False
+        if character == closing:
+            self._position += 1
+            return True
+        raise self._error(f'Expecting \',\' or {closing!r} delimiter')
+
+    def _decode_value(self) -> Any:
+        """
+        Internal function that decodes the JSON value at current position, reading more data if value is incomplete.
+
+        :return: decoded value.
+        :rtype: Any
+        :raises json.JSONDecodeError: if value is not valid JSON.
+        """
+
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # numbers may continue within the next chunk (for example, "10." followed by "5"), so values are only
+            # accepted once the delimiter that follows them has been read
+            if not self._eof and not self._is_delimited(end) and self._fill():
+                continue
+            self._position = end
+            return value
+
+    def _is_delimited(self, end: int) -> bool:
+        """
+        Internal function that returns whether a delimiter follows the value that ends at given buffer position.
+
+        :param int end: buffer position where the decoded value ends.
+        :return: True if a delimiter character follows the value; False otherwise.
+        :rtype: bool
+        """
+
+        buffer_size = len(self._buffer)
+        while end < buffer_size and self._buffer[end] in _WHITESPACE:
+            end += 1
+
+        return end < buffer_size and self._buffer[end] in _DELIMITERS
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+
+def iterate_entries(
+        filename: str, stream_keys: Iterable[str] = (),
+        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Generator function that yields the top-level entries of the JSON object stored within given file as they are read.
+
+    :param str filename: name of the JSON file we want to read data from.
+    :param Iterable[str] stream_keys: keys of the top-level arrays whose items should be yielded one by one.
+    :param int chunk_size: number of characters to read from disk each time more data is needed.
+    :return: iterated (key, value) tuples.
+    :rtype: Iterator[tuple[str, Any]]
+
+    ..code-block:: python
+        for key, value in iterate_entries('graph.json', stream_keys=('nodes', 'edges')):
+            if key == 'nodes':
+                create_node(value)
+    """
+
+    with open(filename, 'r', encoding='utf-8') as json_file:
+        yield from JsonStreamReader(json_file, chunk_size=chunk_size).entries(stream_keys)
+
+
+class JsonStreamWriter:
+    """
+    Class that incrementally writes a JSON document whose root is an object.
+    Document is written atomically, so the target file is only replaced once the writer is closed without errors.
+
+    ..code-block:: python
+        with JsonStreamWriter('graph.json') as writer:
+            writer.write('id', graph_id)
+            writer.write_items('nodes', (serialize_node(node) for node in nodes))
+    """
+
+    def __init__(self, filename: str, indent: int | None = 2, sort_keys: bool = False):
+        """
+        Constructor.
+
+        :param str filename: name of the JSON file we want to store data into.
+        :param int or None indent: indentation. If None, data is written in compact form.
+        :param bool sort_keys: whether to sort the keys of written values.
+        """
+
+        super().__init__()
+
+        self._filename = filename
+        self._indent = indent
+        self._sort_keys = sort_keys
+        self._context = None
+        self._file = None                   # type: IO[bytes] | None
+        self._entry_count = 0
+
+    def __enter__(self) -> JsonStreamWriter:
+        self._context = fileio.atomic_write(self._filename, 'wb')
+        self._file = self._context.__enter__()
+        self._file.write(b'{')
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._file.write(self._newline(0) + b'}')
+        self._file = None
+        return self._context.__exit__(exc_type, exc_val, exc_tb)
+
+    def write(self, key: str, value: Any):
+        """
+        Writes a top-level entry.
+
+        :param str key: entry key.
+        :param Any value: entry value.
+        """
+
+        self._write_key(key)
+        self._file.write(self._dumps(value, 1))
+
+    def write_items(self, key: str, items: Iterable[Any]):
+        """
+        Writes a top-level array entry, serializing its items one by one as they are iterated.
+
+        :param str key: entry key.
+        :param Iterable[Any] items: array items.
+        """
+
+        self._write_key(key)
+        self._file.write(b'[')
+        item_count = 0
+        for item in items:
+            self._file.write((b',' if item_count else b'') + self._newline(2) + self._dumps(item, 2))
+            item_count += 1
+        self._file.write((self._newline(1) if item_count else b'') + b']')
+
+    def _write_key(self, key: str):
+        """
+        Internal function that writes the key of a new top-level entry.
+
+        :param str key: entry key.
+        """
+
+        separator = b': ' if self._indent is not None else b':'
+        self._file.write(
+            (b',' if self._entry_count else b'') + self._newline(1) + jsonio.dumps(key, indent=None) + separator)
+        self._entry_count += 1
+
+    def _newline(self, level: int) -> bytes:
+        return b'\n' + b' ' * (self._indent * level) if self._indent is not None else b''
+
+    def _dumps(self, value: Any, level: int) -> bytes:
+        data = jsonio.dumps(value, indent=self._indent, sort_keys=self._sort_keys)
+        # JSON strings cannot contain raw new lines, so all new lines are indentation ones
+        return data.replace(b'\n', self._newline(level)) if self._indent else data
+
+
+def write_entries(
+        entries: Iterable[tuple[str, Any]], filename: str, stream_keys: Iterable[str] = (),
+        indent: int | None = 2) -> str | None:
+    """
+    Writes given top-level entries into a JSON file without building the whole document first.
+
+    :param Iterable[tuple[str, Any]] entries: (key, value) tuples to write.
+    :param str filename: name of the JSON file we want to store data into.
+    :param Iterable[str] stream_keys: keys whose values are iterables of array items to stream.
+    :param int or None indent: indentation. If None, data is written in compact form.
+    :return: file name of the stored file.
+    :rtype: str or None
+    """
+
+    stream_keys = set(stream_keys)
+    try:
+        with JsonStreamWriter(filename, indent=indent) as writer:
+            for key, value in entries:
+                if key in stream_keys:
+                    writer.write_items(key, value)
+                else:
+                    writer.write(key, value)
+    except IOError:
+        logger.error(f'Data not saved to file {filename}')
+        return None
+
+    logger.debug(f'File correctly saved to: {filename}')
+
+    return filename
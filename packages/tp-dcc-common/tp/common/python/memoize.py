@@ -0,0 +1,499 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains memoization utilities: thread-safe caches with LRU and TTL policies, invalidation by key, tag or
+watched file path and single-flight computation.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import weakref
+import threading
+from functools import wraps
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Hashable
+
+from tp.core import log
+
+logger = log.tpLogger
+
+# default maximum number of entries of a cache
+DEFAULT_MAX_SIZE = 1024
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_FROZEN_MARK = object()
+_CACHES = weakref.WeakValueDictionary()         # type: weakref.WeakValueDictionary[str, MemoCache]
+
+
+def path_stamp(file_path: str) -> tuple[int, int] | None:
+    """
+    Returns the stamp of the given path, which changes each time the path is modified.
+
+    :param str file_path: file or directory path.
+    :return: tuple with the modification time in nanoseconds and size of the path or None if path does not exist.
+    :rtype: tuple[int, int] or None
+    """
+
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Returns a hashable representation of the given value, so unhashable values (such as lists or dictionaries) can be
+    used as cache keys. Containers are converted recursively into tuples tagged with their type, so values of
+    different types (for example, {1: 'a'} and {'1': 'a'}) never share the same representation.
+
+    :param Any value: value to freeze.
+    :return: hashable value.
+    :rtype: Hashable
+    :raises TypeError: if value contains unhashable values that are not lists, tuples, sets or dictionaries.
+    """
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+
+    if isinstance(value, dict):
+        return _FROZEN_MARK, type(value), frozenset((freeze(key), freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return _FROZEN_MARK, type(value), frozenset(freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return _FROZEN_MARK, type(value), tuple(freeze(item) for item in value)
+
+    raise TypeError(f'Unhashable type: {type(value).__name__}')
+
+
+def make_key(args: tuple, kwargs: dict, typed: bool = False) -> Hashable:
+    """
+    Returns the cache key of the given function arguments. Keyword arguments are part of the key and unhashable
+    arguments are keyed by their frozen contents.
+
+    :param tuple args: positional arguments.
+    :param dict kwargs: keyword arguments.
+    :param bool typed: whether arguments of different types are cached separately (for example, 1 and 1.0).
+    :return: cache key.
+    :rtype: Hashable
+    :raises TypeError: if any argument cannot be frozen into a hashable value.
+    """
+
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(value) for value in args) + tuple(type(value) for value in kwargs.values())
+    try:
+        hash(key)
+    except TypeError:
+        return freeze(key)
+
+    return key
+
+
+class CacheStats:
+    """
+    Class that holds the statistics of a cache.
+    """
+
+    __slots__ = ('hits', 'misses', 'evictions', 'expirations', 'invalidations', 'waits')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.waits = 0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}({self.to_dict()})>'
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Returns statistics as a dictionary.
+
+        :return: statistics dictionary.
+        :rtype: dict
+        """
+
+        return {
+            'hits': self.hits, 'misses': self.misses, 'hitRate': self.hit_rate, 'evictions': self.evictions,
+            'expirations': self.expirations, 'invalidations': self.invalidations, 'waits': self.waits}
+
+
+class _CacheEntry:
+    """
+    Internal class that holds a cached value and its invalidation data.
+    """
+
+    __slots__ = ('value', 'expires', 'tags', 'paths')
+
+    def __init__(
+            self, value: Any, expires: float | None, tags: frozenset[str],
+            paths: tuple[tuple[str, tuple[int, int] | None], ...]):
+        self.value = value
+        self.expires = expires
+        self.tags = tags
+        self.paths = paths
+
+    def is_valid(self, now: float) -> bool:
+        if self.expires is not None and now >= self.expires:
+            return False
+
+        return all(path_stamp(file_path) == stamp for file_path, stamp in self.paths)
+
+
+class _Flight:
+    """
+    Internal class that represents a value being computed, so concurrent callers wait for it instead of computing it
+    again.
+    """
+
+    __slots__ = ('event', 'owner', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.owner = threading.get_ident()
+        self.value = None
+        self.error = None           # type: BaseException | None
+
+
+class MemoCache:
+    """
+    Thread-safe cache with optional LRU (maximum size) and TTL (time to live) policies.
+    Entries can be tagged and can depend on file paths: entries are invalidated when the modification time or size
+    of any of their paths change.
+    """
+
+    def __init__(self, max_size: int | None = DEFAULT_MAX_SIZE, ttl: float | None = None, name: str | None = None):
+        """
+        Constructor.
+
+        :param int or None max_size: maximum number of entries. If None, cache is unbounded.
+        :param float or None ttl: seconds entries are valid for. If None, entries never expire.
+        :param str or None name: optional cache name. Named caches are registered, so their statistics can be
+            retrieved with cache_statistics function.
+        """
+
+        super().__init__()
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._name = name or f'cache_{id(self)}'
+        self._entries = OrderedDict()           # type: OrderedDict[Hashable, _CacheEntry]
+        self._flights = {}                      # type: dict[Hashable, _Flight]
+        self._stats = CacheStats()
+        self._lock = threading.RLock()
+        _CACHES[self._name] = self
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}(name={self._name}, size={len(self._entries)})> object at {hex(id(self))}'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def max_size(self) -> int | None:
+        return self._max_size
+
+    @property
+    def ttl(self) -> float | None:
+        return self._ttl
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """
+        Returns the cached value with given key.
+
+        :param Hashable key: cache key.
+        :param Any default: value to return if no valid value is cached.
+        :param bool count: whether to update hit/miss statistics.
+        :return: cached value.
+        :rtype: Any
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_valid(time.monotonic()):
+                del self._entries[key]
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self._stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            if count:
+                self._stats.hits += 1
+
+            return entry.value
+
+    def set(
+            self, key: Hashable, value: Any, tags: Iterable[str] = (), paths: Iterable[str] = (),
+            path_stamps: Iterable[tuple[str, tuple[int, int] | None]] | None = None):
+        """
+        Caches given value.
+
+        :param Hashable key: cache key.
+        :param Any value: value to cache.
+        :param Iterable[str] tags: tags used to invalidate the entry with invalidate_tag function.
+        :param Iterable[str] paths: paths the value depends on. Entry is invalidated when any of them changes.
+        :param Iterable[tuple[str, tuple[int, int] or None]] or None path_stamps: paths the value depends on along with
+            their stamps (as returned by path_stamp function), used instead of paths when the stamps were read before
+            computing the value.
+        """
+
+        if path_stamps is None:
+            path_stamps = ((file_path, path_stamp(file_path)) for file_path in paths)
+        entry = _CacheEntry(
+            value, time.monotonic() + self._ttl if self._ttl is not None else None, frozenset(tags),
+            tuple(path_stamps))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if self._max_size is not None:
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._stats.evictions += 1
+
+    def get_or_compute(
+            self, key: Hashable, function: Callable[[], Any], tags: Iterable[str] = (),
+            paths: Iterable[str] | Callable[[], Iterable[str]] = ()) -> Any:
+        """
+        Returns the cached value with given key, computing and caching it if necessary.
+        If the value is being computed by another thread, this function waits for its result instead of computing it
+        again.
+
+        :param Hashable key: cache key.
+        :param Callable[[], Any] function: function that computes the value.
+        :param Iterable[str] tags: tags of the entry.
+        :param Iterable[str] or Callable[[], Iterable[str]] paths: paths the value depends on (or function returning
+            them). Path stamps are read before computing the value, so changes done while computing invalidate it.
+        :return: cached or computed value.
+        :rtype: Any
+        """
+
+        with self._lock:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            else:
+                leader = False
+                if flight.owner != threading.get_ident():
+                    self._stats.waits += 1
+
+        if not leader:
+            if flight.owner == threading.get_ident():
+                # recursive call for the same key within the computing thread
+                return function()
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            paths = list(paths() if callable(paths) else paths)
+            stamps = [(file_path, path_stamp(file_path)) for file_path in paths]
+            flight.value = function()
+            self.set(key, flight.value, tags=tags, path_stamps=stamps)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Removes the entry with given key.
+
+        :param Hashable key: cache key.
+        :return: True if entry was cached; False otherwise.
+        :rtype: bool
+        """
+
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return False
+            self._stats.invalidations += 1
+
+        return True
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Removes all entries with given tag.
+
+        :param str tag: entry tag.
+        :return: number of removed entries.
+        :rtype: int
+        """
+
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if tag in entry.tags]
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+
+        return len(keys)
+
+    def invalidate_path(self, file_path: str) -> int:
+        """
+        Removes all entries that depend on the given path, even if the path did not change.
+
+        :param str file_path: file or directory path.
+        :return: number of removed entries.
+        :rtype: int
+        """
+
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if any(
+                dependency == file_path for dependency, _ in entry.paths)]
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+
+        return len(keys)
+
+    def clear(self):
+        """
+        Removes all entries. Statistics are kept.
+        """
+
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+
+def memoize(
+        max_size: int | None = DEFAULT_MAX_SIZE, ttl: float | None = None, tags: Iterable[str] = (),
+        paths: Callable[..., Iterable[str]] | None = None, typed: bool = False, name: str | None = None) -> Callable:
+    """
+    Decorator that caches the results of the decorated function, keyed by its positional and keyword arguments.
+    Decorated function exposes its cache through the `cache` attribute, plus `cache_clear`, `cache_info` and
+    `invalidate` functions.
+
+    :param int or None max_size: maximum number of cached results. If None, cache is unbounded.
+    :param float or None ttl: seconds results are valid for. If None, results never expire.
+    :param Iterable[str] tags: tags of all cached results.
+    :param Callable[..., Iterable[str]] or None paths: optional function that receives the same arguments as the
+        decorated function and returns the paths the result depends on. Results are invalidated when any of those
+        paths change.
+    :param bool typed: whether arguments of different types are cached separately.
+    :param str or None name: cache name. If not given, decorated function qualified name is used.
+    :return: decorator.
+    :rtype: Callable
+
+    ..code-block:: python
+        @memoize(max_size=64, paths=lambda file_path: [file_path])
+        def read_settings(file_path):
+            ...
+    """
+
+    tags = tuple(tags)
+
+    def decorator(fn: Callable) -> Callable:
+        cache = MemoCache(max_size=max_size, ttl=ttl, name=name or f'{fn.__module__}.{fn.__qualname__}')
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                key = make_key(args, kwargs, typed=typed)
+            except TypeError:
+                # arguments that cannot be used as a cache key are never cached
+                return fn(*args, **kwargs)
+            return cache.get_or_compute(
+                key, lambda: fn(*args, **kwargs), tags=tags,
+                paths=(lambda: paths(*args, **kwargs)) if paths is not None else ())
+
+        def invalidate(*args, **kwargs) -> bool:
+            try:
+                return cache.invalidate(make_key(args, kwargs, typed=typed))
+            except TypeError:
+                return False
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.stats.to_dict
+        wrapper.invalidate = invalidate
+
+        return wrapper
+
+    return decorator
+
+
+def caches() -> list[MemoCache]:
+    """
+    Returns all alive registered caches.
+
+    :return: list of caches.
+    :rtype: list[MemoCache]
+    """
+
+    return list(_CACHES.values())
+
+
+def cache_statistics() -> dict[str, dict]:
+    """
+    Returns the statistics of all alive registered caches, sorted by number of hits.
+
+    :return: dictionary with the statistics of each cache name.
+    :rtype: dict[str, dict]
+    """
+
+    statistics = {cache.name: dict(cache.stats.to_dict(), size=len(cache)) for cache in caches()}
+    return dict(sorted(statistics.items(), key=lambda item: item[1]['hits'], reverse=True))
+
+
+def invalidate_tag(tag: str) -> int:
+    """
+    Removes the entries with given tag from all registered caches.
+
+    :param str tag: entry tag.
+    :return: number of removed entries.
+    :rtype: int
+    """
+
+    return sum(cache.invalidate_tag(tag) for cache in caches())
+
+
+def invalidate_path(file_path: str) -> int:
+    """
+    Removes the entries that depend on given path from all registered caches.
+
+    :param str file_path: file or directory path.
+    :return: number of removed entries.
+    :rtype: int
+    """
+
+    return sum(cache.invalidate_path(file_path) for cache in caches())
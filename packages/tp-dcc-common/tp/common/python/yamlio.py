@@ -14,10 +14,16 @@ import yaml
 import yaml.representer
 
 from tp.core import log
-from tp.common.python import yamlordereddictloader
+from tp.common.python import fileio, yamlordereddictloader
 
 logger = log.tpLogger
 
+# libyaml based loaders and dumpers are used when PyYAML was built with libyaml support
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+Dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+OrderedLoader = yamlordereddictloader.CLoader
+
 
 def validate_yaml(dictionary: Dict) -> bool:
     """
@@ -35,30 +41,49 @@ def validate_yaml(dictionary: Dict) -> bool:
         return False
 
 
+def dumps(data: Dict, **kwargs) -> str:
+    """
+    Serializes given data into a YAML string. Safe dumper is used unless data contains Python objects not supported by
+    it or a custom dumper is given.
+
+    :param Dict data: data to serialize.
+    :return: YAML string.
+    :rtype: str
+    """
+
+    dumper = kwargs.pop('Dumper', None)
+    kwargs['indent'] = kwargs.pop('indent', 2)
+    kwargs['default_flow_style'] = kwargs.pop('default_flow_style', False)
+    kwargs['width'] = kwargs.pop('width', 200)
+    if kwargs.pop('compact', False):
+        kwargs['default_flow_style'] = True
+        kwargs['width'] = 2 ** 31 - 1
+
+    if dumper:
+        return yaml.dump(data, Dumper=dumper, **kwargs)
+    try:
+        return yaml.dump(data, Dumper=SafeDumper, **kwargs)
+    except yaml.representer.RepresenterError:
+        return yaml.dump(data, Dumper=Dumper, **kwargs)
+
+
 def write_to_file(data: Dict, filename: str, **kwargs) -> str | None:
     """
     Writes data to YAML file.
+    File is written atomically: data is serialized and written into a temporary file that replaces the target one once
+    finished, so readers never see a partially written file.
 
     :param Dict data: data to store into YAML file.
     :param str filename: name of the YAML file we want to store data into.
     :return: file name of the stored file.
     :rtype: str
-    """
 
-    indent = kwargs.pop('indent', 2)
-    dumper = kwargs.pop('Dumper', None)
-    kwargs['default_flow_style'] = kwargs.pop('default_flow_style', False)
-    kwargs['width'] = kwargs.pop('width', 200)
+    ..note:: compact keyword argument can be used to write files that are only read by tools in flow style.
+    """
 
     try:
-        with open(filename, 'w') as yaml_file:
-            if not dumper:
-                try:
-                    yaml.safe_dump(data, yaml_file, indent=indent, **kwargs)
-                except yaml.representer.RepresenterError:
-                    yaml.dump(data, yaml_file, indent=indent, **kwargs)
-            else:
-                yaml.dump(data, yaml_file, indent=indent, Dumper=dumper, **kwargs)
+        with fileio.atomic_write(filename, 'w') as yaml_file:
+            yaml_file.write(dumps(data, **kwargs))
     except IOError:
         logger.error('Data not saved to file {}'.format(filename))
         return None
@@ -84,9 +109,9 @@ def read_file(filename: str, maintain_order: bool = False) -> Dict | None:
         try:
             with open(filename, 'r') as yaml_file:
                 if maintain_order:
-                    data = yaml.load(yaml_file, Loader=yamlordereddictloader.Loader)
+                    data = yaml.load(yaml_file, Loader=OrderedLoader)
                 else:
-                    data = yaml.safe_load(yaml_file)
+                    data = yaml.load(yaml_file, Loader=SafeLoader)
         except Exception as exc:
             logger.warning('Could not read {} : {}'.format(filename, exc))
             return None
@@ -71,6 +71,43 @@ class SafeLoader(yaml.SafeLoader):
     construct_mapping = construct_mapping
 
 
+if hasattr(yaml, 'CLoader'):
+    class CLoader(yaml.CLoader):
+        """
+        Loader that keeps keys order and uses libyaml C parser.
+        """
+
+        def __init__(self, *args, **kwargs):
+            yaml.CLoader.__init__(self, *args, **kwargs)
+
+            self.add_constructor(
+                'tag:yaml.org,2002:map', type(self).construct_yaml_map)
+            self.add_constructor(
+                'tag:yaml.org,2002:omap', type(self).construct_yaml_map)
+
+        construct_yaml_map = construct_yaml_map
+        construct_mapping = construct_mapping
+
+    class CSafeLoader(yaml.CSafeLoader):
+        """
+        Safe loader that keeps keys order and uses libyaml C parser.
+        """
+
+        def __init__(self, *args, **kwargs):
+            yaml.CSafeLoader.__init__(self, *args, **kwargs)
+
+            self.add_constructor(
+                'tag:yaml.org,2002:map', type(self).construct_yaml_map)
+            self.add_constructor(
+                'tag:yaml.org,2002:omap', type(self).construct_yaml_map)
+
+        construct_yaml_map = construct_yaml_map
+        construct_mapping = construct_mapping
+else:
+    CLoader = Loader
+    CSafeLoader = SafeLoader
+
+
 #
 # Dumpers
 #
@@ -25,6 +25,8 @@ class BaseDataSource(QObject):
 		self._model = model
 		self._parent = parent
 		self._children = list()			# type: list[Any]
+		self._row_cache = dict()			# type: dict[int, int]
+		self._row_cache_start = 0
 		self._column_index = 0
 		self._font = None
 		self._uid = str(uuid.uuid4())
@@ -115,7 +117,7 @@ class BaseDataSource(QObject):
 
 		if self._parent is not None:
 			try:
-				self._parent.children.remove(self)
+				self._parent.remove_row_data_source(self._parent.child_row(self))
 			except ValueError:
 				pass
 		self.model = parent_source.model
@@ -148,11 +150,12 @@ class BaseDataSource(QObject):
 		:rtype: bool
 		"""
 
-		if child in self._children:
+		if self.has_child(child):
 			return False
 
 		child.model = self.model
 		self._children.insert(index, child)
+		self.invalidate_rows(index)
 		return True
 
 	def insert_children(self, index: int, children: list[BaseDataSource]):
@@ -166,6 +169,7 @@ class BaseDataSource(QObject):
 		for child in children:
 			child.model = self.model
 		self._children[index:index] = children
+		self.invalidate_rows(index)
 
 	def index(self) -> int:
 		"""
@@ -177,7 +181,58 @@ class BaseDataSource(QObject):
 
 		parent = self.parent_source()
 
-		return parent.children.index(self) if parent is not None and parent.children else 0
+		return parent.child_row(self) if parent is not None and parent.children else 0
+
+	def child_row(self, child: Any) -> int:
+		"""
+		Returns the row of the given child within this data source.
+		Rows are cached, so this is a constant time operation unless children changed since last query.
+
+		:param Any child: child to get row of.
+		:return: child row.
+		:rtype: int
+		:raises ValueError: if given child is not a child of this data source.
+		"""
+
+		row = self._cached_row(child)
+		if row == -1:
+			raise ValueError(f'{child} is not a child of {self}')
+
+		return row
+
+	def has_child(self, child: Any) -> bool:
+		"""
+		Returns whether given child is a child of this data source.
+
+		:param Any child: child to check.
+		:return: True if given child is a child of this data source; False otherwise.
+		:rtype: bool
+		"""
+
+		return self._cached_row(child) != -1
+
+	def invalidate_rows(self, start: int = 0):
+		"""
+		Invalidates the cached rows of the children starting at the given row.
+		Must be called when children are inserted, removed or reordered.
+
+		:param int start: first row whose cache is no longer valid.
+		"""
+
+		self._row_cache_start = max(0, min(self._row_cache_start, start))
+		if self._row_cache_start == 0:
+			self._row_cache.clear()
+
+	def sort_children(self, key: Any = None, reverse: bool = False):
+		"""
+		Sorts the children of this data source.
+
+		:param Any key: optional function used to extract the comparison key from each child.
+		:param bool reverse: whether to sort children in descending order.
+		"""
+
+		self.children.sort(key=key, reverse=reverse)
+		self.invalidate_rows(0)
 
 	def model_index(self) -> QModelIndex:
 		"""
@@ -225,11 +280,14 @@ class BaseDataSource(QObject):
 		:rtype: BaseDataSource or None
 		"""
 
-		if child in self._children:
+		if self.has_child(child):
 			return None
 
 		child.model = self.model
 		self._children.append(child)
+		if self._row_cache_start == len(self._children) - 1:
+			self._row_cache[id(child)] = self._row_cache_start
+			self._row_cache_start += 1
 
 		return child
 
@@ -335,7 +393,9 @@ class BaseDataSource(QObject):
 		"""
 
 		if index < self.row_count():
+			self._row_cache.pop(id(self._children[index]), None)
 			del self._children[index]
+			self.invalidate_rows(index)
 			return True
 
 		return False
@@ -351,7 +411,10 @@ class BaseDataSource(QObject):
 		"""
 
 		if index < self.row_count():
-			self._children = self._children[:index] + self._children[index + count:]
+			for child in self._children[index:index + count]:
+				self._row_cache.pop(id(child), None)
+			del self._children[index:index + count]
+			self.invalidate_rows(index)
 			return True
 
 		return False
@@ -550,6 +613,7 @@ class BaseDataSource(QObject):
 		"""
 
 		self._children = objects
+		self.invalidate_rows(0)
 
 	def user_object(self, index: int) -> Any:
 		"""
@@ -637,6 +701,40 @@ class BaseDataSource(QObject):
 		return delegates.HtmlDelegate(parent)
 
 
+	def _cached_row(self, child: Any) -> int:
+		"""
+		Internal function that returns the cached row of the given child, updating the rows that were invalidated.
+		Cache is kept up to date by the functions that modify children, so a child that is not cached is not a child
+		of this data source.
+
+		:param Any child: child to get row of.
+		:return: child row or -1 if the child is not found.
+		:rtype: int
+		"""
+
+		children = self._children
+		row_cache = self._row_cache
+		if self._row_cache_start > len(children):
+			# children were removed without using data source functions
+			self.invalidate_rows(0)
+		for i in range(self._row_cache_start, len(children)):
+			row_cache[id(children[i])] = i
+		self._row_cache_start = len(children)
+
+		row = row_cache.get(id(child))
+		if row is None:
+			return -1
+		if row < len(children) and children[row] is child:
+			return row
+
+		# children were reordered without using data source functions, so all rows are cached again
+		row_cache.clear()
+		for i, found_child in enumerate(children):
+			row_cache[id(found_child)] = i
+
+		return row_cache.get(id(child), -1)
+
+
 class ColumnDataSource(BaseDataSource):
 	def __init__(
 			self, header_text: str = '', model: QAbstractItemModel | None = None, parent: BaseDataSource | None = None):
@@ -1,27 +1,111 @@
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from overrides import override
-from Qt.QtCore import Qt, QRegularExpression, QModelIndex, QAbstractItemModel, QSortFilterProxyModel
+from Qt.QtCore import Qt, Signal, QTimer, QRegularExpression, QModelIndex, QAbstractItemModel, QSortFilterProxyModel
 from Qt.QtWidgets import QWidget
 
+try:
+	from Qt.QtCore import QRegExp
+except ImportError:
+	# QRegExp does not exist in Qt6, where proxy models only use QRegularExpression
+	QRegExp = None
+
 from tp.common.qt.models import datasources, treemodel, tablemodel
 
+_REGEX_SPECIAL_CHARACTERS = frozenset('\\^$.|?*+()[]{}')
+
+
+def _filter_expression(proxy_model: QSortFilterProxyModel) -> QRegExp | QRegularExpression:
+	"""
+	Internal function that returns a case-insensitive copy of the filter regular expression of the given proxy model.
+
+	:param QSortFilterProxyModel proxy_model: proxy model.
+	:return: filter regular expression.
+	:rtype: QRegExp or QRegularExpression
+	"""
+
+	if QRegExp is not None:
+		search_exp = proxy_model.filterRegExp()
+		search_exp.setCaseSensitivity(Qt.CaseInsensitive)
+		return search_exp
+
+	search_exp = QRegularExpression(proxy_model.filterRegularExpression())
+	search_exp.setPatternOptions(search_exp.patternOptions() | QRegularExpression.CaseInsensitiveOption)
+	return search_exp
+
+
+def _expression_matches(search_exp: QRegExp | QRegularExpression, text: str) -> bool:
+	"""
+	Internal function that returns whether given regular expression matches the given text.
+
+	:param QRegExp or QRegularExpression search_exp: regular expression.
+	:param str text: text to match.
+	:return: True if text matches; False otherwise.
+	:rtype: bool
+	"""
+
+	if QRegExp is not None and isinstance(search_exp, QRegExp):
+		return search_exp.indexIn(text) != -1
+
+	return search_exp.match(text).hasMatch()
+
 
 class LeafTreeFilterProxyModel(QSortFilterProxyModel):
+	"""
+	Custom filter proxy model that keeps an item visible if the item or any of its descendants matches the filter.
+	Match results are cached per filter pattern, so each item is only evaluated once while the pattern does not change.
+	"""
+
+	# default delay (in milliseconds) used to wait for filter text changes before filtering.
+	FILTER_DEBOUNCE_INTERVAL = 150
+
 	def __init__(self, sort: bool = True, parent: QWidget | None = None):
 		super().__init__(parent)
 
+		self._match_cache = dict()				# type: dict[int, bool]
+		self._match_key = None					# type: tuple | None
+		self._matcher = None					# type: Callable[[Any], bool] | None
+		self._pending_filter_text = ''
+
+		self._filter_timer = QTimer(self)
+		self._filter_timer.setSingleShot(True)
+		self._filter_timer.setInterval(self.FILTER_DEBOUNCE_INTERVAL)
+		self._filter_timer.timeout.connect(self._on_filter_timer_timeout)
+
 		self.setSortCaseSensitivity(Qt.CaseInsensitive)
 
 		if sort:
 			self.setDynamicSortFilter(True)
 			self.setFilterKeyColumn(0)
 
+	@override
+	def setSourceModel(self, source_model: QAbstractItemModel) -> None:
+		current_model = self.sourceModel()
+		if current_model is not None:
+			for signal in self._source_model_signals(current_model):
+				try:
+					signal.disconnect(self.clear_match_cache)
+				except (RuntimeError, TypeError):
+					pass
+			try:
+				current_model.dataChanged.disconnect(self._on_source_data_changed)
+			except (RuntimeError, TypeError):
+				pass
+
+		super().setSourceModel(source_model)
+
+		self.clear_match_cache()
+		if source_model is not None:
+			for signal in self._source_model_signals(source_model):
+				signal.connect(self.clear_match_cache)
+			source_model.dataChanged.connect(self._on_source_data_changed)
+
 	@override
 	def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
-		search_exp = self.filterRegExp()					# type: QRegExp
-		search_exp.setCaseSensitivity(Qt.CaseInsensitive)
-		if search_exp.isEmpty():
+		search_exp = _filter_expression(self)
+		if not search_exp.pattern():
 			return True
 
 		# check item and its children to see if we should keep or cull
@@ -29,36 +113,174 @@ class LeafTreeFilterProxyModel(QSortFilterProxyModel):
 		if not source_parent.isValid():
 			item = model.root.child(source_row)				# type: datasources.BaseDataSource
 		else:
-			model_index = source_parent.child(source_row, self.filterKeyColumn())
+			model_index = model.index(source_row, self.filterKeyColumn(), source_parent)
 			item = model.item_from_index(model_index)		# type: datasources.BaseDataSource
 
-		return self._match(search_exp, item, self.filterKeyColumn())
+		self._update_match_cache(search_exp)
+
+		return self._match(item, self.filterKeyColumn())
 
 	@override
 	def setFilterFixedString(self, pattern: str) -> None:
 		return super().setFilterFixedString(pattern if len(pattern) >= 2 else '')
 
-	def _match(self, search_expr: QRegularExpression, item: datasources.BaseDataSource, column: int) -> bool:
+	def filter_debounce_interval(self) -> int:
+		"""
+		Returns the delay (in milliseconds) used to wait for filter text changes before filtering.
+
+		:return: debounce interval in milliseconds.
+		:rtype: int
+		"""
+
+		return self._filter_timer.interval()
+
+	def set_filter_debounce_interval(self, interval: int):
+		"""
+		Sets the delay (in milliseconds) used to wait for filter text changes before filtering.
+
+		:param int interval: debounce interval in milliseconds. If 0, filter text is applied immediately.
+		"""
+
+		self._filter_timer.setInterval(max(0, interval))
+
+	def set_filter_text(self, text: str):
+		"""
+		Sets the regular expression filter text. Rapid consecutive calls (for example, while the user is typing within
+		a search field) are debounced, so filtering only happens once the text stops changing.
+
+		:param str text: filter text.
+		"""
+
+		self._pending_filter_text = text
+		if self._filter_timer.interval() <= 0:
+			self._filter_timer.stop()
+			self._on_filter_timer_timeout()
+		else:
+			self._filter_timer.start()
+
+	def clear_match_cache(self, *args):
+		"""
+		Clears cached match results. Must be called when source model items are modified.
+		"""
+
+		self._match_cache.clear()
+
+	@staticmethod
+	def _source_model_signals(source_model: QAbstractItemModel) -> list[Signal]:
+		"""
+		Internal function that returns the source model signals that invalidate cached match results.
+
+		:param QAbstractItemModel source_model: source model.
+		:return: list of signals.
+		:rtype: list[Signal]
+		"""
+
+		return [
+			source_model.rowsAboutToBeInserted, source_model.rowsAboutToBeRemoved, source_model.rowsAboutToBeMoved,
+			source_model.layoutAboutToBeChanged, source_model.modelAboutToBeReset]
+
+	@staticmethod
+	def _is_literal(pattern: str, syntax: QRegExp.PatternSyntax | None) -> bool:
+		"""
+		Internal function that returns whether given pattern matches text literally.
+
+		:param str pattern: filter pattern.
+		:param QRegExp.PatternSyntax or None syntax: filter pattern syntax (None for QRegularExpression patterns).
+		:return: True if pattern has no special characters; False otherwise.
+		:rtype: bool
+		"""
+
+		if QRegExp is not None and syntax == QRegExp.FixedString:
+			return True
+
+		return not any(char in _REGEX_SPECIAL_CHARACTERS for char in pattern)
+
+	def _update_match_cache(self, search_exp: QRegExp | QRegularExpression):
+		"""
+		Internal function that updates cached match results if given regular expression changed.
+		When the new literal pattern contains the previous one, items that did not match the previous pattern cannot
+		match the new one, so only those results are kept and the rest of items are evaluated again.
+
+		:param QRegExp or QRegularExpression search_exp: filter regular expression.
 		"""
-		Internal function that recursively checks whether the given regex expression matches the given item
-		or its children.
 
-		:param QRegularExpression search_expr: regular expression to match.
+		pattern = search_exp.pattern()
+		syntax = search_exp.patternSyntax() if QRegExp is not None and isinstance(search_exp, QRegExp) else None
+		match_key = (pattern, syntax, self.filterKeyColumn())
+		if match_key == self._match_key:
+			return
+
+		previous_key = self._match_key
+		if previous_key is not None and previous_key[1:] == match_key[1:] and self._is_literal(
+				previous_key[0], syntax) and self._is_literal(pattern, syntax) and \
+				previous_key[0].lower() in pattern.lower():
+			self._match_cache = {item_id: result for item_id, result in self._match_cache.items() if not result}
+		else:
+			self._match_cache.clear()
+
+		self._match_key = match_key
+		if self._is_literal(pattern, syntax):
+			needle = pattern.lower()
+			self._matcher = lambda data: data is not None and needle in str(data).lower()
+		else:
+			self._matcher = lambda data: data is not None and _expression_matches(search_exp, str(data))
+
+	def _match(self, item: datasources.BaseDataSource, column: int) -> bool:
+		"""
+		Internal function that checks whether the current filter matches the given item or any of its descendants.
+		Hierarchy is traversed once in a bottom-up pass, caching the result of every visited item.
+
 		:param datasource.BaseDataSource item: data source item.
 		:param int column: filter key column index.
-		:return: True if item matches regular expression; False otherwise.
+		:return: True if item or any of its descendants matches the filter; False otherwise.
 		:rtype: bool
 		"""
 
-		match = search_expr.match(item.data(column))
-		if match.hasMatch():
-			return True
-		for index in range(item.row_count()):
-			child_item = item.child(index)
-			if self._match(search_expr, child_item, column):
-				return True
+		cache = self._match_cache
+		result = cache.get(id(item))
+		if result is not None:
+			return result
 
-		return False
+		matcher = self._matcher
+		stack = [(item, False)]
+		while stack:
+			current_item, children_visited = stack.pop()
+			current_id = id(current_item)
+			if current_id in cache:
+				continue
+			if children_visited:
+				cache[current_id] = any(
+					cache.get(id(current_item.child(i)), False) for i in range(current_item.row_count()))
+				continue
+			if matcher(current_item.data(column)):
+				cache[current_id] = True
+				continue
+			stack.append((current_item, True))
+			for i in range(current_item.row_count()):
+				child_item = current_item.child(i)
+				if id(child_item) not in cache:
+					stack.append((child_item, False))
+
+		return cache[id(item)]
+
+	def _on_filter_timer_timeout(self):
+		"""
+		Internal callback function that is called when filter text stops changing.
+		"""
+
+		if QRegExp is not None:
+			self.setFilterRegExp(self._pending_filter_text)
+		else:
+			self.setFilterRegularExpression(self._pending_filter_text)
+
+	def _on_source_data_changed(self, *args):
+		"""
+		Internal callback function that is called when source model data changes.
+		"""
+
+		self.clear_match_cache()
+		if _filter_expression(self).pattern():
+			self.invalidateFilter()
 
 
 class TableFilterProxyModel(QSortFilterProxyModel):
@@ -76,9 +298,8 @@ class TableFilterProxyModel(QSortFilterProxyModel):
 
 	@override
 	def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
-		search_exp = self.filterRegExp()
-		search_exp.setCaseSensitivity(Qt.CaseInsensitive)
-		if search_exp.isEmpty():
+		search_exp = _filter_expression(self)
+		if not search_exp.pattern():
 			return True
 		model = self.sourceModel()						# type: tablemodel.BaseTableModel
 		column = self.filterKeyColumn()
@@ -86,7 +307,7 @@ class TableFilterProxyModel(QSortFilterProxyModel):
 			data = model.row_data_source.data(source_row)
 		else:
 			data = model.column_data_sources[column - 1].data(model.row_data_source, source_row)
-		if search_exp.indexIn(str(data)) != -1:
+		if _expression_matches(search_exp, str(data)):
 			return True
 
 		return False
@@ -314,6 +314,67 @@ class BaseTreeModel(QAbstractItemModel):
 
 		self.modelReset.emit()
 
+	def insert_data_sources(
+			self, row: int, data_sources: List[datasources.BaseDataSource],
+			parent: QModelIndex = QModelIndex()) -> bool:
+		"""
+		Inserts given data sources under the given parent emitting a single insertion notification.
+
+		:param int row: row where data sources will be inserted.
+		:param List[datasources.BaseDataSource] data_sources: data sources to insert.
+		:param QModelIndex parent: parent model index.
+		:return: True if the insertion operation was successful; False otherwise.
+		:rtype: bool
+		"""
+
+		if not data_sources:
+			return False
+
+		parent_item = self.item_from_index(parent)
+		position = max(0, min(parent_item.row_count(), row))
+		self.beginInsertRows(parent, position, position + len(data_sources) - 1)
+		parent_item.insert_children(position, data_sources)
+		for data_source in data_sources:
+			data_source._parent = parent_item
+		self.endInsertRows()
+
+		return True
+
+	def remove_data_sources(self, data_sources: List[datasources.BaseDataSource]) -> bool:
+		"""
+		Removes given data sources from the model.
+		Data sources are grouped by parent into contiguous row blocks, and each block is removed with a single
+		removal notification, from the bottom to the top so the rows of pending blocks remain valid.
+
+		:param List[datasources.BaseDataSource] data_sources: data sources to remove.
+		:return: True if all data sources were removed successfully; False otherwise.
+		:rtype: bool
+		"""
+
+		rows_by_parent = {}
+		for data_source in data_sources:
+			parent_item = data_source.parent_source()
+			if parent_item is None:
+				continue
+			rows_by_parent.setdefault(id(parent_item), (parent_item, set()))[1].add(data_source.index())
+
+		result = True
+		for parent_item, rows in rows_by_parent.values():
+			blocks = []
+			for row in sorted(rows):
+				if blocks and blocks[-1][1] == row - 1:
+					blocks[-1][1] = row
+				else:
+					blocks.append([row, row])
+			parent_index = QModelIndex() if parent_item is self.root else self.createIndex(
+				parent_item.index(), 0, parent_item)
+			for first_row, last_row in reversed(blocks):
+				self.beginRemoveRows(parent_index, first_row, last_row)
+				result = parent_item.remove_row_data_sources(first_row, last_row - first_row + 1) and result
+				self.endRemoveRows()
+
+		return result
+
 	def item_from_index(self, index: QModelIndex) -> datasources.BaseDataSource | None:
 		"""
 		Returns the data source for the given model index.
@@ -288,7 +288,7 @@ class ExtendedTreeView(QFrame):
 		Internal function that connects signals.
 		"""
 
-		self._search_edit.textChanged.connect(self._proxy_search.setFilterRegExp)
+		self._search_edit.textChanged.connect(self._proxy_search.set_filter_text)
 		selection_model = self.selection_model()
 		selection_model.selectionChanged.connect(self._on_selection_changed)
 		self._tree_view.header().setContextMenuPolicy(Qt.CustomContextMenu)
@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+
+from tp.core import telemetry
+
+
+class BlockingStore:
+    def __init__(self):
+        self.release = threading.Event()
+        self.written = []
+
+    def write(self, aggregates):
+        self.release.wait(5.0)
+        self.written.extend(aggregates)
+
+
+def test_percentile_nearest_rank():
+    values = [float(i) for i in range(1, 11)]
+    assert telemetry.percentile(values, 0.5) == 5.0
+    assert telemetry.percentile(values, 0.95) == 10.0
+    assert telemetry.percentile(values, 0.1) == 1.0
+    assert telemetry.percentile(values, 0.0) == 1.0
+    assert telemetry.percentile(values, 1.0) == 10.0
+    assert telemetry.percentile([1.0, 2.0, 3.0, 4.0], 0.25) == 1.0
+    assert telemetry.percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert telemetry.percentile([], 0.5) == 0.0
+
+
+def test_record_does_not_wait_for_store():
+    store = BlockingStore()
+    command_telemetry = telemetry.CommandTelemetry(store=store, flush_interval=0.0)
+
+    # store blocks until released, so record would never return if it flushed synchronously
+    command_telemetry.record('tp.command', 0.1)
+    command_telemetry.record('tp.command', 0.2)
+    assert not store.written
+    assert command_telemetry.summary('tp.command')[0]['count'] == 2
+
+    store.release.set()
+    command_telemetry.flush()
+    assert sum(data['count'] for data in store.written) == 2
+
+
+def test_store_closes_connections(tmp_path, monkeypatch):
+    connections = []
+    connect = sqlite3.connect
+
+    class TrackedConnection(sqlite3.Connection):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    def _connect(file_path):
+        connection = connect(file_path, factory=TrackedConnection)
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(telemetry.sqlite3, 'connect', _connect)
+    store = telemetry.CommandTelemetryStore(str(tmp_path / 'telemetry.db'))
+    command_telemetry = telemetry.CommandTelemetry(store=store)
+    command_telemetry.record('tp.command', 0.5)
+    command_telemetry.record('tp.command', 1.5, trace='Traceback')
+    command_telemetry.flush()
+
+    totals = store.totals()
+    assert totals[0]['id'] == 'tp.command'
+    assert totals[0]['count'] == 2 and totals[0]['failures'] == 1
+    assert connections and all(connection.closed for connection in connections)
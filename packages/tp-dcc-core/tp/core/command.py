@@ -9,15 +9,17 @@ from __future__ import annotations
 
 import sys
 import time
+import atexit
 import inspect
 import traceback
-from typing import Any
-from collections import deque
+import functools
+from typing import Iterator, Any
+from contextlib import contextmanager
 from abc import ABCMeta, abstractmethod
 
 from overrides import override
 
-from tp.core import log, exceptions, dcc, output
+from tp.core import log, exceptions, dcc, output, telemetry, commandstack
 from tp.common.python import decorators, osplatform
 from tp.common import plugin
 
@@ -104,6 +106,26 @@ class DccCommandInterface:
 
         pass
 
+    def release(self):
+        """
+        Function that is called when the command is evicted from the command runner undo/redo stacks.
+        Can be overridden by subclasses to free any large data stored by the command.
+        """
+
+        pass
+
+    def approximate_size(self) -> int:
+        """
+        Returns the approximate amount of bytes used by this command, which is used to limit the memory used by
+        command runner undo/redo stacks.
+
+        :return: approximate size in bytes.
+        :rtype: int
+        """
+
+        return commandstack.approximate_size(self) + commandstack.approximate_size(
+            (self._arguments, self._return_result))
+
     def run(self) -> Any:
         """
         Runs `do` function with the current arguments.
@@ -259,12 +281,55 @@ class DccCommand(DccCommandInterface):
         raise exceptions.CommandCancel(msg)
 
 
+@functools.lru_cache(maxsize=None)
+def machine_info() -> dict:
+    """
+    Returns the information of the current machine and application.
+    Information is computed only once per process, because querying some of its values (such as the processor) is slow.
+
+    :return: machine information.
+    :rtype: dict
+    """
+
+    info = {'application': dcc.name()}
+    info.update(osplatform.machine_info())
+
+    return info
+
+
+@functools.lru_cache(maxsize=None)
+def command_class_info(command_class: type[DccCommand]) -> dict:
+    """
+    Returns the static information of the given command class.
+    Information is computed only once per command class.
+
+    :param type[DccCommand] command_class: command class to get information of.
+    :return: command class information.
+    :rtype: dict
+    """
+
+    try:
+        file_path = inspect.getfile(command_class)
+    except TypeError:
+        file_path = ''
+
+    return {
+        'name': command_class.__name__,
+        'creator': command_class.creator,
+        'module': command_class.__module__,
+        'filepath': file_path,
+        'id': command_class.id
+    }
+
+
 class CommandStats:
-    def __init__(self, command: DccCommand):
+    def __init__(self, command: DccCommand | type[DccCommand]):
         self._command = command
         self._start_time = 0.0
         self._end_time = 0.0
         self._execution_time = 0.0
+        self._start_counter = 0.0
+        self._trace = None                  # type: str | None
 
         self._info = {}
 
@@ -290,20 +355,27 @@ class CommandStats:
     def execution_time(self) -> float:
         return self._execution_time
 
+    @property
+    def command_id(self) -> str | None:
+        return self._info.get('id')
+
+    @property
+    def trace(self) -> str | None:
+        return self._trace
+
+    @property
+    def info(self) -> dict:
+        return self._info
+
     def _init(self):
         """
         Internal function that initializes info for the command and its environment.
+        Command class and machine information is cached, so creating stats for each command execution is cheap.
         """
 
-        self._info.update({
-            'name': self._command.__class__.__name__,
-            'creator': self._command.creator,
-            'module': self._command.__class__.__module__,
-            'filepath': inspect.getfile(self._command.__class__),
-            'id': self._command.id,
-            'application': dcc.name()
-        })
-        self._info.update(osplatform.machine_info())
+        command_class = self._command if inspect.isclass(self._command) else self._command.__class__
+        self._info.update(command_class_info(command_class))
+        self._info.update(machine_info())
 
     def start(self):
         """
@@ -311,20 +383,22 @@ class CommandStats:
         """
 
         self._start_time = time.time()
+        self._start_counter = time.perf_counter()
 
-    def finish(self, trace: str | None = None):
+    def finish(self, trace: str | list[str] | None = None):
         """
         Function that is called when plugin finishes its execution.
 
-        :param str or None trace: optional trace stack.
+        :param str or list[str] or None trace: optional trace stack.
         """
 
         self._end_time = time.time()
-        self._execution_time = self._end_time - self._start_time
+        self._execution_time = time.perf_counter() - self._start_counter if self._start_counter else 0.0
         self._info['executionTime'] = self._execution_time
         self._info['lastUsed'] = self._end_time
         if trace:
-            self._info['traceback'] = trace
+            self._trace = ''.join(trace) if isinstance(trace, (list, tuple)) else trace
+            self._info['traceback'] = self._trace
 
 
 class MetaCommandRunner(type):
@@ -346,27 +420,95 @@ class MetaCommandRunner(type):
 
 
 class BaseCommandRunner:
-    def __init__(self, interface: type | None = None, register_env: str = 'TPDCC_COMMAND_LIB'):
+    def __init__(
+            self, interface: type | None = None, register_env: str = 'TPDCC_COMMAND_LIB',
+            undo_depth: int = commandstack.UNDO_STACK_DEPTH, undo_memory: int = commandstack.UNDO_STACK_MEMORY):
         interface = interface or DccCommand
-        self._undo_stack: deque[DccCommand] = deque()
-        self._redo_stack: deque[DccCommand] = deque()
+        self._undo_stack = commandstack.CommandStack(max_depth=undo_depth, max_bytes=undo_memory)
+        self._redo_stack = commandstack.CommandStack(max_depth=undo_depth, max_bytes=undo_memory)
+        self._macro = None                          # type: commandstack.CommandMacro | None
+        self._macro_depth = 0
         self._manager = plugin.PluginFactory(interface, plugin_id='id')
         self._manager.register_paths_from_env_var(register_env, package_name='tp-dcc')
+        self._telemetry = telemetry.CommandTelemetry.from_env()
+        if self._telemetry.store is not None:
+            atexit.register(self._telemetry.flush)
 
     @property
-    def undo_stack(self) -> deque:
+    def undo_stack(self) -> commandstack.CommandStack:
         return self._undo_stack
 
     @property
-    def redo_stack(self) -> deque:
+    def redo_stack(self) -> commandstack.CommandStack:
         return self._redo_stack
 
+    @property
+    def telemetry(self) -> telemetry.CommandTelemetry:
+        return self._telemetry
+
     def commands(self) -> list[DccCommand]:
         return self._manager.plugins()
 
     def manager(self) -> plugin.PluginFactory:
         return self._manager
 
+    def set_undo_limits(self, depth: int | None = None, memory: int | None = None):
+        """
+        Sets the limits of the undo/redo stacks. Oldest entries are evicted if new limits are exceeded.
+
+        :param int or None depth: maximum number of entries per stack. 0 means unlimited.
+        :param int or None memory: maximum approximate amount of bytes per stack. 0 means unlimited.
+        """
+
+        for stack in (self._undo_stack, self._redo_stack):
+            if depth is not None:
+                stack.max_depth = depth
+            if memory is not None:
+                stack.max_bytes = memory
+
+    def begin_macro(self, name: str):
+        """
+        Starts grouping executed commands into a macro, so they are undone as one unit. Nested macros are merged into
+        the outermost one.
+
+        :param str name: macro name.
+        """
+
+        self._macro_depth += 1
+        if self._macro is None:
+            self._macro = commandstack.CommandMacro(name)
+
+    def end_macro(self):
+        """
+        Stops grouping executed commands and pushes the macro into the undo stack if it contains undoable commands.
+        """
+
+        if self._macro_depth == 0:
+            return
+        self._macro_depth -= 1
+        if self._macro_depth > 0:
+            return
+
+        macro, self._macro = self._macro, None
+        if macro.is_undoable:
+            self._push_undo(macro)
+
+    @contextmanager
+    def macro(self, name: str) -> Iterator[commandstack.CommandMacro]:
+        """
+        Context manager that groups all the commands executed within it into a macro.
+
+        :param str name: macro name.
+        :return: opened macro.
+        :rtype: Iterator[commandstack.CommandMacro]
+        """
+
+        self.begin_macro(name)
+        try:
+            yield self._macro
+        finally:
+            self.end_macro()
+
     def run(self, command_id: str, **kwargs: dict) -> Any:
         """
         Run the command with given ID.
@@ -396,11 +538,12 @@ class BaseCommandRunner:
 
         exc_tb, exc_type, exc_value = None, None, None
         result = None
+        cancelled = False
+        command_to_run.stats.start()
         try:
             result = self._run(command_to_run)
         except exceptions.CommandCancel:
-            self._undo_stack.remove(command_to_run)
-            command_to_run.stats.finish(None)
+            cancelled = True
             return result
         except Exception:
             exc_type, exc_value, exc_tb = sys.exc_info()
@@ -409,9 +552,10 @@ class BaseCommandRunner:
             tb = None
             if exc_type and exc_value and exc_tb:
                 tb = traceback.format_exception(exc_type, exc_value, exc_tb)
-            elif command_to_run.is_undoable:
-                self._undo_stack.append(command_to_run)
+            elif command_to_run.is_undoable and not cancelled:
+                self._push_undo(command_to_run)
             command_to_run.stats.finish(tb)
+            self.record_stats(command_to_run.stats)
 
             return result
 
@@ -425,45 +569,50 @@ class BaseCommandRunner:
         if not self._undo_stack:
             return False
 
-        command_to_undo = self._undo_stack[-1]
+        command_to_undo = self._undo_stack.peek()
         if command_to_undo is not None and command_to_undo.is_undoable:
             command_to_undo.undo()
+            self._undo_stack.pop()
             self._redo_stack.append(command_to_undo)
-            self._undo_stack.remove(command_to_undo)
             return True
 
         return False
 
     def redo_last(self) -> Any:
         """
-        Redoes last undo command.
+        Redoes last undo command. If last undo entry is a macro, all its commands are redone.
 
         :return: redo command result.
         :rtype: Any
         """
 
-        exc_tb, exc_type, exc_value = None, None, None
         result = None
-        if self._redo_stack:
-            command_to_redo = self._redo_stack.pop()
-            if command_to_redo is not None:
-                try:
-                    command_to_redo.stats = CommandStats(command_to_redo)
-                    result = self._run(command_to_redo)
-                except exceptions.CommandCancel:
-                    self._undo_stack.remove(command_to_redo)
-                    command_to_redo.stats.finish(None)
-                    raise
-                except Exception:
-                    exc_type, exc_value, exc_tb = sys.exc_info()
-                    raise
-                finally:
-                    tb = None
-                    if exc_type and exc_value and exc_tb:
-                        tb = traceback.format_exception(exc_type, exc_value, exc_tb)
-                    elif command_to_redo.is_undoable:
-                        self._undo_stack.append(command_to_redo)
-                    command_to_redo.stats.finish(tb)
+        if not self._redo_stack:
+            return result
+
+        entry_to_redo = self._redo_stack.pop()
+        if entry_to_redo is None:
+            return result
+
+        commands_to_redo = entry_to_redo if isinstance(entry_to_redo, commandstack.CommandMacro) else [entry_to_redo]
+        for command_to_redo in commands_to_redo:
+            command_to_redo.stats = CommandStats(command_to_redo)
+            command_to_redo.stats.start()
+            try:
+                result = self._run(command_to_redo)
+            except exceptions.CommandCancel:
+                command_to_redo.stats.finish(None)
+                self.record_stats(command_to_redo.stats)
+                raise
+            except Exception:
+                command_to_redo.stats.finish(traceback.format_exc())
+                self.record_stats(command_to_redo.stats)
+                raise
+            command_to_redo.stats.finish(None)
+            self.record_stats(command_to_redo.stats)
+
+        if entry_to_redo.is_undoable:
+            self._undo_stack.append(entry_to_redo)
 
         return result
 
@@ -501,6 +650,18 @@ class BaseCommandRunner:
         {run_help}
         """
 
+    def record_stats(self, stats: CommandStats | None):
+        """
+        Records the given finished command stats within the runner telemetry.
+
+        :param CommandStats or None stats: finished command stats.
+        """
+
+        if stats is None or not stats.command_id:
+            return
+
+        self._telemetry.record(stats.command_id, stats.execution_time, stats.trace)
+
     def flush(self):
         """
         Clears the undo/redo history of the command.
@@ -518,6 +679,36 @@ class BaseCommandRunner:
 
         raise exceptions.CommandCancel(msg)
 
+    def _push_undo(self, entry: DccCommand | commandstack.CommandMacro):
+        """
+        Internal function that pushes given executed command into the undo stack, or into the current macro if a macro
+        is opened. Pushing a new entry into the undo stack invalidates the redo stack.
+
+        :param DccCommand or commandstack.CommandMacro entry: executed command or macro.
+        """
+
+        if self._macro is not None:
+            self._macro.append(entry)
+            return
+
+        self._undo_stack.append(entry)
+        self._redo_stack.clear()
+
+    def _discard_undo(self, entry: DccCommand) -> bool:
+        """
+        Internal function that removes given command if it was the last command pushed into the undo stack or into the
+        current macro.
+
+        :param DccCommand entry: command to remove.
+        :return: True if command was removed; False otherwise.
+        :rtype: bool
+        """
+
+        if self._macro is not None:
+            return self._macro.discard(entry)
+
+        return self._undo_stack.discard(entry)
+
     def _run(self, command_to_run: DccCommand) -> Any:
         """
         Internal function that executes given command.
@@ -0,0 +1,356 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains bounded undo/redo stack implementation used by command runners
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Callable, Iterator, Any
+from collections import deque
+
+from tp.core import log
+
+logger = log.tpLogger
+
+# maximum number of entries kept by default within command runner stacks (0 means unlimited)
+UNDO_STACK_DEPTH = 200
+# maximum approximate amount of bytes kept by default within command runner stacks (0 means unlimited)
+UNDO_STACK_MEMORY = 256 * 1024 * 1024
+# maximum depth used when traversing containers to compute approximate sizes
+SIZE_RECURSION_DEPTH = 4
+
+
+def approximate_size(value: Any, depth: int = SIZE_RECURSION_DEPTH, _seen: set[int] | None = None) -> int:
+    """
+    Returns the approximate amount of bytes used by the given value, including the values it contains.
+    Only built-in containers are traversed; other objects are measured with sys.getsizeof.
+
+    :param Any value: value to get approximate size of.
+    :param int depth: maximum container depth to traverse.
+    :param set[int] or None _seen: IDs of already measured values, so shared values are only measured once.
+    :return: approximate size in bytes.
+    :rtype: int
+    """
+
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    try:
+        size = sys.getsizeof(value)
+    except TypeError:
+        size = 0
+    if depth <= 0:
+        return size
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += approximate_size(key, depth - 1, _seen) + approximate_size(item, depth - 1, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        for item in value:
+            size += approximate_size(item, depth - 1, _seen)
+
+    return size
+
+
+def entry_size(entry: Any) -> int:
+    """
+    Returns the approximate amount of bytes used by the given stack entry.
+    Entries can define an approximate_size function to compute their own size.
+
+    :param Any entry: stack entry.
+    :return: approximate size in bytes.
+    :rtype: int
+    """
+
+    size_function = getattr(entry, 'approximate_size', None)
+    if callable(size_function):
+        return size_function()
+
+    return approximate_size(entry)
+
+
+def release_entry(entry: Any):
+    """
+    Calls the release hook of the given stack entry, if any.
+
+    :param Any entry: stack entry.
+    """
+
+    release_function = getattr(entry, 'release', None)
+    if not callable(release_function):
+        return
+
+    try:
+        release_function()
+    except Exception:
+        logger.exception(f'Unable to release command stack entry: {entry}')
+
+
+class CommandMacro:
+    """
+    Class that groups a batch of commands, so they are stored within command stacks as a single entry and are undone
+    and redone as one unit.
+    """
+
+    id: str | None = None
+    creator = ''
+
+    def __init__(self, name: str):
+        super().__init__()
+
+        self._name = name
+        self._commands = []
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}(name={self._name}, commands={len(self._commands)})> object at {hex(id(self))}'
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._commands)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def commands(self) -> list[Any]:
+        return list(self._commands)
+
+    @property
+    def is_undoable(self) -> bool:
+        return any(command.is_undoable for command in self._commands)
+
+    def append(self, command: Any):
+        """
+        Adds given command into the macro.
+
+        :param Any command: command to add.
+        """
+
+        self._commands.append(command)
+
+    def discard(self, command: Any) -> bool:
+        """
+        Removes given command from the macro if it is the last added command.
+
+        :param Any command: command to remove.
+        :return: True if command was removed; False otherwise.
+        :rtype: bool
+        """
+
+        if not self._commands or self._commands[-1] is not command:
+            return False
+
+        self._commands.pop()
+        return True
+
+    def undo(self):
+        """
+        Undoes all macro commands in reverse order.
+        """
+
+        for command in reversed(self._commands):
+            if command.is_undoable:
+                command.undo()
+
+    def approximate_size(self) -> int:
+        """
+        Returns the approximate amount of bytes used by all macro commands.
+
+        :return: approximate size in bytes.
+        :rtype: int
+        """
+
+        return sys.getsizeof(self) + sum(entry_size(command) for command in self._commands)
+
+    def release(self):
+        """
+        Calls the release hook of all macro commands.
+        """
+
+        for command in self._commands:
+            release_entry(command)
+
+
+class CommandStack:
+    """
+    Class that stores undo or redo entries (commands or command macros) with optional depth and approximate memory
+    limits. When limits are exceeded, oldest entries are evicted and their release hook is called.
+    Push, pop and discard of the last entry are O(1) operations.
+    """
+
+    def __init__(
+            self, max_depth: int = UNDO_STACK_DEPTH, max_bytes: int = UNDO_STACK_MEMORY,
+            size_function: Callable[[Any], int] = entry_size,
+            release_function: Callable[[Any], None] | None = release_entry):
+        """
+        Constructor.
+
+        :param int max_depth: maximum number of entries. 0 means unlimited.
+        :param int max_bytes: maximum approximate amount of bytes used by all entries. 0 means unlimited. Entry sizes
+            are only measured while a memory limit is defined.
+        :param Callable[[Any], int] size_function: function that returns the approximate size of an entry.
+        :param Callable[[Any], None] or None release_function: function called with each evicted or cleared entry.
+        """
+
+        super().__init__()
+
+        self._max_depth = max_depth
+        self._max_bytes = max_bytes
+        self._size_function = size_function
+        self._release_function = release_function
+        self._entries = deque()                 # type: deque[tuple[Any, int]]
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (entry for entry, _ in self._entries)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._entries[index][0]
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, value: int):
+        self._max_depth = value
+        self._trim()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        self._max_bytes = value
+        self._trim()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def peek(self) -> Any:
+        """
+        Returns the last pushed entry without removing it.
+
+        :return: last pushed entry or None if stack is empty.
+        :rtype: Any
+        """
+
+        return self._entries[-1][0] if self._entries else None
+
+    def append(self, entry: Any) -> list[Any]:
+        """
+        Pushes given entry into the stack, evicting the oldest entries if stack limits are exceeded.
+        The pushed entry itself is never evicted, even if it exceeds the memory limit by itself.
+
+        :param Any entry: entry to push.
+        :return: list of evicted entries.
+        :rtype: list[Any]
+        """
+
+        size = self._size_function(entry) if self._max_bytes else 0
+        self._entries.append((entry, size))
+        self._total_bytes += size
+
+        return self._trim()
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the last pushed entry. Entry is not released.
+
+        :return: last pushed entry.
+        :rtype: Any
+        :raises IndexError: if stack is empty.
+        """
+
+        entry, size = self._entries.pop()
+        self._total_bytes -= size
+
+        return entry
+
+    def discard(self, entry: Any) -> bool:
+        """
+        Removes given entry if it is the last pushed entry (for example, when a command is cancelled right after being
+        pushed). Entry is not released.
+
+        :param Any entry: entry to remove.
+        :return: True if entry was removed; False otherwise.
+        :rtype: bool
+        """
+
+        if not self._entries or self._entries[-1][0] is not entry:
+            return False
+
+        self.pop()
+        return True
+
+    def remove(self, entry: Any):
+        """
+        Removes given entry from the stack. Entry is not released.
+        Removing the last pushed entry is O(1); removing any other entry requires a linear search.
+
+        :param Any entry: entry to remove.
+        :raises ValueError: if entry is not within the stack.
+        """
+
+        if self.discard(entry):
+            return
+
+        for i, (stack_entry, size) in enumerate(self._entries):
+            if stack_entry is entry:
+                del self._entries[i]
+                self._total_bytes -= size
+                return
+
+        raise ValueError(f'Entry is not within the stack: {entry}')
+
+    def clear(self, release: bool = True):
+        """
+        Removes all entries from the stack.
+
+        :param bool release: whether to call the release hook of the removed entries.
+        """
+
+        entries = [entry for entry, _ in self._entries]
+        self._entries.clear()
+        self._total_bytes = 0
+        if release and self._release_function is not None:
+            for entry in entries:
+                self._release_function(entry)
+
+    def _trim(self) -> list[Any]:
+        """
+        Internal function that evicts the oldest entries until stack limits are satisfied.
+
+        :return: list of evicted entries.
+        :rtype: list[Any]
+        """
+
+        evicted = []
+        while len(self._entries) > 1 and (
+                (self._max_depth and len(self._entries) > self._max_depth) or
+                (self._max_bytes and self._total_bytes > self._max_bytes)):
+            entry, size = self._entries.popleft()
+            self._total_bytes -= size
+            evicted.append(entry)
+
+        if self._release_function is not None:
+            for entry in evicted:
+                self._release_function(entry)
+
+        return evicted
@@ -0,0 +1,366 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains command execution telemetry implementation
+"""
+
+from __future__ import annotations
+
+import os
+import math
+import time
+import sqlite3
+import threading
+import contextlib
+from typing import Iterator
+from collections import deque
+
+from tp.core import log
+
+logger = log.tpLogger
+
+TELEMETRY_PATH_ENV = 'TPDCC_COMMAND_TELEMETRY_PATH'
+LATENCY_SAMPLES = 256
+FLUSH_INTERVAL = 300.0
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Returns the percentile of the given sorted values using nearest rank method.
+
+    :param list[float] sorted_values: values sorted in ascending order.
+    :param float fraction: percentile as a fraction between 0.0 and 1.0.
+    :return: percentile value or 0.0 if no values are given.
+    :rtype: float
+    """
+
+    if not sorted_values:
+        return 0.0
+
+    index = min(max(math.ceil(fraction * len(sorted_values)) - 1, 0), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class CommandAggregate:
+    """
+    Class that holds the execution aggregates of a single command.
+    Latency percentiles are computed from a bounded window with the most recent execution times.
+    """
+
+    __slots__ = ('command_id', 'count', 'failures', 'total_time', 'max_time', 'last_used', 'last_traceback', '_samples')
+
+    def __init__(self, command_id: str, max_samples: int = LATENCY_SAMPLES):
+        self.command_id = command_id
+        self.count = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_used = 0.0
+        self.last_traceback = ''
+        self._samples = deque(maxlen=max_samples)
+
+    def add(self, execution_time: float, trace: str | None = None):
+        """
+        Adds a new command execution.
+
+        :param float execution_time: execution time in seconds.
+        :param str or None trace: traceback of the execution, if execution failed.
+        """
+
+        self.count += 1
+        self.total_time += execution_time
+        if execution_time > self.max_time:
+            self.max_time = execution_time
+        self.last_used = time.time()
+        self._samples.append(execution_time)
+        if trace:
+            self.failures += 1
+            self.last_traceback = trace
+
+    def to_dict(self) -> dict:
+        """
+        Returns the aggregates as a dictionary.
+
+        :return: aggregates dictionary.
+        :rtype: dict
+        """
+
+        samples = sorted(self._samples)
+        return {
+            'id': self.command_id,
+            'count': self.count,
+            'failures': self.failures,
+            'totalTime': self.total_time,
+            'meanTime': self.total_time / self.count if self.count else 0.0,
+            'p50': percentile(samples, 0.5),
+            'p95': percentile(samples, 0.95),
+            'maxTime': self.max_time,
+            'lastUsed': self.last_used,
+            'lastTraceback': self.last_traceback
+        }
+
+
+class CommandTelemetryStore:
+    """
+    Class that stores flushed command aggregates within a local SQLite database.
+    """
+
+    def __init__(self, file_path: str):
+        super().__init__()
+
+        self._file_path = file_path
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with self._connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS command_stats ('
+                'flushed REAL, command_id TEXT, count INTEGER, failures INTEGER, total_time REAL, p50 REAL, '
+                'p95 REAL, max_time REAL, last_traceback TEXT)')
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS command_stats_id ON command_stats (command_id, flushed)')
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def write(self, aggregates: list[dict], flushed: float | None = None):
+        """
+        Writes the given command aggregates.
+
+        :param list[dict] aggregates: aggregates dictionaries, as returned by CommandAggregate.to_dict.
+        :param float or None flushed: flush time. If not given, current time is used.
+        """
+
+        if not aggregates:
+            return
+
+        flushed = time.time() if flushed is None else flushed
+        rows = [(
+            flushed, data['id'], data['count'], data['failures'], data['totalTime'], data['p50'], data['p95'],
+            data['maxTime'], data['lastTraceback']) for data in aggregates]
+        with self._connect() as connection:
+            connection.executemany('INSERT INTO command_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def query(self, command_id: str | None = None, since: float | None = None) -> list[dict]:
+        """
+        Returns the stored aggregates of each flush.
+
+        :param str or None command_id: optional command ID to filter by.
+        :param float or None since: optional time; only aggregates flushed after this time are returned.
+        :return: list of flushed aggregates, ordered by flush time.
+        :rtype: list[dict]
+        """
+
+        conditions, parameters = self._conditions(command_id, since)
+        with self._connect() as connection:
+            rows = connection.execute(
+                'SELECT flushed, command_id, count, failures, total_time, p50, p95, max_time, last_traceback '
+                f'FROM command_stats{conditions} ORDER BY flushed', parameters).fetchall()
+
+        return [{
+            'flushed': row[0], 'id': row[1], 'count': row[2], 'failures': row[3], 'totalTime': row[4],
+            'p50': row[5], 'p95': row[6], 'maxTime': row[7], 'lastTraceback': row[8]} for row in rows]
+
+    def totals(self, since: float | None = None) -> list[dict]:
+        """
+        Returns the stored aggregates combined per command, sorted by total execution time, so commands users wait on
+        the most come first.
+
+        :param float or None since: optional time; only aggregates flushed after this time are combined.
+        :return: list of combined aggregates.
+        :rtype: list[dict]
+        """
+
+        conditions, parameters = self._conditions(None, since)
+        with self._connect() as connection:
+            rows = connection.execute(
+                'SELECT command_id, SUM(count), SUM(failures), SUM(total_time), MAX(p95), MAX(max_time) '
+                f'FROM command_stats{conditions} GROUP BY command_id ORDER BY SUM(total_time) DESC',
+                parameters).fetchall()
+
+        return [{
+            'id': row[0], 'count': row[1], 'failures': row[2], 'totalTime': row[3],
+            'meanTime': row[3] / row[1] if row[1] else 0.0, 'maxP95': row[4], 'maxTime': row[5]} for row in rows]
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Internal context manager that opens a new connection to the database, commits the transaction (or rolls it
+        back if an error happens) and closes the connection.
+
+        :return: database connection.
+        :rtype: Iterator[sqlite3.Connection]
+        """
+
+        connection = sqlite3.connect(self._file_path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _conditions(command_id: str | None, since: float | None) -> tuple[str, list]:
+        """
+        Internal function that returns the SQL conditions for the given filters.
+
+        :param str or None command_id: optional command ID to filter by.
+        :param float or None since: optional minimum flush time.
+        :return: tuple with the WHERE clause and its parameters.
+        :rtype: tuple[str, list]
+        """
+
+        clauses, parameters = [], []
+        if command_id is not None:
+            clauses.append('command_id = ?')
+            parameters.append(command_id)
+        if since is not None:
+            clauses.append('flushed >= ?')
+            parameters.append(since)
+
+        return (f' WHERE {" AND ".join(clauses)}' if clauses else ''), parameters
+
+
+class CommandTelemetry:
+    """
+    Class that collects in memory execution aggregates per command ID and periodically flushes them into an
+    optional store. Flushed aggregates only contain the executions since the previous flush.
+    Periodic flushes run in a background thread, so recording an execution never waits for the store.
+    """
+
+    def __init__(
+            self, store: CommandTelemetryStore | None = None, flush_interval: float = FLUSH_INTERVAL,
+            max_samples: int = LATENCY_SAMPLES):
+        super().__init__()
+
+        self._store = store
+        self._flush_interval = flush_interval
+        self._max_samples = max_samples
+        self._aggregates = {}                       # type: dict[str, CommandAggregate]
+        self._pending = {}                          # type: dict[str, CommandAggregate]
+        self._last_flush = time.monotonic()
+        self._flush_thread = None                   # type: threading.Thread | None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> CommandTelemetry:
+        """
+        Returns a new telemetry instance that stores aggregates in the SQLite database defined by the
+        TPDCC_COMMAND_TELEMETRY_PATH environment variable, if defined.
+
+        :return: new telemetry instance.
+        :rtype: CommandTelemetry
+        """
+
+        store = None
+        file_path = os.environ.get(TELEMETRY_PATH_ENV, '')
+        if file_path:
+            try:
+                store = CommandTelemetryStore(file_path)
+            except (OSError, sqlite3.Error):
+                logger.warning(f'Unable to open command telemetry store: {file_path}', exc_info=True)
+
+        return cls(store=store)
+
+    @property
+    def store(self) -> CommandTelemetryStore | None:
+        return self._store
+
+    @store.setter
+    def store(self, value: CommandTelemetryStore | None):
+        self._store = value
+
+    def record(self, command_id: str, execution_time: float, trace: str | None = None):
+        """
+        Records a command execution.
+
+        :param str command_id: ID of the executed command.
+        :param float execution_time: execution time in seconds.
+        :param str or None trace: traceback of the execution, if execution failed.
+        """
+
+        with self._lock:
+            aggregate = self._aggregates.get(command_id)
+            if aggregate is None:
+                aggregate = self._aggregates[command_id] = CommandAggregate(command_id, self._max_samples)
+            aggregate.add(execution_time, trace)
+            if self._store is not None:
+                pending = self._pending.get(command_id)
+                if pending is None:
+                    pending = self._pending[command_id] = CommandAggregate(command_id, self._max_samples)
+                pending.add(execution_time, trace)
+            flush_thread = None
+            if (self._store is not None and self._flush_thread is None and
+                    time.monotonic() - self._last_flush >= self._flush_interval):
+                flush_thread = self._flush_thread = threading.Thread(
+                    target=self._background_flush, name='CommandTelemetryFlush', daemon=True)
+
+        if flush_thread is not None:
+            flush_thread.start()
+
+    def summary(self, command_id: str | None = None) -> list[dict]:
+        """
+        Returns the in memory aggregates of the commands executed within this process, sorted by total execution time.
+
+        :param str or None command_id: optional command ID to get aggregates of.
+        :return: list of aggregates dictionaries.
+        :rtype: list[dict]
+        """
+
+        with self._lock:
+            if command_id is not None:
+                aggregate = self._aggregates.get(command_id)
+                return [aggregate.to_dict()] if aggregate is not None else []
+            summaries = [aggregate.to_dict() for aggregate in self._aggregates.values()]
+
+        return sorted(summaries, key=lambda x: x['totalTime'], reverse=True)
+
+    def flush(self):
+        """
+        Writes the aggregates of the executions since the previous flush into the store.
+        Waits for the background flush to finish first, if one is running.
+        """
+
+        flush_thread = self._flush_thread
+        if flush_thread is not None and flush_thread is not threading.current_thread():
+            flush_thread.join()
+
+        self._write_pending()
+
+    def reset(self):
+        """
+        Removes all in memory aggregates. Aggregates pending to be flushed are discarded.
+        """
+
+        with self._lock:
+            self._aggregates.clear()
+            self._pending.clear()
+
+    def _background_flush(self):
+        """
+        Internal function that flushes the pending aggregates from the background flush thread.
+        """
+
+        try:
+            self._write_pending()
+        finally:
+            with self._lock:
+                self._flush_thread = None
+
+    def _write_pending(self):
+        """
+        Internal function that writes the aggregates of the executions since the previous flush into the store.
+        """
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if self._store is None or not pending:
+            return
+
+        try:
+            self._store.write([aggregate.to_dict() for aggregate in pending.values()])
+        except sqlite3.Error:
+            logger.warning('Unable to flush command telemetry', exc_info=True)
@@ -0,0 +1,116 @@
+"""
+Benchmark that measures cold and warm curve shape loads from the loose curve files of the default curves library and
+from its packed archive.
+
+  - cold: library is opened from scratch and every shape is loaded once (building the archive when it does not exist,
+	opening the existing archive otherwise).
+  - warm: library is already opened and every shape is loaded again.
+
+Curve library is copied into a temporary directory, so no archive is written within the repository. Maya is not
+needed: packed module is loaded directly from its file, because curves package imports Maya.
+
+Usage:
+	python bench_packed_curves.py [--iterations 20]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import importlib.util
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+	if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+		sys.path.append(_package_root)
+
+_CURVES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tp', 'maya', 'libs', 'curves')
+_spec = importlib.util.spec_from_file_location('packed', os.path.join(_CURVES_PATH, 'packed.py'))
+packed = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(packed)
+
+
+def load_loose_curves(root: str) -> int:
+	count = 0
+	for entry in packed.iterate_curve_files(root):
+		with open(entry.path, 'r') as curve_file:
+			count += len(json.load(curve_file))
+	return count
+
+
+def load_packed_curves(library: packed.PackedCurveLibrary) -> int:
+	return sum(len(library.load(curve_name)) for curve_name in library.names())
+
+
+def _timed(function, iterations: int) -> float:
+	"""
+	Internal function that returns the average time, in milliseconds, of the given function.
+	"""
+
+	start = time.perf_counter()
+	for _ in range(iterations):
+		function()
+	return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main(args: list[str] | None = None) -> int:
+	"""
+	Command line entry point.
+
+	:param list[str] or None args: command line arguments.
+	:return: exit code.
+	:rtype: int
+	"""
+
+	parser = argparse.ArgumentParser(description='Benchmarks cold and warm curve shape loads')
+	parser.add_argument('--iterations', type=int, default=20, help='number of times each measure is repeated')
+	parser.add_argument('--library', default=os.path.join(_CURVES_PATH, 'library'), help='curves library directory')
+	parsed_args = parser.parse_args(args)
+
+	directory = tempfile.mkdtemp(prefix='tp_curves_bench_')
+	try:
+		root = os.path.join(directory, 'library')
+		shutil.copytree(parsed_args.library, root, ignore=shutil.ignore_patterns('*.py', '__pycache__'))
+		pack_path = os.path.join(root, packed.PACK_FILE_NAME)
+		curve_count = len(list(packed.iterate_curve_files(root)))
+
+		def _cold_build():
+			if os.path.exists(pack_path):
+				os.remove(pack_path)
+			library = packed.open_library(root)
+			load_packed_curves(library)
+			library.close()
+
+		def _cold_open():
+			library = packed.open_library(root)
+			load_packed_curves(library)
+			library.close()
+
+		loose_time = _timed(lambda: load_loose_curves(root), parsed_args.iterations)
+		build_time = _timed(_cold_build, parsed_args.iterations)
+		open_time = _timed(_cold_open, parsed_args.iterations)
+		library = packed.open_library(root)
+		shape_count = load_packed_curves(library)
+		warm_time = _timed(lambda: load_packed_curves(library), parsed_args.iterations)
+		library.close()
+	finally:
+		shutil.rmtree(directory, ignore_errors=True)
+
+	print(f'{curve_count} curves ({shape_count} shapes), average of {parsed_args.iterations} iterations')
+	print(f'  loose JSON files:             {loose_time:8.2f} ms')
+	print(f'  packed, cold (build archive): {build_time:8.2f} ms')
+	print(f'  packed, cold (open archive):  {open_time:8.2f} ms ({loose_time / open_time:.1f}x)')
+	print(f'  packed, warm:                 {warm_time:8.2f} ms ({loose_time / warm_time:.1f}x)')
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -12,8 +12,10 @@ import sys
 import typing
 import inspect
 import logging
+import threading
 
 import maya.cmds as cmds
+import maya.utils as utils
 from maya.api import OpenMaya
 
 from tp.core import dcc
@@ -133,9 +135,18 @@ class MayaLogHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord) -> None:
         msg = self.format(record)
-        if record.levelno > logging.WARNING:
+        if record.levelno > logging.WARNING and threading.current_thread() is not threading.main_thread():
+            # Maya GUI can only be accessed from the main thread (for example, when records are handled by the
+            # log queue listener thread).
+            utils.executeDeferred(self._display, record.levelno, msg)
+        else:
+            self._display(record.levelno, msg)
+
+    @staticmethod
+    def _display(levelno: int, msg: str):
+        if levelno > logging.WARNING:
             OpenMaya.MGlobal.displayWarning(msg)
-        elif record.levelno in (logging.CRITICAL, logging.ERROR):
+        elif levelno in (logging.CRITICAL, logging.ERROR):
             OpenMaya.MGlobal.displayError(msg)
         else:
             # Write all messages to sys.__stdout__, which goes to the output window. Only write debug messages here.
@@ -0,0 +1,106 @@
+import os
+import importlib.util
+
+import numpy as np
+import pytest
+
+# animation package imports Maya, so sampling module is loaded directly from its file
+_spec = importlib.util.spec_from_file_location('sampling', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tp', 'maya', 'om', 'animation', 'sampling.py'))
+sampling = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sampling)
+
+
+class FakeEvaluator(sampling.SampleEvaluator):
+    def __init__(self, curves):
+        self.curves = curves
+        self.calls = []
+
+    def channel_names(self):
+        return list(self.curves)
+
+    def begin(self, frames):
+        self.calls.append(('begin', list(frames)))
+
+    def evaluate(self, frame):
+        self.calls.append(('evaluate', frame))
+        return [curve(frame) for curve in self.curves.values()]
+
+    def end(self):
+        self.calls.append(('end',))
+
+
+class FakeWriter(sampling.KeyWriter):
+    def __init__(self):
+        self.keys = {}
+        self.ended = False
+
+    def write(self, channel_index, frames, values):
+        self.keys[channel_index] = (frames.tolist(), values.tolist())
+
+    def end(self):
+        self.ended = True
+
+
+def test_frame_range():
+    assert sampling.frame_range(1, 5) == [1, 2, 3, 4, 5]
+    assert sampling.frame_range(0, 1, 0.25) == [0, 0.25, 0.5, 0.75, 1.0]
+    assert sampling.frame_range(5, 1) == []
+    with pytest.raises(ValueError):
+        sampling.frame_range(0, 10, 0)
+
+
+def test_sample():
+    evaluator = FakeEvaluator({'tx': lambda frame: frame * 2.0, 'ty': lambda frame: 1.0})
+    samples = sampling.sample(evaluator, sampling.frame_range(1, 3))
+    assert samples.shape == (3, 2)
+    assert samples.tolist() == [[2.0, 1.0], [4.0, 1.0], [6.0, 1.0]]
+    assert evaluator.calls == [
+        ('begin', [1, 2, 3]), ('evaluate', 1), ('evaluate', 2), ('evaluate', 3), ('end',)]
+
+
+def test_sample_ends_evaluator_on_error():
+    def _fail(frame):
+        if frame == 2:
+            raise RuntimeError('evaluation failed')
+        return 0.0
+
+    evaluator = FakeEvaluator({'tx': _fail})
+    with pytest.raises(RuntimeError):
+        sampling.sample(evaluator, [1, 2, 3])
+    assert evaluator.calls[-1] == ('end',)
+
+
+def test_redundant_keys_mask():
+    values = [0.0, 1.0, 1.0, 1.0, 1.0, 2.0, 3.0]
+    assert sampling.redundant_keys_mask(values).tolist() == [True, True, False, False, True, True, True]
+    assert sampling.redundant_keys_mask([1.0, 1.0 + 1e-9, 1.0]).tolist() == [True, False, False]
+    assert sampling.redundant_keys_mask([1.0, 1.0]).tolist() == [True, True]
+    assert sampling.redundant_keys_mask([]).tolist() == []
+
+
+def test_bake_reduces_constant_runs():
+    frames = sampling.frame_range(1, 6)
+    evaluator = FakeEvaluator({
+        'tx': lambda frame: min(frame, 3.0),
+        'ty': lambda frame: 5.0,
+        'tz': lambda frame: float(frame)})
+    samples = sampling.sample(evaluator, frames)
+
+    writer = FakeWriter()
+    sampling.bake(writer, frames, samples, reduce=True)
+    assert writer.ended
+    assert writer.keys[0] == ([1.0, 2.0, 3.0, 6.0], [1.0, 2.0, 3.0, 3.0])
+    assert writer.keys[1] == ([1.0], [5.0])
+    assert writer.keys[2] == ([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    writer = FakeWriter()
+    sampling.bake(writer, frames, samples)
+    assert all(len(key_frames) == len(frames) for key_frames, _ in writer.keys.values())
+
+
+def test_bake_checks_samples_shape():
+    writer = FakeWriter()
+    with pytest.raises(ValueError):
+        sampling.bake(writer, [1, 2, 3], np.zeros((2, 1)))
+    assert not writer.ended
@@ -0,0 +1,370 @@
+import pytest
+
+from tp.maya.meta import sceneindex
+
+# attribute changed message flags, as sent by OpenMaya.MNodeMessage
+ATTRIBUTE_SET = 1
+ATTRIBUTE_ADDED = 2
+ATTRIBUTE_REMOVED = 4
+CONNECTION_MADE = 8
+CONNECTION_BROKEN = 16
+
+CLASS_ATTR = 'mClass'
+PARENT_ATTR = 'mMetaParent'
+CHILDREN_ATTR = 'mMetaChildren'
+
+
+class FakeScene:
+    """
+    Scene of network nodes that sends the messages Maya sends while nodes are created, renamed, connected and deleted.
+    Nodes are identified by keys that do not change when nodes are renamed, as MObjectHandle hash codes.
+    """
+
+    def __init__(self):
+        self.listeners = []
+        self.names = {}
+        self.class_types = {}
+        self.parents = {}
+        self.resolved = []
+        self._next_key = 1
+
+    def key(self, name):
+        return next(key for key, node_name in self.names.items() if node_name == name)
+
+    def scan(self):
+        return list(self.names)
+
+    def resolve(self, key):
+        self.resolved.append(key)
+        if key not in self.names or key not in self.class_types:
+            return None
+        return self.class_types[key], list(self.parents.get(key, ()))
+
+    def send(self, message, *args):
+        for listener in self.listeners:
+            getattr(listener, message)(*args)
+
+    def create(self, name, class_type=None):
+        key = self._next_key
+        self._next_key += 1
+        self.names[key] = name
+        self.send('node_added', key)
+        if class_type is not None:
+            self.add_class_attribute(name, class_type)
+        return key
+
+    def rename(self, name, new_name):
+        key = self.key(name)
+        self.names[key] = new_name
+        self.send('name_changed', key)
+
+    def add_class_attribute(self, name, class_type):
+        key = self.key(name)
+        self.class_types[key] = class_type
+        self.send('attribute_changed', ATTRIBUTE_ADDED, key, CLASS_ATTR, None)
+
+    def set_class_type(self, name, class_type):
+        key = self.key(name)
+        self.class_types[key] = class_type
+        self.send('attribute_changed', ATTRIBUTE_SET, key, CLASS_ATTR, None)
+
+    def remove_class_attribute(self, name):
+        key = self.key(name)
+        del self.class_types[key]
+        self.send('attribute_changed', ATTRIBUTE_REMOVED, key, CLASS_ATTR, None)
+
+    def connect(self, child_name, parent_name):
+        child_key, parent_key = self.key(child_name), self.key(parent_name)
+        self.parents.setdefault(child_key, []).append(parent_key)
+        self.send('attribute_changed', CONNECTION_MADE, child_key, PARENT_ATTR, parent_key)
+        self.send('attribute_changed', CONNECTION_MADE, parent_key, CHILDREN_ATTR, child_key)
+
+    def disconnect(self, child_name, parent_name):
+        self._disconnect(self.key(child_name), self.key(parent_name))
+
+    def delete(self, name):
+        key = self.key(name)
+        # Maya breaks node connections before removing it
+        for parent_key in list(self.parents.get(key, ())):
+            self._disconnect(key, parent_key)
+        for child_key, parent_keys in list(self.parents.items()):
+            if key in parent_keys:
+                self._disconnect(child_key, key)
+        del self.names[key]
+        self.class_types.pop(key, None)
+        self.parents.pop(key, None)
+        self.send('node_removed', key)
+
+    def new_scene(self):
+        self.send('before_scene_change')
+        self.names.clear()
+        self.class_types.clear()
+        self.parents.clear()
+        self.send('after_scene_change')
+
+    def _disconnect(self, child_key, parent_key):
+        self.parents[child_key].remove(parent_key)
+        self.send('attribute_changed', CONNECTION_BROKEN, child_key, PARENT_ATTR, parent_key)
+        self.send('attribute_changed', CONNECTION_BROKEN, parent_key, CHILDREN_ATTR, child_key)
+
+
+class FakeIndexer:
+    """
+    Message listener that updates a meta scene index following the same rules as MetaSceneIndexer callbacks.
+    """
+
+    def __init__(self, scene):
+        self.index = sceneindex.MetaSceneIndex(scene.scan, scene.resolve)
+        self.scene_changing = False
+
+    def node_added(self, key):
+        if self.scene_changing or not self.index.is_valid:
+            return
+        self.index.node_added(key)
+
+    def node_removed(self, key):
+        if not self.scene_changing:
+            self.index.node_removed(key)
+
+    def name_changed(self, key):
+        pass
+
+    def attribute_changed(self, msg, key, attribute_name, other_key):
+        if self.scene_changing:
+            return
+        if attribute_name == CLASS_ATTR:
+            if msg & (ATTRIBUTE_SET | ATTRIBUTE_ADDED | ATTRIBUTE_REMOVED):
+                self.index.node_changed(key)
+        elif msg & (CONNECTION_MADE | CONNECTION_BROKEN):
+            if attribute_name == PARENT_ATTR:
+                self.index.node_changed(key)
+            elif attribute_name == CHILDREN_ATTR:
+                self.index.node_changed(other_key)
+
+    def before_scene_change(self):
+        self.scene_changing = True
+        self.index.invalidate()
+
+    def after_scene_change(self):
+        self.scene_changing = False
+        self.index.invalidate()
+
+
+def _state(index):
+    keys = sorted(index.keys())
+    return {
+        'keys': keys,
+        'class_types': {key: index.class_type(key) for key in keys},
+        'parents': {key: sorted(index.parent_keys(key)) for key in keys},
+        'children': {key: sorted(index.child_keys(key)) for key in keys},
+        'roots': sorted(index.root_keys()),
+        'by_root': {key: sorted(index.keys_by_root(key)) for key in index.root_keys()},
+        'by_class_type': {
+            class_type: sorted(index.keys_by_class_type(class_type))
+            for class_type in set(index.class_type(key) for key in keys)}
+    }
+
+
+def assert_matches_scan(index, scene):
+    """
+    Checks that the incrementally updated index matches an index built scanning the whole scene.
+    """
+
+    assert _state(index) == _state(sceneindex.MetaSceneIndex(scene.scan, scene.resolve))
+
+
+@pytest.fixture
+def scene():
+    fake_scene = FakeScene()
+    fake_scene.create('rig', 'MetaRig')
+    fake_scene.create('geo', 'MetaGeometry')
+    fake_scene.connect('geo', 'rig')
+    fake_scene.create('unrelated')
+    return fake_scene
+
+
+@pytest.fixture
+def indexer(scene):
+    fake_indexer = FakeIndexer(scene)
+    scene.listeners.append(fake_indexer)
+    return fake_indexer
+
+
+def test_scan(scene, indexer):
+    index = indexer.index
+    rig, geo, unrelated = scene.key('rig'), scene.key('geo'), scene.key('unrelated')
+    assert not index.is_valid
+    assert sorted(index.keys()) == [rig, geo]
+    assert index.is_valid
+    assert unrelated not in index
+    assert index.keys_by_class_type('MetaGeometry') == [geo]
+    assert index.parent_keys(geo) == [rig]
+    assert index.child_keys(rig) == [geo]
+    assert index.root_keys() == [rig]
+    assert_matches_scan(index, scene)
+
+
+def test_events_before_scan_are_ignored(scene, indexer):
+    scene.create('skeleton', 'MetaSkeleton')
+    scene.connect('skeleton', 'rig')
+    assert not indexer.index.is_valid
+    assert scene.key('skeleton') in indexer.index
+    assert_matches_scan(indexer.index, scene)
+
+
+def test_replay_create(scene, indexer):
+    index = indexer.index
+    index.keys()
+
+    scene.create('skeleton', 'MetaSkeleton')
+    scene.connect('skeleton', 'rig')
+    skeleton = scene.key('skeleton')
+    assert index.keys_by_class_type('MetaSkeleton') == [skeleton]
+    assert sorted(index.child_keys(scene.key('rig'))) == sorted([scene.key('geo'), skeleton])
+    assert_matches_scan(index, scene)
+
+    # created nodes are resolved lazily, so meta attributes added after node creation are found
+    scene.resolved.clear()
+    scene.create('controls')
+    scene.add_class_attribute('controls', 'MetaControls')
+    scene.connect('controls', 'rig')
+    assert not scene.resolved
+    assert index.class_type(scene.key('controls')) == 'MetaControls'
+    assert scene.resolved == [scene.key('controls')]
+    assert_matches_scan(index, scene)
+
+
+def test_replay_rename(scene, indexer):
+    index = indexer.index
+    expected = _state(index)
+    scene.resolved.clear()
+
+    scene.rename('geo', 'body_geo')
+    scene.rename('rig', 'character_rig')
+    assert _state(index) == expected
+    assert not scene.resolved
+    assert index.keys_by_root(scene.key('character_rig')) == [scene.key('character_rig'), scene.key('body_geo')]
+    assert_matches_scan(index, scene)
+
+
+def test_replay_class_type_changes(scene, indexer):
+    index = indexer.index
+    index.keys()
+    geo = scene.key('geo')
+
+    scene.set_class_type('geo', 'MetaSkinnedGeometry')
+    assert index.keys_by_class_type('MetaGeometry') == []
+    assert index.keys_by_class_type('MetaSkinnedGeometry') == [geo]
+    assert_matches_scan(index, scene)
+
+    scene.remove_class_attribute('geo')
+    assert geo not in index
+    assert index.child_keys(scene.key('rig')) == []
+    assert_matches_scan(index, scene)
+
+    scene.add_class_attribute('unrelated', 'MetaGeometry')
+    assert index.keys_by_class_type('MetaGeometry') == [scene.key('unrelated')]
+    assert_matches_scan(index, scene)
+
+
+def test_replay_connect(scene, indexer):
+    index = indexer.index
+    index.keys()
+    scene.create('skeleton', 'MetaSkeleton')
+    scene.create('joints', 'MetaJoints')
+    rig, geo, skeleton, joints = (scene.key(name) for name in ('rig', 'geo', 'skeleton', 'joints'))
+    assert sorted(index.root_keys()) == sorted([rig, skeleton, joints])
+
+    scene.connect('joints', 'skeleton')
+    scene.connect('skeleton', 'rig')
+    assert index.root_keys() == [rig]
+    assert sorted(index.keys_by_root(rig)) == sorted([rig, geo, skeleton, joints])
+    assert_matches_scan(index, scene)
+
+    scene.disconnect('skeleton', 'rig')
+    assert sorted(index.root_keys()) == sorted([rig, skeleton])
+    assert sorted(index.keys_by_root(skeleton)) == sorted([skeleton, joints])
+    assert_matches_scan(index, scene)
+
+    # meta nodes with several meta parents
+    scene.connect('geo', 'skeleton')
+    assert sorted(index.parent_keys(geo)) == sorted([rig, skeleton])
+    assert geo in index.keys_by_root(skeleton)
+    assert_matches_scan(index, scene)
+
+
+def test_replay_delete(scene, indexer):
+    index = indexer.index
+    index.keys()
+    scene.create('skeleton', 'MetaSkeleton')
+    scene.connect('skeleton', 'rig')
+    scene.connect('geo', 'skeleton')
+    index.keys()
+
+    scene.delete('skeleton')
+    rig, geo = scene.key('rig'), scene.key('geo')
+    assert sorted(index.keys()) == [rig, geo]
+    assert index.parent_keys(geo) == [rig]
+    assert index.child_keys(rig) == [geo]
+    assert_matches_scan(index, scene)
+
+    scene.delete('rig')
+    assert index.keys() == [geo]
+    assert index.root_keys() == [geo]
+    assert_matches_scan(index, scene)
+
+
+def test_removed_nodes_are_unindexed_without_connection_messages(scene, indexer):
+    index = indexer.index
+    rig, geo = scene.key('rig'), scene.key('geo')
+    index.keys()
+
+    # node removed message can be received before the connection broken messages of its children
+    del scene.names[rig]
+    del scene.class_types[rig]
+    scene.send('node_removed', rig)
+    assert rig not in index
+    assert index.parent_keys(geo) == []
+    assert index.root_keys() == [geo]
+
+
+def test_replay_removed_before_resolved(scene, indexer):
+    index = indexer.index
+    index.keys()
+    scene.create('temp', 'MetaTemp')
+    temp = scene.key('temp')
+    scene.delete('temp')
+    scene.resolved.clear()
+
+    assert temp not in index
+    assert temp not in scene.resolved
+    assert_matches_scan(index, scene)
+
+
+def test_replay_new_scene(scene, indexer):
+    index = indexer.index
+    index.keys()
+
+    scene.new_scene()
+    assert not index.is_valid
+    assert index.keys() == []
+
+    scene.create('rig', 'MetaRig')
+    scene.create('geo', 'MetaGeometry')
+    scene.connect('geo', 'rig')
+    assert index.root_keys() == [scene.key('rig')]
+    assert_matches_scan(index, scene)
+
+
+def test_replay_long_sequence(scene, indexer):
+    index = indexer.index
+    index.keys()
+    for i in range(20):
+        scene.create(f'part{i}', f'MetaPart{i % 3}')
+        scene.connect(f'part{i}', 'rig' if i % 4 == 0 else f'part{i - 1}')
+        if i % 5 == 4:
+            scene.rename(f'part{i - 1}', f'renamed{i - 1}')
+            scene.delete(f'renamed{i - 1}')
+        if i % 6 == 5:
+            scene.set_class_type(f'part{i}', 'MetaLeaf')
+        assert_matches_scan(index, scene)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from tp.maya.cmds import skinweights
+
+
+@pytest.fixture
+def backend():
+    weights = np.array([
+        [1.0, 0.0, 0.0],
+        [0.5, 0.5, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, 0.25, 0.0],
+    ])
+    return skinweights.MemorySkinWeightsBackend(['root', 'spine', 'unused'], weights)
+
+
+def test_subset(backend):
+    skin_weights = skinweights.read_skin_weights(backend)
+    subset = skin_weights.subset([3, 1])
+    assert subset.vertex_ids.tolist() == [3, 1]
+    assert subset.weights.tolist() == [[0.0, 0.25, 0.0], [0.5, 0.5, 0.0]]
+    assert subset.influences == ['root', 'spine', 'unused']
+    with pytest.raises(ValueError):
+        skin_weights.subset([4])
+
+
+def test_subset_empty(backend):
+    skin_weights = skinweights.read_skin_weights(backend, vertex_ids=[])
+    assert len(skin_weights.vertex_ids) == 0
+    subset = skin_weights.subset([])
+    assert isinstance(subset, skinweights.SkinWeights)
+    assert subset.weights.shape == (0, 3)
+    with pytest.raises(ValueError):
+        skin_weights.subset([0])
+    assert skinweights.read_skin_weights(backend).subset([]).weights.shape == (0, 3)
+
+
+def test_influence_weights_keys(backend):
+    weights = skinweights.influence_weights(backend)
+    # influences whose weights are all zero are kept
+    assert list(weights) == [0, 1, 2]
+    assert weights[2] == [0.0, 0.0, 0.0, 0.0]
+    assert weights[1] == [0.0, 0.5, 1.0, 0.25]
+
+    weights = skinweights.influence_weights(backend, influence_keys=[3, 7, 9])
+    assert list(weights) == [3, 7, 9]
+    assert weights[3] == [1.0, 0.5, 0.0, 0.0]
+
+
+def test_influence_weights_vertex_subset(backend):
+    weights = skinweights.influence_weights(backend, vertex_ids=[1, 2])
+    assert list(weights) == [0, 1, 2]
+    assert weights[0] == [0.0, 0.5, 0.0, 0.0]
+    assert weights[1] == [0.0, 0.5, 1.0, 0.0]
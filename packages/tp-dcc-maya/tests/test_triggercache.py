@@ -0,0 +1,102 @@
+from tp.maya.libs.triggers import triggercache
+
+
+class FakeResolver:
+    def __init__(self, triggers):
+        self.triggers = triggers
+        self.resolved = []
+
+    def __call__(self, node):
+        self.resolved.append(node)
+        return self.triggers.get(node)
+
+
+def test_registry_caches_triggers_and_missing_triggers():
+    resolver = FakeResolver({'ctrl': 'ctrlTrigger'})
+    registry = triggercache.TriggerRegistry(resolver)
+
+    assert registry.trigger(1, 'ctrl') == 'ctrlTrigger'
+    assert registry.trigger(2, 'mesh') is None
+    assert registry.trigger(1, 'ctrl') == 'ctrlTrigger'
+    assert registry.trigger(2, 'mesh') is None
+    assert resolver.resolved == ['ctrl', 'mesh']
+    assert len(registry) == 2 and 1 in registry and 2 in registry
+
+
+def test_registry_builds_nodes_lazily():
+    resolver = FakeResolver({'ctrl': 'ctrlTrigger'})
+    registry = triggercache.TriggerRegistry(resolver)
+    built = []
+
+    def _node():
+        built.append('ctrl')
+        return 'ctrl'
+
+    assert registry.trigger(1, _node) == 'ctrlTrigger'
+    assert registry.trigger(1, _node) == 'ctrlTrigger'
+    assert built == ['ctrl']
+
+
+def test_registry_invalidate():
+    resolver = FakeResolver({})
+    registry = triggercache.TriggerRegistry(resolver)
+    assert registry.trigger(1, 'ctrl') is None
+
+    # trigger is created on the node, cached missing trigger must be invalidated
+    resolver.triggers['ctrl'] = 'ctrlTrigger'
+    assert registry.trigger(1, 'ctrl') is None
+    registry.invalidate(1)
+    assert registry.trigger(1, 'ctrl') == 'ctrlTrigger'
+
+    registry.invalidate(3)
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_registry_resolver_errors():
+    def _resolver(node):
+        raise RuntimeError('invalid node')
+
+    registry = triggercache.TriggerRegistry(_resolver)
+    assert registry.trigger(1, 'ctrl') is None
+    assert 1 in registry
+
+
+def test_registry_iterate_triggers():
+    registry = triggercache.TriggerRegistry(FakeResolver({'a': 'aTrigger', 'c': 'cTrigger'}))
+    triggers = list(registry.iterate_triggers([(1, 'a'), (2, 'b'), (3, 'c')]))
+    assert triggers == ['aTrigger', 'cTrigger']
+
+
+def test_coalescer_dispatches_last_selection_of_burst():
+    scheduled = []
+    dispatched = []
+    coalescer = triggercache.SelectionCoalescer(dispatched.append, scheduled.append)
+
+    coalescer.push(['a'])
+    coalescer.push(['a', 'b'])
+    coalescer.push(['c'])
+    assert len(scheduled) == 1
+    assert coalescer.is_scheduled
+    assert not dispatched
+
+    scheduled.pop()()
+    assert dispatched == [['c']]
+    assert not coalescer.is_scheduled
+
+    coalescer.push(['d'])
+    assert len(scheduled) == 1
+    scheduled.pop()()
+    assert dispatched == [['c'], ['d']]
+
+
+def test_coalescer_cancel():
+    scheduled = []
+    dispatched = []
+    coalescer = triggercache.SelectionCoalescer(dispatched.append, scheduled.append)
+
+    coalescer.push(['a'])
+    coalescer.cancel()
+    scheduled.pop()()
+    assert not dispatched
+    assert not coalescer.is_scheduled
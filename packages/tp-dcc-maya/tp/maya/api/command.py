@@ -13,7 +13,7 @@ from overrides import override
 import maya.cmds as cmds
 import maya.api.OpenMaya as OpenMaya
 
-from tp.core import log, command, exceptions
+from tp.core import log, command, commandstack, exceptions
 from tp.maya.cmds import helpers
 from tp.maya.api import output
 
@@ -65,19 +65,23 @@ class MayaCommandRunner(command.BaseCommandRunner):
 
         exc_tb, exc_type, exc_value = None, None, None
         command_to_run.stats = command.CommandStats(command_to_run)
+        command_to_run.stats.start()
         try:
             if command_to_run.is_undoable:
                 cmds.undoInfo(openChunk=True, chunkName=command_to_run.id)
-                self._undo_stack.append(command_to_run)
+                self._push_undo(command_to_run)
             OpenMaya._TPDCC_COMMAND = command_to_run
             cmds.tpDccUndo(id=command_to_run.id)
             return command_to_run._return_result
         except exceptions.CommandCancel:
+            if command_to_run.is_undoable:
+                self._discard_undo(command_to_run)
             command_to_run.stats.finish(None)
+            self.record_stats(command_to_run.stats)
         except Exception:
-            exc_type, exc_value, exc_trace = sys.exc_info()
-            if command_to_run.is_undoable and command_to_run.use_undo_chunk:
-                self._undo_stack.pop()
+            exc_type, exc_value, exc_tb = sys.exc_info()
+            if command_to_run.is_undoable:
+                self._discard_undo(command_to_run)
             raise
         finally:
             tb = None
@@ -85,7 +89,9 @@ class MayaCommandRunner(command.BaseCommandRunner):
                 tb = traceback.format_exception(exc_type, exc_value, exc_tb)
             if command_to_run.is_undoable and command_to_run.use_undo_chunk:
                 cmds.undoInfo(closeChunk=True)
-            command_to_run.stats.finish(tb)
+            if command_to_run.stats.end_time == 0.0:
+                command_to_run.stats.finish(tb)
+                self.record_stats(command_to_run.stats)
             logger.debug(f'Finished executing command: "{command_id}"')
 
     @override
@@ -93,13 +99,14 @@ class MayaCommandRunner(command.BaseCommandRunner):
         if not self._undo_stack:
             return False
 
-        command_to_undo = self._undo_stack[-1]
+        command_to_undo = self._undo_stack.peek()
         if command_to_undo is None or not command_to_undo.is_undoable:
             return False
 
         exc_tb, exc_type, exc_value = None, None, None
         try:
             command_to_undo.stats = command.CommandStats(command_to_undo)
+            command_to_undo.stats.start()
             cmds.undo()
         except exceptions.CommandCancel:
             command_to_undo.stats.finish(None)
@@ -111,9 +118,8 @@ class MayaCommandRunner(command.BaseCommandRunner):
             tb = None
             if exc_type and exc_value and exc_tb:
                 tb = traceback.format_exception(exc_type, exc_value, exc_tb)
-            elif command_to_undo.is_undoable:
-                self._undo_stack.remove(command_to_undo)
-            self._redo_stack.append(command_to_undo)
+            elif self._undo_stack.discard(command_to_undo):
+                self._redo_stack.append(command_to_undo)
             command_to_undo.stats.finish(tb)
 
         return True
@@ -124,31 +130,51 @@ class MayaCommandRunner(command.BaseCommandRunner):
             return
 
         result = None
-        command_to_redo = self._redo_stack[-1]
+        command_to_redo = self._redo_stack.peek()
         if command_to_redo is None:
             return result
 
         exc_tb, exc_type, exc_value = None, None, None
         try:
             command_to_redo.stats = command.CommandStats(command_to_redo)
+            command_to_redo.stats.start()
             cmds.redo()
         except exceptions.CommandCancel:
             command_to_redo.stats.finish(None)
+            self.record_stats(command_to_redo.stats)
             return
         except Exception:
             exc_type, exc_value, exc_tb = sys.exc_info()
             raise
         finally:
             tb = None
-            command_to_redo = self._redo_stack.pop()
             if exc_type and exc_value and exc_tb:
                 tb = traceback.format_exception(exc_type, exc_value, exc_tb)
-            elif command_to_redo.is_undoable:
+            elif self._redo_stack.discard(command_to_redo) and command_to_redo.is_undoable:
+                # replayed commands are moved by _run; this only handles entries that were not replayed
                 self._undo_stack.append(command_to_redo)
-            command_to_redo.stats.finish(tb)
+            if command_to_redo.stats.end_time == 0.0:
+                command_to_redo.stats.finish(tb)
+                self.record_stats(command_to_redo.stats)
 
         return result
 
+    @override
+    def begin_macro(self, name: str):
+        if self._macro_depth == 0:
+            cmds.undoInfo(openChunk=True, chunkName=name)
+        super().begin_macro(name)
+
+    @override
+    def end_macro(self):
+        if self._macro_depth == 0:
+            return
+        try:
+            super().end_macro()
+        finally:
+            if self._macro_depth == 0:
+                cmds.undoInfo(closeChunk=True)
+
     @override
     def flush(self):
         super().flush()
@@ -157,13 +183,28 @@ class MayaCommandRunner(command.BaseCommandRunner):
     @override
     def _run(self, command_to_run: command.DccCommand) -> Any:
         if OpenMaya.MGlobal.isRedoing():
-            if self._redo_stack:
-                self._redo_stack.pop()
             result = super()._run(command_to_run)
-            self._undo_stack.append(command_to_run)
+            self._move_redone(command_to_run)
             return result
         try:
             return super(MayaCommandRunner, self)._run(command_to_run)
         except Exception:
             logger.error(f'Unhandled exception ocurred in command "{command_to_run.id}"')
             raise
+
+    def _move_redone(self, command_to_run: command.DccCommand):
+        """
+        Internal function that moves the redo entry of the given command, which has just been replayed by Maya, into
+        the undo stack. Macros are moved once their last command is replayed.
+
+        :param command.DccCommand command_to_run: replayed command.
+        """
+
+        entry = self._redo_stack.peek()
+        if isinstance(entry, commandstack.CommandMacro):
+            if len(entry) and entry.commands[-1] is command_to_run:
+                self._undo_stack.append(self._redo_stack.pop())
+            return
+
+        self._redo_stack.discard(command_to_run)
+        self._undo_stack.append(command_to_run)
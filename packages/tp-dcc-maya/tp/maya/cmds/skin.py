@@ -21,8 +21,9 @@ from tp.core import log, dcc
 from tp.common.python import helpers
 from tp.common.math import vec3, kdtree
 from tp.maya import api
-from tp.maya.om import mathlib as api_mathlib, skin as api_skin
+from tp.maya.om import mathlib as api_mathlib, skin as api_skin, dagpath as api_dagpath, undo as api_undo
 from tp.maya.cmds import decorators, exceptions, deformer, attribute, node as node_utils, mesh as mesh_utils
+from tp.maya.cmds import skinweights
 from tp.maya.cmds import joint as jnt_utils, transform as xform_utils, shape as shape_utils, name as name_utils
 
 logger = log.tpLogger
@@ -836,6 +837,146 @@ class SkinJointCurve(SkinJointSurface, object):
         return last_joint
 
 
+class MayaSkinWeightsBackend(skinweights.SkinWeightsBackend):
+    """
+    Skin weights backend that reads and writes the weights of a Maya skinCluster in bulk using MFnSkinCluster.
+    Write operations are undoable.
+    """
+
+    def __init__(self, skin_deformer):
+        super(MayaSkinWeightsBackend, self).__init__()
+
+        skinweights.check_numpy()
+        skin_object = api_dagpath.mobject_by_name(skin_deformer)
+        if skin_object is None or not skin_object.hasFn(maya.api.OpenMaya.MFn.kSkinClusterFilter):
+            raise exceptions.NodeException(skin_deformer, 'skinCluster')
+
+        self._fn_skin = maya.api.OpenMayaAnim.MFnSkinCluster(skin_object)
+        self._path = self._fn_skin.getPathAtIndex(0)
+        if self._path.hasFn(maya.api.OpenMaya.MFn.kMesh):
+            self._component_type = maya.api.OpenMaya.MFn.kMeshVertComponent
+        elif self._path.hasFn(maya.api.OpenMaya.MFn.kNurbsCurve):
+            self._component_type = maya.api.OpenMaya.MFn.kCurveCVComponent
+        else:
+            raise exceptions.MayaException(
+                'Geometry "{}" deformed by "{}" is not supported'.format(self._path.partialPathName(), skin_deformer))
+        self._vertex_count = maya.api.OpenMaya.MItGeometry(self._path).count()
+
+    def vertex_count(self):
+        return self._vertex_count
+
+    def influence_names(self):
+        return [influence_path.partialPathName() for influence_path in self._fn_skin.influenceObjects()]
+
+    def influence_indices(self):
+        """
+        Returns the logical indices (skinCluster matrix attribute indices) of the influences.
+
+        :return: list<int>
+        """
+
+        return [
+            int(self._fn_skin.indexForInfluenceObject(influence_path))
+            for influence_path in self._fn_skin.influenceObjects()]
+
+    def weights(self, vertex_ids=None):
+        components, order = self._components(vertex_ids)
+        weights_array, influences_count = self._fn_skin.getWeights(self._path, components)
+        weights = skinweights.np.fromiter(
+            weights_array, dtype=skinweights.np.float64, count=len(weights_array)).reshape(-1, influences_count)
+
+        return self._restore_order(weights, order)
+
+    def set_weights(self, weights, vertex_ids=None, influence_columns=None, normalize=False):
+        np = skinweights.np
+        components, order = self._components(vertex_ids)
+        if influence_columns is None:
+            influence_columns = range(len(self._fn_skin.influenceObjects()))
+        weights = np.asarray(weights, dtype=np.float64)
+        if order is not None:
+            weights = weights[order]
+        influences = maya.api.OpenMaya.MIntArray([int(column) for column in influence_columns])
+        new_weights = maya.api.OpenMaya.MDoubleArray(weights.ravel().tolist())
+        old_weights = self._fn_skin.setWeights(self._path, components, influences, new_weights, normalize, True)
+
+        def _undo():
+            self._fn_skin.setWeights(self._path, components, influences, old_weights, False)
+
+        def _redo():
+            self._fn_skin.setWeights(self._path, components, influences, new_weights, normalize)
+
+        api_undo.commit(_redo, _undo)
+
+    def blend_weights(self, vertex_ids=None):
+        components, order = self._components(vertex_ids)
+        blend_weights_array = self._fn_skin.getBlendWeights(self._path, components)
+        blend_weights = skinweights.np.fromiter(
+            blend_weights_array, dtype=skinweights.np.float64, count=len(blend_weights_array))
+
+        return self._restore_order(blend_weights, order)
+
+    def set_blend_weights(self, blend_weights, vertex_ids=None):
+        np = skinweights.np
+        components, order = self._components(vertex_ids)
+        blend_weights = np.nan_to_num(np.asarray(blend_weights, dtype=np.float64))
+        if order is not None:
+            blend_weights = blend_weights[order]
+        old_blend_weights = self._fn_skin.getBlendWeights(self._path, components)
+        new_blend_weights = maya.api.OpenMaya.MDoubleArray(blend_weights.tolist())
+        self._fn_skin.setBlendWeights(self._path, components, new_blend_weights)
+
+        def _undo():
+            self._fn_skin.setBlendWeights(self._path, components, old_blend_weights)
+
+        def _redo():
+            self._fn_skin.setBlendWeights(self._path, components, new_blend_weights)
+
+        api_undo.commit(_redo, _undo)
+
+    def _components(self, vertex_ids):
+        """
+        Internal function that creates the components object for the given vertices.
+        Components are always created with sorted vertex ids, so the order used to sort them is also returned.
+
+        :param np.ndarray or None vertex_ids: vertex ids. If None, all vertices are used.
+        :return: tuple with the components object and the sorting order (None if ids were already sorted).
+        :rtype: tuple(maya.api.OpenMaya.MObject, np.ndarray or None)
+        """
+
+        fn_component = maya.api.OpenMaya.MFnSingleIndexedComponent()
+        components = fn_component.create(self._component_type)
+        if vertex_ids is None:
+            fn_component.setCompleteData(self._vertex_count)
+            return components, None
+
+        vertex_ids = skinweights.np.asarray(vertex_ids, dtype=skinweights.np.int64)
+        order = skinweights.np.argsort(vertex_ids, kind='stable')
+        if skinweights.np.array_equal(order, skinweights.np.arange(len(vertex_ids))):
+            order = None
+        sorted_ids = vertex_ids if order is None else vertex_ids[order]
+        fn_component.addElements(maya.api.OpenMaya.MIntArray(sorted_ids.tolist()))
+
+        return components, order
+
+    @staticmethod
+    def _restore_order(values, order):
+        """
+        Internal function that reorders values retrieved with sorted components to match the requested vertex order.
+
+        :param np.ndarray values: values retrieved with sorted components.
+        :param np.ndarray or None order: sorting order returned by _components function.
+        :return: np.ndarray
+        """
+
+        if order is None:
+            return values
+
+        restored = skinweights.np.empty_like(values)
+        restored[order] = values
+
+        return restored
+
+
 def check_skin(skin_cluster):
     """
     Checks if a node is valid skin cluster and raise and exception if the node is not valid
@@ -2098,6 +2239,11 @@ def get_skin_weights(skin_deformer, vertices_ids=None):
     value is the list of weights of the influence
     """
 
+    if skinweights.np is not None:
+        backend = MayaSkinWeightsBackend(skin_deformer)
+        return skinweights.influence_weights(
+            backend, vertices_ids or None, influence_keys=backend.influence_indices())
+
     mobj = node_utils.get_mobject(skin_deformer)
 
     mf_skin = maya.api.OpenMayaAnim.MFnSkinCluster(mobj)
@@ -2346,6 +2492,11 @@ def get_skin_blend_weights(skin_deformer):
     :return: list<float>, blend weight values corresponding to point order
     """
 
+    if skinweights.np is not None:
+        blend_weights = MayaSkinWeightsBackend(skin_deformer).blend_weights()
+        blend_weights[blend_weights < 0.000001] = 0.0
+        return skinweights.np.nan_to_num(blend_weights).tolist()
+
     indices = attribute.indices('{}.weightList'.format(skin_deformer))
     blend_weights = attribute.indices('{}.blendWeights'.format(skin_deformer))
     blend_weights_dict = dict()
@@ -2382,6 +2533,12 @@ def set_skin_blend_weights(skin_deformer, weights):
     :param weights: list<float>, list of weight values corresponding to point order
     """
 
+    if skinweights.np is not None:
+        backend = MayaSkinWeightsBackend(skin_deformer)
+        blend_weights = skinweights.np.asarray(weights, dtype=skinweights.np.float64)[:backend.vertex_count()]
+        backend.set_blend_weights(blend_weights, vertex_ids=skinweights.np.arange(len(blend_weights)))
+        return
+
     indices = attribute.indices('{}.weightList'.format(skin_deformer))
 
     new_weights = list()
@@ -2404,6 +2561,12 @@ def set_skin_weights_to_zero(skin_deformer):
     :param skin_deformer: str, name of a skinCluster deformer
     """
 
+    if skinweights.np is not None:
+        backend = MayaSkinWeightsBackend(skin_deformer)
+        backend.set_weights(
+            skinweights.np.zeros((backend.vertex_count(), len(backend.influence_names()))), normalize=False)
+        return
+
     weights = maya.cmds.ls('{}.weightList[*]'.format(skin_deformer))
     for weight in weights:
         weight_attrs = maya.cmds.listAttr('{}.weights'.format(weight), multi=True)
@@ -2414,6 +2577,58 @@ def set_skin_weights_to_zero(skin_deformer):
             maya.cmds.setAttr(attr, 0)
 
 
+def read_skin_weights(skin_deformer, vertices_ids=None):
+    """
+    Reads the weights of the given skinCluster in bulk
+    :param skin_deformer: str, name of a skinCluster deformer
+    :param vertices_ids: list<int> or None, optional vertices to read weights of. If None, all vertices are read
+    :return: skinweights.SkinWeights
+    """
+
+    return skinweights.read_skin_weights(MayaSkinWeightsBackend(skin_deformer), vertex_ids=vertices_ids)
+
+
+def write_skin_weights(skin_deformer, skin_weights, vertices_ids=None, normalize=False):
+    """
+    Writes the given weights into the given skinCluster in bulk. Weights are remapped by influence name
+    :param skin_deformer: str, name of a skinCluster deformer
+    :param skin_weights: skinweights.SkinWeights, weights to write
+    :param vertices_ids: list<int> or None, optional subset of the stored vertices to write
+    :param normalize: bool, whether to normalize weights
+    """
+
+    skinweights.write_skin_weights(
+        MayaSkinWeightsBackend(skin_deformer), skin_weights, vertex_ids=vertices_ids, normalize=normalize)
+
+
+def export_skin_weights(skin_deformer, file_path, vertices_ids=None):
+    """
+    Exports the weights of the given skinCluster into a compressed sparse file
+    :param skin_deformer: str, name of a skinCluster deformer
+    :param file_path: str, absolute file path
+    :param vertices_ids: list<int> or None, optional vertices to export weights of. If None, all vertices are exported
+    """
+
+    read_skin_weights(skin_deformer, vertices_ids=vertices_ids).save(file_path)
+
+
+@decorators.undo_chunk
+def import_skin_weights(skin_deformer, file_path, vertices_ids=None, normalize=False):
+    """
+    Imports the weights stored in the given file into the given skinCluster
+    :param skin_deformer: str, name of a skinCluster deformer
+    :param file_path: str, absolute file path
+    :param vertices_ids: list<int> or None, optional subset of the stored vertices to import
+    :param normalize: bool, whether to normalize weights
+    :return: skinweights.SkinWeights, imported weights
+    """
+
+    skin_weights = skinweights.SkinWeights.load(file_path)
+    write_skin_weights(skin_deformer, skin_weights, vertices_ids=vertices_ids, normalize=normalize)
+
+    return skin_weights
+
+
 @decorators.undo_chunk
 def skin_mesh_from_mesh(source_mesh, target_mesh, exclude_joints=None, include_joints=None, uv_space=False):
     """
@@ -0,0 +1,458 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains bulk skin weights I/O based on NumPy arrays.
+Skin weights are read and written through a backend, so array packing, influence remapping and vertex subset logic
+do not depend on a specific skin deformer implementation.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tp.core import log
+from tp.common.python import decorators
+
+logger = log.tpLogger
+
+# weights lower than this value are discarded when packing weights into a sparse representation
+ZERO_TOLERANCE = 1e-6
+
+
+def check_numpy():
+    """
+    Checks whether NumPy is available.
+
+    :raises ImportError: if NumPy module is not available.
+    """
+
+    if np is None:
+        raise ImportError('Unable to import the numpy module')
+
+
+class SkinWeightsBackend:
+    """
+    Base class for skin weights backends. Backends give bulk access to the weights of a skin deformer.
+    Influence columns follow the order returned by influence_names function.
+    """
+
+    @decorators.abstractmethod
+    def vertex_count(self) -> int:
+        """
+        Returns the number of vertices deformed by the skin.
+
+        :return: vertex count.
+        :rtype: int
+        """
+
+        raise NotImplementedError
+
+    @decorators.abstractmethod
+    def influence_names(self) -> list[str]:
+        """
+        Returns the names of the influences of the skin.
+
+        :return: influence names.
+        :rtype: list[str]
+        """
+
+        raise NotImplementedError
+
+    @decorators.abstractmethod
+    def weights(self, vertex_ids: np.ndarray | None = None) -> np.ndarray:
+        """
+        Returns the dense weights of the given vertices.
+
+        :param np.ndarray or None vertex_ids: vertices to get weights of. If None, all vertices are returned.
+        :return: array with shape (vertex count, influence count).
+        :rtype: np.ndarray
+        """
+
+        raise NotImplementedError
+
+    @decorators.abstractmethod
+    def set_weights(
+            self, weights: np.ndarray, vertex_ids: np.ndarray | None = None,
+            influence_columns: np.ndarray | None = None, normalize: bool = False):
+        """
+        Sets the dense weights of the given vertices.
+
+        :param np.ndarray weights: array with shape (vertex count, influence columns count).
+        :param np.ndarray or None vertex_ids: vertices to set weights of. If None, all vertices are set.
+        :param np.ndarray or None influence_columns: influence columns to set weights of. If None, all influences
+            are set.
+        :param bool normalize: whether weights should be normalized.
+        """
+
+        raise NotImplementedError
+
+    @decorators.abstractmethod
+    def blend_weights(self, vertex_ids: np.ndarray | None = None) -> np.ndarray:
+        """
+        Returns the dual quaternion blend weights of the given vertices.
+
+        :param np.ndarray or None vertex_ids: vertices to get blend weights of. If None, all vertices are returned.
+        :return: array with shape (vertex count,).
+        :rtype: np.ndarray
+        """
+
+        raise NotImplementedError
+
+    @decorators.abstractmethod
+    def set_blend_weights(self, blend_weights: np.ndarray, vertex_ids: np.ndarray | None = None):
+        """
+        Sets the dual quaternion blend weights of the given vertices.
+
+        :param np.ndarray blend_weights: array with shape (vertex count,).
+        :param np.ndarray or None vertex_ids: vertices to set blend weights of. If None, all vertices are set.
+        """
+
+        raise NotImplementedError
+
+
+class MemorySkinWeightsBackend(SkinWeightsBackend):
+    """
+    Skin weights backend that stores weights in memory. Useful to process weights outside of a scene.
+    """
+
+    def __init__(self, influences: Sequence[str], weights: np.ndarray, blend_weights: np.ndarray | None = None):
+        super().__init__()
+
+        check_numpy()
+        self._influences = list(influences)
+        self._weights = np.array(weights, dtype=np.float64).reshape(-1, len(self._influences))
+        self._blend_weights = np.zeros(
+            len(self._weights), dtype=np.float64) if blend_weights is None else np.array(
+            blend_weights, dtype=np.float64)
+
+    def vertex_count(self) -> int:
+        return len(self._weights)
+
+    def influence_names(self) -> list[str]:
+        return list(self._influences)
+
+    def weights(self, vertex_ids: np.ndarray | None = None) -> np.ndarray:
+        return self._weights.copy() if vertex_ids is None else self._weights[vertex_ids]
+
+    def set_weights(
+            self, weights: np.ndarray, vertex_ids: np.ndarray | None = None,
+            influence_columns: np.ndarray | None = None, normalize: bool = False):
+        rows = np.arange(len(self._weights)) if vertex_ids is None else np.asarray(vertex_ids)
+        if influence_columns is None:
+            self._weights[rows] = weights
+        else:
+            self._weights[np.ix_(rows, np.asarray(influence_columns))] = weights
+        if normalize:
+            self._weights[rows] = normalize_weights(self._weights[rows])
+
+    def blend_weights(self, vertex_ids: np.ndarray | None = None) -> np.ndarray:
+        return self._blend_weights.copy() if vertex_ids is None else self._blend_weights[vertex_ids]
+
+    def set_blend_weights(self, blend_weights: np.ndarray, vertex_ids: np.ndarray | None = None):
+        if vertex_ids is None:
+            self._blend_weights[:] = blend_weights
+        else:
+            self._blend_weights[vertex_ids] = blend_weights
+
+
+class SkinWeights:
+    """
+    Class that holds the weights of a set of vertices as a dense array, with one column per influence.
+    """
+
+    def __init__(self, influences: Sequence[str], weights: np.ndarray, vertex_ids: np.ndarray | None = None):
+        super().__init__()
+
+        check_numpy()
+        self._influences = list(influences)
+        self._weights = np.asarray(weights, dtype=np.float64).reshape(-1, len(self._influences))
+        self._vertex_ids = np.arange(len(self._weights)) if vertex_ids is None else np.asarray(
+            vertex_ids, dtype=np.int64)
+        if len(self._vertex_ids) != len(self._weights):
+            raise ValueError(
+                f'Vertex ids count ({len(self._vertex_ids)}) does not match weights count ({len(self._weights)})')
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} vertices: {len(self._vertex_ids)}, influences: {len(self._influences)}>'
+
+    @property
+    def influences(self) -> list[str]:
+        return self._influences
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @property
+    def vertex_ids(self) -> np.ndarray:
+        return self._vertex_ids
+
+    @classmethod
+    def from_sparse(
+            cls, influences: Sequence[str], offsets: np.ndarray, columns: np.ndarray, values: np.ndarray,
+            vertex_ids: np.ndarray | None = None) -> SkinWeights:
+        """
+        Creates a new skin weights instance from sparse (compressed sparse row) data.
+
+        :param Sequence[str] influences: influence names.
+        :param np.ndarray offsets: array with shape (vertex count + 1,) with the start offset of each vertex values.
+        :param np.ndarray columns: influence column of each value.
+        :param np.ndarray values: weight values.
+        :param np.ndarray or None vertex_ids: vertex ids of each row. If None, rows are consecutive vertex ids.
+        :return: new skin weights instance.
+        :rtype: SkinWeights
+        """
+
+        check_numpy()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        weights = np.zeros((len(offsets) - 1, len(influences)), dtype=np.float64)
+        rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        weights[rows, np.asarray(columns, dtype=np.int64)] = values
+
+        return cls(influences, weights, vertex_ids=vertex_ids)
+
+    @classmethod
+    def load(cls, file_path: str) -> SkinWeights:
+        """
+        Loads skin weights from a file saved with save function.
+
+        :param str file_path: absolute file path.
+        :return: loaded skin weights instance.
+        :rtype: SkinWeights
+        """
+
+        check_numpy()
+        with np.load(file_path, allow_pickle=False) as data:
+            return cls.from_sparse(
+                data['influences'].tolist(), data['offsets'], data['columns'], data['values'],
+                vertex_ids=data['vertex_ids'])
+
+    def to_sparse(self, tolerance: float = ZERO_TOLERANCE) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the weights in compressed sparse row form. Weights lower than given tolerance are discarded.
+
+        :param float tolerance: weights lower or equal than this value are discarded.
+        :return: tuple with the offsets, influence columns and values arrays.
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        mask = self._weights > tolerance
+        rows, columns = np.nonzero(mask)
+        offsets = np.zeros(len(self._weights) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self._weights)), out=offsets[1:])
+
+        return offsets, columns.astype(np.int32), self._weights[rows, columns]
+
+    def save(self, file_path: str, tolerance: float = ZERO_TOLERANCE):
+        """
+        Saves skin weights into a compressed sparse file.
+
+        :param str file_path: absolute file path.
+        :param float tolerance: weights lower or equal than this value are not saved.
+        """
+
+        offsets, columns, values = self.to_sparse(tolerance=tolerance)
+        with open(file_path, 'wb') as weights_file:
+            np.savez_compressed(
+                weights_file, influences=np.array(self._influences, dtype=str), vertex_ids=self._vertex_ids,
+                offsets=offsets, columns=columns, values=values)
+
+    def subset(self, vertex_ids: Sequence[int]) -> SkinWeights:
+        """
+        Returns a new skin weights instance with the weights of the given vertices only.
+
+        :param Sequence[int] vertex_ids: vertex ids to keep.
+        :return: skin weights subset.
+        :rtype: SkinWeights
+        :raises ValueError: if any of the given vertex ids is not stored within this instance.
+        """
+
+        vertex_ids = np.asarray(vertex_ids, dtype=np.int64)
+        if not len(self._vertex_ids):
+            if len(vertex_ids):
+                raise ValueError(f'Vertices not found in skin weights: {vertex_ids.tolist()}')
+            return SkinWeights(self._influences, self._weights[:0], vertex_ids=vertex_ids)
+        order = np.argsort(self._vertex_ids, kind='stable')
+        positions = np.searchsorted(self._vertex_ids, vertex_ids, sorter=order)
+        positions = np.minimum(positions, len(order) - 1)
+        rows = order[positions]
+        missing = self._vertex_ids[rows] != vertex_ids
+        if np.any(missing):
+            raise ValueError(f'Vertices not found in skin weights: {vertex_ids[missing].tolist()}')
+
+        return SkinWeights(self._influences, self._weights[rows], vertex_ids=vertex_ids)
+
+    def remapped(self, influences: Sequence[str], tolerance: float = ZERO_TOLERANCE) -> SkinWeights:
+        """
+        Returns a new skin weights instance with its columns matching the given influences order.
+        Influences are matched by name, or by short name if no exact match is found. Target influences that are not
+        stored within this instance get zero weights.
+
+        :param Sequence[str] influences: target influence names.
+        :param float tolerance: source influences with weights higher than this value must exist in target.
+        :return: remapped skin weights.
+        :rtype: SkinWeights
+        :raises ValueError: if a weighted influence is not found within the given influences.
+        """
+
+        influences = list(influences)
+        if influences == self._influences:
+            return SkinWeights(influences, self._weights.copy(), vertex_ids=self._vertex_ids)
+
+        mapping = influence_mapping(self._influences, influences)
+        unmapped = [i for i in range(len(self._influences)) if i not in mapping]
+        if unmapped:
+            weighted = np.any(self._weights[:, unmapped] > tolerance, axis=0)
+            missing = [self._influences[unmapped[i]] for i in np.nonzero(weighted)[0]]
+            if missing:
+                raise ValueError(f'Influences not found in target: {missing}')
+
+        weights = np.zeros((len(self._weights), len(influences)), dtype=np.float64)
+        if mapping:
+            source_columns = np.fromiter(mapping.keys(), dtype=np.int64, count=len(mapping))
+            target_columns = np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping))
+            weights[:, target_columns] = self._weights[:, source_columns]
+
+        return SkinWeights(influences, weights, vertex_ids=self._vertex_ids)
+
+    def normalized(self) -> SkinWeights:
+        """
+        Returns a new skin weights instance whose vertex weights sum 1.0.
+
+        :return: normalized skin weights.
+        :rtype: SkinWeights
+        """
+
+        return SkinWeights(self._influences, normalize_weights(self._weights), vertex_ids=self._vertex_ids)
+
+
+def short_influence_name(name: str) -> str:
+    """
+    Returns the short name (without DAG path and namespaces) of the given influence name.
+
+    :param str name: influence name.
+    :return: short influence name.
+    :rtype: str
+    """
+
+    return name.rsplit('|', 1)[-1].rsplit(':', 1)[-1]
+
+
+def influence_mapping(source_influences: Sequence[str], target_influences: Sequence[str]) -> dict[int, int]:
+    """
+    Returns a mapping between the columns of the source influences and the columns of the target influences.
+    Influences are matched by name, or by short name if no exact match is found.
+
+    :param Sequence[str] source_influences: source influence names.
+    :param Sequence[str] target_influences: target influence names.
+    :return: dictionary mapping source columns to target columns.
+    :rtype: dict[int, int]
+    """
+
+    target_columns = {name: i for i, name in enumerate(target_influences)}
+    target_short_columns = dict()
+    for i, name in enumerate(target_influences):
+        target_short_columns.setdefault(short_influence_name(name), i)
+
+    mapping = dict()
+    for i, name in enumerate(source_influences):
+        column = target_columns.get(name)
+        if column is None:
+            column = target_short_columns.get(short_influence_name(name))
+        if column is not None:
+            mapping[i] = column
+
+    return mapping
+
+
+def normalize_weights(weights: np.ndarray) -> np.ndarray:
+    """
+    Returns given weights normalized so the weights of each vertex sum 1.0. Vertices without weights are not modified.
+
+    :param np.ndarray weights: array with shape (vertex count, influence count).
+    :return: normalized weights.
+    :rtype: np.ndarray
+    """
+
+    totals = weights.sum(axis=1, keepdims=True)
+    return np.divide(weights, totals, out=weights.copy(), where=totals > 0.0)
+
+
+def read_skin_weights(backend: SkinWeightsBackend, vertex_ids: Sequence[int] | None = None) -> SkinWeights:
+    """
+    Reads the skin weights of the given vertices from the given backend.
+
+    :param SkinWeightsBackend backend: skin weights backend.
+    :param Sequence[int] or None vertex_ids: vertices to read weights of. If None, all vertices are read.
+    :return: skin weights.
+    :rtype: SkinWeights
+    """
+
+    check_numpy()
+    if vertex_ids is not None:
+        vertex_ids = np.asarray(vertex_ids, dtype=np.int64)
+
+    return SkinWeights(backend.influence_names(), backend.weights(vertex_ids), vertex_ids=vertex_ids)
+
+
+def write_skin_weights(
+        backend: SkinWeightsBackend, skin_weights: SkinWeights, vertex_ids: Sequence[int] | None = None,
+        normalize: bool = False):
+    """
+    Writes the given skin weights into the given backend. Weights are remapped to match backend influences.
+
+    :param SkinWeightsBackend backend: skin weights backend.
+    :param SkinWeights skin_weights: skin weights to write.
+    :param Sequence[int] or None vertex_ids: optional subset of the stored vertices to write.
+    :param bool normalize: whether weights should be normalized.
+    :raises ValueError: if skin weights vertices are out of backend range or weighted influences are not found.
+    """
+
+    check_numpy()
+    if vertex_ids is not None:
+        skin_weights = skin_weights.subset(vertex_ids)
+    skin_weights = skin_weights.remapped(backend.influence_names())
+    ids = skin_weights.vertex_ids
+    vertex_count = backend.vertex_count()
+    if len(ids) and (ids.min() < 0 or ids.max() >= vertex_count):
+        raise ValueError(f'Skin weights vertex ids are out of range (vertex count: {vertex_count})')
+
+    all_vertices = len(ids) == vertex_count and np.array_equal(ids, np.arange(vertex_count))
+    backend.set_weights(skin_weights.weights, vertex_ids=None if all_vertices else ids, normalize=normalize)
+
+
+def influence_weights(
+        backend: SkinWeightsBackend, vertex_ids: Sequence[int] | None = None,
+        influence_keys: Sequence[int] | None = None) -> dict[int, list[float]]:
+    """
+    Returns the weights of every backend influence for all backend vertices, as a dictionary of weight lists per
+    influence. Vertices that are not read get zero weights. All influences are returned, even the ones whose weights
+    are all zero.
+
+    :param SkinWeightsBackend backend: skin weights backend.
+    :param Sequence[int] or None vertex_ids: vertices to read weights of. If None, all vertices are read.
+    :param Sequence[int] or None influence_keys: key of each backend influence (for example, skinCluster influence
+        logical indices). If None, influence column indices are used.
+    :return: dictionary with the weights of each influence key.
+    :rtype: dict[int, list[float]]
+    """
+
+    check_numpy()
+    vertex_count = backend.vertex_count()
+    if vertex_ids is not None:
+        vertex_ids = np.asarray(vertex_ids, dtype=np.int64)
+    weights = backend.weights(vertex_ids)
+    if vertex_ids is not None:
+        all_weights = np.zeros((vertex_count, weights.shape[1]))
+        all_weights[vertex_ids] = weights
+        weights = all_weights
+    if influence_keys is None:
+        influence_keys = range(weights.shape[1])
+
+    return {influence_key: weights[:, column].tolist() for column, influence_key in enumerate(influence_keys)}
@@ -10,10 +10,14 @@ from tp.core import log
 from tp.common.python import helpers, path, jsonio
 from tp.maya.api import curves
 from tp.maya.om import nodes as om_nodes
+from tp.maya.libs.curves import packed
 
 CURVE_FILE_EXTENSION = 'curve'
 CURVES_ENV_VAR = 'TPDCC_CURVES_PATHS'
+# when enabled, curves are loaded from a packed archive per library root, which is rebuilt when curve files change
+CURVES_PACKED_ENV_VAR = 'TPDCC_CURVES_PACKED'
 _PATHS_CACHE = dict()
+_PACKED_LIBRARIES = dict()
 
 logger = log.tpLogger
 
@@ -28,7 +32,14 @@ def update_cache(force: bool = False):
 	if _PATHS_CACHE and not force:
 		return
 
+	use_packed = is_packed_enabled()
 	for root in iterate_root_paths():
+		library = _packed_library(root, force=force) if use_packed else None
+		if library is not None:
+			for curve_name in library.names():
+				_PATHS_CACHE[curve_name] = {
+					'path': path.join_path(root, '.'.join([curve_name, CURVE_FILE_EXTENSION])), 'packed': library}
+			continue
 		for shape_path in glob.glob(path.join_path(root, '*.{}'.format(CURVE_FILE_EXTENSION))):
 			_PATHS_CACHE[os.path.splitext(path.basename(shape_path))[0]] = {'path': shape_path}
 
@@ -39,6 +50,45 @@ def clear_cache():
 	"""
 
 	_PATHS_CACHE.clear()
+	for library in _PACKED_LIBRARIES.values():
+		library.close()
+	_PACKED_LIBRARIES.clear()
+
+
+def is_packed_enabled() -> bool:
+	"""
+	Returns whether curves are loaded from packed library archives.
+
+	:return: True if CURVES_PACKED_ENV_VAR environment variable is enabled; False otherwise.
+	:rtype: bool
+	"""
+
+	return os.environ.get(CURVES_PACKED_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def _packed_library(root: str, force: bool = False) -> packed.PackedCurveLibrary | None:
+	"""
+	Internal function that returns the packed library of the given root, opening (and rebuilding if needed) it the
+	first time it is requested.
+
+	:param str root: library root directory.
+	:param bool force: whether to check whether already opened library is stale.
+	:return: packed library or None if it is not available.
+	:rtype: packed.PackedCurveLibrary or None
+	"""
+
+	library = _PACKED_LIBRARIES.get(root)
+	if library is not None and not (force and library.is_stale(root)):
+		return library
+	if library is not None:
+		library.close()
+		del _PACKED_LIBRARIES[root]
+
+	library = packed.open_library(root)
+	if library is not None:
+		_PACKED_LIBRARIES[root] = library
+
+	return library
 
 
 def iterate_root_paths() -> Iterator[str]:
@@ -140,9 +190,15 @@ def load_from_lib(curve_name: str) -> Dict:
 		raise MissingCurveFromLibrary('Curve name {} does not exist in the library'.format(curve_name))
 
 	data = curve_data.get('data')
-	if not data:
-		data = jsonio.read_file(curve_data['path'])
-		curve_data['data'] = data
+	if data:
+		return data
+
+	library = curve_data.get('packed')
+	if library is not None and curve_name in library:
+		return library.load(curve_name)
+
+	data = jsonio.read_file(curve_data['path'])
+	curve_data['data'] = data
 
 	return data
 
@@ -209,7 +265,7 @@ def save_to_directory(
 	save_path = path.join_path(directory, name)
 
 	jsonio.write_to_file(data, save_path)
-	_PATHS_CACHE[os.path.splitext(name)[0]] = {'path': path, 'data': data}
+	_PATHS_CACHE[os.path.splitext(name)[0]] = {'path': save_path, 'data': data}
 
 	return data, save_path
 
@@ -262,6 +318,7 @@ def rename_curve(curve_name: str, new_name: str):
 	os.rename(curve_path, new_path)
 	old_data = _PATHS_CACHE.get(curve_name)
 	old_data['path'] = new_path
+	old_data.pop('packed', None)
 	_PATHS_CACHE[new_name] = old_data
 	del _PATHS_CACHE[curve_name]
 
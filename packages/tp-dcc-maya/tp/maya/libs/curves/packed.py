@@ -0,0 +1,261 @@
+"""
+Module that contains the packed curve library format.
+A packed library stores all the curve files of a library root within a single indexed archive: a JSON index with the
+shape attributes plus a flat float64 block with all CVs and knots, which is memory-mapped so loading a curve is a
+dictionary lookup plus an array slice. Archives are rebuilt from loose curve files when their modification times change.
+
+This module does not depend on Maya.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import mmap
+import array
+import struct
+import tempfile
+from typing import Iterator, Any
+
+from tp.core import log
+
+logger = log.tpLogger
+
+CURVE_FILE_EXTENSION = 'curve'
+PACK_FILE_NAME = 'curves.pack'
+PACK_MAGIC = b'TPCURVES'
+PACK_VERSION = 1
+# magic, version and index size
+_HEADER = struct.Struct('<8sIQ')
+_DOUBLE_SIZE = 8
+_PACKED_ATTRIBUTES = ('cvs', 'knots')
+
+
+def iterate_curve_files(root: str) -> Iterator[os.DirEntry]:
+	"""
+	Generator function that iterates over the loose curve files within given root.
+
+	:param str root: library root directory.
+	:return: iterated curve file entries.
+	:rtype: Iterator[os.DirEntry]
+	"""
+
+	extension = f'.{CURVE_FILE_EXTENSION}'
+	with os.scandir(root) as entries:
+		for entry in entries:
+			if entry.name.endswith(extension) and entry.is_file():
+				yield entry
+
+
+def source_signature(root: str) -> dict[str, list[int]]:
+	"""
+	Returns the modification time and size of each loose curve file within given root.
+	Only file stats are read, so this is cheap even for network locations.
+
+	:param str root: library root directory.
+	:return: dictionary with the [modification time in nanoseconds, size] of each curve file name.
+	:rtype: dict[str, list[int]]
+	"""
+
+	signature = {}
+	for entry in iterate_curve_files(root):
+		stat = entry.stat()
+		signature[entry.name] = [stat.st_mtime_ns, stat.st_size]
+
+	return signature
+
+
+def build(root: str, pack_path: str | None = None) -> str:
+	"""
+	Builds the packed library of the given root from its loose curve files.
+	Archive is written into a temporary file and then moved, so readers never see a partially written archive.
+
+	:param str root: library root directory.
+	:param str or None pack_path: archive path. If not given, archive is created within the root directory.
+	:return: archive path.
+	:rtype: str
+	"""
+
+	pack_path = pack_path or os.path.join(root, PACK_FILE_NAME)
+	values = array.array('d')
+	shapes = {}
+	signature = source_signature(root)
+	for file_name in sorted(signature):
+		try:
+			with open(os.path.join(root, file_name), 'r') as curve_file:
+				curve_data = json.load(curve_file)
+		except (OSError, ValueError):
+			logger.warning(f'Skipping invalid curve file while packing library: {os.path.join(root, file_name)}')
+			continue
+		packed_shapes = {}
+		for shape_name, shape_data in curve_data.items():
+			packed_shape = {key: value for key, value in shape_data.items() if key not in _PACKED_ATTRIBUTES}
+			cvs = shape_data.get('cvs') or []
+			width = len(cvs[0]) if cvs else 0
+			packed_shape['cvs'] = [len(values), len(cvs), width]
+			for cv in cvs:
+				values.extend(float(value) for value in cv)
+			knots = shape_data.get('knots')
+			if knots is None:
+				packed_shape['knots'] = None
+			else:
+				packed_shape['knots'] = [len(values), len(knots)]
+				values.extend(float(knot) for knot in knots)
+			packed_shapes[shape_name] = packed_shape
+		shapes[os.path.splitext(file_name)[0]] = packed_shapes
+
+	index = json.dumps({'sources': signature, 'shapes': shapes}, separators=(',', ':')).encode('utf-8')
+	padding = -(_HEADER.size + len(index)) % _DOUBLE_SIZE
+	file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(pack_path) or '.', suffix='.tmp')
+	try:
+		with os.fdopen(file_descriptor, 'wb') as pack_file:
+			pack_file.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index) + padding))
+			pack_file.write(index)
+			pack_file.write(b' ' * padding)
+			if values.itemsize != _DOUBLE_SIZE:
+				raise ValueError('Unsupported double size')
+			values.tofile(pack_file)
+		os.replace(temp_path, pack_path)
+	except BaseException:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		raise
+
+	return pack_path
+
+
+class PackedCurveLibrary:
+	"""
+	Class that provides random access to the curves of a packed library archive.
+	"""
+
+	def __init__(self, pack_path: str):
+		"""
+		Constructor.
+
+		:param str pack_path: archive path.
+		:raises ValueError: if given file is not a valid packed library archive.
+		"""
+
+		super().__init__()
+
+		self._pack_path = pack_path
+		self._mmap = None					# type: mmap.mmap | None
+		self._values = None					# type: memoryview | None
+		with open(pack_path, 'rb') as pack_file:
+			magic, version, index_size = _HEADER.unpack(pack_file.read(_HEADER.size))
+			if magic != PACK_MAGIC or version != PACK_VERSION:
+				raise ValueError(f'Invalid packed curve library: {pack_path}')
+			index = json.loads(pack_file.read(index_size).decode('utf-8'))
+			data_offset = _HEADER.size + index_size
+			data_size = os.fstat(pack_file.fileno()).st_size - data_offset
+			if data_size > 0:
+				self._mmap = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+				self._values = memoryview(self._mmap)[data_offset:].cast('d')
+		self._sources = index['sources']		# type: dict[str, list[int]]
+		self._shapes = index['shapes']			# type: dict[str, dict[str, dict]]
+
+	def __contains__(self, curve_name: str) -> bool:
+		return curve_name in self._shapes
+
+	def __len__(self) -> int:
+		return len(self._shapes)
+
+	@property
+	def pack_path(self) -> str:
+		return self._pack_path
+
+	@property
+	def sources(self) -> dict[str, list[int]]:
+		return self._sources
+
+	def names(self) -> list[str]:
+		"""
+		Returns the names of all packed curves.
+
+		:return: curve names.
+		:rtype: list[str]
+		"""
+
+		return list(self._shapes)
+
+	def load(self, curve_name: str) -> dict[str, dict[str, Any]]:
+		"""
+		Returns the data of the curve with given name, with the same layout as loose curve files.
+
+		:param str curve_name: name of the curve to load.
+		:return: curve data.
+		:rtype: dict[str, dict[str, Any]]
+		:raises KeyError: if no curve with given name is packed.
+		"""
+
+		curve_data = {}
+		for shape_name, packed_shape in self._shapes[curve_name].items():
+			shape_data = dict(packed_shape)
+			offset, count, width = packed_shape['cvs']
+			values = self._values[offset:offset + count * width].tolist() if count else []
+			shape_data['cvs'] = [values[i:i + width] for i in range(0, len(values), width)]
+			knots = packed_shape['knots']
+			if knots is not None:
+				offset, count = knots
+				shape_data['knots'] = self._values[offset:offset + count].tolist() if count else []
+			curve_data[shape_name] = shape_data
+
+		return curve_data
+
+	def is_stale(self, root: str) -> bool:
+		"""
+		Returns whether the loose curve files of the given root changed since this archive was built.
+
+		:param str root: library root directory.
+		:return: True if archive needs to be rebuilt; False otherwise.
+		:rtype: bool
+		"""
+
+		return source_signature(root) != self._sources
+
+	def close(self):
+		"""
+		Releases the memory map of the archive.
+		"""
+
+		if self._values is not None:
+			self._values.release()
+			self._values = None
+		if self._mmap is not None:
+			self._mmap.close()
+			self._mmap = None
+
+
+def open_library(root: str, rebuild: bool = True) -> PackedCurveLibrary | None:
+	"""
+	Opens the packed library of the given root, building or rebuilding it if it does not exist or if its loose curve
+	files changed.
+
+	:param str root: library root directory.
+	:param bool rebuild: whether to build the archive if it is missing or stale.
+	:return: packed library or None if archive is not available and could not be built (for example, because root
+		directory is read-only).
+	:rtype: PackedCurveLibrary or None
+	"""
+
+	pack_path = os.path.join(root, PACK_FILE_NAME)
+	library = None
+	if os.path.isfile(pack_path):
+		try:
+			library = PackedCurveLibrary(pack_path)
+		except (OSError, ValueError, struct.error):
+			logger.warning(f'Unable to open packed curve library: {pack_path}', exc_info=True)
+	if library is not None and not library.is_stale(root):
+		return library
+	if library is not None:
+		library.close()
+	if not rebuild:
+		return None
+
+	try:
+		build(root, pack_path)
+		return PackedCurveLibrary(pack_path)
+	except (OSError, ValueError):
+		logger.debug(f'Unable to build packed curve library: {pack_path}', exc_info=True)
+		return None
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator, Hashable, Any
+
+from tp.core import log
+
+logger = log.tpLogger
+
+
+class TriggerRegistry:
+	"""
+	Class that caches the trigger of each node, keyed by node handle, so dispatching a selection event only costs a
+	dictionary lookup per selected node. Nodes without triggers are cached too.
+	Registry does not depend on Maya: triggers are resolved through a resolver function and cache entries must be
+	invalidated by calling invalidate function when trigger attributes of a node change or a node is deleted.
+	"""
+
+	def __init__(self, resolver: Callable[[Any], Any]):
+		"""
+		Constructor.
+
+		:param Callable[[Any], Any] resolver: function that receives a node and returns its trigger or None if node
+			has no trigger.
+		"""
+
+		super().__init__()
+
+		self._resolver = resolver
+		self._triggers = {}						# type: dict[Hashable, Any]
+
+	def __len__(self) -> int:
+		return len(self._triggers)
+
+	def __contains__(self, key: Hashable) -> bool:
+		return key in self._triggers
+
+	def trigger(self, key: Hashable, node: Any) -> Any:
+		"""
+		Returns the trigger of the given node, resolving it if it is not cached yet.
+
+		:param Hashable key: node key.
+		:param Any node: node to resolve trigger of if trigger is not cached. It can also be a function with no
+			arguments that returns the node, so the node is only built when trigger needs to be resolved.
+		:return: node trigger or None if node has no trigger.
+		:rtype: Any
+		"""
+
+		try:
+			return self._triggers[key]
+		except KeyError:
+			pass
+
+		node = node() if callable(node) else node
+		try:
+			found_trigger = self._resolver(node)
+		except Exception:
+			logger.exception(f'Unable to resolve trigger of node: {node}')
+			found_trigger = None
+		self._triggers[key] = found_trigger
+
+		return found_trigger
+
+	def iterate_triggers(self, keys_and_nodes: Iterable[tuple[Hashable, Any]]) -> Iterator[Any]:
+		"""
+		Generator function that iterates over the triggers of the given nodes, skipping nodes without triggers.
+
+		:param Iterable[tuple[Hashable, Any]] keys_and_nodes: node keys and nodes (or functions returning nodes).
+		:return: iterated triggers.
+		:rtype: Iterator[Any]
+		"""
+
+		for key, node in keys_and_nodes:
+			found_trigger = self.trigger(key, node)
+			if found_trigger is not None:
+				yield found_trigger
+
+	def invalidate(self, key: Hashable):
+		"""
+		Removes the cached trigger of the node with given key.
+		Should be called when trigger attributes of a node change or the node is deleted.
+
+		:param Hashable key: node key.
+		"""
+
+		self._triggers.pop(key, None)
+
+	def clear(self):
+		"""
+		Removes all cached triggers.
+		"""
+
+		self._triggers.clear()
+
+
+class SelectionCoalescer:
+	"""
+	Class that coalesces bursts of selection events, so only the last selection of a burst is dispatched.
+	Dispatch is scheduled through a scheduler function (for example, a function that defers execution until the DCC
+	is idle).
+	"""
+
+	def __init__(self, dispatcher: Callable[[Any], None], scheduler: Callable[[Callable[[], None]], None]):
+		"""
+		Constructor.
+
+		:param Callable[[Any], None] dispatcher: function that receives the last selection of a burst.
+		:param Callable[[Callable[[], None]], None] scheduler: function that schedules the execution of the given
+			function.
+		"""
+
+		super().__init__()
+
+		self._dispatcher = dispatcher
+		self._scheduler = scheduler
+		self._pending = None
+		self._scheduled = False
+
+	@property
+	def is_scheduled(self) -> bool:
+		return self._scheduled
+
+	def push(self, selection: Any):
+		"""
+		Adds a new selection event. Dispatch is scheduled only for the first event of a burst.
+
+		:param Any selection: selection to dispatch.
+		"""
+
+		self._pending = selection
+		if self._scheduled:
+			return
+		self._scheduled = True
+		self._scheduler(self.flush)
+
+	def flush(self):
+		"""
+		Dispatches the last pushed selection, if any.
+		"""
+
+		selection, self._pending = self._pending, None
+		self._scheduled = False
+		if selection is None:
+			return
+
+		self._dispatcher(selection)
+
+	def cancel(self):
+		"""
+		Discards the pending selection, if any.
+		"""
+
+		self._pending = None
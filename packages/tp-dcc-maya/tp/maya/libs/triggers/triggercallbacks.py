@@ -4,13 +4,15 @@ import contextlib
 from functools import wraps
 from typing import List, Callable, Any
 
+import maya.utils as utils
 import maya.api.OpenMaya as OpenMaya
 
 from tp.maya.cmds import decorators
 from tp.maya.api import base, callbacks
-from tp.maya.libs.triggers import consts, triggernode
+from tp.maya.libs.triggers import consts, triggernode, triggercache
 
 CURRENT_SELECTION_CALLBACK = None					# type: callbacks.CallbackSelection
+_SELECTION_COALESCER = None							# type: triggercache.SelectionCoalescer | None
 
 
 def create_selection_callback():
@@ -21,13 +23,12 @@ def create_selection_callback():
 	def _on_selection_callback(selection: List[OpenMaya.MObjectHandle]):
 		"""
 		Internal function that is called when Maya selection callback is executed.
+		Bursts of selection changes are coalesced, so triggers are only executed for the last selection.
 
 		:param List[OpenMaya.MObjectHandle] selection: selected nodes.
 		"""
 
-		selection = [base.node_by_object(handle.object()) for handle in selection]
-		if selection:
-			execute_trigger_from_nodes(selection)
+		selection_coalescer().push(list(selection))
 
 	global CURRENT_SELECTION_CALLBACK
 	if CURRENT_SELECTION_CALLBACK is not None:
@@ -64,6 +65,35 @@ def remove_selection_callback():
 	CURRENT_SELECTION_CALLBACK.stop()
 
 
+def selection_coalescer() -> triggercache.SelectionCoalescer:
+	"""
+	Returns the coalescer that defers selection trigger execution until Maya is idle.
+
+	:return: selection coalescer.
+	:rtype: triggercache.SelectionCoalescer
+	"""
+
+	global _SELECTION_COALESCER
+	if _SELECTION_COALESCER is None:
+		_SELECTION_COALESCER = triggercache.SelectionCoalescer(execute_trigger_from_handles, utils.executeDeferred)
+
+	return _SELECTION_COALESCER
+
+
+def execute_trigger_from_handles(handles: List[OpenMaya.MObjectHandle]):
+	"""
+	Executes the selection trigger command for each one of the given node handles.
+	Triggers are retrieved from the trigger registry, so nodes without triggers only cost a dictionary lookup.
+
+	:param List[OpenMaya.MObjectHandle] handles: handles of the nodes to execute trigger for.
+	"""
+
+	registry = triggernode.trigger_registry()
+	triggers = [trigger for trigger in map(registry.trigger_from_handle, handles) if trigger is not None]
+	if triggers:
+		_execute_selection_triggers(triggers)
+
+
 @decorators.undo
 def execute_trigger_from_nodes(nodes: List[base.DGNode]):
 	"""
@@ -72,13 +102,22 @@ def execute_trigger_from_nodes(nodes: List[base.DGNode]):
 	:param List[base.DGNode] nodes: nodes to execute trigger for. 
 	"""
 
-	triggers = []
-	for node in nodes:
-		triggers.append(triggernode.TriggerNode.from_node(node))
-	if not triggers:
-		return
+	registry = triggernode.trigger_registry()
+	triggers = [trigger for trigger in map(registry.trigger, nodes) if trigger is not None]
+	if triggers:
+		_execute_selection_triggers(triggers)
+
+
+@decorators.undo
+def _execute_selection_triggers(triggers: List[triggernode.TriggerNode]):
+	"""
+	Internal function that executes the commands of the given selection triggers within a single undo chunk.
+
+	:param List[triggernode.TriggerNode] triggers: triggers to execute.
+	"""
+
 	for trigger in triggers:
-		if trigger is None or not trigger.is_command_base_type(consts.TRIGGER_SELECTION_TYPE):
+		if not trigger.is_command_base_type(consts.TRIGGER_SELECTION_TYPE):
 			continue
 		cmd = trigger.command
 		if cmd:
@@ -7,11 +7,30 @@ import maya.api.OpenMaya as OpenMaya
 
 from tp.maya.api import base, exceptions, attributetypes
 from tp.maya.meta import base as meta_base
-from tp.maya.libs.triggers import consts, errors, managers
+from tp.maya.libs.triggers import consts, errors, managers, triggercache
 
 if typing.TYPE_CHECKING:
 	from tp.maya.libs.triggers.triggercommand import TriggerCommand
 
+TRIGGER_ATTR_NAMES = (consts.TRIGGER_ATTR_NAME, consts.TRIGGER_COMMAND_TYPE_ATTR_NAME)
+_TRIGGER_NODE_REGISTRY = None						# type: TriggerNodeRegistry | None
+
+
+def trigger_registry() -> TriggerNodeRegistry:
+	"""
+	Returns the trigger node registry used to dispatch trigger commands.
+
+	:return: trigger node registry.
+	:rtype: TriggerNodeRegistry
+	"""
+
+	global _TRIGGER_NODE_REGISTRY
+	if _TRIGGER_NODE_REGISTRY is None:
+		_TRIGGER_NODE_REGISTRY = TriggerNodeRegistry()
+		_TRIGGER_NODE_REGISTRY.install()
+
+	return _TRIGGER_NODE_REGISTRY
+
 
 def create_trigger_for_node(
 		node: base.DGNode, command_name: str, modifier: OpenMaya.MDGModifier | None = None) -> TriggerNode:
@@ -222,6 +241,8 @@ class TriggerNode:
 			self._command.on_create(modifier=modifier)
 			if apply and modifier is not None:
 				modifier.doIt()
+			if _TRIGGER_NODE_REGISTRY is not None:
+				_TRIGGER_NODE_REGISTRY.track_node(self._node)
 
 	def attributes(self) -> List[Dict]:
 		"""
@@ -252,6 +273,8 @@ class TriggerNode:
 		self._node.deleteAttribute(consts.TRIGGER_ATTR_NAME, mod=modifier)
 		if modifier is not None and apply:
 			modifier.doIt()
+		if _TRIGGER_NODE_REGISTRY is not None:
+			_TRIGGER_NODE_REGISTRY.invalidate_node(self._node)
 
 	def _create_attributes(self, modifier: OpenMaya.MDGModifier | None = None, apply: bool = True):
 		"""
@@ -276,3 +299,185 @@ class TriggerNode:
 		self._node.addCompoundAttribute(consts.TRIGGER_ATTR_NAME, attrs, mod=modifier, apply=apply)
 		if modifier is not None and apply:
 			modifier.doIt()
+
+
+class TriggerNodeRegistry:
+	"""
+	Class that caches trigger nodes keyed by Maya node handle and keeps the cache up to date using Maya callbacks.
+	Cached trigger of a node is invalidated when its trigger attributes change or when the node is deleted, and the
+	whole cache is cleared when a scene is opened or created.
+	Attribute callbacks are only registered for nodes that have (or had) a trigger. Nodes without triggers are cached
+	without callbacks, so their entries are invalidated by TriggerNode when a trigger is created on them.
+	"""
+
+	def __init__(self):
+		super().__init__()
+
+		self._node_callbacks = {}				# type: dict[int, int]
+		self._callback_ids = []					# type: list[int]
+		self._registry = triggercache.TriggerRegistry(self._resolve)
+
+	@property
+	def registry(self) -> triggercache.TriggerRegistry:
+		return self._registry
+
+	@property
+	def is_installed(self) -> bool:
+		return bool(self._callback_ids)
+
+	def install(self):
+		"""
+		Installs the scene callbacks used to keep the cache up to date.
+		"""
+
+		if self._callback_ids:
+			return
+
+		self._callback_ids = [
+			OpenMaya.MDGMessage.addNodeRemovedCallback(self._on_node_removed, 'dependNode'),
+			OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeOpen, self._on_scene_change),
+			OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, self._on_scene_change)
+		]
+
+	def uninstall(self):
+		"""
+		Removes all the callbacks installed by this registry and clears the cache.
+		"""
+
+		for callback_id in self._callback_ids:
+			OpenMaya.MMessage.removeCallback(callback_id)
+		self._callback_ids = []
+		self.clear()
+
+	def trigger(self, node: base.DGNode) -> TriggerNode | None:
+		"""
+		Returns the cached trigger node of the given node.
+
+		:param base.DGNode node: node to get trigger of.
+		:return: trigger node or None if node has no trigger.
+		:rtype: TriggerNode or None
+		"""
+
+		return self._registry.trigger(hash(node), node)
+
+	def trigger_from_handle(self, handle: OpenMaya.MObjectHandle) -> TriggerNode | None:
+		"""
+		Returns the cached trigger node of the node with given handle. API node is only created if trigger of the node
+		is not cached yet.
+
+		:param OpenMaya.MObjectHandle handle: node handle.
+		:return: trigger node or None if node has no trigger.
+		:rtype: TriggerNode or None
+		"""
+
+		key = handle.hashCode()
+		if not handle.isValid() or not handle.isAlive():
+			self.invalidate(key)
+			return None
+
+		return self._registry.trigger(key, lambda: base.node_by_object(handle.object()))
+
+	def invalidate(self, key: int):
+		"""
+		Removes the cached trigger of the node with given handle hash code.
+
+		:param int key: node handle hash code.
+		"""
+
+		self._registry.invalidate(key)
+		callback_id = self._node_callbacks.pop(key, None)
+		if callback_id is not None:
+			OpenMaya.MMessage.removeCallback(callback_id)
+
+	def invalidate_node(self, node: base.DGNode):
+		"""
+		Removes the cached trigger of the given node. Node attribute changes keep being tracked, if they were.
+
+		:param base.DGNode node: node to invalidate.
+		"""
+
+		self._registry.invalidate(hash(node))
+
+	def track_node(self, node: base.DGNode):
+		"""
+		Removes the cached trigger of the given node and tracks its attribute changes from now on.
+		Must be called when a trigger is created on a node, so the cache is also updated when trigger attributes are
+		created later by a modifier.
+
+		:param base.DGNode node: node to track.
+		"""
+
+		self._registry.invalidate(hash(node))
+		self._track(node)
+
+	def clear(self):
+		"""
+		Removes all cached triggers.
+		"""
+
+		for callback_id in self._node_callbacks.values():
+			OpenMaya.MMessage.removeCallback(callback_id)
+		self._node_callbacks.clear()
+		self._registry.clear()
+
+	def _resolve(self, node: base.DGNode) -> TriggerNode | None:
+		"""
+		Internal function that resolves the trigger of the given node and tracks its attribute changes if it has a
+		trigger.
+
+		:param base.DGNode node: node to resolve trigger of.
+		:return: trigger node or None if node has no trigger.
+		:rtype: TriggerNode or None
+		"""
+
+		trigger_node = TriggerNode.from_node(node)
+		if trigger_node is not None:
+			self._track(node)
+
+		return trigger_node
+
+	def _track(self, node: base.DGNode):
+		"""
+		Internal function that registers the attribute changed callback of the given node, if it is not registered yet.
+
+		:param base.DGNode node: node to track.
+		"""
+
+		key = hash(node)
+		if key not in self._node_callbacks:
+			self._node_callbacks[key] = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+				node.object(), self._on_attribute_changed)
+
+	def _on_node_removed(self, mobj: OpenMaya.MObject, *args):
+		"""
+		Internal callback function that is called each time a node is removed from the scene.
+
+		:param OpenMaya.MObject mobj: removed node.
+		"""
+
+		# nodes without triggers are cached too, and handle hash codes can be reused by new nodes
+		self.invalidate(OpenMaya.MObjectHandle(mobj).hashCode())
+
+	def _on_attribute_changed(self, msg: int, plug: OpenMaya.MPlug, *args):
+		"""
+		Internal callback function that is called each time an attribute of a tracked node changes.
+
+		:param int msg: attribute message.
+		:param OpenMaya.MPlug plug: changed plug.
+		"""
+
+		if not msg & (
+				OpenMaya.MNodeMessage.kAttributeSet | OpenMaya.MNodeMessage.kAttributeAdded |
+				OpenMaya.MNodeMessage.kAttributeRemoved):
+			return
+		if OpenMaya.MFnAttribute(plug.attribute()).name not in TRIGGER_ATTR_NAMES:
+			return
+
+		self._registry.invalidate(OpenMaya.MObjectHandle(plug.node()).hashCode())
+
+	def _on_scene_change(self, *args):
+		"""
+		Internal callback function that is called before a scene is opened or created.
+		"""
+
+		self.clear()
@@ -12,6 +12,7 @@ import maya.api.OpenMaya as OpenMaya
 from tp.core import log
 from tp.common.python import helpers, decorators, path, modules
 from tp.maya.api import types, base, attributetypes
+from tp.maya.meta import sceneindex
 
 
 MCLASS_ATTR_NAME = 'tpMetaClass'
@@ -22,6 +23,8 @@ MTAG_ATTR_NAME = 'tpTag'
 
 logger = log.tpLogger
 
+_SCENE_INDEXER: MetaSceneIndexer | None = None
+
 
 def core_meta_node() -> Core:
     """
@@ -113,6 +116,23 @@ def meta_node_type(node: base.DGNode) -> Type | None:
     return MetaRegistry.get_type(meta_class_name)
 
 
+def scene_indexer() -> MetaSceneIndexer:
+    """
+    Returns the meta scene indexer instance, which keeps track of the meta nodes within current scene.
+    If indexer does not exist yet, it will be created and its scene callbacks installed.
+
+    :return: meta scene indexer instance.
+    :rtype: MetaSceneIndexer
+    """
+
+    global _SCENE_INDEXER
+    if _SCENE_INDEXER is None:
+        _SCENE_INDEXER = MetaSceneIndexer()
+    _SCENE_INDEXER.install()
+
+    return _SCENE_INDEXER
+
+
 def find_scene_roots() -> list[MetaBase]:
     """
     Finds all meta nodes in the scene that are root meta nodes.
@@ -121,7 +141,22 @@ def find_scene_roots() -> list[MetaBase]:
     :rtype: list[MetaBase]
     """
 
-    return [meta for meta in iterate_scene_meta_nodes() if not list(meta.get_meta_parents())]
+    indexer = scene_indexer()
+    return [MetaBase(node=mobj) for mobj in indexer.iterate_objects(indexer.index.root_keys())]
+
+
+def find_meta_nodes_by_root(root: MetaBase) -> list[MetaBase]:
+    """
+    Returns all meta nodes under the given root meta node, including the root meta node itself.
+
+    :param MetaBase root: root meta node.
+    :return: list of meta nodes under given root.
+    :rtype: list[MetaBase]
+    """
+
+    indexer = scene_indexer()
+    root_key = OpenMaya.MObjectHandle(root.object()).hashCode()
+    return [MetaBase(node=mobj) for mobj in indexer.iterate_objects(indexer.index.keys_by_root(root_key))]
 
 
 def iterate_scene_meta_nodes() -> Iterator[MetaBase]:
@@ -132,13 +167,9 @@ def iterate_scene_meta_nodes() -> Iterator[MetaBase]:
     :rtype: Iterator[MetaBase]
     """
 
-    it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kAffect)
-    while not it.isDone():
-        mobj = it.thisNode()
-        dep = OpenMaya.MFnDependencyNode(mobj)
-        if dep.hasAttribute(MCLASS_ATTR_NAME):
-            yield MetaBase(node=mobj)
-        it.next()
+    indexer = scene_indexer()
+    for mobj in indexer.iterate_objects(indexer.index.keys()):
+        yield MetaBase(node=mobj)
 
 
 def find_meta_nodes_by_class_type(class_type: Type | str) -> list[MetaBase]:
@@ -154,14 +185,8 @@ def find_meta_nodes_by_class_type(class_type: Type | str) -> list[MetaBase]:
     if inspect.isclass(class_type):
         class_type_name = class_type.ID
 
-    found_meta_nodes = []
-    for meta_node in iterate_scene_meta_nodes():
-        meta_class_name = meta_node.attribute(MCLASS_ATTR_NAME).value()
-        if meta_class_name != class_type_name:
-            continue
-        found_meta_nodes.append(meta_node)
-
-    return found_meta_nodes
+    indexer = scene_indexer()
+    return [MetaBase(node=mobj) for mobj in indexer.iterate_objects(indexer.index.keys_by_class_type(class_type_name))]
 
 
 def find_meta_node_from_node(
@@ -323,6 +348,218 @@ def connected_meta_nodes(node: base.DGNode | OpenMaya.MObject) -> list[MetaBase]
     return meta_nodes
 
 
+class MetaSceneIndexer:
+    """
+    Class that keeps a meta scene index up to date using Maya callbacks. Scene is scanned once, and after that, the
+    index is updated through node added, node removed, attribute changed and scene open callbacks.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._handles = {}  # type: dict[int, OpenMaya.MObjectHandle]
+        self._node_callbacks = {}  # type: dict[int, int]
+        self._callback_ids = []  # type: list[int]
+        self._scene_changing = False
+        self._index = sceneindex.MetaSceneIndex(self._scan, self._resolve)
+
+    @property
+    def index(self) -> sceneindex.MetaSceneIndex:
+        return self._index
+
+    @property
+    def is_installed(self) -> bool:
+        return bool(self._callback_ids)
+
+    def install(self):
+        """
+        Installs the scene callbacks used to keep the index up to date.
+        """
+
+        if self._callback_ids:
+            return
+
+        self._callback_ids = [
+            OpenMaya.MDGMessage.addNodeAddedCallback(self._on_node_added, 'network'),
+            OpenMaya.MDGMessage.addNodeRemovedCallback(self._on_node_removed, 'network'),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeOpen, self._on_before_scene_change),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, self._on_before_scene_change),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, self._on_after_scene_change),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterNew, self._on_after_scene_change)
+        ]
+        self._index.invalidate()
+
+    def uninstall(self):
+        """
+        Removes all the callbacks installed by this indexer.
+        """
+
+        for callback_id in self._callback_ids:
+            OpenMaya.MMessage.removeCallback(callback_id)
+        self._callback_ids = []
+        self._clear_nodes()
+        self._index.invalidate()
+
+    def iterate_objects(self, keys: Iterable[int]) -> Iterator[OpenMaya.MObject]:
+        """
+        Generator function that iterates over the Maya objects of the given index keys.
+
+        :param Iterable[int] keys: index keys.
+        :return: iterated Maya objects.
+        :rtype: Iterator[OpenMaya.MObject]
+        """
+
+        for key in keys:
+            handle = self._handles.get(key)
+            if handle is not None and handle.isValid() and handle.isAlive():
+                yield handle.object()
+
+    def _register(self, mobj: OpenMaya.MObject) -> int:
+        """
+        Internal function that registers given node, so its attribute changes are tracked.
+
+        :param OpenMaya.MObject mobj: node to register.
+        :return: node index key.
+        :rtype: int
+        """
+
+        handle = OpenMaya.MObjectHandle(mobj)
+        key = handle.hashCode()
+        if key not in self._node_callbacks:
+            self._handles[key] = handle
+            self._node_callbacks[key] = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+                mobj, self._on_attribute_changed)
+
+        return key
+
+    def _unregister(self, key: int):
+        """
+        Internal function that unregisters the node with given key.
+
+        :param int key: node index key.
+        """
+
+        self._handles.pop(key, None)
+        callback_id = self._node_callbacks.pop(key, None)
+        if callback_id is not None:
+            OpenMaya.MMessage.removeCallback(callback_id)
+
+    def _clear_nodes(self):
+        """
+        Internal function that unregisters all nodes.
+        """
+
+        for key in list(self._node_callbacks):
+            self._unregister(key)
+        self._handles.clear()
+
+    def _scan(self) -> Iterator[int]:
+        """
+        Internal function that iterates over all network nodes within current scene.
+
+        :return: iterated node index keys.
+        :rtype: Iterator[int]
+        """
+
+        self._clear_nodes()
+        it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kAffect)
+        while not it.isDone():
+            yield self._register(it.thisNode())
+            it.next()
+
+    def _resolve(self, key: int) -> sceneindex.NodeInfo:
+        """
+        Internal function that returns the class type and meta parents of the node with given key.
+
+        :param int key: node index key.
+        :return: node class type and meta parent keys or None if node is not a meta node.
+        :rtype: sceneindex.NodeInfo
+        """
+
+        handle = self._handles.get(key)
+        if handle is None or not handle.isValid() or not handle.isAlive():
+            return None
+        dep = OpenMaya.MFnDependencyNode(handle.object())
+        if not dep.hasAttribute(MCLASS_ATTR_NAME):
+            return None
+
+        parent_keys = []
+        if dep.hasAttribute(MPARENT_ATTR_NAME):
+            parent_plug = dep.findPlug(MPARENT_ATTR_NAME, False)
+            for i in range(parent_plug.numElements()):
+                for destination in parent_plug.elementByPhysicalIndex(i).destinations():
+                    parent_keys.append(self._register(destination.node()))
+
+        return dep.findPlug(MCLASS_ATTR_NAME, False).asString(), parent_keys
+
+    def _on_node_added(self, mobj: OpenMaya.MObject, *args):
+        """
+        Internal callback function that is called each time a network node is added into the scene.
+
+        :param OpenMaya.MObject mobj: added node.
+        """
+
+        if self._scene_changing or not self._index.is_valid:
+            return
+
+        self._index.node_added(self._register(mobj))
+
+    def _on_node_removed(self, mobj: OpenMaya.MObject, *args):
+        """
+        Internal callback function that is called each time a network node is removed from the scene.
+
+        :param OpenMaya.MObject mobj: removed node.
+        """
+
+        if self._scene_changing:
+            return
+
+        key = OpenMaya.MObjectHandle(mobj).hashCode()
+        self._unregister(key)
+        self._index.node_removed(key)
+
+    def _on_attribute_changed(self, msg: int, plug: OpenMaya.MPlug, other_plug: OpenMaya.MPlug, *args):
+        """
+        Internal callback function that is called each time an attribute of a registered node changes.
+
+        :param int msg: attribute message.
+        :param OpenMaya.MPlug plug: changed plug.
+        :param OpenMaya.MPlug other_plug: other plug of the connection, if any.
+        """
+
+        if self._scene_changing:
+            return
+
+        attribute_name = OpenMaya.MFnAttribute(plug.attribute()).name
+        if attribute_name == MCLASS_ATTR_NAME:
+            if msg & (
+                    OpenMaya.MNodeMessage.kAttributeSet | OpenMaya.MNodeMessage.kAttributeAdded |
+                    OpenMaya.MNodeMessage.kAttributeRemoved):
+                self._index.node_changed(OpenMaya.MObjectHandle(plug.node()).hashCode())
+        elif msg & (OpenMaya.MNodeMessage.kConnectionMade | OpenMaya.MNodeMessage.kConnectionBroken):
+            if attribute_name == MPARENT_ATTR_NAME:
+                self._index.node_changed(OpenMaya.MObjectHandle(plug.node()).hashCode())
+            elif attribute_name == MCHILDREN_ATTR_NAME:
+                self._index.node_changed(OpenMaya.MObjectHandle(other_plug.node()).hashCode())
+
+    def _on_before_scene_change(self, *args):
+        """
+        Internal callback function that is called before a scene is opened or created.
+        """
+
+        self._scene_changing = True
+        self._clear_nodes()
+        self._index.invalidate()
+
+    def _on_after_scene_change(self, *args):
+        """
+        Internal callback function that is called after a scene is opened or created.
+        """
+
+        self._scene_changing = False
+        self._index.invalidate()
+
+
 @decorators.add_metaclass(decorators.Singleton)
 class MetaRegistry(object):
     """
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Hashable, Optional, Tuple
+
+# (class type name, meta parent keys) of a node, or None if the node is not a meta node.
+NodeInfo = Optional[Tuple[str, Iterable[Hashable]]]
+
+
+class MetaSceneIndex:
+    """
+    Class that indexes the meta nodes of a scene by class type, by meta parent connection and by root.
+    Index does not depend on Maya: nodes are identified by opaque hashable keys, nodes are found using a scanner
+    function and node information is retrieved using a resolver function. Index is kept up to date by calling the
+    event functions (node_added, node_changed, node_removed and invalidate) from scene callbacks.
+    """
+
+    def __init__(self, scanner: Callable[[], Iterable[Hashable]], resolver: Callable[[Hashable], NodeInfo]):
+        """
+        Constructor.
+
+        :param Callable[[], Iterable[Hashable]] scanner: function that returns the keys of all scene nodes that can
+            be meta nodes.
+        :param Callable[[Hashable], NodeInfo] resolver: function that returns the class type and meta parent keys of
+            the node with given key, or None if node is not a meta node.
+        """
+
+        super().__init__()
+
+        self._scanner = scanner
+        self._resolver = resolver
+        self._class_types = {}  # type: dict[Hashable, str]
+        self._by_class_type = {}  # type: dict[str, dict[Hashable, None]]
+        self._parents = {}  # type: dict[Hashable, tuple[Hashable, ...]]
+        self._children = {}  # type: dict[Hashable, dict[Hashable, None]]
+        self._pending = {}  # type: dict[Hashable, None]
+        self._valid = False
+
+    def __len__(self) -> int:
+        self._update()
+        return len(self._class_types)
+
+    def __contains__(self, key: Hashable) -> bool:
+        self._update()
+        return key in self._class_types
+
+    @property
+    def is_valid(self) -> bool:
+        return self._valid
+
+    def invalidate(self):
+        """
+        Invalidates the whole index, so the scene is scanned again the next time the index is queried.
+        Should be called when a new scene is opened or created.
+        """
+
+        self._valid = False
+        self._pending.clear()
+
+    def node_added(self, key: Hashable):
+        """
+        Function that should be called when a node is added into the scene.
+        Node is resolved the next time the index is queried, so meta attributes added after node creation are found.
+
+        :param Hashable key: node key.
+        """
+
+        if self._valid:
+            self._pending[key] = None
+
+    def node_changed(self, key: Hashable):
+        """
+        Function that should be called when the class type or the meta parent connections of a node change.
+
+        :param Hashable key: node key.
+        """
+
+        if self._valid:
+            self._pending[key] = None
+
+    def node_removed(self, key: Hashable):
+        """
+        Function that should be called when a node is removed from the scene.
+
+        :param Hashable key: node key.
+        """
+
+        self._pending.pop(key, None)
+        if not self._valid:
+            return
+
+        self._unindex(key)
+        for child_key in self._children.pop(key, {}):
+            parent_keys = self._parents.get(child_key)
+            if parent_keys:
+                self._parents[child_key] = tuple(parent_key for parent_key in parent_keys if parent_key != key)
+
+    def keys(self) -> list[Hashable]:
+        """
+        Returns the keys of all meta nodes in the scene.
+
+        :return: meta node keys.
+        :rtype: list[Hashable]
+        """
+
+        self._update()
+        return list(self._class_types)
+
+    def class_type(self, key: Hashable) -> str | None:
+        """
+        Returns the class type name of the meta node with given key.
+
+        :param Hashable key: meta node key.
+        :return: class type name or None if key is not a meta node.
+        :rtype: str or None
+        """
+
+        self._update()
+        return self._class_types.get(key)
+
+    def keys_by_class_type(self, class_type: str) -> list[Hashable]:
+        """
+        Returns the keys of all meta nodes with given class type.
+
+        :param str class_type: class type name.
+        :return: meta node keys.
+        :rtype: list[Hashable]
+        """
+
+        self._update()
+        return list(self._by_class_type.get(class_type, ()))
+
+    def parent_keys(self, key: Hashable) -> list[Hashable]:
+        """
+        Returns the keys of the meta parents of the meta node with given key.
+
+        :param Hashable key: meta node key.
+        :return: meta parent keys.
+        :rtype: list[Hashable]
+        """
+
+        self._update()
+        return list(self._parents.get(key, ()))
+
+    def child_keys(self, key: Hashable) -> list[Hashable]:
+        """
+        Returns the keys of the meta children of the meta node with given key.
+
+        :param Hashable key: meta node key.
+        :return: meta children keys.
+        :rtype: list[Hashable]
+        """
+
+        self._update()
+        return list(self._children.get(key, ()))
+
+    def root_keys(self) -> list[Hashable]:
+        """
+        Returns the keys of all meta nodes without meta parents.
+
+        :return: root meta node keys.
+        :rtype: list[Hashable]
+        """
+
+        self._update()
+        return [key for key in self._class_types if not self._parents.get(key)]
+
+    def keys_by_root(self, root_key: Hashable) -> list[Hashable]:
+        """
+        Returns the keys of all meta nodes under the given root meta node, including the root itself.
+
+        :param Hashable root_key: root meta node key.
+        :return: meta node keys.
+        :rtype: list[Hashable]
+        """
+
+        self._update()
+        if root_key not in self._class_types:
+            return []
+
+        found_keys = {root_key: None}
+        stack = [root_key]
+        while stack:
+            for child_key in self._children.get(stack.pop(), ()):
+                if child_key in found_keys or child_key not in self._class_types:
+                    continue
+                found_keys[child_key] = None
+                stack.append(child_key)
+
+        return list(found_keys)
+
+    def _update(self):
+        """
+        Internal function that scans the scene if index is not valid or resolves pending nodes otherwise.
+        """
+
+        if not self._valid:
+            self._class_types.clear()
+            self._by_class_type.clear()
+            self._parents.clear()
+            self._children.clear()
+            self._pending.clear()
+            for key in self._scanner():
+                self._index(key, self._resolver(key))
+            self._valid = True
+            return
+
+        while self._pending:
+            key = next(iter(self._pending))
+            del self._pending[key]
+            self._unindex(key)
+            self._index(key, self._resolver(key))
+
+    def _index(self, key: Hashable, node_info: NodeInfo):
+        """
+        Internal function that adds the node with given key into the index.
+
+        :param Hashable key: node key.
+        :param NodeInfo node_info: node class type and meta parents keys.
+        """
+
+        if node_info is None:
+            return
+
+        class_type, parent_keys = node_info
+        parent_keys = tuple(parent_keys)
+        self._class_types[key] = class_type
+        self._by_class_type.setdefault(class_type, {})[key] = None
+        self._parents[key] = parent_keys
+        for parent_key in parent_keys:
+            self._children.setdefault(parent_key, {})[key] = None
+
+    def _unindex(self, key: Hashable):
+        """
+        Internal function that removes the node with given key from the index. Children of the node are kept.
+
+        :param Hashable key: node key.
+        """
+
+        class_type = self._class_types.pop(key, None)
+        if class_type is not None:
+            class_keys = self._by_class_type.get(class_type)
+            if class_keys is not None:
+                class_keys.pop(key, None)
+                if not class_keys:
+                    del self._by_class_type[class_type]
+        for parent_key in self._parents.pop(key, ()):
+            children = self._children.get(parent_key)
+            if children is not None:
+                children.pop(key, None)
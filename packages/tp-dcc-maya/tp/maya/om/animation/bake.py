@@ -0,0 +1,248 @@
+"""
+Module that contains Maya evaluators and key writers for the multi-frame sampling and baking engine.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
+
+from tp.core import log
+from tp.maya.om import plugs, undo
+from tp.maya.om.animation import sampling
+
+logger = log.tpLogger
+
+TRANSFORM_CHANNELS = (
+    'translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ')
+
+
+def as_plugs(channels: Sequence[str | OpenMaya.MPlug]) -> list[OpenMaya.MPlug]:
+    """
+    Returns the plugs of the given channels.
+
+    :param Sequence[str or OpenMaya.MPlug] channels: plugs or plug names (node.attribute).
+    :return: list of plugs.
+    :rtype: list[OpenMaya.MPlug]
+    """
+
+    return [channel if isinstance(channel, OpenMaya.MPlug) else plugs.as_mplug(channel) for channel in channels]
+
+
+def transform_channel_plugs(
+        nodes: Sequence[str], attributes: Sequence[str] = TRANSFORM_CHANNELS) -> list[OpenMaya.MPlug]:
+    """
+    Returns the channel plugs of the given transform nodes.
+
+    :param Sequence[str] nodes: transform node names.
+    :param Sequence[str] attributes: channel attributes to get plugs of.
+    :return: list of plugs, ordered by node and then by attribute.
+    :rtype: list[OpenMaya.MPlug]
+    """
+
+    found_plugs = []
+    for node in nodes:
+        sel = OpenMaya.MSelectionList()
+        sel.add(node)
+        fn_node = OpenMaya.MFnDependencyNode(sel.getDependNode(0))
+        found_plugs.extend(fn_node.findPlug(attribute, False) for attribute in attributes)
+
+    return found_plugs
+
+
+def frame_time(frame: int | float, unit: int | None = None) -> OpenMaya.MTime:
+    """
+    Returns the time of the given frame.
+
+    :param int or float frame: frame number.
+    :param int or None unit: time unit. If None, current UI unit is used.
+    :return: frame time.
+    :rtype: OpenMaya.MTime
+    """
+
+    return OpenMaya.MTime(frame, OpenMaya.MTime.uiUnit() if unit is None else unit)
+
+
+class PlugEvaluator(sampling.SampleEvaluator):
+    """
+    Evaluator that samples the values of a list of plugs in internal units, which are the units used by anim curves.
+    All plugs are evaluated within the same DG context for each frame.
+    """
+
+    def __init__(self, channels: Sequence[str | OpenMaya.MPlug]):
+        super().__init__()
+
+        self._plugs = as_plugs(channels)
+        self._unit = OpenMaya.MTime.uiUnit()
+
+    @property
+    def plugs(self) -> list[OpenMaya.MPlug]:
+        return self._plugs
+
+    def channel_names(self) -> list[str]:
+        return [plug.name() for plug in self._plugs]
+
+    def begin(self, frames: Sequence[int | float]):
+        self._unit = OpenMaya.MTime.uiUnit()
+
+    def evaluate(self, frame: int | float) -> list[float]:
+        context = OpenMaya.MDGContext(frame_time(frame, self._unit))
+        return [plug.asDouble(context) for plug in self._plugs]
+
+
+class WorldMatrixEvaluator(sampling.SampleEvaluator):
+    """
+    Evaluator that samples the world matrices of a list of DAG nodes. Each node produces 16 channels with the
+    row-major matrix values.
+    """
+
+    def __init__(self, nodes: Sequence[str]):
+        super().__init__()
+
+        self._names = list(nodes)
+        self._plugs = []
+        for node in self._names:
+            sel = OpenMaya.MSelectionList()
+            sel.add(node)
+            fn_node = OpenMaya.MFnDependencyNode(sel.getDependNode(0))
+            self._plugs.append(fn_node.findPlug('worldMatrix', False).elementByLogicalIndex(0))
+        self._unit = OpenMaya.MTime.uiUnit()
+
+    def channel_names(self) -> list[str]:
+        return [f'{name}.worldMatrix[{i}]' for name in self._names for i in range(16)]
+
+    def begin(self, frames: Sequence[int | float]):
+        self._unit = OpenMaya.MTime.uiUnit()
+
+    def evaluate(self, frame: int | float) -> list[float]:
+        context = OpenMaya.MDGContext(frame_time(frame, self._unit))
+        values = []
+        for plug in self._plugs:
+            values.extend(OpenMaya.MFnMatrixData(plug.asMObject(context)).matrix())
+
+        return values
+
+
+class AnimCurveWriter(sampling.KeyWriter):
+    """
+    Key writer that writes baked values into the anim curves connected to a list of plugs. Anim curves are created
+    if needed, and all the keys of a channel are added with a single MFnAnimCurve.addKeys call.
+    Whole bake is registered as a single undoable operation.
+    """
+
+    def __init__(
+            self, channels: Sequence[str | OpenMaya.MPlug], tangent_type: int = OpenMayaAnim.MFnAnimCurve.kTangentAuto,
+            keep_existing_keys: bool = False):
+        super().__init__()
+
+        self._plugs = as_plugs(channels)
+        self._tangent_type = tangent_type
+        self._keep_existing_keys = keep_existing_keys
+        self._modifier = None                       # type: OpenMaya.MDGModifier | None
+        self._change = None                         # type: OpenMayaAnim.MAnimCurveChange | None
+        self._anim_curves = []                      # type: list[OpenMaya.MObject]
+        self._unit = OpenMaya.MTime.uiUnit()
+
+    def begin(self, frames: Sequence[int | float]):
+        self._unit = OpenMaya.MTime.uiUnit()
+        self._modifier = OpenMaya.MDGModifier()
+        self._change = OpenMayaAnim.MAnimCurveChange()
+        self._anim_curves = [self._find_or_create_anim_curve(plug) for plug in self._plugs]
+        self._modifier.doIt()
+
+    def write(self, channel_index: int, frames: sampling.np.ndarray, values: sampling.np.ndarray):
+        fn_anim_curve = OpenMayaAnim.MFnAnimCurve(self._anim_curves[channel_index])
+        times = OpenMaya.MTimeArray([frame_time(frame, self._unit) for frame in frames.tolist()])
+        fn_anim_curve.addKeys(
+            times, OpenMaya.MDoubleArray(values.tolist()), tangentInType=self._tangent_type,
+            tangentOutType=self._tangent_type, keepExistingKeys=self._keep_existing_keys, change=self._change)
+
+    def end(self):
+        modifier, change = self._modifier, self._change
+        if modifier is None:
+            return
+
+        def _undo():
+            change.undoIt()
+            modifier.undoIt()
+
+        def _redo():
+            modifier.doIt()
+            change.redoIt()
+
+        undo.commit(_redo, _undo)
+        self._modifier = None
+        self._change = None
+
+    def _find_or_create_anim_curve(self, plug: OpenMaya.MPlug) -> OpenMaya.MObject:
+        """
+        Internal function that returns the anim curve connected to the given plug, creating a new one if necessary.
+        Any other input connection of the plug (constraints, expressions, etc) is disconnected, so the new anim curve
+        can be connected to it.
+
+        :param OpenMaya.MPlug plug: plug to get anim curve of.
+        :return: anim curve node.
+        :rtype: OpenMaya.MObject
+        """
+
+        source = plug.source()
+        if not source.isNull:
+            if source.node().hasFn(OpenMaya.MFn.kAnimCurve):
+                return source.node()
+            # disconnection is done by the same modifier, so it is undone along with the bake
+            self._modifier.disconnect(source, plug)
+
+        return OpenMayaAnim.MFnAnimCurve().create(plug, modifier=self._modifier)
+
+
+def sample_plugs(channels: Sequence[str | OpenMaya.MPlug], frames: Sequence[int | float]) -> sampling.np.ndarray:
+    """
+    Samples the values of the given plugs over the given frames.
+
+    :param Sequence[str or OpenMaya.MPlug] channels: plugs or plug names (node.attribute).
+    :param Sequence[int or float] frames: frames to sample.
+    :return: array with shape (frame count, channel count) with values in internal units.
+    :rtype: np.ndarray
+    """
+
+    return sampling.sample(PlugEvaluator(channels), frames)
+
+
+def bake_plugs(
+        channels: Sequence[str | OpenMaya.MPlug], frames: Sequence[int | float], reduce: bool = False,
+        tangent_type: int = OpenMayaAnim.MFnAnimCurve.kTangentAuto) -> sampling.np.ndarray:
+    """
+    Bakes the values of the given plugs over the given frames into anim curves.
+
+    :param Sequence[str or OpenMaya.MPlug] channels: plugs or plug names (node.attribute).
+    :param Sequence[int or float] frames: frames to bake.
+    :param bool reduce: whether to remove redundant keys within constant runs of values.
+    :param int tangent_type: tangent type of the baked keys.
+    :return: baked values with shape (frame count, channel count).
+    :rtype: np.ndarray
+    """
+
+    channel_plugs = as_plugs(channels)
+    samples = sampling.sample(PlugEvaluator(channel_plugs), frames)
+    sampling.bake(AnimCurveWriter(channel_plugs, tangent_type=tangent_type), frames, samples, reduce=reduce)
+
+    return samples
+
+
+def bake_transforms(
+        nodes: Sequence[str], frames: Sequence[int | float], attributes: Sequence[str] = TRANSFORM_CHANNELS,
+        reduce: bool = False) -> sampling.np.ndarray:
+    """
+    Bakes the transform channels of the given nodes over the given frames into anim curves.
+
+    :param Sequence[str] nodes: transform node names.
+    :param Sequence[int or float] frames: frames to bake.
+    :param Sequence[str] attributes: channel attributes to bake.
+    :param bool reduce: whether to remove redundant keys within constant runs of values.
+    :return: baked values with shape (frame count, node count * attribute count).
+    :rtype: np.ndarray
+    """
+
+    return bake_plugs(transform_channel_plugs(nodes, attributes=attributes), frames, reduce=reduce)
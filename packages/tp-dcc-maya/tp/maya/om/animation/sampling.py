@@ -0,0 +1,220 @@
+"""
+Module that contains a multi-frame sampling and baking engine.
+Channels are evaluated through an evaluator and baked through a key writer, so frame scheduling, step handling and
+array assembly do not depend on Maya.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tp.core import log
+from tp.common.python import decorators
+
+logger = log.tpLogger
+
+# keys whose value differs less than this value from their neighbour keys are considered redundant
+KEY_TOLERANCE = 1e-6
+
+
+def check_numpy():
+    """
+    Checks whether NumPy is available.
+
+    :raises ImportError: if NumPy module is not available.
+    """
+
+    if np is None:
+        raise ImportError('Unable to import the numpy module')
+
+
+def frame_range(start: int | float, end: int | float, step: int | float = 1) -> list[int | float]:
+    """
+    Returns the list of frames between given start and end frames (both included) separated by given step.
+    Frames are computed from the start frame, so float steps do not accumulate rounding errors.
+
+    :param int or float start: start frame.
+    :param int or float end: end frame.
+    :param int or float step: amount of frames between consecutive frames.
+    :return: list of frames.
+    :rtype: list[int or float]
+    :raises ValueError: if step is not a positive value.
+    """
+
+    if step <= 0:
+        raise ValueError(f'Frame step must be a positive value: {step}')
+    if end < start:
+        return []
+
+    count = int(math.floor((end - start) / step + 1e-9)) + 1
+    return [start + i * step for i in range(count)]
+
+
+class SampleEvaluator:
+    """
+    Base class for evaluators, which evaluate a fixed list of channels at a given frame.
+    """
+
+    @decorators.abstractmethod
+    def channel_names(self) -> list[str]:
+        """
+        Returns the names of the channels evaluated by this evaluator.
+
+        :return: channel names.
+        :rtype: list[str]
+        """
+
+        raise NotImplementedError
+
+    @decorators.abstractmethod
+    def evaluate(self, frame: int | float) -> Sequence[float]:
+        """
+        Evaluates all channels at the given frame.
+
+        :param int or float frame: frame to evaluate.
+        :return: channel values, in the same order as channel_names function.
+        :rtype: Sequence[float]
+        """
+
+        raise NotImplementedError
+
+    def begin(self, frames: Sequence[int | float]):
+        """
+        Function that is called before frames are evaluated.
+
+        :param Sequence[int or float] frames: frames that will be evaluated.
+        """
+
+        pass
+
+    def end(self):
+        """
+        Function that is called after all frames are evaluated.
+        """
+
+        pass
+
+
+class KeyWriter:
+    """
+    Base class for key writers, which write baked channel values as keys.
+    """
+
+    def begin(self, frames: Sequence[int | float]):
+        """
+        Function that is called before any channel is written.
+
+        :param Sequence[int or float] frames: baked frames.
+        """
+
+        pass
+
+    @decorators.abstractmethod
+    def write(self, channel_index: int, frames: np.ndarray, values: np.ndarray):
+        """
+        Writes the keys of the given channel.
+
+        :param int channel_index: index of the channel to write.
+        :param np.ndarray frames: key frames.
+        :param np.ndarray values: key values.
+        """
+
+        raise NotImplementedError
+
+    def end(self):
+        """
+        Function that is called after all channels are written.
+        """
+
+        pass
+
+
+def sample(evaluator: SampleEvaluator, frames: Sequence[int | float]) -> np.ndarray:
+    """
+    Evaluates all the channels of the given evaluator in one pass per frame.
+
+    :param SampleEvaluator evaluator: evaluator to sample.
+    :param Sequence[int or float] frames: frames to sample.
+    :return: array with shape (frame count, channel count).
+    :rtype: np.ndarray
+    """
+
+    check_numpy()
+    frames = list(frames)
+    samples = np.empty((len(frames), len(evaluator.channel_names())), dtype=np.float64)
+    evaluator.begin(frames)
+    try:
+        for i, frame in enumerate(frames):
+            samples[i] = evaluator.evaluate(frame)
+    finally:
+        evaluator.end()
+
+    return samples
+
+
+def redundant_keys_mask(values: np.ndarray, tolerance: float = KEY_TOLERANCE) -> np.ndarray:
+    """
+    Returns a mask with the keys that must be kept, so constant runs of values are reduced to their first and last
+    keys. Static channels are reduced to a single key.
+
+    :param np.ndarray values: key values.
+    :param float tolerance: maximum difference between values considered equal.
+    :return: boolean array with True for keys that must be kept.
+    :rtype: np.ndarray
+    """
+
+    check_numpy()
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values)
+    if count < 3:
+        return np.ones(count, dtype=bool)
+
+    differences = np.abs(np.diff(values)) > tolerance
+    if not np.any(differences):
+        mask = np.zeros(count, dtype=bool)
+        mask[0] = True
+        return mask
+
+    mask = np.ones(count, dtype=bool)
+    mask[1:-1] = differences[:-1] | differences[1:]
+
+    return mask
+
+
+def bake(
+        writer: KeyWriter, frames: Sequence[int | float], samples: np.ndarray, reduce: bool = False,
+        tolerance: float = KEY_TOLERANCE):
+    """
+    Writes the given sampled values as keys.
+
+    :param KeyWriter writer: writer used to write keys.
+    :param Sequence[int or float] frames: sampled frames.
+    :param np.ndarray samples: array with shape (frame count, channel count).
+    :param bool reduce: whether to remove redundant keys within constant runs of values.
+    :param float tolerance: maximum difference between values considered equal when reducing keys.
+    :raises ValueError: if samples shape does not match the number of frames.
+    """
+
+    check_numpy()
+    frames = np.asarray(frames, dtype=np.float64)
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.ndim != 2 or samples.shape[0] != len(frames):
+        raise ValueError(f'Samples count ({samples.shape[0]}) does not match frames count ({len(frames)})')
+
+    writer.begin(frames)
+    try:
+        for channel_index in range(samples.shape[1]):
+            values = samples[:, channel_index]
+            if reduce:
+                mask = redundant_keys_mask(values, tolerance=tolerance)
+                writer.write(channel_index, frames[mask], values[mask])
+            else:
+                writer.write(channel_index, frames, values)
+    finally:
+        writer.end()
@@ -1,6 +1,8 @@
 import maya.api.OpenMaya as OpenMaya
 import maya.api.OpenMayaAnim as OpenMayaAnim
 
+from tp.maya.om.animation import sampling
+
 
 FRAME_TO_UNIT = {
 	25: OpenMaya.MTime.k25FPS,
@@ -123,17 +125,14 @@ def iterate_frame_range_dg_context(start, end, step=1):
 
 	:param int start: the start frame.
 	:param int end: the end frame.
-	:param int step: amount of frames to skip between frames.
+	:param int or float step: amount of frames between consecutive frames.
 	:return: generator function with each element being a MDGContext with the current frame applied.
 	:rtype: collections.Iterator[:class:`OpenMaya.MDGContext`
 	"""
 
 	current_time = OpenMayaAnim.MAnimControl.currentTime()
-	per_frame = OpenMaya.MTime(start, current_time.unit)
-	for frame in range(start, end + 1, step):
-		context = OpenMaya.MDGContext(per_frame)
-		yield context
-		per_frame += 1
+	for frame in sampling.frame_range(start, end, step):
+		yield OpenMaya.MDGContext(OpenMaya.MTime(frame, current_time.unit))
 
 
 def iterate_frames_dg_context(frames, step=1):
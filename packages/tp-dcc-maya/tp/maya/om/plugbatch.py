@@ -0,0 +1,222 @@
+"""
+Module that contains a batched plug read/write engine.
+Plug paths are resolved once and grouped by plug type, so reading or writing many plugs only dispatches on the plug
+type once per group. Engine does not depend on Maya: plugs are resolved, read and written through a backend.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, Iterable, Sequence
+
+from tp.core import log
+
+logger = log.tpLogger
+
+
+class PlugBatchBackend:
+    """
+    Base class for plug batch backends, which define how plugs are resolved, read and written.
+    """
+
+    def resolve(self, paths: Sequence[str]) -> dict[str, Any]:
+        """
+        Resolves the plugs of the given paths.
+
+        :param Sequence[str] paths: plug paths (node.attribute).
+        :return: dictionary mapping each path with its plug. Paths that cannot be resolved are not included.
+        :rtype: dict[str, Any]
+        """
+
+        raise NotImplementedError
+
+    def type_key(self, plug: Any) -> Hashable:
+        """
+        Returns the key that identifies how the given plug is read and written.
+
+        :param Any plug: plug to get type key of.
+        :return: plug type key.
+        :rtype: Hashable
+        """
+
+        raise NotImplementedError
+
+    def reader(self, type_key: Hashable) -> Callable[[Any], Any]:
+        """
+        Returns the function used to read the value of plugs with given type key.
+
+        :param Hashable type_key: plug type key.
+        :return: function that receives a plug and returns its value.
+        :rtype: Callable[[Any], Any]
+        """
+
+        raise NotImplementedError
+
+    def writer(self, type_key: Hashable) -> Callable[[Any, Any, Any], None]:
+        """
+        Returns the function used to write the value of plugs with given type key.
+
+        :param Hashable type_key: plug type key.
+        :return: function that receives a plug, a value and a modifier and queues the value change into the modifier.
+        :rtype: Callable[[Any, Any, Any], None]
+        """
+
+        raise NotImplementedError
+
+    def create_modifier(self) -> Any:
+        """
+        Returns a new modifier where value changes are queued.
+
+        :return: new modifier.
+        :rtype: Any
+        """
+
+        raise NotImplementedError
+
+    def apply(self, modifier: Any):
+        """
+        Applies all the value changes queued into the given modifier as a single undoable operation.
+
+        :param Any modifier: modifier to apply.
+        """
+
+        raise NotImplementedError
+
+
+class PlugBatch:
+    """
+    Class that reads and writes the values of a list of plugs in bulk.
+    Plugs and their type keys are resolved when the batch is created, so a batch instance can be reused to read and
+    write the same plugs several times (for example, to save and restore a pose).
+    """
+
+    def __init__(self, paths: Iterable[str], backend: PlugBatchBackend):
+        super().__init__()
+
+        self._backend = backend
+        self._paths = list(dict.fromkeys(paths))
+        self._plugs = backend.resolve(self._paths)
+        self._missing = [plug_path for plug_path in self._paths if plug_path not in self._plugs]
+        self._type_keys = {}                        # type: dict[str, Hashable]
+        self._groups = {}                           # type: dict[Hashable, list[str]]
+        for plug_path in self._paths:
+            plug = self._plugs.get(plug_path)
+            if plug is None:
+                continue
+            type_key = backend.type_key(plug)
+            self._type_keys[plug_path] = type_key
+            self._groups.setdefault(type_key, []).append(plug_path)
+        self._readers = {}                          # type: dict[Hashable, Callable]
+        self._writers = {}                          # type: dict[Hashable, Callable]
+
+    def __len__(self) -> int:
+        return len(self._plugs)
+
+    def __contains__(self, plug_path: str) -> bool:
+        return plug_path in self._plugs
+
+    @property
+    def paths(self) -> list[str]:
+        return [plug_path for plug_path in self._paths if plug_path in self._plugs]
+
+    @property
+    def missing_paths(self) -> list[str]:
+        return list(self._missing)
+
+    def plug(self, plug_path: str) -> Any:
+        """
+        Returns the resolved plug of the given path.
+
+        :param str plug_path: plug path.
+        :return: resolved plug or None if path was not resolved.
+        :rtype: Any
+        """
+
+        return self._plugs.get(plug_path)
+
+    def groups(self) -> dict[Hashable, list[str]]:
+        """
+        Returns the resolved plug paths grouped by their type key.
+
+        :return: dictionary mapping type keys with plug paths.
+        :rtype: dict[Hashable, list[str]]
+        """
+
+        return {type_key: list(plug_paths) for type_key, plug_paths in self._groups.items()}
+
+    def read(self) -> dict[str, Any]:
+        """
+        Reads the values of all the resolved plugs.
+
+        :return: dictionary mapping each resolved plug path with its value.
+        :rtype: dict[str, Any]
+        """
+
+        values = {}
+        plugs = self._plugs
+        for type_key, plug_paths in self._groups.items():
+            reader = self._reader(type_key)
+            for plug_path in plug_paths:
+                values[plug_path] = reader(plugs[plug_path])
+
+        return {plug_path: values[plug_path] for plug_path in self._paths if plug_path in values}
+
+    def write(self, values: dict[str, Any], modifier: Any | None = None, apply: bool = True) -> Any:
+        """
+        Writes the given values into their plugs. All the value changes are queued into a single modifier.
+        Values for plug paths that were not resolved by this batch are ignored.
+
+        :param dict[str, Any] values: dictionary mapping plug paths with the values to write.
+        :param Any or None modifier: optional modifier to queue value changes into.
+        :param bool apply: whether to apply the modifier as a single undoable operation.
+        :return: modifier with the queued value changes.
+        :rtype: Any
+        """
+
+        modifier = modifier if modifier is not None else self._backend.create_modifier()
+        plugs = self._plugs
+        grouped_values = {}
+        for plug_path, value in values.items():
+            type_key = self._type_keys.get(plug_path)
+            if type_key is None:
+                logger.debug(f'Skipping value of unresolved plug: {plug_path}')
+                continue
+            grouped_values.setdefault(type_key, []).append((plug_path, value))
+        for type_key, path_values in grouped_values.items():
+            writer = self._writer(type_key)
+            for plug_path, value in path_values:
+                writer(plugs[plug_path], value, modifier)
+
+        if apply and grouped_values:
+            self._backend.apply(modifier)
+
+        return modifier
+
+    def _reader(self, type_key: Hashable) -> Callable[[Any], Any]:
+        """
+        Internal function that returns the cached reader for given type key.
+
+        :param Hashable type_key: plug type key.
+        :return: plug reader function.
+        :rtype: Callable[[Any], Any]
+        """
+
+        reader = self._readers.get(type_key)
+        if reader is None:
+            reader = self._readers[type_key] = self._backend.reader(type_key)
+
+        return reader
+
+    def _writer(self, type_key: Hashable) -> Callable[[Any, Any, Any], None]:
+        """
+        Internal function that returns the cached writer for given type key.
+
+        :param Hashable type_key: plug type key.
+        :return: plug writer function.
+        :rtype: Callable[[Any, Any, Any], None]
+        """
+
+        writer = self._writers.get(type_key)
+        if writer is None:
+            writer = self._writers[type_key] = self._backend.writer(type_key)
+
+        return writer
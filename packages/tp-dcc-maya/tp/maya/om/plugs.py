@@ -18,7 +18,7 @@ import maya.api.OpenMaya as OpenMaya
 
 from tp.core import log
 from tp.common.python import helpers
-from tp.maya.om import dagpath, attributes, undo
+from tp.maya.om import dagpath, attributes, undo, plugbatch
 from tp.maya.api import attributetypes
 
 logger = log.tpLogger
@@ -1795,7 +1795,7 @@ def serialize_plug(plug):
         'value': python_type_from_plug_value(plug),
     })
 
-    if plug_type(plug) == attributetypes.kMFnkEnumAttribute:
+    if attr_type == attributetypes.kMFnkEnumAttribute:
         data['enums'] = enum_names(plug)
 
     return data
@@ -1939,3 +1939,137 @@ def is_string(plug: OpenMaya.MPlug) -> bool:
     return False
 
 
+
+
+def plug_batch(paths: list[str]) -> plugbatch.PlugBatch:
+    """
+    Returns a plug batch that reads and writes the values of the given plugs in bulk.
+
+    :param list[str] paths: plug paths (node.attribute).
+    :return: plug batch instance.
+    :rtype: plugbatch.PlugBatch
+
+    .. code-block:: python
+
+        batch = plug_batch(['ctrl1.translateX', 'ctrl1.rotateY', 'ctrl2.space'])
+        pose = batch.read()
+        batch.write(pose)
+    """
+
+    return plugbatch.PlugBatch(paths, backend=MayaPlugBatchBackend())
+
+
+class MayaPlugBatchBackend(plugbatch.PlugBatchBackend):
+    """
+    Plug batch backend that resolves, reads and writes Maya plugs.
+    Scalar numeric, unit, enum and string plugs are read and written directly; any other plug is handled by
+    plug_value and set_plug_value functions.
+    """
+
+    GENERIC_TYPE_KEY = 'generic'
+
+    NUMERIC_READERS = {
+        OpenMaya.MFnNumericData.kDouble: OpenMaya.MPlug.asDouble,
+        OpenMaya.MFnNumericData.kFloat: OpenMaya.MPlug.asFloat,
+        OpenMaya.MFnNumericData.kBoolean: OpenMaya.MPlug.asBool,
+        OpenMaya.MFnNumericData.kInt: OpenMaya.MPlug.asInt,
+        OpenMaya.MFnNumericData.kLong: OpenMaya.MPlug.asInt,
+        OpenMaya.MFnNumericData.kShort: OpenMaya.MPlug.asShort,
+    }
+    UNIT_READERS = {
+        OpenMaya.MFnUnitAttribute.kDistance: OpenMaya.MPlug.asMDistance,
+        OpenMaya.MFnUnitAttribute.kAngle: OpenMaya.MPlug.asMAngle,
+        OpenMaya.MFnUnitAttribute.kTime: OpenMaya.MPlug.asMTime,
+    }
+
+    def resolve(self, paths: list[str]) -> dict[str, OpenMaya.MPlug]:
+        resolved_plugs = {}
+        nodes = {}
+        for plug_path in paths:
+            node_name, _, attribute_path = plug_path.partition('.')
+            if not attribute_path:
+                continue
+            fn_node = nodes.get(node_name)
+            if fn_node is None and node_name not in nodes:
+                try:
+                    sel = OpenMaya.MSelectionList()
+                    sel.add(node_name)
+                    fn_node = OpenMaya.MFnDependencyNode(sel.getDependNode(0))
+                except RuntimeError:
+                    fn_node = None
+                nodes[node_name] = fn_node
+            if fn_node is None:
+                continue
+            try:
+                if '[' in attribute_path or '.' in attribute_path:
+                    resolved_plugs[plug_path] = find_plug(fn_node.object(), attribute_path)
+                elif fn_node.hasAttribute(attribute_path):
+                    resolved_plugs[plug_path] = fn_node.findPlug(attribute_path, False)
+            except (RuntimeError, TypeError):
+                logger.debug(f'Unable to resolve plug: {plug_path}')
+
+        return resolved_plugs
+
+    def type_key(self, plug: OpenMaya.MPlug) -> tuple | str:
+        if plug.isArray:
+            return self.GENERIC_TYPE_KEY
+        obj = plug.attribute()
+        if obj.hasFn(OpenMaya.MFn.kNumericAttribute):
+            numeric_type = OpenMaya.MFnNumericAttribute(obj).numericType()
+            return ('numeric', numeric_type) if numeric_type in self.NUMERIC_READERS else self.GENERIC_TYPE_KEY
+        elif obj.hasFn(OpenMaya.MFn.kUnitAttribute):
+            unit_type = OpenMaya.MFnUnitAttribute(obj).unitType()
+            return ('unit', unit_type) if unit_type in self.UNIT_READERS else self.GENERIC_TYPE_KEY
+        elif obj.hasFn(OpenMaya.MFn.kEnumAttribute):
+            return 'enum'
+        elif obj.hasFn(OpenMaya.MFn.kTypedAttribute) and OpenMaya.MFnTypedAttribute(
+                obj).attrType() == OpenMaya.MFnData.kString:
+            return 'string'
+
+        return self.GENERIC_TYPE_KEY
+
+    def reader(self, type_key: tuple | str) -> callable:
+        if type_key == 'enum':
+            return OpenMaya.MPlug.asInt
+        elif type_key == 'string':
+            return OpenMaya.MPlug.asString
+        elif type_key[0] == 'numeric':
+            return self.NUMERIC_READERS[type_key[1]]
+        elif type_key[0] == 'unit':
+            return self.UNIT_READERS[type_key[1]]
+
+        return plug_value
+
+    def writer(self, type_key: tuple | str) -> callable:
+        if type_key == 'enum':
+            return lambda plug, value, mod: mod.newPlugValueInt(plug, value)
+        elif type_key == 'string':
+            return lambda plug, value, mod: mod.newPlugValueString(plug, value)
+        elif type_key[0] == 'numeric':
+            numeric_type = type_key[1]
+            if numeric_type == OpenMaya.MFnNumericData.kDouble:
+                return lambda plug, value, mod: mod.newPlugValueDouble(plug, value)
+            elif numeric_type == OpenMaya.MFnNumericData.kFloat:
+                return lambda plug, value, mod: mod.newPlugValueFloat(plug, value)
+            elif numeric_type == OpenMaya.MFnNumericData.kBoolean:
+                return lambda plug, value, mod: mod.newPlugValueBool(plug, value)
+            return lambda plug, value, mod: mod.newPlugValueInt(plug, value)
+        elif type_key[0] == 'unit':
+            unit_type = type_key[1]
+            if unit_type == OpenMaya.MFnUnitAttribute.kDistance:
+                return lambda plug, value, mod: mod.newPlugValueMDistance(
+                    plug, value if isinstance(value, OpenMaya.MDistance) else OpenMaya.MDistance(value))
+            elif unit_type == OpenMaya.MFnUnitAttribute.kAngle:
+                return lambda plug, value, mod: mod.newPlugValueMAngle(
+                    plug, value if isinstance(value, OpenMaya.MAngle) else OpenMaya.MAngle(value))
+            return lambda plug, value, mod: mod.newPlugValueMTime(
+                plug, value if isinstance(value, OpenMaya.MTime) else OpenMaya.MTime(value))
+
+        return lambda plug, value, mod: set_plug_value(plug, value, mod=mod, apply=False)
+
+    def create_modifier(self) -> OpenMaya.MDGModifier:
+        return OpenMaya.MDGModifier()
+
+    def apply(self, modifier: OpenMaya.MDGModifier):
+        undo.commit(modifier.doIt, modifier.undoIt)
+        modifier.doIt()
@@ -0,0 +1,122 @@
+"""
+Benchmark that measures repeated preference setting lookups across many preference roots, comparing the preference
+store against parsing preference files on each lookup (previous preferences manager behaviour).
+
+Lookups follow PreferencesManager.find_setting: roots are searched in reverse registration order until the relative
+preference file exists, and the file is then parsed (or read from the store).
+
+Usage:
+    python bench_store.py [--roots 20] [--files 10] [--settings 50] [--iterations 200]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+    if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+        sys.path.append(_package_root)
+
+from tp.common.python import yamlio
+from tp.preferences import store
+
+
+def create_roots(directory: str, root_count: int, file_count: int, setting_count: int) -> list[str]:
+    """
+    Creates preference roots within given directory. Only even roots contain preference files, so lookups have to
+    check several roots before finding the file.
+
+    :param str directory: directory where roots are created.
+    :param int root_count: number of preference roots.
+    :param int file_count: number of preference files within each root that contains files.
+    :param int setting_count: number of settings within each preference file.
+    :return: list of root paths, in registration order.
+    :rtype: list[str]
+    """
+
+    roots = []
+    for i in range(root_count):
+        root_path = os.path.join(directory, f'root{i}')
+        os.makedirs(os.path.join(root_path, 'prefs'))
+        if i % 2 == 0:
+            for j in range(file_count):
+                yamlio.write_to_file(
+                    {'settings': {f'k{n}': n for n in range(setting_count)}},
+                    os.path.join(root_path, 'prefs', f'tool{j}.yaml'))
+        roots.append(root_path)
+
+    return roots
+
+
+def find_setting_parsing(roots: list[str], relative_path: str, name: str):
+    for root_path in reversed(roots):
+        full_path = os.path.join(root_path, relative_path)
+        if not os.path.exists(full_path):
+            continue
+        return (yamlio.read_file(full_path, maintain_order=True) or {})['settings'][name]
+
+
+def find_setting_store(preference_store: store.PreferenceStore, roots: list[str], relative_path: str, name: str):
+    for root_path in reversed(roots):
+        full_path = os.path.join(root_path, relative_path)
+        if not preference_store.exists(full_path):
+            continue
+        data = preference_store.load(full_path, lambda: yamlio.read_file(full_path, maintain_order=True) or {})
+        return data['settings'][name]
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    :param list[str] or None args: command line arguments.
+    :return: exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks repeated preference lookups across many roots')
+    parser.add_argument('--roots', type=int, default=20, help='number of preference roots')
+    parser.add_argument('--files', type=int, default=10, help='number of preference files per root')
+    parser.add_argument('--settings', type=int, default=50, help='number of settings per preference file')
+    parser.add_argument('--iterations', type=int, default=200, help='number of times all files are looked up')
+    parsed_args = parser.parse_args(args)
+
+    directory = tempfile.mkdtemp(prefix='tp_preferences_bench_')
+    try:
+        roots = create_roots(directory, parsed_args.roots, parsed_args.files, parsed_args.settings)
+        relative_paths = [os.path.join('prefs', f'tool{j}.yaml') for j in range(parsed_args.files)]
+        lookup_count = parsed_args.iterations * len(relative_paths)
+
+        start = time.perf_counter()
+        for _ in range(parsed_args.iterations):
+            for relative_path in relative_paths:
+                find_setting_parsing(roots, relative_path, 'k5')
+        parsing_time = time.perf_counter() - start
+
+        preference_store = store.PreferenceStore()
+        start = time.perf_counter()
+        for _ in range(parsed_args.iterations):
+            for relative_path in relative_paths:
+                find_setting_store(preference_store, roots, relative_path, 'k5')
+        store_time = time.perf_counter() - start
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f'{lookup_count} lookups across {parsed_args.roots} roots ({yamlio.SafeLoader.__name__} YAML loader)')
+    print(f'  parse per lookup: {parsing_time * 1000:8.1f} ms')
+    print(f'  preference store: {store_time * 1000:8.1f} ms ({parsing_time / store_time:.1f}x)')
+    print(f'  store statistics: {preference_store.stats.to_dict()}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
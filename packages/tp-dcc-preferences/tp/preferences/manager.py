@@ -19,7 +19,7 @@ from tp.core import consts, log
 from tp.common import plugin
 from tp.common.python import strings, path, folder, yamlio, helpers
 
-from tp.preferences import errors, preference as core_preference
+from tp.preferences import errors, store, preference as core_preference
 
 logger = log.tpLogger
 
@@ -89,12 +89,16 @@ class PreferenceObject(dict):
 
         return path.join_path(self.root, self['relative_path'])
 
-    def save(self, indent=False, sort=False):
+    def save(self, indent=False, sort=False, delay=None):
         """
-        Saves the data into the settings file within disk.
+        Saves the data into the settings file within disk. File is written atomically.
 
-        :param indent:
-        :return:
+        :param bool indent: whether to indent the file.
+        :param bool sort: whether to sort the keys of the file.
+        :param float or None delay: if given, save is deferred the given seconds, so consecutive saves of this file
+            are coalesced into a single write.
+        :return: preference file path.
+        :rtype: str
         """
 
         root = self.root
@@ -102,6 +106,10 @@ class PreferenceObject(dict):
             return ''
 
         full_path = self.get_path()
+        if delay is not None:
+            store.default_store().schedule_save(full_path, lambda: self.save(indent=indent, sort=sort), delay=delay)
+            return full_path
+
         folder.ensure_folder_exists(path.dirname(full_path))
         output = copy.deepcopy(dict(self))
 
@@ -114,6 +122,7 @@ class PreferenceObject(dict):
             yamlio.write_to_file(output, full_path, sort_keys=sort)
         else:
             yamlio.write_to_file(output, full_path, indent=2, sort_keys=sort)
+        store.default_store().saved(full_path, self)
 
         return self.get_path()
 
@@ -124,11 +133,11 @@ class PreferencesManager(object):
     """
 
     DEFAULT_USER_PREFERENCE_NAME = 'user_preferences'
-    _CACHE = dict()
 
     def __init__(self):
         super(PreferencesManager, self).__init__()
 
+        self._store = store.default_store()
         self._roots = OrderedDict()
         self._extension = consts.PREFERENCE_EXTENSION
         self._plugin_factory = plugin.PluginFactory(interface=core_preference.PreferenceInterface, plugin_id='ID')
@@ -172,6 +181,14 @@ class PreferencesManager(object):
 
         return path.join_path(cls.default_preference_path(), 'assets')
 
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def store(self) -> store.PreferenceStore:
+        return self._store
+
     # =================================================================================================================
     # BASE
     # =================================================================================================================
@@ -307,7 +324,7 @@ class PreferencesManager(object):
 
         full_path = path.join_path(root_path, relative_path)
 
-        if not path.exists(full_path):
+        if self._store.exists(full_path):
             return self._open(root_path, relative_path)
 
         return PreferenceObject('', relative_path)
@@ -340,7 +357,7 @@ class PreferencesManager(object):
                 if root_path is not None:
                     resolved_root = self._resolve_root(root_path)
                     full_path = path.clean_path(os.path.normpath(path.join_path(resolved_root, relative_path)))
-                    if not path.exists(full_path):
+                    if not self._store.exists(full_path):
                         return PreferenceObject(root_path, relative_path=relative_path)
                     preference_object = self._open(resolved_root, relative_path)
             else:
@@ -350,7 +367,7 @@ class PreferencesManager(object):
                 for _, root_path in reversed(self._roots.items()):
                     resolved_root = self._resolve_root(root_path)
                     full_path = path.clean_path(os.path.normpath(path.join_path(resolved_root, relative_path)))
-                    if not path.exists(full_path):
+                    if not self._store.exists(full_path):
                         continue
                     preference_object = self._open(resolved_root, relative_path)
                     break
@@ -384,7 +401,7 @@ class PreferencesManager(object):
         """
 
         full_path = path.join_path(root_path, strings.append_extension(relative_path, extension or self._extension))
-        if path.exists(full_path):
+        if self._store.exists(full_path):
             return self._open(root_path, relative_path)
 
         return PreferenceObject('', relative_path=relative_path)
@@ -497,6 +514,7 @@ class PreferencesManager(object):
                         logger.debug(
                             'Transferring preference {} to destination: {}'.format(preference_file, destination))
                         shutil.copy2(preference_file, destination)
+                        self._store.invalidate(destination)
                     elif update:
                         # TODO: this can be slow when checking lot of pref files, add env var to disable this functionality.
                         orig_dict = yamlio.read_file(preference_file)
@@ -510,6 +528,7 @@ class PreferencesManager(object):
                             if result != destination_dict:
                                 logger.info('Updating Preference file: {}'.format(preference_file))
                                 yamlio.write_to_file(updated_dict, destination)
+                                self._store.invalidate(destination)
             logger.debug('Finished copying package preferences to: {} ({})'.format(root, timeit.default_timer() - start_time))
 
     def set_root_location(self, root, destination):
@@ -656,15 +675,13 @@ class PreferencesManager(object):
         relative_path = path.clean_path(relative_path)
         relative_path = strings.append_extension(relative_path, extension or self._extension)
         full_path = path.join_path(root, relative_path)
-        if not path.exists(full_path):
-            raise core_preference.InvalidPreferencePathError(full_path)
-        if full_path in self._CACHE:
-            return self._CACHE[full_path]
-        data = yamlio.read_file(full_path, maintain_order=True) or dict()
-        preference_object = PreferenceObject(root, relative_path=relative_path, **data)
-        self._CACHE[full_path] = preference_object
 
-        return preference_object
+        def _read():
+            data = yamlio.read_file(full_path, maintain_order=True) or dict()
+            return PreferenceObject(root, relative_path=relative_path, **data)
+
+        # file is only parsed again if it changed on disk since the last time it was parsed
+        return self._store.load(full_path, _read)
 
 
 def preference() -> PreferencesManager:
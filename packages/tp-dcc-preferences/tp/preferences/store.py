@@ -0,0 +1,351 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the preference store: a cache of parsed preference files that are invalidated when their files
+change on disk, with debounced writes and change notifications.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from typing import Callable, Any
+
+from tp.core import log
+from tp.common.python import memoize
+
+from tp.preferences import preference as core_preference
+
+logger = log.tpLogger
+
+# seconds a file stat is trusted before checking the file again
+CHECK_INTERVAL = 1.0
+# seconds deferred saves wait for further changes before writing to disk
+SAVE_DELAY = 0.5
+# seconds between watcher polls
+WATCH_INTERVAL = 2.0
+
+_STORE: PreferenceStore | None = None
+
+
+class _StoreEntry:
+    """
+    Internal class that holds a parsed preference file.
+    """
+
+    __slots__ = ('value', 'stamp')
+
+    def __init__(self, value: Any, stamp: tuple[int, int]):
+        self.value = value
+        self.stamp = stamp
+
+
+class PreferenceStore:
+    """
+    Class that caches parsed preference files, so each file is parsed only once while it does not change on disk.
+    File stats are throttled: a file is checked again at most once every check interval seconds, unless it is written
+    through the store. Optionally, a watcher thread polls cached files and notifies listeners when they change.
+    """
+
+    def __init__(self, check_interval: float = CHECK_INTERVAL, save_delay: float = SAVE_DELAY):
+        """
+        Constructor.
+
+        :param float check_interval: seconds a file stat is trusted before checking the file again.
+        :param float save_delay: default seconds deferred saves wait before writing to disk.
+        """
+
+        super().__init__()
+
+        self._check_interval = check_interval
+        self._save_delay = save_delay
+        self._entries = {}                  # type: dict[str, _StoreEntry]
+        self._stamps = {}                   # type: dict[str, tuple[tuple[int, int] | None, float]]
+        self._listeners = []                # type: list[Callable[[str], None]]
+        self._pending_saves = {}            # type: dict[str, tuple[Callable[[], Any], float]]
+        self._save_timer = None             # type: threading.Timer | None
+        self._watcher = None                # type: threading.Thread | None
+        self._stop_watching = threading.Event()
+        self._lock = threading.RLock()
+        self._stats = memoize.CacheStats()
+
+    @property
+    def stats(self) -> memoize.CacheStats:
+        return self._stats
+
+    def stamp(self, full_path: str, force: bool = False) -> tuple[int, int] | None:
+        """
+        Returns the stamp of the given file, which changes each time the file is modified.
+
+        :param str full_path: absolute file path.
+        :param bool force: whether to check the file even if its last check is still trusted.
+        :return: file stamp or None if file does not exist.
+        :rtype: tuple[int, int] or None
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._stamps.get(full_path)
+            if not force and cached is not None and now - cached[1] < self._check_interval:
+                return cached[0]
+            stamp = memoize.path_stamp(full_path)
+            self._stamps[full_path] = (stamp, now)
+
+        return stamp
+
+    def exists(self, full_path: str) -> bool:
+        """
+        Returns whether given file exists.
+
+        :param str full_path: absolute file path.
+        :return: True if file exists; False otherwise.
+        :rtype: bool
+        """
+
+        return self.stamp(full_path) is not None
+
+    def load(self, full_path: str, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the cached parsed contents of the given file, parsing it with the given loader function if it is not
+        cached yet or if the file changed since it was parsed.
+
+        :param str full_path: absolute file path.
+        :param Callable[[], Any] loader: function that parses the file.
+        :return: parsed file contents.
+        :rtype: Any
+        :raises core_preference.InvalidPreferencePathError: if file does not exist.
+        """
+
+        with self._lock:
+            entry = self._entries.get(full_path)
+            if entry is not None and full_path in self._pending_saves:
+                # in-memory data not written yet is newer than the file
+                self._stats.hits += 1
+                return entry.value
+            stamp = self.stamp(full_path)
+            if stamp is None:
+                raise core_preference.InvalidPreferencePathError(full_path)
+            if entry is not None and entry.stamp == stamp:
+                self._stats.hits += 1
+                return entry.value
+            self._stats.misses += 1
+            if entry is not None:
+                self._stats.invalidations += 1
+            value = loader()
+            self._entries[full_path] = _StoreEntry(value, stamp)
+
+        return value
+
+    def invalidate(self, full_path: str | None = None):
+        """
+        Removes the cached contents of the given file, or of all files if no file is given.
+
+        :param str or None full_path: absolute file path.
+        """
+
+        with self._lock:
+            if full_path is None:
+                self._stats.invalidations += len(self._entries)
+                self._entries.clear()
+                self._stamps.clear()
+            else:
+                if self._entries.pop(full_path, None) is not None:
+                    self._stats.invalidations += 1
+                self._stamps.pop(full_path, None)
+
+    def saved(self, full_path: str, value: Any):
+        """
+        Updates the cache after the given file was written, so it is not parsed again, and notifies listeners.
+
+        :param str full_path: absolute file path.
+        :param Any value: written contents.
+        """
+
+        with self._lock:
+            stamp = self.stamp(full_path, force=True)
+            if stamp is not None:
+                self._entries[full_path] = _StoreEntry(value, stamp)
+        self._notify(full_path)
+
+    def schedule_save(self, full_path: str, writer: Callable[[], Any], delay: float | None = None):
+        """
+        Schedules a save of the given file. Saves scheduled for the same file before the delay expires are coalesced,
+        so only the last one is written.
+
+        :param str full_path: absolute file path.
+        :param Callable[[], Any] writer: function that writes the file.
+        :param float or None delay: seconds to wait for further changes before writing. If None, store default save
+            delay is used.
+        """
+
+        delay = self._save_delay if delay is None else delay
+        with self._lock:
+            self._pending_saves[full_path] = (writer, time.monotonic() + delay)
+            self._restart_save_timer()
+
+    def has_pending_saves(self) -> bool:
+        """
+        Returns whether there are scheduled saves not written yet.
+
+        :return: True if there are pending saves; False otherwise.
+        :rtype: bool
+        """
+
+        return bool(self._pending_saves)
+
+    def flush(self, force: bool = True):
+        """
+        Writes scheduled saves.
+
+        :param bool force: whether to write all pending saves or only the ones whose delay expired.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            due = [full_path for full_path, (_, due_time) in self._pending_saves.items() if force or due_time <= now]
+            writers = [self._pending_saves.pop(full_path)[0] for full_path in due]
+        for writer in writers:
+            try:
+                writer()
+            except Exception:
+                logger.error('Failed to write deferred preference save', exc_info=True)
+        with self._lock:
+            self._restart_save_timer()
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """
+        Adds a listener that is called with the absolute path of each preference file that changes, either because
+        it was written through the store or because the watcher detected an external change.
+
+        :param Callable[[str], None] callback: listener function.
+
+        ..note:: listeners of changes detected by the watcher are called from the watcher thread.
+        """
+
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]):
+        """
+        Removes given listener.
+
+        :param Callable[[str], None] callback: listener function.
+        """
+
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def poll(self) -> list[str]:
+        """
+        Checks all cached files, removing the ones that changed on disk and notifying listeners.
+
+        :return: list of changed file paths.
+        :rtype: list[str]
+        """
+
+        with self._lock:
+            cached = [(full_path, entry.stamp) for full_path, entry in self._entries.items()]
+        changed = []
+        for full_path, stamp in cached:
+            if full_path in self._pending_saves or self.stamp(full_path, force=True) == stamp:
+                continue
+            self.invalidate(full_path)
+            changed.append(full_path)
+        for full_path in changed:
+            self._notify(full_path)
+
+        return changed
+
+    def start_watching(self, interval: float = WATCH_INTERVAL):
+        """
+        Starts a daemon thread that polls cached files every given seconds.
+
+        :param float interval: seconds between polls.
+        """
+
+        if self.is_watching():
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name='PreferenceStoreWatcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        """
+        Stops watcher thread.
+        """
+
+        if not self.is_watching():
+            return
+        self._stop_watching.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def is_watching(self) -> bool:
+        """
+        Returns whether watcher thread is running.
+
+        :return: True if watcher is running; False otherwise.
+        :rtype: bool
+        """
+
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def _watch(self, interval: float):
+        """
+        Internal function that polls cached files until watcher is stopped.
+
+        :param float interval: seconds between polls.
+        """
+
+        while not self._stop_watching.wait(interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.error('Failed to poll preference files', exc_info=True)
+
+    def _restart_save_timer(self):
+        """
+        Internal function that restarts the timer that writes pending saves when the next one is due.
+        """
+
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        if not self._pending_saves:
+            return
+        wait_time = max(0.0, min(due_time for _, due_time in self._pending_saves.values()) - time.monotonic())
+        self._save_timer = threading.Timer(wait_time, self.flush, kwargs={'force': False})
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _notify(self, full_path: str):
+        """
+        Internal function that calls listeners with the given changed file path.
+
+        :param str full_path: absolute file path.
+        """
+
+        for callback in self._listeners[:]:
+            try:
+                callback(full_path)
+            except Exception:
+                logger.error(f'Preference change listener failed: {callback}', exc_info=True)
+
+
+def default_store() -> PreferenceStore:
+    """
+    Returns global preference store. Pending saves of the global store are written on exit.
+
+    :return: preference store.
+    :rtype: PreferenceStore
+    """
+
+    global _STORE
+    if _STORE is None:
+        _STORE = PreferenceStore()
+        atexit.register(_STORE.flush)
+
+    return _STORE
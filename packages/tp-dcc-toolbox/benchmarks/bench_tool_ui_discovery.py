@@ -0,0 +1,139 @@
+"""
+Benchmark that measures toolbox startup time spent discovering tool UIs. Each measurement runs within a new Python
+process, so modules imported by a previous measurement do not hide import costs.
+
+Tool UIs discovered by ToolUisManager through the tool UIs manifest, both when the manifest must be generated (cold)
+and when it is loaded from disk (warm), are compared against the previous behaviour, which registered all tool UI
+paths within the plugin factory, importing every tool UI module.
+
+Tool UI modules import Qt and DCC modules, so this benchmark must be run with the Python interpreter of the DCC (such
+as mayapy).
+
+Usage:
+	mayapy bench_tool_ui_discovery.py [--paths PATH [PATH ...]] [--repeats 5]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import subprocess
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+	if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+		sys.path.append(_package_root)
+
+MODES = ('import', 'manifest')
+
+
+def default_tool_ui_paths() -> list[str]:
+	"""
+	Returns the tool UI paths set within TPDCC_TOOL_UI_PATHS environment variable or, if not set, the tools folders of
+	all tpDcc packages.
+
+	:return: tool UI paths.
+	:rtype: list[str]
+	"""
+
+	paths = [path for path in os.environ.get('TPDCC_TOOL_UI_PATHS', '').split(os.pathsep) if path]
+	return paths or sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', 'tp', 'tools')))
+
+
+def discover(mode: str) -> float:
+	"""
+	Discovers tool UIs within current process and returns the time it took, in milliseconds. Tool UI paths are read
+	from TPDCC_TOOL_UI_PATHS environment variable.
+
+	:param str mode: "import" to register all tool UI paths within the plugin factory or "manifest" to discover them
+		with ToolUisManager.
+	:return: discovery time.
+	:rtype: float
+	"""
+
+	# modules imported by both modes are imported before timing
+	from tp.core import dcc
+	from tp.common import plugin
+	from tp.tools.toolbox import manager
+	from tp.tools.toolbox.widgets import toolui
+
+	start = time.perf_counter()
+	if mode == 'import':
+		interfaces = [toolui.ToolUiWidget]
+		if dcc.is_maya():
+			from tp.tools.toolbox.maya import toolui as maya_toolui
+			interfaces.insert(0, maya_toolui.MayaToolUiWidget)
+		tool_uis_factory = plugin.PluginFactory(interface=interfaces, plugin_id='id', name='ToolUIs')
+		tool_uis_factory.register_paths(os.environ['TPDCC_TOOL_UI_PATHS'].split(os.pathsep))
+	else:
+		manager.ToolUisManager()
+
+	return (time.perf_counter() - start) * 1000
+
+
+def _run(mode: str, paths: list[str], manifest_path: str) -> float:
+	"""
+	Internal function that runs the discovery with given mode within a new process and returns its time.
+	"""
+
+	env = dict(os.environ)
+	env['TPDCC_TOOL_UI_PATHS'] = os.pathsep.join(paths)
+	env['TPDCC_TOOL_UI_MANIFEST_PATH'] = manifest_path
+	env.pop('TPDCC_TOOL_UI_TOOLBOX_PATHS', None)
+	output = subprocess.check_output(
+		[sys.executable, os.path.abspath(__file__), '--discover', mode], env=env, universal_newlines=True)
+
+	return float(output.strip().splitlines()[-1])
+
+
+def _median(values: list[float]) -> float:
+	values = sorted(values)
+	return values[len(values) // 2]
+
+
+def main(args: list[str] | None = None) -> int:
+	"""
+	Command line entry point.
+
+	:param list[str] or None args: command line arguments.
+	:return: exit code.
+	:rtype: int
+	"""
+
+	parser = argparse.ArgumentParser(description='Benchmarks toolbox tool UIs discovery at startup')
+	parser.add_argument('--paths', nargs='+', default=None, help='tool UI paths to discover')
+	parser.add_argument('--repeats', type=int, default=5, help='number of processes run for each measurement')
+	parser.add_argument('--discover', choices=MODES, help=argparse.SUPPRESS)
+	parsed_args = parser.parse_args(args)
+
+	if parsed_args.discover:
+		print(discover(parsed_args.discover))
+		return 0
+
+	paths = parsed_args.paths or default_tool_ui_paths()
+	with tempfile.TemporaryDirectory() as temp_directory:
+		manifest_path = os.path.join(temp_directory, 'tooluis.manifest')
+		import_times, cold_times, warm_times = [], [], []
+		for _ in range(parsed_args.repeats):
+			import_times.append(_run('import', paths, manifest_path))
+			if os.path.isfile(manifest_path):
+				os.remove(manifest_path)
+			cold_times.append(_run('manifest', paths, manifest_path))
+			warm_times.append(_run('manifest', paths, manifest_path))
+
+	import_time = _median(import_times)
+	print(f'median tool UIs discovery time of {parsed_args.repeats} processes over {len(paths)} paths')
+	print(f'  {"import all":>15}: {import_time:8.2f} ms')
+	for name, times in (('manifest cold', cold_times), ('manifest warm', warm_times)):
+		print(f'  {name:>15}: {_median(times):8.2f} ms ({import_time / _median(times):.1f}x)')
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,230 @@
+import os
+import textwrap
+
+import pytest
+
+from tp.tools.toolbox import manifest
+
+TOOL_UI_FILE = '''
+from tp.tools.toolbox.widgets import toolui
+
+
+class RenamerToolUi(toolui.ToolUiWidget):
+    id = 'tp.utility.renamer'
+    creator = 'Tomi Poveda'
+    tags = ['rename', 'naming']
+    ui_data = {'label': 'Renamer', 'icon': 'rename'}
+
+
+class CustomRenamerToolUi(RenamerToolUi):
+    id = 'tp.utility.renamer.custom'
+
+
+class Helper:
+    id = 'not.a.tool.ui'
+'''
+
+DYNAMIC_TOOL_UI_FILE = '''
+from tp.tools.toolbox.widgets import toolui
+
+TOOL_ID = 'tp.utility.dynamic'
+
+
+class DynamicToolUi(toolui.ToolUiWidget):
+    id = TOOL_ID
+'''
+
+TOOLBOX_FILE = '''
+toolboxGroups:
+  - type: utility
+    name: Utility
+    color: [85, 127, 248]
+    hueShift: 10
+    toolUis: [tp.utility.renamer]
+'''
+
+
+def _write(directory, name, contents):
+    file_path = os.path.join(str(directory), name)
+    with open(file_path, 'w') as open_file:
+        open_file.write(textwrap.dedent(contents))
+    return file_path
+
+
+def _touch(file_path, contents):
+    # changes both file contents and size, so the change is detected even within the modification time resolution
+    with open(file_path, 'a') as open_file:
+        open_file.write(contents)
+
+
+@pytest.fixture
+def tools_path(tmp_path, monkeypatch):
+    tools_directory = tmp_path / 'tools'
+    tools_directory.mkdir()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tools_directory
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    scanned = []
+    scan_tool_ui_file = manifest.scan_tool_ui_file
+
+    def _scan(file_path):
+        scanned.append(os.path.basename(file_path))
+        return scan_tool_ui_file(file_path)
+
+    monkeypatch.setattr(manifest, 'scan_tool_ui_file', _scan)
+    return scanned
+
+
+def test_scan_tool_ui_file(tools_path):
+    file_path = _write(tools_path, 'renamer.py', TOOL_UI_FILE)
+    entries = manifest.scan_tool_ui_file(file_path)
+
+    assert [entry['id'] for entry in entries] == ['tp.utility.renamer', 'tp.utility.renamer.custom']
+    assert entries[0] == {
+        'id': 'tp.utility.renamer',
+        'className': 'RenamerToolUi',
+        'uiData': {'label': 'Renamer', 'icon': 'rename'},
+        'tags': ['rename', 'naming'],
+        'creator': 'Tomi Poveda',
+        'path': file_path,
+        'module': 'tools.renamer'
+    }
+    assert entries[1]['className'] == 'CustomRenamerToolUi'
+    assert entries[1]['uiData'] == {} and entries[1]['tags'] == [] and entries[1]['creator'] == ''
+
+
+def test_scan_dynamic_and_invalid_files(tools_path):
+    assert manifest.scan_tool_ui_file(_write(tools_path, 'dynamic.py', DYNAMIC_TOOL_UI_FILE)) is None
+    assert manifest.scan_tool_ui_file(_write(tools_path, 'invalid.py', 'class Broken(:\n')) == []
+    assert manifest.scan_tool_ui_file(_write(tools_path, 'empty.py', '')) == []
+    assert manifest.scan_tool_ui_file(str(tools_path / 'missing.py')) == []
+
+
+def test_iterate_python_files(tools_path):
+    _write(tools_path, 'renamer.py', TOOL_UI_FILE)
+    _write(tools_path, 'test_renamer.py', TOOL_UI_FILE)
+    _write(tools_path, 'setup.py', '')
+    _write(tools_path, 'README.md', '')
+    (tools_path / '__pycache__').mkdir()
+    _write(tools_path / '__pycache__', 'cached.py', '')
+    (tools_path / 'widgets').mkdir()
+    widgets_path = _write(tools_path / 'widgets', 'buttons.py', '')
+
+    found_files = sorted(os.path.relpath(file_path, str(tools_path)) for file_path in manifest.iterate_python_files(
+        str(tools_path)))
+    assert found_files == ['renamer.py', os.path.join('widgets', 'buttons.py')]
+    assert list(manifest.iterate_python_files(widgets_path)) == [widgets_path]
+    assert list(manifest.iterate_python_files(str(tools_path / 'missing'))) == []
+
+
+def test_manifest_generation(tools_path, tmp_path, scans):
+    file_path = _write(tools_path, 'renamer.py', TOOL_UI_FILE)
+    manifest_path = str(tmp_path / 'cache' / 'tooluis.manifest')
+
+    tool_ui_manifest = manifest.ToolUiManifest(manifest_path)
+    entries = tool_ui_manifest.tool_uis(file_path)
+    assert [entry['id'] for entry in entries] == ['tp.utility.renamer', 'tp.utility.renamer.custom']
+    assert tool_ui_manifest.tool_uis(file_path) == entries
+    assert scans == ['renamer.py']
+    assert not os.path.isfile(manifest_path)
+
+    tool_ui_manifest.save()
+    assert os.path.isfile(manifest_path)
+    modified_time = os.stat(manifest_path).st_mtime_ns
+
+    # unchanged manifests are not written again
+    tool_ui_manifest.load()
+    tool_ui_manifest.tool_uis(file_path)
+    tool_ui_manifest.save()
+    assert os.stat(manifest_path).st_mtime_ns == modified_time
+
+
+def test_manifest_loading(tools_path, tmp_path, scans):
+    file_path = _write(tools_path, 'renamer.py', TOOL_UI_FILE)
+    dynamic_path = _write(tools_path, 'dynamic.py', DYNAMIC_TOOL_UI_FILE)
+    manifest_path = str(tmp_path / 'tooluis.manifest')
+    tool_ui_manifest = manifest.ToolUiManifest(manifest_path)
+    entries = tool_ui_manifest.tool_uis(file_path)
+    tool_ui_manifest.tool_uis(dynamic_path)
+    tool_ui_manifest.save()
+    scans.clear()
+
+    # a new session reuses manifest entries without scanning files again
+    loaded_manifest = manifest.ToolUiManifest(manifest_path)
+    assert loaded_manifest.tool_uis(file_path) == entries
+    assert loaded_manifest.tool_uis(dynamic_path) is None
+    assert scans == []
+
+    _touch(file_path, textwrap.dedent('''
+        class ExtraToolUi(toolui.ToolUiWidget):
+            id = 'tp.utility.extra'
+    '''))
+    assert [entry['id'] for entry in loaded_manifest.tool_uis(file_path)][-1] == 'tp.utility.extra'
+    assert scans == ['renamer.py']
+
+
+def test_manifest_discards_stale_entries(tools_path, tmp_path, scans):
+    file_path = _write(tools_path, 'renamer.py', TOOL_UI_FILE)
+    removed_path = _write(tools_path, 'removed.py', TOOL_UI_FILE.replace('renamer', 'removed'))
+    manifest_path = str(tmp_path / 'tooluis.manifest')
+    tool_ui_manifest = manifest.ToolUiManifest(manifest_path)
+    tool_ui_manifest.tool_uis(file_path)
+    tool_ui_manifest.tool_uis(removed_path)
+    tool_ui_manifest.save()
+
+    os.remove(removed_path)
+    tool_ui_manifest = manifest.ToolUiManifest(manifest_path)
+    tool_ui_manifest.tool_uis(file_path)
+    tool_ui_manifest.save()
+
+    tool_ui_manifest.load()
+    assert list(tool_ui_manifest._entries) == [file_path]
+
+
+@pytest.mark.parametrize('contents', ['{"version": 0, "entries": {}}', '{not json', ''])
+def test_manifest_ignores_invalid_files(tools_path, tmp_path, scans, contents):
+    file_path = _write(tools_path, 'renamer.py', TOOL_UI_FILE)
+    manifest_path = _write(tmp_path, 'tooluis.manifest', contents)
+
+    tool_ui_manifest = manifest.ToolUiManifest(manifest_path)
+    assert len(tool_ui_manifest.tool_uis(file_path)) == 2
+    assert scans == ['renamer.py']
+    tool_ui_manifest.save()
+
+    tool_ui_manifest.load()
+    assert list(tool_ui_manifest._entries) == [file_path]
+
+
+def test_manifest_path_environment_variable(tmp_path, monkeypatch):
+    manifest_path = str(tmp_path / 'tooluis.manifest')
+    monkeypatch.setenv(manifest.MANIFEST_PATH_ENV, manifest_path)
+    assert manifest.ToolUiManifest().manifest_path == manifest_path
+
+
+def test_manifest_toolbox_groups(tmp_path):
+    config_path = _write(tmp_path, 'utility.toolbox', TOOLBOX_FILE)
+    manifest_path = str(tmp_path / 'tooluis.manifest')
+    tool_ui_manifest = manifest.ToolUiManifest(manifest_path)
+    groups = tool_ui_manifest.toolbox_groups(config_path)
+    assert groups == [{
+        'type': 'utility', 'name': 'Utility', 'color': [85, 127, 248], 'hueShift': 10,
+        'toolUis': ['tp.utility.renamer']}]
+    tool_ui_manifest.save()
+
+    assert manifest.ToolUiManifest(manifest_path).toolbox_groups(config_path) == groups
+    assert tool_ui_manifest.toolbox_groups(_write(tmp_path, 'empty.toolbox', 'other: 1\n')) == []
+
+
+def test_tool_ui_info(tools_path):
+    entries = manifest.scan_tool_ui_file(_write(tools_path, 'renamer.py', TOOL_UI_FILE))
+    info = manifest.ToolUiInfo(entries[0], default_ui_data={'label': '', 'icon': '', 'tooltip': ''})
+
+    assert info.id == 'tp.utility.renamer'
+    assert info.class_name == 'RenamerToolUi'
+    assert info.ui_data == {'label': 'Renamer', 'icon': 'rename', 'tooltip': ''}
+    assert info.icon == 'rename'
+    assert info.module == 'tools.renamer'
+    assert info.group_type is None and info.color is None
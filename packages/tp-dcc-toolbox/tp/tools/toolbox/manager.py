@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import os
 import typing
-from typing import Tuple, List, Dict, Type
+from typing import Tuple, List, Dict, Type, Union
 
 from tp.core import log, dcc
 from tp.common import plugin
-from tp.common.python import yamlio, color
+from tp.common.python import color
+from tp.tools.toolbox import manifest
 from tp.tools.toolbox.widgets import toolui
 
 if dcc.is_maya():
@@ -30,6 +31,11 @@ class ToolUisManager:
 		super().__init__()
 
 		self._tool_ui_classes = {}
+		# static data of tool UIs whose modules are only imported when the tool UI is opened
+		self._tool_ui_infos = {}				# type: Dict[str, manifest.ToolUiInfo]
+		self._tool_ui_paths = []				# type: List[str]
+		self._all_paths_registered = False
+		self._manifest = manifest.ToolUiManifest()
 
 		# List of available toolbox groups retrieved from .toolbox files with the following format:
 		# {
@@ -93,7 +99,10 @@ class ToolUisManager:
 
 	def discover_tool_uis(self) -> bool:
 		"""
-		Searches the Tool UI classes registered in manager environment variable "TPDCC_TOOL_UI_PATHS"
+		Searches the Tool UI classes registered in manager environment variable "TPDCC_TOOL_UI_PATHS".
+		Tool UI files are statically scanned (and cached within the tool UIs manifest file) instead of imported, so tool
+		UI modules are only imported when their tool UI is opened. Files whose tool UIs cannot be statically scanned
+		are imported.
 
 		:return: True if Tool UI paths where discovered; False otherwise.
 		:rtype: bool
@@ -102,14 +111,30 @@ class ToolUisManager:
 		self.register_toolbox_files()
 
 		paths = os.environ.get(self.TOOL_UIS_ENV, '').split(os.pathsep)
+		paths = [tool_ui_path for tool_ui_path in paths if tool_ui_path]
 		if not paths:
 			logger.warning(f'No Tool UIs paths found for "{self.TOOL_UIS_ENV}"')
 			return False
 
-		self._tool_uis_factory.register_paths(paths)
-
-		for too_ui_class in self._tool_uis_factory.plugins():
-			self._tool_ui_classes[too_ui_class.id] = too_ui_class
+		self._tool_ui_paths = paths
+		dynamic_paths = []
+		for tool_ui_path in paths:
+			for file_path in manifest.iterate_python_files(tool_ui_path):
+				tool_ui_entries = self._manifest.tool_uis(file_path)
+				if tool_ui_entries is None:
+					dynamic_paths.append(file_path)
+					continue
+				for tool_ui_entry in tool_ui_entries:
+					tool_ui_info = manifest.ToolUiInfo(tool_ui_entry, default_ui_data=toolui.ToolUiWidget.ui_data)
+					self._tool_ui_infos.setdefault(tool_ui_info.id, tool_ui_info)
+		self._manifest.save()
+
+		if dynamic_paths:
+			self._register_tool_ui_classes(self._tool_uis_factory.register_paths(dynamic_paths))
+
+		for tool_ui_id, tool_ui_info in self._tool_ui_infos.items():
+			tool_ui_info.group_type = self.group_from_tool_ui(tool_ui_id, show_hidden=True)
+			tool_ui_info.color = self.tool_ui_color(tool_ui_id)
 
 		return True
 
@@ -121,8 +146,7 @@ class ToolUisManager:
 		config_paths = os.getenv(self.TOOL_UIS_TOOLBOX_ENV, '')
 		config_paths = [config_path for config_path in config_paths.split(os.pathsep) if os.path.isfile(config_path)]
 		for config_path in config_paths:
-			config_data = yamlio.read_file(config_path)
-			toolbox_groups = config_data.get('toolboxGroups', None)
+			toolbox_groups = self._manifest.toolbox_groups(config_path)
 			if toolbox_groups:
 				self._toolbox_groups += toolbox_groups
 
@@ -225,31 +249,46 @@ class ToolUisManager:
 			if toolbox_group['type'] == group_type:
 				return toolbox_group['toolUis']
 
-	def tool_uis(self, group_type: str) -> List[Type]:
+	def tool_uis(self, group_type: str) -> List[Union[Type, manifest.ToolUiInfo]]:
 		"""
-		Returns list of tool UI classes under the given group type.
+		Returns list of tool UIs under the given group type.
+		Tool UIs whose modules were not imported yet are returned as tool UI infos, which expose the same id and
+		ui_data attributes as tool UI classes.
 
-		:param str group_type: group type to get tool UI classes of ("Assets", "Rigging", "Animation", ...).
-		:return: found tool UIs classes.
-		:rtype: List[Type]
+		:param str group_type: group type to get tool UIs of ("Assets", "Rigging", "Animation", ...).
+		:return: found tool UIs classes or infos.
+		:rtype: List[Type or manifest.ToolUiInfo]
 		:raises TypeError: if group_type argument is empty.
 		"""
 
 		if not group_type:
 			raise TypeError('"group_type" argument must not be empty!')
 
-		tool_ui_ids = self.tool_ui_ids(group_type)
-		found_tool_ui_classes = []
+		tool_ui_ids = self.tool_ui_ids(group_type) or []
+		found_tool_uis = []
 		for tool_ui_id in tool_ui_ids:
-			tool_ui_class = self.tool_ui(tool_ui_id)
-			if tool_ui_class:
-				found_tool_ui_classes.append(tool_ui_class)
+			tool_ui = self._tool_ui_classes.get(tool_ui_id) or self._tool_ui_infos.get(tool_ui_id)
+			if tool_ui is None:
+				tool_ui = self.tool_ui(tool_ui_id)
+			if tool_ui:
+				found_tool_uis.append(tool_ui)
+
+		return found_tool_uis
+
+	def tool_ui_info(self, tool_ui_id: str) -> manifest.ToolUiInfo | None:
+		"""
+		Returns the static data of the tool UI with given id, without importing its module.
+
+		:param str tool_ui_id: ID of the tool UI.
+		:return: tool UI info.
+		:rtype: manifest.ToolUiInfo or None
+		"""
 
-		return found_tool_ui_classes
+		return self._tool_ui_infos.get(tool_ui_id)
 
 	def tool_ui(self, tool_ui_id: str) -> Type | None:
 		"""
-		Returns tool UI class based on given id.
+		Returns tool UI class based on given id. Tool UI module is imported the first time its class is requested.
 
 		:param str tool_ui_id: ID of the tool UI class to find.
 		:return: found tool ui class with given ID.
@@ -257,8 +296,21 @@ class ToolUisManager:
 		"""
 
 		result = self._tool_ui_classes.get(tool_ui_id)
+		if result is not None:
+			return result
+
+		tool_ui_info = self._tool_ui_infos.get(tool_ui_id)
+		if tool_ui_info is not None:
+			self._register_tool_ui_classes(self._tool_uis_factory.register_paths([tool_ui_info.PATH]))
+			result = self._tool_ui_classes.get(tool_ui_id)
+		if result is None and not self._all_paths_registered:
+			# tool UI was not found within the manifest (for example, because it inherits from a custom base class),
+			# so all tool UI paths are imported as a fallback
+			self._all_paths_registered = True
+			self._register_tool_ui_classes(self._tool_uis_factory.register_paths(self._tool_ui_paths))
+			result = self._tool_ui_classes.get(tool_ui_id)
 		if result is None:
-			logger.warning('"{}" tool UI not found!')
+			logger.warning(f'"{tool_ui_id}" tool UI not found!')
 
 		return result
 
@@ -280,5 +332,15 @@ class ToolUisManager:
 
 		return 255, 255, 255
 
+	def _register_tool_ui_classes(self, tool_ui_classes: List[Type]):
+		"""
+		Internal function that stores given tool UI classes by their ids.
+
+		:param List[Type] tool_ui_classes: tool UI classes to store.
+		"""
+
+		for tool_ui_class in tool_ui_classes:
+			self._tool_ui_classes[tool_ui_class.id] = tool_ui_class
+
 
 _TOOLS_UI_MANAGER_INSTANCE = None			# type: ToolUisManager
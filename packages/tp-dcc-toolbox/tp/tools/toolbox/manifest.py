@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import os
+import ast
+from typing import Iterator, Callable, List, Dict, Any
+
+from tp.core import log
+from tp.common import plugin
+from tp.common.python import jsonio, yamlio, folder, modules
+
+logger = log.tpLogger
+
+# Version of the manifest file layout. Manifest files with a different version are discarded.
+MANIFEST_VERSION = 1
+MANIFEST_PATH_ENV = 'TPDCC_TOOL_UI_MANIFEST_PATH'
+# name of the base classes tool UI classes inherit from
+TOOL_UI_BASE_NAMES = ('ToolUiWidget', 'MayaToolUiWidget')
+# marker used for class attributes whose value is not a literal
+_DYNAMIC = object()
+
+
+def default_manifest_path() -> str:
+	"""
+	Returns the path where the tool UIs manifest file is stored.
+	Path can be overridden using TPDCC_TOOL_UI_MANIFEST_PATH environment variable.
+
+	:return: absolute manifest file path.
+	:rtype: str
+	"""
+
+	return os.environ.get(MANIFEST_PATH_ENV) or os.path.join(folder.get_temp_folder(), 'toolbox', 'tooluis.manifest')
+
+
+def iterate_python_files(path_to_scan: str) -> Iterator[str]:
+	"""
+	Generator function that iterates over the Python files of the given path that plugin factories would inspect.
+
+	:param str path_to_scan: Python file or directory path.
+	:return: iterated Python file paths.
+	:rtype: Iterator[str]
+	"""
+
+	if os.path.isfile(path_to_scan):
+		yield path_to_scan
+		return
+	if not os.path.isdir(path_to_scan):
+		return
+
+	folder_validator = plugin.PluginFactory.get_regex_folder_validator()
+	file_validator = plugin.PluginFactory.get_regex_file_validator()
+	for root, _, files in os.walk(path_to_scan):
+		if not folder_validator.match(root):
+			continue
+		for file_name in files:
+			if not file_validator.match(file_name) or file_name.startswith('test') or file_name == 'setup.py':
+				continue
+			yield os.path.join(root, file_name)
+
+
+def _literal_class_attributes(class_node: ast.ClassDef) -> Dict[str, Any]:
+	"""
+	Internal function that returns the class attributes of the given class that are defined with literal values.
+
+	:param ast.ClassDef class_node: class node.
+	:return: dictionary with attribute names and values.
+	:rtype: Dict[str, Any]
+	"""
+
+	attributes = {}
+	for node in class_node.body:
+		if not isinstance(node, ast.Assign):
+			continue
+		try:
+			value = ast.literal_eval(node.value)
+		except (ValueError, TypeError, SyntaxError):
+			value = _DYNAMIC
+		for target in node.targets:
+			if isinstance(target, ast.Name):
+				attributes[target.id] = value
+
+	return attributes
+
+
+def _base_name(base_node: ast.expr) -> str:
+	"""
+	Internal function that returns the name of the given class base node (for example, "toolui.ToolUiWidget" returns
+	"ToolUiWidget").
+
+	:param ast.expr base_node: base node.
+	:return: base class name.
+	:rtype: str
+	"""
+
+	if isinstance(base_node, ast.Attribute):
+		return base_node.attr
+	if isinstance(base_node, ast.Name):
+		return base_node.id
+
+	return ''
+
+
+def scan_tool_ui_file(file_path: str) -> List[Dict] | None:
+	"""
+	Statically scans the given Python file, without importing it, and returns the data of the tool UI classes defined
+	within it.
+
+	:param str file_path: absolute Python file path.
+	:return: list of tool UI data dictionaries or None if file defines tool UIs whose data cannot be statically
+		resolved (so the file must be imported to discover them).
+	:rtype: List[Dict] or None
+	"""
+
+	try:
+		with open(file_path, 'rb') as python_file:
+			tree = ast.parse(python_file.read(), filename=file_path)
+	except (OSError, SyntaxError, ValueError):
+		logger.debug(f'Unable to scan tool UI file: {file_path}', exc_info=True)
+		return []
+
+	tool_ui_names = set(TOOL_UI_BASE_NAMES)
+	entries = []
+	module_path = None
+	for node in tree.body:
+		if not isinstance(node, ast.ClassDef):
+			continue
+		if not any(_base_name(base) in tool_ui_names for base in node.bases):
+			continue
+		tool_ui_names.add(node.name)
+		attributes = _literal_class_attributes(node)
+		tool_ui_id = attributes.get('id')
+		ui_data = attributes.get('ui_data', {})
+		if not isinstance(tool_ui_id, str) or not isinstance(ui_data, dict):
+			return None
+		if module_path is None:
+			module_path = modules.convert_to_dotted_path(file_path)
+		tags = attributes.get('tags', [])
+		creator = attributes.get('creator', '')
+		entries.append({
+			'id': tool_ui_id,
+			'className': node.name,
+			'uiData': ui_data,
+			'tags': list(tags) if isinstance(tags, (list, tuple)) else [],
+			'creator': creator if isinstance(creator, str) else '',
+			'path': file_path,
+			'module': module_path
+		})
+
+	return entries
+
+
+class ToolUiInfo:
+	"""
+	Class that holds the static data of a tool UI, so toolbox buttons and menus can be created without importing the
+	tool UI module. Exposes the same id and ui_data attributes as tool UI classes.
+	"""
+
+	def __init__(self, data: Dict, default_ui_data: Dict | None = None):
+		super().__init__()
+
+		self.id = data['id']						# type: str
+		self.class_name = data['className']			# type: str
+		self.ui_data = dict(default_ui_data or {}, **data['uiData'])
+		self.tags = data['tags']					# type: List[str]
+		self.creator = data['creator']				# type: str
+		self.PATH = data['path']					# type: str
+		self.module = data['module']				# type: str
+		self.group_type = None						# type: str | None
+		self.color = None							# type: tuple[int, int, int] | None
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(id={self.id}, path={self.PATH})> object at {hex(id(self))}'
+
+	@property
+	def icon(self) -> str:
+		return self.ui_data.get('icon', '')
+
+
+class ToolUiManifest:
+	"""
+	Class that stores the static data of tool UI files and toolbox configuration files on disk, keyed by file path.
+	Each entry is validated against the file modification time and size, so only changed files are scanned again.
+	"""
+
+	def __init__(self, manifest_path: str | None = None):
+		super().__init__()
+
+		self._manifest_path = manifest_path or default_manifest_path()
+		self._entries = {}							# type: Dict[str, List]
+		self._visited = set()
+		self._dirty = False
+		self._loaded = False
+
+	@property
+	def manifest_path(self) -> str:
+		return self._manifest_path
+
+	def load(self):
+		"""
+		Loads manifest entries from manifest file. Invalid or outdated manifest files are ignored.
+		"""
+
+		self._entries.clear()
+		self._visited.clear()
+		self._dirty = False
+		self._loaded = True
+		if not os.path.isfile(self._manifest_path):
+			return
+
+		try:
+			data = jsonio.read_file(self._manifest_path) or {}
+		except Exception:
+			logger.warning(f'Failed to load tool UIs manifest: {self._manifest_path}', exc_info=True)
+			return
+		if data.get('version') != MANIFEST_VERSION:
+			return
+
+		self._entries = data.get('entries', {})
+
+	def save(self):
+		"""
+		Writes manifest entries into manifest file. Entries for files that were not requested since last load are
+		discarded.
+		"""
+
+		stale_paths = [file_path for file_path in self._entries if file_path not in self._visited]
+		for stale_path in stale_paths:
+			del self._entries[stale_path]
+		if not self._dirty and not stale_paths:
+			return
+
+		try:
+			os.makedirs(os.path.dirname(self._manifest_path), exist_ok=True)
+		except OSError:
+			logger.warning(f'Failed to save tool UIs manifest: {self._manifest_path}', exc_info=True)
+			return
+		if jsonio.write_to_file(
+				{'version': MANIFEST_VERSION, 'entries': self._entries}, self._manifest_path, compact=True):
+			self._dirty = False
+
+	def tool_uis(self, file_path: str) -> List[Dict] | None:
+		"""
+		Returns the data of the tool UI classes defined within given Python file. File is only scanned if it changed
+		since it was scanned.
+
+		:param str file_path: absolute Python file path.
+		:return: list of tool UI data dictionaries or None if file must be imported to discover its tool UIs.
+		:rtype: List[Dict] or None
+		"""
+
+		return self._entry(file_path, scan_tool_ui_file)
+
+	def toolbox_groups(self, config_path: str) -> List[Dict]:
+		"""
+		Returns the toolbox groups defined within given toolbox configuration file. File is only parsed if it changed
+		since it was parsed.
+
+		:param str config_path: absolute toolbox configuration file path.
+		:return: list of toolbox groups data.
+		:rtype: List[Dict]
+		"""
+
+		def _read(file_path: str) -> List[Dict]:
+			config_data = yamlio.read_file(file_path) or {}
+			return config_data.get('toolboxGroups', None) or []
+
+		return self._entry(config_path, _read) or []
+
+	def _entry(self, file_path: str, reader: Callable[[str], Any]) -> Any:
+		"""
+		Internal function that returns the manifest data of the given file, reading it if it is not valid.
+
+		:param str file_path: absolute file path.
+		:param Callable[[str], Any] reader: function that reads the data of the file.
+		:return: file manifest data.
+		:rtype: Any
+		"""
+
+		if not self._loaded:
+			self.load()
+
+		stat = os.stat(file_path)
+		self._visited.add(file_path)
+		entry = self._entries.get(file_path)
+		if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+			return entry[2]
+
+		data = reader(file_path)
+		self._entries[file_path] = [stat.st_mtime_ns, stat.st_size, data]
+		self._dirty = True
+
+		return data
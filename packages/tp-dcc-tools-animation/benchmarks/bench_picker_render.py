@@ -0,0 +1,122 @@
+"""
+Benchmark that measures rendering a large anim picker map at different zoom levels. Runs offscreen, so no display is
+needed.
+
+Picker items cached per selection state and zoom bucket are compared against the previous behaviour, which drew the
+whole item appearance every time the item was painted. Cached pixmaps memory is reported after each zoom level.
+
+Usage:
+	python bench_picker_render.py [--columns 40] [--rows 25] [--iterations 10]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import glob
+import argparse
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+	if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+		sys.path.append(_package_root)
+
+from tp.common.qt import api as qt
+
+# picker items are rendered into pixmaps, which need an application
+_APP = qt.QApplication.instance() or qt.QApplication(sys.argv)
+
+from tp.tools.animpicker import uiutils
+from tp.tools.animpicker.widgets import items
+
+ZOOM_LEVELS = (0.5, 1.0, 2.0, 4.0)
+
+
+class UncachedRectangleDropItem(items.RectangleDropItem):
+	"""
+	Rectangle picker item that draws its whole appearance every time it is painted, as picker items did before
+	rendered appearances were cached.
+	"""
+
+	def paint(self, painter: qt.QPainter, option: qt.QStyleOptionGraphicsItem, widget: qt.QWidget | None = None):
+		painter.save()
+		try:
+			self.draw_content(painter, self.isSelected())
+		finally:
+			painter.restore()
+
+
+def create_picker_scene(item_class: type[items.RectangleDropItem], columns: int, rows: int) -> qt.QGraphicsScene:
+	"""
+	Returns a picker scene with a grid of labeled picker items.
+
+	:param type[items.RectangleDropItem] item_class: picker item class to create.
+	:param int columns: number of picker item columns.
+	:param int rows: number of picker item rows.
+	:return: picker scene.
+	:rtype: qt.QGraphicsScene
+	"""
+
+	scene = qt.QGraphicsScene()
+	for row in range(rows):
+		for column in range(columns):
+			item = item_class(qt.QColor.fromHsv((column * 9 + row * 5) % 360, 160, 220), 30, 20)
+			item.label = f'c{column}r{row}'
+			item.setPos(column * 36.0, row * 26.0)
+			scene.addItem(item)
+			if (column + row) % 7 == 0:
+				item.setSelected(True)
+
+	return scene
+
+
+def cached_pixels(scene: qt.QGraphicsScene) -> int:
+	"""
+	Returns the number of pixels of all the picker item appearances cached within the given scene.
+
+	:param qt.QGraphicsScene scene: picker scene.
+	:return: number of cached pixels.
+	:rtype: int
+	"""
+
+	total = 0
+	for item in scene.items():
+		for _, pixmap in getattr(item, '_render_cache', {}).values():
+			total += pixmap.width() * pixmap.height()
+	return total
+
+
+def main(args: list[str] | None = None) -> int:
+	"""
+	Command line entry point.
+
+	:param list[str] or None args: command line arguments.
+	:return: exit code.
+	:rtype: int
+	"""
+
+	parser = argparse.ArgumentParser(description='Benchmarks anim picker map rendering')
+	parser.add_argument('--columns', type=int, default=40, help='number of picker item columns')
+	parser.add_argument('--rows', type=int, default=25, help='number of picker item rows')
+	parser.add_argument('--iterations', type=int, default=10, help='number of rendered frames per zoom level')
+	parsed_args = parser.parse_args(args)
+
+	uncached_scene = create_picker_scene(UncachedRectangleDropItem, parsed_args.columns, parsed_args.rows)
+	cached_scene = create_picker_scene(items.RectangleDropItem, parsed_args.columns, parsed_args.rows)
+
+	print(f'average frame time of {parsed_args.columns * parsed_args.rows} picker items')
+	for zoom in ZOOM_LEVELS:
+		uncached_time = uiutils.measure_scene_render_time(uncached_scene, zoom, parsed_args.iterations)
+		cached_time = uiutils.measure_scene_render_time(cached_scene, zoom, parsed_args.iterations)
+		print(
+			f'  zoom {zoom:4.1f}: uncached {uncached_time:8.2f} ms, cached {cached_time:8.2f} ms '
+			f'({uncached_time / cached_time:.1f}x), cached pixmaps {cached_pixels(cached_scene) * 4 / 1024 ** 2:.1f} MB')
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
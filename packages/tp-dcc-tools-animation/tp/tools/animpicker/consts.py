@@ -9,6 +9,16 @@ COMMAND_TYPES = ['Select', 'Reset', 'Key', 'Toggle', 'Pose', 'Range']
 
 DEFAULT_MAP_BACKGROUND_COLOR = qt.QColor(qt.Qt.darkGray)
 SELECTED_BORDER_COLOR = qt.QColor(67, 255, 163)
+# milliseconds to wait after the last DCC scene selection change before highlighting picker items
+SELECTION_SYNC_INTERVAL = 50
+# level of detail below which picker items are drawn as plain colored shapes
+ITEM_SIMPLIFIED_LOD = 0.35
+# zoom buckets per zoom octave used to cache rendered picker items
+ITEM_RENDER_ZOOM_BUCKETS = 2
+# maximum level of detail picker items are cached at
+ITEM_RENDER_MAX_LOD = 8.0
+# maximum number of pixels of a cached picker item appearance, so large items are not cached at full zoom scale
+ITEM_RENDER_MAX_PIXELS = 1024 * 1024
 FONT_DB = qt.QFontDatabase()
 FONT_FAMILIES = FONT_DB.families()
 
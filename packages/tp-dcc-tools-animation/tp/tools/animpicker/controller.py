@@ -24,6 +24,7 @@ class AnimPickerController(Controller):
 	matchPrefixToMap = Signal(events.MatchPrefixToMapEvent)
 	preLoadMap = Signal(events.PreLoadMapEvent)
 	loadMap = Signal(events.LoadMapEvent)
+	sceneSelectionChanged = Signal(list)
 
 	def __init__(self):
 		super().__init__()
@@ -144,6 +145,28 @@ class AnimPickerController(Controller):
 
 		raise NotImplementedError
 
+	def register_selection_callback(self):
+		"""
+		Registers the DCC callback that notifies scene selection changes through notify_scene_selection_changed.
+		"""
+
+		pass
+
+	def unregister_selection_callback(self):
+		"""
+		Unregisters the DCC callback registered by register_selection_callback.
+		"""
+
+		pass
+
+	def notify_scene_selection_changed(self, *args):
+		"""
+		Emits the names of the nodes currently selected within the DCC scene.
+		Should be called by DCC selection changed callbacks.
+		"""
+
+		self.sceneSelectionChanged.emit(self.selected_node_names())
+
 	def refresh(self, *args):
 		"""
 		Refreshes UIs.
@@ -6,6 +6,7 @@ from typing import Tuple, List
 
 from overrides import override
 import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
 
 from tp.core import log
 from tp.tools.animpicker import controller
@@ -17,6 +18,28 @@ logger = log.modelLogger
 
 class MayaAnimPickerController(controller.AnimPickerController):
 
+	def __init__(self):
+		super().__init__()
+
+		self._selection_callback_id = None				# type: int | None
+
+	@override
+	def register_selection_callback(self):
+		if self._selection_callback_id is not None:
+			return
+		self._selection_callback_id = OpenMaya.MEventMessage.addEventCallback(
+			'SelectionChanged', self.notify_scene_selection_changed)
+
+	@override
+	def unregister_selection_callback(self):
+		if self._selection_callback_id is None:
+			return
+		try:
+			OpenMaya.MMessage.removeCallback(self._selection_callback_id)
+		except RuntimeError:
+			logger.debug('Selection changed callback was already removed')
+		self._selection_callback_id = None
+
 	@override
 	def filter_picker_nodes(self) -> List[str]:
 		return [n for n in cmds.ls(type='geometryVarGroup') if cmds.objExists(f'{n}.animPickerMap')]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Hashable, Any
+
+
+class PickerSelectionIndex:
+	"""
+	Class that indexes picker items by their target node names and the other way around, so matching picker items
+	with scene selection does not need to scan all picker items.
+	Index does not depend on Qt: items are opaque hashable objects. An item is highlighted when all its target nodes
+	are selected within the scene.
+	"""
+
+	def __init__(self):
+		super().__init__()
+
+		self._items = {}						# type: dict[Hashable, tuple[str, ...]]
+		self._items_by_node = {}				# type: dict[str, dict[Hashable, None]]
+		self._selected_nodes = set()			# type: set[str]
+		self._highlighted = {}					# type: dict[Hashable, None]
+
+	def __len__(self) -> int:
+		return len(self._items)
+
+	def __contains__(self, item: Hashable) -> bool:
+		return item in self._items
+
+	def __iter__(self) -> Iterator[Hashable]:
+		return iter(list(self._items))
+
+	@property
+	def selected_nodes(self) -> set[str]:
+		return set(self._selected_nodes)
+
+	def items(self) -> list[Any]:
+		"""
+		Returns all indexed items, in the order they were added.
+
+		:return: indexed items.
+		:rtype: list[Any]
+		"""
+
+		return list(self._items)
+
+	def target_items(self) -> list[Any]:
+		"""
+		Returns all indexed items with at least one target node.
+
+		:return: indexed items with target nodes.
+		:rtype: list[Any]
+		"""
+
+		return [item for item, nodes in self._items.items() if nodes]
+
+	def nodes_for_item(self, item: Hashable) -> list[str]:
+		"""
+		Returns the target node names of the given item.
+
+		:param Hashable item: indexed item.
+		:return: target node names.
+		:rtype: list[str]
+		"""
+
+		return list(self._items.get(item, ()))
+
+	def items_for_node(self, node_name: str) -> list[Any]:
+		"""
+		Returns the items that target the given node.
+
+		:param str node_name: node name.
+		:return: items targeting the node.
+		:rtype: list[Any]
+		"""
+
+		return list(self._items_by_node.get(node_name, ()))
+
+	def items_for_nodes(self, node_names: Iterable[str]) -> list[Any]:
+		"""
+		Returns the items that target any of the given nodes.
+
+		:param Iterable[str] node_names: node names.
+		:return: items targeting any of the nodes, without duplicates.
+		:rtype: list[Any]
+		"""
+
+		found_items = {}
+		for node_name in node_names:
+			found_items.update(self._items_by_node.get(node_name, {}))
+
+		return list(found_items)
+
+	def is_highlighted(self, item: Hashable) -> bool:
+		"""
+		Returns whether the given item is highlighted by current scene selection.
+
+		:param Hashable item: indexed item.
+		:return: True if all item target nodes are selected; False otherwise.
+		:rtype: bool
+		"""
+
+		return item in self._highlighted
+
+	def highlighted_items(self) -> list[Any]:
+		"""
+		Returns all items highlighted by current scene selection.
+
+		:return: highlighted items.
+		:rtype: list[Any]
+		"""
+
+		return list(self._highlighted)
+
+	def add(self, item: Hashable, node_names: Iterable[str] = ()) -> bool:
+		"""
+		Adds given item into the index. If item is already indexed, it is retargeted.
+
+		:param Hashable item: item to add.
+		:param Iterable[str] node_names: item target node names.
+		:return: True if item highlight state changed; False otherwise.
+		:rtype: bool
+		"""
+
+		return self.retarget(item, node_names)
+
+	def retarget(self, item: Hashable, node_names: Iterable[str]) -> bool:
+		"""
+		Updates the target nodes of the given item.
+
+		:param Hashable item: item to update.
+		:param Iterable[str] node_names: new item target node names.
+		:return: True if item highlight state changed; False otherwise.
+		:rtype: bool
+		"""
+
+		node_names = tuple(dict.fromkeys(node_names))
+		for node_name in self._items.get(item, ()):
+			self._unlink(item, node_name)
+		self._items[item] = node_names
+		for node_name in node_names:
+			self._items_by_node.setdefault(node_name, {})[item] = None
+
+		return self._update_highlight(item)
+
+	def remove(self, item: Hashable) -> bool:
+		"""
+		Removes given item from the index.
+
+		:param Hashable item: item to remove.
+		:return: True if item was indexed; False otherwise.
+		:rtype: bool
+		"""
+
+		node_names = self._items.pop(item, None)
+		if node_names is None:
+			return False
+		for node_name in node_names:
+			self._unlink(item, node_name)
+		self._highlighted.pop(item, None)
+
+		return True
+
+	def clear(self):
+		"""
+		Removes all items from the index. Scene selection is kept.
+		"""
+
+		self._items.clear()
+		self._items_by_node.clear()
+		self._highlighted.clear()
+
+	def update_selection(self, node_names: Iterable[str]) -> tuple[list[Any], list[Any]]:
+		"""
+		Updates the scene selection and returns the items whose highlight state changed.
+		Only the items targeting nodes whose selection state changed are checked.
+
+		:param Iterable[str] node_names: names of the currently selected nodes.
+		:return: tuple with the items to highlight and the items to unhighlight.
+		:rtype: tuple[list[Any], list[Any]]
+		"""
+
+		selected_nodes = set(node_names)
+		changed_nodes = selected_nodes.symmetric_difference(self._selected_nodes)
+		self._selected_nodes = selected_nodes
+		highlighted = []
+		unhighlighted = []
+		for item in self.items_for_nodes(changed_nodes):
+			if self._update_highlight(item):
+				(highlighted if item in self._highlighted else unhighlighted).append(item)
+
+		return highlighted, unhighlighted
+
+	def _unlink(self, item: Hashable, node_name: str):
+		"""
+		Internal function that removes the link between given item and node.
+
+		:param Hashable item: indexed item.
+		:param str node_name: node name.
+		"""
+
+		node_items = self._items_by_node.get(node_name)
+		if node_items is None:
+			return
+		node_items.pop(item, None)
+		if not node_items:
+			del self._items_by_node[node_name]
+
+	def _update_highlight(self, item: Hashable) -> bool:
+		"""
+		Internal function that updates the highlight state of the given item.
+
+		:param Hashable item: indexed item.
+		:return: True if item highlight state changed; False otherwise.
+		:rtype: bool
+		"""
+
+		node_names = self._items.get(item, ())
+		highlight = bool(node_names) and all(node_name in self._selected_nodes for node_name in node_names)
+		if highlight == (item in self._highlighted):
+			return False
+		if highlight:
+			self._highlighted[item] = None
+		else:
+			del self._highlighted[item]
+
+		return True
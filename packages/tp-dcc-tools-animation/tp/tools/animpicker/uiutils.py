@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import time
 import queue
 import typing
@@ -12,6 +13,7 @@ from overrides import override
 
 from tp.core import log
 from tp.common.qt import api as qt
+from tp.tools.animpicker import consts
 
 if typing.TYPE_CHECKING:
 	from tp.tools.animpicker.views.viewer import AnimPickerViewerWidget
@@ -69,6 +71,52 @@ def generate_hash_code(item: qt.QGraphicsItem) -> str:
 	return urllib.parse.quote_plus(digest)
 
 
+def zoom_bucket(level_of_detail: float) -> float:
+	"""
+	Returns the zoom bucket the given level of detail belongs to. Buckets are rounded up, so content rendered at the
+	bucket scale is never upscaled when drawn.
+
+	:param float level_of_detail: level of detail (scale of the item within the view).
+	:return: zoom bucket scale.
+	:rtype: float
+	"""
+
+	if level_of_detail <= 0.0:
+		return 1.0
+	steps = math.ceil(math.log2(level_of_detail) * consts.ITEM_RENDER_ZOOM_BUCKETS - 1e-9)
+	return min(2.0 ** (steps / consts.ITEM_RENDER_ZOOM_BUCKETS), consts.ITEM_RENDER_MAX_LOD)
+
+
+def measure_scene_render_time(
+		scene: qt.QGraphicsScene, zoom: float = 1.0, iterations: int = 10, rect: qt.QRectF | None = None) -> float:
+	"""
+	Renders the given scene offscreen several times and returns the average frame time.
+	Useful to compare picker map rendering performance at different zoom levels.
+
+	:param qt.QGraphicsScene scene: scene to render.
+	:param float zoom: zoom level to render scene with.
+	:param int iterations: number of frames to render.
+	:param qt.QRectF or None rect: scene rectangle to render. If not given, items bounding rectangle is used.
+	:return: average frame time in milliseconds.
+	:rtype: float
+	"""
+
+	rect = rect if rect is not None else scene.itemsBoundingRect()
+	size = qt.QSize(max(int(math.ceil(rect.width() * zoom)), 1), max(int(math.ceil(rect.height() * zoom)), 1))
+	image = qt.QImage(size, qt.QImage.Format_ARGB32_Premultiplied)
+	target = qt.QRectF(0, 0, size.width(), size.height())
+	iterations = max(iterations, 1)
+	start = time.perf_counter()
+	for _ in range(iterations):
+		image.fill(qt.Qt.transparent)
+		painter = qt.QPainter(image)
+		painter.setRenderHint(qt.QPainter.Antialiasing)
+		scene.render(painter, target, rect)
+		painter.end()
+
+	return (time.perf_counter() - start) * 1000.0 / iterations
+
+
 def warning(msg: str, parent: qt.QWidget | None = None) -> bool:
 	"""
 	Shows a warning message.
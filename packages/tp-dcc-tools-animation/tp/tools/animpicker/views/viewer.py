@@ -9,7 +9,7 @@ from tp.common.qt import api as qt
 from tp.common.resources import api as resources
 from tp.tools.animpicker import consts, uiutils
 from tp.tools.animpicker.views import main
-from tp.tools.animpicker.widgets import buttons, tabs, dialogs, lineedits
+from tp.tools.animpicker.widgets import buttons, tabs, dialogs, lineedits, graphics
 
 if typing.TYPE_CHECKING:
 	from tp.tools.animpicker.widgets.graphics import DropScene
@@ -58,6 +58,11 @@ class AnimPickerViewerWidget(qt.QWidget):
 		self._auto_key_state = False
 		self._select_guide_dialog = None
 		self._callbacks = []
+		self._pending_selection = None					# type: List[str] | None
+
+		self._selection_timer = qt.QTimer(parent=self)
+		self._selection_timer.setSingleShot(True)
+		self._selection_timer.setInterval(consts.SELECTION_SYNC_INTERVAL)
 
 		self.setup_ui()
 		self.setup_signals()
@@ -121,6 +126,8 @@ class AnimPickerViewerWidget(qt.QWidget):
 		self._controller.matchPrefixToMap.connect(self._on_match_prefix_to_map)
 		self._controller.preLoadMap.connect(self._on_pre_load_map)
 		self._controller.loadMap.connect(self._on_load_map)
+		self._controller.sceneSelectionChanged.connect(self._on_scene_selection_changed)
+		self._selection_timer.timeout.connect(self._on_selection_timer_timeout)
 
 
 		self._setup_tab_signals()
@@ -132,6 +139,19 @@ class AnimPickerViewerWidget(qt.QWidget):
 
 		self.tab_widget.currentChanged.connect(self.set_tab_data)
 
+	@override
+	def showEvent(self, event: qt.QShowEvent) -> None:
+		super().showEvent(event)
+		self._controller.register_selection_callback()
+		self._controller.notify_scene_selection_changed()
+
+	@override
+	def hideEvent(self, event: qt.QHideEvent) -> None:
+		self._controller.unregister_selection_callback()
+		self._selection_timer.stop()
+		self._pending_selection = None
+		super().hideEvent(event)
+
 	def refresh(self, *args):
 		"""
 		Refreshes viewer.
@@ -171,6 +191,32 @@ class AnimPickerViewerWidget(qt.QWidget):
 			index = self.tab_widget.currentIndex()
 		return self.tab_widget.tabText(index)
 
+	def all_scenes(self) -> List[DropScene]:
+		"""
+		Returns all scenes shown by this viewer, including the ones within tear off dialogs.
+
+		:return: list of scenes.
+		:rtype: List[DropScene]
+		"""
+
+		scenes = {}
+		for view in self.findChildren(graphics.DropView):
+			scene = view.scene()
+			if scene is not None:
+				scenes[scene] = None
+
+		return list(scenes)
+
+	def apply_scene_selection(self, node_names: List[str]):
+		"""
+		Highlights the items of all scenes whose target nodes are selected within the DCC scene.
+
+		:param List[str] node_names: names of the selected nodes within the DCC scene.
+		"""
+
+		for scene in self.all_scenes():
+			scene.apply_scene_selection(node_names)
+
 	def tear_off_dialogs(self) -> List[dialogs.TearOffDialog]:
 		"""
 		Returns all tear off dialogs attached to this viewer.
@@ -472,4 +518,26 @@ class AnimPickerViewerWidget(qt.QWidget):
 			event.result = True
 
 	def _on_load_map(self, event: LoadMapEvent):
-		pass
\ No newline at end of file
+		pass
+
+	def _on_scene_selection_changed(self, node_names: List[str]):
+		"""
+		Internal callback function that is called each time DCC scene selection changes.
+		Selection changes are debounced, so a burst of selection changes only updates the items once.
+
+		:param List[str] node_names: names of the selected nodes within the DCC scene.
+		"""
+
+		self._pending_selection = node_names
+		self._selection_timer.start()
+
+	def _on_selection_timer_timeout(self):
+		"""
+		Internal callback function that is called when selection debounce timer times out.
+		"""
+
+		node_names, self._pending_selection = self._pending_selection, None
+		if node_names is None:
+			return
+
+		self.apply_scene_selection(node_names)
\ No newline at end of file
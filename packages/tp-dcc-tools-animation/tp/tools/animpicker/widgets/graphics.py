@@ -9,7 +9,7 @@ from tp.core import log
 from tp.common.qt import api as qt
 from tp.common.resources import api as resources
 from tp.common.python.decorators import accepts, returns
-from tp.tools.animpicker import consts, uiutils
+from tp.tools.animpicker import consts, uiutils, selectionindex
 from tp.tools.animpicker.widgets import items
 
 logger = log.animLogger
@@ -45,6 +45,7 @@ class DropScene(qt.QGraphicsScene):
 		self._use_background_image = False
 		self._coop = False
 		self._is_handle_working = False
+		self._selection_index = selectionindex.PickerSelectionIndex()
 
 	@property
 	@returns(qt.QSizeF)
@@ -100,6 +101,20 @@ class DropScene(qt.QGraphicsScene):
 	def coop(self, flag: bool):
 		self._coop = flag
 
+	@property
+	def selection_index(self) -> selectionindex.PickerSelectionIndex:
+		return self._selection_index
+
+	@override
+	def removeItem(self, item: qt.QGraphicsItem) -> None:
+		self._selection_index.remove(item)
+		super().removeItem(item)
+
+	@override
+	def clear(self) -> None:
+		self._selection_index.clear()
+		super().clear()
+
 	@override
 	def mousePressEvent(self, event: qt.QGraphicsSceneMouseEvent) -> None:
 		scene_items = [x for x in self.items(event.scenePos()) if isinstance(x, items.AbstractDropItem)]
@@ -297,8 +312,11 @@ class DropScene(qt.QGraphicsScene):
 		:rtype: List[items.AbstractDropItem]
 		"""
 
-		scene_items = [x for x in rect.isValid() and self.items(rect) or self.items() if isinstance(
-			x, (items.AbstractDropItem, items.GroupItem))]
+		if rect.isValid():
+			scene_items = [
+				x for x in self.items(rect) if x in self._selection_index or isinstance(x, items.GroupItem)]
+		else:
+			scene_items = self._selection_index.items()
 		if scene_items:
 			scene_items.sort(key=lambda x: x.zValue())
 		return scene_items
@@ -311,8 +329,8 @@ class DropScene(qt.QGraphicsScene):
 		:rtype: items.AbstractDropItem or items.GroupItem or None
 		"""
 
-		scene_items = self.items_by_z_value_order()
-		return scene_items[-1] if scene_items else None
+		scene_items = self._selection_index.items()
+		return max(scene_items, key=lambda x: x.zValue()) if scene_items else None
 
 	def select_in_rect(self, rect: qt.QRectF, mode: str = 'add'):
 		"""
@@ -322,8 +340,9 @@ class DropScene(qt.QGraphicsScene):
 		:param str mode: selection mode.
 		"""
 
-		scene_items = [x for x in self.items(rect) if isinstance(x, items.AbstractDropItem)]
-		selected_items = [x for x in self.selectedItems() if isinstance(x, items.AbstractDropItem)]
+		selection_index = self._selection_index
+		scene_items = [x for x in self.items(rect) if x in selection_index]
+		selected_items = [x for x in self.selectedItems() if x in selection_index]
 		items_set = set(scene_items)
 		selected_items_set = set(selected_items)
 
@@ -365,7 +384,7 @@ class DropScene(qt.QGraphicsScene):
 		:return:
 		"""
 
-		scene_items = [x for x in self.items() if isinstance(x, items.AbstractDropItem) and x.target_node]
+		scene_items = self._selection_index.target_items()
 		if channel_flag.lower() == 'defined':
 			channel_flag = ''
 			scene_items = [x for x in scene_items if x.target_channel]
@@ -374,6 +393,39 @@ class DropScene(qt.QGraphicsScene):
 		for item in scene_items:
 			item.emit_command(command, channel_flag)
 
+	def items_for_nodes(self, node_names: List[str]) -> List[items.AbstractDropItem]:
+		"""
+		Returns the items that target any of the given nodes.
+
+		:param List[str] node_names: node names.
+		:return: items targeting any of the given nodes.
+		:rtype: List[items.AbstractDropItem]
+		"""
+
+		return self._selection_index.items_for_nodes(node_names)
+
+	def apply_scene_selection(self, node_names: List[str]):
+		"""
+		Highlights the items whose target nodes are all selected within the DCC scene.
+		Only items whose highlight state changes are updated, and they are repainted with a single scene update.
+
+		:param List[str] node_names: names of the selected nodes within the DCC scene.
+		"""
+
+		highlighted, unhighlighted = self._selection_index.update_selection(node_names)
+		if not highlighted and not unhighlighted:
+			return
+
+		dirty_rect = qt.QRectF()
+		for item in highlighted:
+			item.set_highlighted(True, update=False)
+			dirty_rect = dirty_rect.united(item.sceneBoundingRect())
+		for item in unhighlighted:
+			item.set_highlighted(False, update=False)
+			dirty_rect = dirty_rect.united(item.sceneBoundingRect())
+		margin = items.AbstractDropItem.BLUR_OUTER_RADIUS
+		self.update(dirty_rect.adjusted(-margin, -margin, margin, margin))
+
 	def add_vars_item(self, **kwargs):
 		"""
 		Adds a new item into the scene.
@@ -470,6 +522,8 @@ class DropScene(qt.QGraphicsScene):
 			item.match_min_size_to_subordinate()
 		top_item = self.top_item()
 		self.addItem(item)
+		self._selection_index.add(item, item.target_node)
+		item.set_highlighted(self._selection_index.is_highlighted(item), update=False)
 		item.setPos(kwargs.get('pos', qt.QPointF(0, 0)))
 		if 'hashcode' in kwargs and kwargs.get('hashcode'):
 			item.hash_code = kwargs['hashcode']
@@ -493,10 +547,24 @@ class DropScene(qt.QGraphicsScene):
 		item.signals.redefineMember.connect(self.redefineMember.emit)
 		item.signals.changeMember.connect(self.changeMember.emit)
 		item.signals.editRemote.connect(self.editRemote.emit)
+		item.signals.targetNodeChanged.connect(self._on_item_target_node_changed)
+		item.signals.aboutToRemove.connect(self._selection_index.remove)
 		if item.command.lower() == 'pose':
 			item.signals.mousePressed.connect(lambda: self.poseGlobalVarSet.emit(item))
 			item.signals.mouseReleased.connect(lambda: self.poseGlobalVarUnset.emit(item))
 
+	def _on_item_target_node_changed(self, item: items.AbstractDropItem):
+		"""
+		Internal callback function that is called each time target nodes of an item change.
+
+		:param items.AbstractDropItem item: retargeted item.
+		"""
+
+		if item not in self._selection_index:
+			return
+		if self._selection_index.retarget(item, item.target_node):
+			item.set_highlighted(self._selection_index.is_highlighted(item))
+
 	def _elide_text(self, text: str, width: int) -> str:
 		"""
 		Internal function that returns the elid text of the given one.
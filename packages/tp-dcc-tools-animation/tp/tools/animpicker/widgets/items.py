@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import typing
 from typing import Tuple, List, Union, Any
 
@@ -7,12 +8,32 @@ from overrides import override
 
 from tp.common.qt import api as qt
 from tp.common.python.decorators import accepts, returns
-from tp.tools.animpicker import consts
+from tp.tools.animpicker import consts, uiutils
 
 if typing.TYPE_CHECKING:
 	from tp.tools.animpicker.widgets.graphics import DropScene
 
 
+_FONT_METRICS_CACHE = {}			# type: dict[str, qt.QFontMetricsF]
+
+
+def font_metrics(font: qt.QFont) -> qt.QFontMetricsF:
+	"""
+	Returns the cached font metrics of the given font.
+
+	:param qt.QFont font: font to get metrics of.
+	:return: font metrics.
+	:rtype: qt.QFontMetricsF
+	"""
+
+	key = font.key()
+	metrics = _FONT_METRICS_CACHE.get(key)
+	if metrics is None:
+		metrics = _FONT_METRICS_CACHE[key] = qt.QFontMetricsF(font)
+
+	return metrics
+
+
 class DropItemType:
 
 	Rectangle = qt.QGraphicsItem.UserType + 1
@@ -157,6 +178,7 @@ class ItemSignals(qt.QObject):
 	mousePressed = qt.Signal()
 	mouseReleased = qt.Signal()
 	aboutToRemove = qt.Signal(qt.QGraphicsItem)
+	targetNodeChanged = qt.Signal(qt.QGraphicsItem)
 
 
 class AbstractDropItem(qt.QGraphicsItem):
@@ -198,6 +220,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 		self._signals = ItemSignals()
 		self._add = False
 		self._hover = False
+		self._highlighted = False
 		self._ignore = False
 		self._press_region = 0
 		self._press_pos = qt.QPointF()
@@ -205,6 +228,9 @@ class AbstractDropItem(qt.QGraphicsItem):
 		self._ignore_start_value = False
 		self._linked_items = []
 		self._lines = {}
+		self._render_cache = {}				# type: dict[bool, tuple[float, qt.QPixmap]]
+		self._label_layout_key = None			# type: tuple | None
+		self._label_layout = qt.QRectF()
 
 		self._effect = GrahicsLayeredBlurEffect()
 		self.setGraphicsEffect(self._effect)
@@ -225,6 +251,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 			self._font_color = qt.QColor(qt.Qt.black)
 		else:
 			self._font_color = qt.QColor(qt.Qt.white)
+		self.invalidate_render_cache()
 
 	@property
 	@returns(float)
@@ -236,6 +263,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	def width(self, value: float):
 		self.prepareGeometryChange()
 		self._width = value
+		self.invalidate_render_cache()
 		self.signals.sizeChanged.emit()
 
 	@property
@@ -248,6 +276,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	def height(self, value: float):
 		self.prepareGeometryChange()
 		self._height = value
+		self.invalidate_render_cache()
 		self.signals.sizeChanged.emit()
 
 	@property
@@ -288,7 +317,10 @@ class AbstractDropItem(qt.QGraphicsItem):
 	@target_node.setter
 	@accepts(list)
 	def target_node(self, value: List[AbstractDropItem]):
+		changed = value != self._target_node
 		self._target_node = value
+		if changed:
+			self.signals.targetNodeChanged.emit(self)
 
 	@property
 	@returns(list)
@@ -320,6 +352,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	def font(self, value: qt.QFont):
 		if value.family() in consts.FONT_FAMILIES:
 			self._font = value
+			self.invalidate_render_cache()
 			self.update()
 
 	@property
@@ -331,6 +364,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	@accepts(qt.QColor)
 	def font_color(self, value: qt.QColor):
 		self._font_color = value
+		self.invalidate_render_cache()
 		self.update()
 
 	@property
@@ -342,6 +376,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	@accepts(str)
 	def label(self, value: str):
 		self._label = value
+		self.invalidate_render_cache()
 		self.update()
 
 	@property
@@ -354,6 +389,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	def label_rect(self, value: qt.QRectF):
 		self.prepareGeometryChange()
 		self._label_rect = value
+		self.invalidate_render_cache()
 
 	@property
 	@returns(qt.QPixmap)
@@ -364,6 +400,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	@accepts(qt.QPixmap)
 	def icon(self, value: qt.QPixmap):
 		self._icon = value
+		self.invalidate_render_cache()
 
 	@property
 	@returns(qt.QRectF)
@@ -375,6 +412,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 	def icon_rect(self, value: qt.QRectF):
 		self.prepareGeometryChange()
 		self._icon_rect = value
+		self.invalidate_render_cache()
 
 	@property
 	@returns(str)
@@ -392,6 +430,7 @@ class AbstractDropItem(qt.QGraphicsItem):
 			self._icon_path = ''
 			self._icon = qt.QPixmap()
 		self.match_min_size_to_subordinate()
+		self.invalidate_render_cache()
 		self.update()
 
 	@property
@@ -419,6 +458,26 @@ class AbstractDropItem(qt.QGraphicsItem):
 	def hover(self, flag: bool):
 		self._hover = flag
 
+	@property
+	@returns(bool)
+	def highlighted(self) -> bool:
+		return self._highlighted
+
+	def set_highlighted(self, flag: bool, update: bool = True):
+		"""
+		Sets whether item is highlighted because all its target nodes are selected within the scene.
+
+		:param bool flag: True to highlight the item; False otherwise.
+		:param bool update: whether to schedule a repaint of the item. Scenes updating the highlight of several items
+			at once disable it and repaint the affected region once.
+		"""
+
+		if flag == self._highlighted:
+			return
+		self._highlighted = flag
+		if update:
+			self.update()
+
 	@property
 	@returns(bool)
 	def ignore(self) -> bool:
@@ -558,11 +617,48 @@ class AbstractDropItem(qt.QGraphicsItem):
 	@override
 	def paint(
 			self, painter: qt.QPainter, option: qt.QStyleOptionGraphicsItem, widget: Union[qt.QWidget,None] = ...) -> None:
-		# painter.setClipRect(option.exposedRect.adjusted(-1, -1, -1, -1))
+		selected = self.isSelected() or self._highlighted
+		level_of_detail = option.levelOfDetailFromTransform(painter.worldTransform())
+		if level_of_detail < consts.ITEM_SIMPLIFIED_LOD:
+			self.draw_simplified(painter, selected)
+			return
+
+		pixmap = self._rendered_pixmap(selected, uiutils.zoom_bucket(level_of_detail))
+		if pixmap is None:
+			return
+		painter.setRenderHint(qt.QPainter.SmoothPixmapTransform)
+		painter.drawPixmap(self.boundingRect(), pixmap, qt.QRectF(pixmap.rect()))
+
+	def draw_content(self, painter: qt.QPainter, selected: bool):
+		"""
+		Draws the item appearance. Drawn content is cached by paint function per selection state and zoom bucket, so
+		this function is only called when item appearance changes.
+
+		:param qt.QPainter painter: painter to draw with, in item coordinates.
+		:param bool selected: whether item is drawn as selected.
+		"""
+
 		painter.setRenderHints(
 			qt.QPainter.Antialiasing | qt.QPainter.TextAntialiasing | qt.QPainter.SmoothPixmapTransform)
-		painter.setPen(qt.QPen(consts.SELECTED_BORDER_COLOR, 1.5, j=qt.Qt.RoundJoin) if self.isSelected() else qt.Qt.NoPen)
-		painter.setBrush(self.color.lighter(105) if self.isSelected() else self.color)
+		painter.setPen(qt.QPen(consts.SELECTED_BORDER_COLOR, 1.5, j=qt.Qt.RoundJoin) if selected else qt.Qt.NoPen)
+		painter.setBrush(self.color.lighter(105) if selected else self.color)
+
+	def draw_simplified(self, painter: qt.QPainter, selected: bool):
+		"""
+		Draws a simplified item appearance, without icon and label, used when the view is zoomed out.
+
+		:param qt.QPainter painter: painter to draw with, in item coordinates.
+		:param bool selected: whether item is drawn as selected.
+		"""
+
+		painter.fillPath(self.shape(), consts.SELECTED_BORDER_COLOR if selected else self.color)
+
+	def invalidate_render_cache(self):
+		"""
+		Clears the cached item appearance, so it is drawn again the next time the item is painted.
+		"""
+
+		self._render_cache.clear()
 
 	def iterate_linked_items(self):
 
@@ -615,10 +711,14 @@ class AbstractDropItem(qt.QGraphicsItem):
 		:rtype: Tuple[qt.QRectF, qt.QRectF]
 		"""
 
-		font_metrics = qt.QFontMetricsF(self.font)
 		bounding_rect = self.inbound_rect()
-		return font_metrics.boundingRect(
-			bounding_rect, qt.Qt.AlignHCenter | qt.Qt.AlignBottom | qt.Qt.TextWordWrap, f'{self.label}*'), bounding_rect
+		key = (self.font.key(), self.label, bounding_rect.getRect())
+		if key != self._label_layout_key:
+			self._label_layout = font_metrics(self.font).boundingRect(
+				bounding_rect, qt.Qt.AlignHCenter | qt.Qt.AlignBottom | qt.Qt.TextWordWrap, f'{self.label}*')
+			self._label_layout_key = key
+
+		return qt.QRectF(self._label_layout), bounding_rect
 
 	def set_default_label_rect(self) -> qt.QRectF | None:
 		"""
@@ -673,6 +773,42 @@ class AbstractDropItem(qt.QGraphicsItem):
 			self.set_value(0, False)
 		self.signals.sendCommandData.emit(command, self.target_node, channel, self.target_value, modifier)
 
+	def _rendered_pixmap(self, selected: bool, scale: float) -> qt.QPixmap | None:
+		"""
+		Internal function that returns the cached item appearance for given selection state and zoom bucket, rendering
+		it if necessary. Only the appearance of the last zoom bucket is cached per selection state, and its size
+		is limited to ITEM_RENDER_MAX_PIXELS pixels.
+
+		:param bool selected: whether item is drawn as selected.
+		:param float scale: zoom bucket scale to render the item with.
+		:return: rendered item appearance or None if item is empty.
+		:rtype: qt.QPixmap or None
+		"""
+
+		cached = self._render_cache.get(selected)
+		if cached is not None and cached[0] == scale:
+			return cached[1]
+
+		rect = self.boundingRect()
+		if rect.width() <= 0.0 or rect.height() <= 0.0:
+			return None
+		render_scale = min(scale, math.sqrt(consts.ITEM_RENDER_MAX_PIXELS / (rect.width() * rect.height())))
+		width = max(int(math.ceil(rect.width() * render_scale)), 1)
+		height = max(int(math.ceil(rect.height() * render_scale)), 1)
+		pixmap = qt.QPixmap(width, height)
+		pixmap.fill(qt.Qt.transparent)
+		painter = qt.QPainter(pixmap)
+		try:
+			painter.scale(width / rect.width(), height / rect.height())
+			painter.translate(-rect.topLeft())
+			self.draw_content(painter, selected)
+		finally:
+			painter.end()
+
+		self._render_cache[selected] = (scale, pixmap)
+
+		return pixmap
+
 	def _toggle_shadow(self, toggle: bool):
 		"""
 		Internal function that toggles blur shadow effect.
@@ -835,9 +971,8 @@ class RectangleDropItem(AbstractDropItem):
 		return path
 
 	@override
-	def paint(
-			self, painter: qt.QPainter, option: qt.QStyleOptionGraphicsItem, widget: Union[qt.QWidget,None] = ...) -> None:
-		super().paint(painter, option, widget)
+	def draw_content(self, painter: qt.QPainter, selected: bool):
+		super().draw_content(painter, selected)
 
 		rect = self.boundingRect().normalized()
 		painter.drawRect(rect)
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from tp.tools.modelchecker import meshvalidation
+
+_FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def _read_meshes(file_name):
+    return {mesh.name: mesh for mesh in meshvalidation.read_obj(os.path.join(_FIXTURES_PATH, file_name))}
+
+
+def _results(mesh, check_names):
+    return {check_name: indices.tolist() for check_name, indices in meshvalidation.validate(mesh, check_names).items()}
+
+
+@pytest.fixture(scope='module')
+def topology_meshes():
+    return _read_meshes('topology.obj')
+
+
+@pytest.fixture(scope='module')
+def face_meshes():
+    return _read_meshes('faces.obj')
+
+
+def test_read_obj_splits_objects(topology_meshes):
+    assert list(topology_meshes) == ['open_plane', 'non_manifold', 'lamina', 'pole']
+    pole = topology_meshes['pole']
+    assert pole.vertex_count == 7
+    assert pole.face_count == 6
+    assert pole.points[0].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_clean_mesh():
+    cube = _read_meshes('cube.obj')['cube']
+    assert cube.edge_count == 12
+    assert all(len(indices) == 0 for indices in meshvalidation.validate(cube).values())
+
+
+def test_open_edges(topology_meshes):
+    open_plane = topology_meshes['open_plane']
+    assert open_plane.edge_vertices.tolist()[3] == [1, 4]
+    assert _results(open_plane, ['open_edges', 'non_manifold_edges']) == {
+        'open_edges': [0, 1, 2, 4, 5, 6], 'non_manifold_edges': []}
+
+
+def test_non_manifold_edges(topology_meshes):
+    non_manifold = topology_meshes['non_manifold']
+    assert _results(non_manifold, ['non_manifold_edges']) == {'non_manifold_edges': [0]}
+    assert non_manifold.edge_face_counts.tolist() == [3, 1, 1, 1, 1, 1, 1]
+
+
+def test_lamina(topology_meshes):
+    assert _results(topology_meshes['lamina'], ['lamina']) == {'lamina': [0, 1]}
+    assert _results(topology_meshes['open_plane'], ['lamina']) == {'lamina': []}
+
+
+def test_poles(topology_meshes):
+    assert _results(topology_meshes['pole'], ['poles']) == {'poles': [0]}
+    assert _results(topology_meshes['open_plane'], ['poles']) == {'poles': []}
+
+
+def test_face_types(face_meshes):
+    assert _results(face_meshes['face_types'], ['triangles', 'ngons', 'zero_area_faces']) == {
+        'triangles': [0], 'ngons': [2], 'zero_area_faces': []}
+
+
+def test_zero_area_faces_and_zero_length_edges(face_meshes):
+    degenerated = face_meshes['degenerated']
+    assert _results(degenerated, ['zero_area_faces', 'zero_length_edges']) == {
+        'zero_area_faces': [0, 1], 'zero_length_edges': [6]}
+    assert degenerated.edge_vertices.tolist()[6] == [3, 4]
+
+
+def test_uv_checks():
+    uvs = _read_meshes('uvs.obj')['uvs']
+    assert _results(uvs, ['missing_uvs', 'cross_border', 'uv_range', 'on_border']) == {
+        'missing_uvs': [0], 'cross_border': [1], 'uv_range': [3, 5, 6], 'on_border': [4]}
+
+
+def test_hard_edges():
+    # two triangles sharing the diagonal edge (0, 2)
+    points = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    edge_vertices = [[0, 1], [1, 2], [0, 2], [2, 3], [0, 3]]
+    mesh = meshvalidation.MeshData(
+        'plane', points, [3, 3], [0, 1, 2, 0, 2, 3], edge_vertices=edge_vertices,
+        edge_smooth=[False, True, False, True, True])
+    assert _results(mesh, ['hard_edges']) == {'hard_edges': [2]}
+
+    no_smoothing = meshvalidation.MeshData('plane', points, [3, 3], [0, 1, 2, 0, 2, 3])
+    assert _results(no_smoothing, ['hard_edges']) == {'hard_edges': []}
+
+
+def test_validate_components(topology_meshes):
+    results = meshvalidation.validate_components(topology_meshes.values(), ['non_manifold_edges', 'lamina', 'poles'])
+    assert results == {
+        'non_manifold_edges': ['non_manifold.e[0]', 'lamina.e[2]'],
+        'lamina': ['lamina.f[0]', 'lamina.f[1]'],
+        'poles': ['pole.vtx[0]']}
+
+
+def test_unknown_check(topology_meshes):
+    with pytest.raises(KeyError):
+        meshvalidation.validate(topology_meshes['pole'], ['unknown'])
@@ -0,0 +1,556 @@
+"""
+Module that contains a headless batch validation runner for the model checker.
+Each asset file is validated with the mesh validation engine within a separated worker process with time and memory
+budgets, and results are streamed into a SQLite results database, which supports incremental re-validation of changed
+files and diffs between runs.
+
+Worker processes are spawned, so this module is meant to be used from a standalone Python interpreter (or mayapy), not
+from within a DCC user interface session.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import traceback
+import multiprocessing
+from collections import deque
+from typing import Iterable, Callable, Any
+
+from tp.core import log
+from tp.tools.modelchecker import meshvalidation
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+logger = log.modelLogger
+
+# default maximum amount of seconds a single file validation can take
+DEFAULT_TIMEOUT = 120.0
+# maximum number of invalid component names stored per file and check
+MAX_STORED_COMPONENTS = 1000
+# seconds to wait between worker polls
+POLL_INTERVAL = 0.02
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+STATUS_MEMORY = 'memory'
+
+# file extension: function that receives a file path and returns a list of meshvalidation.MeshData instances
+LOADERS = {
+	'.obj': meshvalidation.read_obj
+}						# type: dict[str, Callable[[str], list[meshvalidation.MeshData]]]
+
+
+def register_loader(extension: str, loader: Callable[[str], list[meshvalidation.MeshData]]):
+	"""
+	Registers a mesh loader for the given file extension.
+	Loaders are sent to worker processes, so they must be module level functions.
+
+	:param str extension: file extension (such as ".obj").
+	:param Callable[[str], list[meshvalidation.MeshData]] loader: function that loads the meshes of a file.
+	"""
+
+	LOADERS[extension.lower()] = loader
+
+
+def file_digest(file_path: str) -> str:
+	"""
+	Returns the SHA1 digest of the contents of the given file.
+
+	:param str file_path: file path.
+	:return: hexadecimal digest.
+	:rtype: str
+	"""
+
+	digest = hashlib.sha1()
+	with open(file_path, 'rb') as open_file:
+		for chunk in iter(lambda: open_file.read(1024 * 1024), b''):
+			digest.update(chunk)
+
+	return digest.hexdigest()
+
+
+def validate_file(
+		file_path: str, check_names: list[str], loader: Callable[[str], list[meshvalidation.MeshData]] | None = None
+) -> dict:
+	"""
+	Validates the meshes of the given file, timing each check.
+
+	:param str file_path: file path.
+	:param list[str] check_names: names of the mesh validation checks to evaluate.
+	:param Callable[[str], list[meshvalidation.MeshData]] or None loader: function used to load the file meshes. If
+		not given, loader is retrieved from registered loaders using the file extension.
+	:return: validation result.
+	:rtype: dict
+	:raises ValueError: if no loader is available for the given file.
+	"""
+
+	if loader is None:
+		loader = LOADERS.get(os.path.splitext(file_path)[-1].lower())
+	if loader is None:
+		raise ValueError(f'No mesh loader available for file: {file_path}')
+
+	start = time.perf_counter()
+	meshes = loader(file_path)
+	load_time = time.perf_counter() - start
+
+	checks = {check_name: {'count': 0, 'time': 0.0, 'components': []} for check_name in check_names}
+	for mesh in meshes:
+		for check_name in check_names:
+			component, check_function = meshvalidation.CHECKS[check_name]
+			check_start = time.perf_counter()
+			indices = check_function(mesh)
+			check_result = checks[check_name]
+			check_result['time'] += time.perf_counter() - check_start
+			check_result['count'] += len(indices)
+			remaining = MAX_STORED_COMPONENTS - len(check_result['components'])
+			if remaining > 0:
+				check_result['components'].extend(
+					meshvalidation.component_names(mesh.name, component, indices[:remaining]))
+
+	return {
+		'path': file_path,
+		'status': STATUS_OK,
+		'meshes': len(meshes),
+		'loadTime': load_time,
+		'duration': time.perf_counter() - start,
+		'error': '',
+		'checks': checks
+	}
+
+
+def _worker(
+		file_path: str, check_names: list[str], loader: Callable[[str], list[meshvalidation.MeshData]] | None,
+		memory_limit: int, connection: multiprocessing.connection.Connection):
+	"""
+	Internal function that validates a file within a worker process and sends the result through given connection.
+
+	:param str file_path: file path.
+	:param list[str] check_names: names of the mesh validation checks to evaluate.
+	:param Callable[[str], list[meshvalidation.MeshData]] or None loader: function used to load the file meshes.
+	:param int memory_limit: maximum amount of bytes the worker process can allocate. 0 means unlimited.
+	:param multiprocessing.connection.Connection connection: connection used to send the result.
+	"""
+
+	if memory_limit and resource is not None:
+		try:
+			resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+		except (ValueError, OSError):
+			pass
+
+	try:
+		result = validate_file(file_path, check_names, loader=loader)
+	except MemoryError:
+		result = {'path': file_path, 'status': STATUS_MEMORY, 'error': 'Memory budget exceeded', 'checks': {}}
+	except Exception:
+		result = {'path': file_path, 'status': STATUS_ERROR, 'error': traceback.format_exc(), 'checks': {}}
+
+	try:
+		connection.send(result)
+	finally:
+		connection.close()
+
+
+class BatchResultsStore:
+	"""
+	Class that stores batch validation runs and their results within a SQLite database.
+	"""
+
+	def __init__(self, file_path: str):
+		super().__init__()
+
+		self._file_path = file_path
+		directory = os.path.dirname(file_path)
+		if directory and not os.path.isdir(directory):
+			os.makedirs(directory)
+		self._connection = sqlite3.connect(file_path)
+		with self._connection:
+			self._connection.executescript(
+				'CREATE TABLE IF NOT EXISTS runs ('
+				'id INTEGER PRIMARY KEY AUTOINCREMENT, started REAL, finished REAL, checks TEXT);'
+				'CREATE TABLE IF NOT EXISTS files ('
+				'run_id INTEGER, path TEXT, digest TEXT, status TEXT, duration REAL, error TEXT, reused INTEGER, '
+				'PRIMARY KEY (run_id, path));'
+				'CREATE INDEX IF NOT EXISTS files_path ON files (path, digest);'
+				'CREATE TABLE IF NOT EXISTS checks ('
+				'run_id INTEGER, path TEXT, check_name TEXT, count INTEGER, duration REAL, components TEXT, '
+				'PRIMARY KEY (run_id, path, check_name));')
+
+	@property
+	def file_path(self) -> str:
+		return self._file_path
+
+	def close(self):
+		"""
+		Closes the database connection.
+		"""
+
+		self._connection.close()
+
+	def create_run(self, check_names: list[str]) -> int:
+		"""
+		Creates a new run.
+
+		:param list[str] check_names: names of the checks evaluated by the run.
+		:return: run ID.
+		:rtype: int
+		"""
+
+		with self._connection:
+			cursor = self._connection.execute(
+				'INSERT INTO runs (started, finished, checks) VALUES (?, NULL, ?)',
+				(time.time(), json.dumps(sorted(check_names))))
+
+		return cursor.lastrowid
+
+	def finish_run(self, run_id: int):
+		"""
+		Marks given run as finished.
+
+		:param int run_id: run ID.
+		"""
+
+		with self._connection:
+			self._connection.execute('UPDATE runs SET finished = ? WHERE id = ?', (time.time(), run_id))
+
+	def runs(self) -> list[dict]:
+		"""
+		Returns all stored runs, from oldest to newest.
+
+		:return: list of runs.
+		:rtype: list[dict]
+		"""
+
+		rows = self._connection.execute('SELECT id, started, finished, checks FROM runs ORDER BY id').fetchall()
+		return [{'id': row[0], 'started': row[1], 'finished': row[2], 'checks': json.loads(row[3])} for row in rows]
+
+	def write_result(self, run_id: int, result: dict):
+		"""
+		Writes the validation result of a file.
+
+		:param int run_id: run ID.
+		:param dict result: validation result.
+		"""
+
+		with self._connection:
+			self._connection.execute(
+				'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)', (
+					run_id, result['path'], result.get('digest', ''), result['status'], result.get('duration', 0.0),
+					result.get('error', ''), int(result.get('reused', False))))
+			self._connection.executemany(
+				'INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?, ?, ?)', [(
+					run_id, result['path'], check_name, check_result['count'], check_result['time'],
+					json.dumps(check_result['components'])) for check_name, check_result in result['checks'].items()])
+
+	def results(self, run_id: int) -> dict[str, dict]:
+		"""
+		Returns the validation results of the given run.
+
+		:param int run_id: run ID.
+		:return: dictionary with the validation result of each file path.
+		:rtype: dict[str, dict]
+		"""
+
+		results = {}
+		for path, digest, status, duration, error, reused in self._connection.execute(
+				'SELECT path, digest, status, duration, error, reused FROM files WHERE run_id = ?', (run_id,)):
+			results[path] = {
+				'path': path, 'digest': digest, 'status': status, 'duration': duration, 'error': error,
+				'reused': bool(reused), 'checks': {}}
+		for path, check_name, count, duration, components in self._connection.execute(
+				'SELECT path, check_name, count, duration, components FROM checks WHERE run_id = ?', (run_id,)):
+			if path in results:
+				results[path]['checks'][check_name] = {
+					'count': count, 'time': duration, 'components': json.loads(components)}
+
+		return results
+
+	def previous_result(self, path: str, digest: str, check_names: list[str]) -> dict | None:
+		"""
+		Returns the latest successful validation result of the given file contents with the given checks.
+
+		:param str path: file path.
+		:param str digest: file contents digest.
+		:param list[str] check_names: names of the evaluated checks.
+		:return: validation result or None if file contents were never validated with the given checks.
+		:rtype: dict or None
+		"""
+
+		row = self._connection.execute(
+			'SELECT files.run_id FROM files JOIN runs ON runs.id = files.run_id '
+			'WHERE files.path = ? AND files.digest = ? AND files.status = ? AND runs.checks = ? '
+			'ORDER BY files.run_id DESC LIMIT 1',
+			(path, digest, STATUS_OK, json.dumps(sorted(check_names)))).fetchone()
+		if row is None:
+			return None
+
+		return self.results(row[0]).get(path)
+
+	def check_timings(self, run_id: int) -> dict[str, float]:
+		"""
+		Returns the total time spent by each check within the given run, ignoring reused results.
+
+		:param int run_id: run ID.
+		:return: dictionary with the total seconds spent by each check.
+		:rtype: dict[str, float]
+		"""
+
+		rows = self._connection.execute(
+			'SELECT checks.check_name, SUM(checks.duration) FROM checks JOIN files '
+			'ON files.run_id = checks.run_id AND files.path = checks.path '
+			'WHERE checks.run_id = ? AND files.reused = 0 GROUP BY checks.check_name', (run_id,)).fetchall()
+
+		return dict(rows)
+
+	def diff(self, old_run_id: int, new_run_id: int) -> dict:
+		"""
+		Compares the results of two runs.
+
+		:param int old_run_id: ID of the run to compare against.
+		:param int new_run_id: ID of the compared run.
+		:return: dictionary with the added and removed file paths, the files whose status changed and, for each file,
+			the checks whose invalid components count changed as (old count, new count) tuples.
+		:rtype: dict
+		"""
+
+		old_results = self.results(old_run_id)
+		new_results = self.results(new_run_id)
+		diff = {
+			'added': sorted(set(new_results) - set(old_results)),
+			'removed': sorted(set(old_results) - set(new_results)),
+			'status': {},
+			'checks': {}
+		}
+		for path in sorted(set(old_results) & set(new_results)):
+			old_result, new_result = old_results[path], new_results[path]
+			if old_result['status'] != new_result['status']:
+				diff['status'][path] = (old_result['status'], new_result['status'])
+			changed_checks = {}
+			for check_name in set(old_result['checks']) | set(new_result['checks']):
+				old_count = old_result['checks'].get(check_name, {}).get('count', 0)
+				new_count = new_result['checks'].get(check_name, {}).get('count', 0)
+				if old_count != new_count:
+					changed_checks[check_name] = (old_count, new_count)
+			if changed_checks:
+				diff['checks'][path] = changed_checks
+
+		return diff
+
+
+class BatchValidator:
+	"""
+	Class that validates a list of asset files in parallel worker processes and streams the results into a results
+	store.
+	"""
+
+	def __init__(
+			self, store: BatchResultsStore, check_names: Iterable[str] | None = None, workers: int | None = None,
+			timeout: float = DEFAULT_TIMEOUT, memory_limit: int = 0):
+		"""
+		Constructor.
+
+		:param BatchResultsStore store: store where results are written.
+		:param Iterable[str] or None check_names: names of the mesh validation checks to evaluate. If None, all checks
+			are evaluated.
+		:param int or None workers: maximum number of worker processes. If None, CPU count is used.
+		:param float timeout: maximum amount of seconds a single file validation can take.
+		:param int memory_limit: maximum amount of bytes each worker process can allocate. 0 means unlimited. Only
+			supported on POSIX systems.
+		"""
+
+		super().__init__()
+
+		self._store = store
+		self._check_names = list(meshvalidation.CHECKS) if check_names is None else list(check_names)
+		self._workers = max(workers or os.cpu_count() or 1, 1)
+		self._timeout = timeout
+		self._memory_limit = memory_limit
+		self._context = multiprocessing.get_context('spawn')
+
+		unknown_checks = [check_name for check_name in self._check_names if check_name not in meshvalidation.CHECKS]
+		if unknown_checks:
+			raise ValueError(f'Unknown mesh validation checks: {unknown_checks}')
+
+	@property
+	def store(self) -> BatchResultsStore:
+		return self._store
+
+	@property
+	def check_names(self) -> list[str]:
+		return list(self._check_names)
+
+	def run(
+			self, file_paths: Iterable[str], incremental: bool = True,
+			callback: Callable[[dict], None] | None = None) -> int:
+		"""
+		Validates given files and writes their results into a new run as soon as each one is available.
+
+		:param Iterable[str] file_paths: asset file paths.
+		:param bool incremental: whether to reuse the results of files whose contents were already validated with the
+			same checks.
+		:param Callable[[dict], None] or None callback: optional function called with each file result.
+		:return: run ID.
+		:rtype: int
+		"""
+
+		run_id = self._store.create_run(self._check_names)
+		pending = deque()
+		for file_path in dict.fromkeys(os.path.abspath(file_path) for file_path in file_paths):
+			try:
+				digest = file_digest(file_path)
+			except OSError as exc:
+				self._finish(run_id, {
+					'path': file_path, 'status': STATUS_ERROR, 'error': str(exc), 'checks': {}}, callback)
+				continue
+			previous_result = self._store.previous_result(
+				file_path, digest, self._check_names) if incremental else None
+			if previous_result is not None:
+				previous_result['reused'] = True
+				self._finish(run_id, previous_result, callback)
+				continue
+			pending.append((file_path, digest))
+
+		active = {}					# type: dict[str, tuple[Any, Any, float, str]]
+		try:
+			while pending or active:
+				while pending and len(active) < self._workers:
+					file_path, digest = pending.popleft()
+					active[file_path] = self._start(file_path) + (digest,)
+				finished = False
+				for file_path, (process, connection, start, digest) in list(active.items()):
+					result = self._poll(file_path, process, connection, start)
+					if result is None:
+						continue
+					finished = True
+					process.join()
+					connection.close()
+					del active[file_path]
+					result['digest'] = digest
+					self._finish(run_id, result, callback)
+				if not finished:
+					time.sleep(POLL_INTERVAL)
+		finally:
+			for process, connection, _, _ in active.values():
+				process.terminate()
+				process.join()
+				connection.close()
+			self._store.finish_run(run_id)
+
+		return run_id
+
+	def _start(self, file_path: str) -> tuple[Any, Any, float]:
+		"""
+		Internal function that starts the worker process that validates the given file.
+
+		:param str file_path: file path.
+		:return: tuple with the worker process, the connection to receive the result from and the start time.
+		:rtype: tuple[Any, Any, float]
+		"""
+
+		loader = LOADERS.get(os.path.splitext(file_path)[-1].lower())
+		receiver, sender = self._context.Pipe(duplex=False)
+		process = self._context.Process(
+			target=_worker, args=(file_path, self._check_names, loader, self._memory_limit, sender), daemon=True)
+		process.start()
+		sender.close()
+
+		return process, receiver, time.monotonic()
+
+	def _poll(self, file_path: str, process: Any, connection: Any, start: float) -> dict | None:
+		"""
+		Internal function that returns the result of the given worker, if it finished.
+
+		:param str file_path: validated file path.
+		:param Any process: worker process.
+		:param Any connection: connection to receive the result from.
+		:param float start: worker start time.
+		:return: validation result or None if worker is still running.
+		:rtype: dict or None
+		"""
+
+		elapsed = time.monotonic() - start
+		if connection.poll():
+			try:
+				return connection.recv()
+			except EOFError:
+				return {
+					'path': file_path, 'status': STATUS_ERROR, 'duration': elapsed,
+					'error': f'Worker exited with code {process.exitcode}', 'checks': {}}
+		if elapsed > self._timeout:
+			process.terminate()
+			return {
+				'path': file_path, 'status': STATUS_TIMEOUT, 'duration': elapsed,
+				'error': f'Validation exceeded {self._timeout} seconds', 'checks': {}}
+
+		return None
+
+	def _finish(self, run_id: int, result: dict, callback: Callable[[dict], None] | None):
+		"""
+		Internal function that writes given file result and notifies it.
+
+		:param int run_id: run ID.
+		:param dict result: file validation result.
+		:param Callable[[dict], None] or None callback: optional function called with the result.
+		"""
+
+		self._store.write_result(run_id, result)
+		if result['status'] != STATUS_OK:
+			logger.warning(f'Unable to validate "{result["path"]}" ({result["status"]}): {result.get("error", "")}')
+		if callback is not None:
+			callback(result)
+
+
+def main(args: list[str] | None = None) -> int:
+	"""
+	Command line entry point.
+
+	:param list[str] or None args: command line arguments. If None, system arguments are used.
+	:return: exit code (1 if any file has invalid components or could not be validated; 0 otherwise).
+	:rtype: int
+	"""
+
+	parser = argparse.ArgumentParser(description='Validates mesh asset files with the model checker')
+	parser.add_argument('files', nargs='+', help='asset file paths')
+	parser.add_argument('--database', required=True, help='results database file path')
+	parser.add_argument('--checks', nargs='*', default=None, help='mesh validation checks to evaluate')
+	parser.add_argument('--workers', type=int, default=None, help='maximum number of worker processes')
+	parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='seconds budget per file')
+	parser.add_argument('--memory', type=int, default=0, help='megabytes budget per worker process')
+	parser.add_argument('--full', action='store_true', help='validate all files, even unchanged ones')
+	parser.add_argument('--diff', type=int, default=None, help='ID of a previous run to compare against')
+	parsed_args = parser.parse_args(args)
+
+	store = BatchResultsStore(parsed_args.database)
+	failed = []
+
+	def _on_result(result: dict):
+		invalid_count = sum(check_result['count'] for check_result in result['checks'].values())
+		if result['status'] != STATUS_OK or invalid_count:
+			failed.append(result['path'])
+		sys.stdout.write(f'{result["status"]:<8} {invalid_count:>8} {result["path"]}\n')
+
+	try:
+		validator = BatchValidator(
+			store, check_names=parsed_args.checks, workers=parsed_args.workers, timeout=parsed_args.timeout,
+			memory_limit=parsed_args.memory * 1024 * 1024)
+		run_id = validator.run(parsed_args.files, incremental=not parsed_args.full, callback=_on_result)
+		sys.stdout.write(f'Run {run_id} finished\n')
+		if parsed_args.diff is not None:
+			sys.stdout.write(json.dumps(store.diff(parsed_args.diff, run_id), indent=4) + '\n')
+	finally:
+		store.close()
+
+	return 1 if failed else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
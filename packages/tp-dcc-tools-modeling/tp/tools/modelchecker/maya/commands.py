@@ -3,6 +3,8 @@ from typing import List
 import maya.cmds as cmds
 import maya.api.OpenMaya as OpenMaya
 
+from tp.tools.modelchecker.maya import meshdata
+
 
 def _get_meshes(nodes: List[str]) -> OpenMaya.MSelectionList:
 	"""
@@ -22,6 +24,33 @@ def _get_meshes(nodes: List[str]) -> OpenMaya.MSelectionList:
 	return selected_meshes
 
 
+def _mesh_check(check_name: str, nodes: List[str]) -> List[str]:
+	"""
+	Function that evaluates a single mesh validation check on the meshes of the given nodes.
+
+	:param str check_name: name of the mesh validation check.
+	:param List[str] nodes: list of node names to check.
+	:return: invalid component names.
+	:rtype: List[str]
+	"""
+
+	return meshdata.run_mesh_checks([check_name], nodes)[check_name]
+
+
+def _mesh_check_command(fn):
+	"""
+	Decorator that flags given command function as a mesh validation check, so the controller can evaluate it together
+	with the rest of enabled mesh validation checks.
+
+	:param Callable fn: command function.
+	:return: flagged command function.
+	:rtype: Callable
+	"""
+
+	fn.mesh_check = fn.__name__
+	return fn
+
+
 def trailing_numbers(nodes: List[str]) -> List[str]:
 	"""
 	Returns list of node names that end with a number.
@@ -233,6 +262,7 @@ def empty_groups(nodes: List[str]) -> List[str]:
 	return found_empty_groups
 
 
+@_mesh_check_command
 def triangles(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of face component names that are part of triangles.
@@ -242,25 +272,10 @@ def triangles(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	face_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return face_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		face_iterator = OpenMaya.MItMeshPolygon(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not face_iterator.isDone():
-			num_of_edges = face_iterator.getEdges()
-			if len(num_of_edges) == 3:
-				component_name = f'{object_name}.f[{face_iterator.index()}]'
-				face_components.append(component_name)
-			face_iterator.next()
-		list_iterator.next()
-
-	return face_components
+	return _mesh_check('triangles', nodes)
 
 
+@_mesh_check_command
 def ngons(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of face component names that are part of ngons.
@@ -270,52 +285,23 @@ def ngons(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	face_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return face_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		face_iterator = OpenMaya.MItMeshPolygon(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not face_iterator.isDone():
-			num_of_edges = face_iterator.getEdges()
-			if len(num_of_edges) > 4:
-				component_name = f'{object_name}.f[{face_iterator.index()}]'
-				face_components.append(component_name)
-			face_iterator.next()
-		list_iterator.next()
-
-	return face_components
+	return _mesh_check('ngons', nodes)
 
 
+@_mesh_check_command
 def open_edges(nodes: List[str]) -> List[str]:
 	"""
-	Returns a list of edge component names that are part of open edges.
+	Returns a list of edge component names that are part of open (border) edges.
 
 	:param List[str] nodes: list of node names to check.
 	:return: edge component names.
 	:rtype: List[str]
 	"""
 
-	edge_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return edge_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		edge_iterator = OpenMaya.MItMeshEdge(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not edge_iterator.isDone():
-			if edge_iterator.numConnectedFaces() > 2:
-				component_name = f'{object_name}.e[{edge_iterator.index()}]'
-				edge_components.append(component_name)
-			edge_iterator.next()
-		list_iterator.next()
-
-	return edge_components
+	return _mesh_check('open_edges', nodes)
 
 
+@_mesh_check_command
 def poles(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of vertex component names that are part of a pole.
@@ -325,24 +311,10 @@ def poles(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	vertex_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return vertex_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		vertex_iterator = OpenMaya.MItMeshVertex(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not vertex_iterator.isDone():
-			if vertex_iterator.numConnectedEdges() > 5:
-				component_name = f'{object_name}.vtx[{vertex_iterator.index()}]'
-				vertex_components.append(component_name)
-			vertex_iterator.next()
-		list_iterator.next()
-
-	return vertex_components
+	return _mesh_check('poles', nodes)
 
 
+@_mesh_check_command
 def hard_edges(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of edge component names that are hard edges.
@@ -352,24 +324,10 @@ def hard_edges(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	edge_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return edge_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		edge_iterator = OpenMaya.MItMeshEdge(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not edge_iterator.isDone():
-			if not edge_iterator.isSmooth and not edge_iterator.onBoundary():
-				component_name = f'{object_name}.e[{edge_iterator.index()}]'
-				edge_components.append(component_name)
-			edge_iterator.next()
-		list_iterator.next()
-
-	return edge_components
+	return _mesh_check('hard_edges', nodes)
 
 
+@_mesh_check_command
 def lamina(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of lamina face component names.
@@ -379,25 +337,10 @@ def lamina(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	face_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return face_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		face_iterator = OpenMaya.MItMeshPolygon(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not face_iterator.isDone():
-			lamina_faces = face_iterator.isLamina()
-			if lamina_faces:
-				component_name = f'{object_name}.f[{face_iterator.index()}]'
-				face_components.append(component_name)
-			face_iterator.next()
-		list_iterator.next()
-
-	return face_components
+	return _mesh_check('lamina', nodes)
 
 
+@_mesh_check_command
 def zero_area_faces(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of zero area face component names.
@@ -407,24 +350,10 @@ def zero_area_faces(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	face_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return face_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		face_iterator = OpenMaya.MItMeshPolygon(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not face_iterator.isDone():
-			if face_iterator.getArea() <= 0.00000001:
-				component_name = f'{object_name}.f[{face_iterator.index()}]'
-				face_components.append(component_name)
-			face_iterator.next()
-		list_iterator.next()
-
-	return face_components
+	return _mesh_check('zero_area_faces', nodes)
 
 
+@_mesh_check_command
 def zero_length_edges(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of edge component names whose length is 0.
@@ -434,49 +363,20 @@ def zero_length_edges(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	edge_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return edge_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		edge_iterator = OpenMaya.MItMeshEdge(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not edge_iterator.isDone():
-			if edge_iterator.length() <= 0.00000001:
-				component_name = f'{object_name}.e[{edge_iterator.index()}]'
-				edge_components.append(component_name)
-			edge_iterator.next()
-		list_iterator.next()
-
-	return edge_components
+	return _mesh_check('zero_length_edges', nodes)
 
 
+@_mesh_check_command
 def non_manifold_edges(nodes: List[str]) -> List[str]:
 	"""
-	Returns a list of manifold edge component names.
+	Returns a list of non-manifold edge component names.
 
 	:param List[str] nodes: list of node names to check.
 	:return: edge component names.
 	:rtype: List[str]
 	"""
 
-	edge_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return edge_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		edge_iterator = OpenMaya.MItMeshEdge(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not edge_iterator.isDone():
-			if edge_iterator.numConnectedFaces() < 2:
-				component_name = f'{object_name}.e[{edge_iterator.index()}]'
-				edge_components.append(component_name)
-			edge_iterator.next()
-		list_iterator.next()
-
-	return edge_components
+	return _mesh_check('non_manifold_edges', nodes)
 
 
 def star_like(nodes: List[str]) -> List[str]:
@@ -527,6 +427,7 @@ def self_penetrating_uvs(nodes: List[str]) -> List[str]:
 	return self_penetrating_nodes
 
 
+@_mesh_check_command
 def missing_uvs(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of missing UVs face component names.
@@ -536,24 +437,10 @@ def missing_uvs(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	face_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return face_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		face_iterator = OpenMaya.MItMeshPolygon(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not face_iterator.isDone():
-			if not face_iterator.hasUVs():
-				component_name = f'{object_name}.f[{face_iterator.index()}]'
-				face_components.append(component_name)
-			face_iterator.next()
-		list_iterator.next()
-
-	return face_components
+	return _mesh_check('missing_uvs', nodes)
 
 
+@_mesh_check_command
 def uv_range(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of map components names whose UV range is not valid.
@@ -563,22 +450,10 @@ def uv_range(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	map_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return map_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	mesh = OpenMaya.MFnMesh(list_iterator.getDagPath())
-	object_name = list_iterator.getDagPath().getPath()
-	us, vs = mesh.getUVs()
-	for i in range(len(us)):
-		if us[i] < 0 or us[i] > 10 or vs[i] < 0:
-			component_name = f'{object_name}.map[{i}]'
-			map_components.append(component_name)
-
-	return map_components
+	return _mesh_check('uv_range', nodes)
 
 
+@_mesh_check_command
 def cross_border(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of cros border face component names.
@@ -588,34 +463,10 @@ def cross_border(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	face_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return face_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	while not list_iterator.isDone():
-		face_iterator = OpenMaya.MItMeshPolygon(list_iterator.getDagPath())
-		object_name = list_iterator.getDagPath().getPath()
-		while not face_iterator.isDone():
-			u, v = set(), set()
-			try:
-				uvs = face_iterator.getUVs()
-				us, vs = uvs[0], uvs[1]
-				for i in range(len(us)):
-					u.add(int(us[i]) if us[i] > 0 else int(us[i]) - 1)
-					v.add(int(vs[i]) if vs[i] > 0 else int(vs[i]) - 1)
-				if len(u) > 1 or len(v) > 1:
-					component_name = f'{object_name}.f[{face_iterator.index()}]'
-					face_components.append(component_name)
-				face_iterator.next()
-			except:
-				cmds.warning(f'Face {face_iterator.index()} has no UVs!')
-				face_iterator.next()
-		list_iterator.next()
-
-	return face_components
+	return _mesh_check('cross_border', nodes)
 
 
+@_mesh_check_command
 def on_border(nodes: List[str]) -> List[str]:
 	"""
 	Returns a list of map components names whose UVs are near the border.
@@ -625,17 +476,4 @@ def on_border(nodes: List[str]) -> List[str]:
 	:rtype: List[str]
 	"""
 
-	map_components = []
-	selection_list = _get_meshes(nodes)
-	if selection_list.isEmpty():
-		return map_components
-	list_iterator = OpenMaya.MItSelectionList(selection_list)
-	mesh = OpenMaya.MFnMesh(list_iterator.getDagPath())
-	object_name = list_iterator.getDagPath().getPath()
-	us, vs = mesh.getUVs()
-	for i in range(len(us)):
-		if abs(int(us[i]) - us[i]) < 0.00001 or abs(int(vs[i]) - vs[i]) < 0.00001:
-			component_name = f'{object_name}.map[{i}]'
-			map_components.append(component_name)
-
-	return map_components
+	return _mesh_check('on_border', nodes)
@@ -7,7 +7,8 @@ from overrides import override
 import maya.cmds as cmds
 
 from tp.core import log
-from tp.tools.modelchecker import controller
+from tp.tools.modelchecker import controller, meshvalidation
+from tp.tools.modelchecker.maya import meshdata
 
 logger = log.modelLogger
 
@@ -59,14 +60,20 @@ class MayaModelCheckerController(controller.ModelCheckerController):
 
 		results = {}
 
+		# mesh validation checks are evaluated together, so each mesh is extracted only once
+		mesh_check_names = [name for name in command_names if self._is_mesh_check(name)]
+		if mesh_check_names:
+			results.update(meshdata.run_mesh_checks(mesh_check_names, nodes))
+
 		for command_name in command_names:
-			command_function = self.command_function(command_name)
-			if not command_function:
-				logger.warning(f'Skipping command check execution: {command_name}!')
-				results[command_name] = [None]
-			else:
-				errors = command_function(nodes)
-				results[command_name] = errors
+			if command_name not in results:
+				command_function = self.command_function(command_name)
+				if not command_function:
+					logger.warning(f'Skipping command check execution: {command_name}!')
+					results[command_name] = [None]
+				else:
+					errors = command_function(nodes)
+					results[command_name] = errors
 			self._results[command_name] = results[command_name]
 
 		return results
@@ -109,3 +116,19 @@ class MayaModelCheckerController(controller.ModelCheckerController):
 
 		return all_valid_nodes
 
+	def _is_mesh_check(self, command_name: str) -> bool:
+		"""
+		Internal function that returns whether given command is a built-in mesh validation check.
+		Command functions with the same name defined by other command modules are not considered mesh validation
+		checks.
+
+		:param str command_name: command name.
+		:return: True if command is evaluated by the mesh validation engine; False otherwise.
+		:rtype: bool
+		"""
+
+		if command_name not in meshvalidation.CHECKS:
+			return False
+
+		command_function = self.command_function(command_name)
+		return getattr(command_function, 'mesh_check', None) == command_name
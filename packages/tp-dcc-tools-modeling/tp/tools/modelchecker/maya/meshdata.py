@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import List, Iterator
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+
+from tp.tools.modelchecker import meshvalidation
+
+
+def iterate_mesh_paths(nodes: List[str]) -> Iterator[OpenMaya.MDagPath]:
+	"""
+	Generator function that iterates over the DAG paths of the given nodes that have a mesh shape.
+
+	:param List[str] nodes: list of node names.
+	:return: iterated DAG paths.
+	:rtype: Iterator[OpenMaya.MDagPath]
+	"""
+
+	selection_list = OpenMaya.MSelectionList()
+	for node in nodes:
+		if cmds.listRelatives(node, shapes=True, type='mesh'):
+			selection_list.add(node)
+
+	for i in range(selection_list.length()):
+		yield selection_list.getDagPath(i)
+
+
+def extract_mesh_data(dag_path: OpenMaya.MDagPath, with_edges: bool = True) -> meshvalidation.MeshData:
+	"""
+	Extracts the topology, positions and UVs of the given mesh into a mesh data instance.
+
+	:param OpenMaya.MDagPath dag_path: mesh (or mesh transform) DAG path.
+	:param bool with_edges: whether to extract Maya edges. If False, edges are derived from faces, which is faster but
+		edge indices do not match Maya ones, so it should be used only if no edge checks are evaluated.
+	:return: mesh data.
+	:rtype: meshvalidation.MeshData
+	"""
+
+	np = meshvalidation.np
+	fn_mesh = OpenMaya.MFnMesh(dag_path)
+	face_counts, face_vertices = fn_mesh.getVertices()
+	face_counts = np.asarray(face_counts, dtype=np.int64)
+	points = np.array([(point.x, point.y, point.z) for point in fn_mesh.getPoints()], dtype=np.float64)
+
+	uvs = None
+	face_uvs = None
+	if fn_mesh.numUVs():
+		us, vs = fn_mesh.getUVs()
+		uvs = np.column_stack((np.asarray(us, dtype=np.float64), np.asarray(vs, dtype=np.float64)))
+		uv_counts, uv_ids = fn_mesh.getAssignedUVs()
+		face_uvs = np.full(len(face_vertices), -1, dtype=np.int64)
+		face_uvs[np.repeat(np.asarray(uv_counts) == face_counts, face_counts)] = np.asarray(uv_ids, dtype=np.int64)
+
+	edge_vertices = None
+	edge_smooth = None
+	if with_edges:
+		edge_count = fn_mesh.numEdges
+		edge_vertices = np.array([fn_mesh.getEdgeVertices(i) for i in range(edge_count)], dtype=np.int64)
+		edge_smooth = np.array([fn_mesh.isEdgeSmooth(i) for i in range(edge_count)], dtype=bool)
+
+	return meshvalidation.MeshData(
+		dag_path.partialPathName(), points, face_counts, face_vertices, uvs=uvs, face_uvs=face_uvs,
+		edge_vertices=edge_vertices, edge_smooth=edge_smooth)
+
+
+def run_mesh_checks(check_names: List[str], nodes: List[str]) -> dict[str, List[str]]:
+	"""
+	Evaluates given mesh validation checks on the meshes of the given nodes. Each mesh is extracted only once, no
+	matter the number of checks.
+
+	:param List[str] check_names: names of the mesh validation checks to evaluate.
+	:param List[str] nodes: list of node names to check.
+	:return: dictionary with the invalid component names of each check.
+	:rtype: dict[str, List[str]]
+	"""
+
+	meshvalidation.check_numpy()
+	with_edges = any(meshvalidation.component_type(check_name) == 'e' for check_name in check_names)
+	meshes = (extract_mesh_data(dag_path, with_edges=with_edges) for dag_path in iterate_mesh_paths(nodes))
+
+	return meshvalidation.validate_components(meshes, check_names)
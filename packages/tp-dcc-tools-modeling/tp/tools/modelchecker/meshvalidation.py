@@ -0,0 +1,636 @@
+"""
+Module that contains a DCC independent mesh validation engine.
+Mesh topology, positions and UVs are stored once within NumPy arrays and all checks are evaluated as array operations
+that return the indices of the invalid components.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Callable
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from tp.core import log
+
+logger = log.modelLogger
+
+# minimum area/length for faces/edges to not be considered degenerated
+ZERO_TOLERANCE = 1e-8
+# maximum distance to an integer coordinate for a UV to be considered on a UV tile border
+UV_BORDER_TOLERANCE = 1e-5
+# maximum U coordinate of a valid UV
+UV_MAX_U = 10.0
+# vertices with more connected edges than this value are considered poles
+POLE_VALENCE = 5
+
+
+def check_numpy():
+	"""
+	Checks whether NumPy is available.
+
+	:raises ImportError: if NumPy module is not available.
+	"""
+
+	if np is None:
+		raise ImportError('Unable to import the numpy module')
+
+
+class MeshData:
+	"""
+	Class that stores the topology, positions and UVs of a polygon mesh within flat arrays.
+	Derived topology (face offsets, edges, edge face counts, ...) is computed the first time it is needed and reused
+	by all checks.
+	"""
+
+	def __init__(
+			self, name: str, points: Iterable, face_counts: Iterable[int], face_vertices: Iterable[int],
+			uvs: Iterable | None = None, face_uvs: Iterable[int] | None = None, edge_vertices: Iterable | None = None,
+			edge_smooth: Iterable[bool] | None = None):
+		"""
+		Constructor.
+
+		:param str name: mesh name, used to build component names.
+		:param Iterable points: vertex positions with shape (vertex count, 3).
+		:param Iterable[int] face_counts: number of vertices of each face.
+		:param Iterable[int] face_vertices: vertex indices of all faces, face after face.
+		:param Iterable or None uvs: UV coordinates with shape (UV count, 2).
+		:param Iterable[int] or None face_uvs: UV index of each face vertex (same length as face_vertices). Face
+			vertices without UV must use -1.
+		:param Iterable or None edge_vertices: vertex indices of each edge with shape (edge count, 2). Must be given to
+			match the edge indices of a DCC; if not given, edges are derived from faces.
+		:param Iterable[bool] or None edge_smooth: smoothing state of each edge, if edge_vertices is given.
+		"""
+
+		check_numpy()
+
+		super().__init__()
+
+		self._name = name
+		self._points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+		self._face_counts = np.asarray(face_counts, dtype=np.int64)
+		self._face_vertices = np.asarray(face_vertices, dtype=np.int64)
+		self._uvs = np.asarray(uvs, dtype=np.float64).reshape(-1, 2) if uvs is not None else np.zeros((0, 2))
+		self._face_uvs = np.asarray(face_uvs, dtype=np.int64) if face_uvs is not None else np.full(
+			len(self._face_vertices), -1, dtype=np.int64)
+		self._edge_vertices = np.sort(
+			np.asarray(edge_vertices, dtype=np.int64).reshape(-1, 2), axis=1) if edge_vertices is not None else None
+		self._edge_smooth = np.asarray(edge_smooth, dtype=bool) if edge_smooth is not None else None
+
+		if self._face_counts.sum() != len(self._face_vertices):
+			raise ValueError(f'Mesh "{name}" face counts do not match face vertices count')
+		if len(self._face_uvs) != len(self._face_vertices):
+			raise ValueError(f'Mesh "{name}" face UVs count does not match face vertices count')
+
+		self._face_offsets = None				# type: np.ndarray | None
+		self._next_face_vertices = None			# type: np.ndarray | None
+		self._face_vertex_edges = None			# type: np.ndarray | None
+		self._edge_face_counts = None			# type: np.ndarray | None
+
+	def __repr__(self) -> str:
+		return (
+			f'<{self.__class__.__name__}(name={self._name}, vertices={self.vertex_count}, faces={self.face_count})> '
+			f'object at {hex(id(self))}')
+
+	@property
+	def name(self) -> str:
+		return self._name
+
+	@property
+	def points(self) -> np.ndarray:
+		return self._points
+
+	@property
+	def face_counts(self) -> np.ndarray:
+		return self._face_counts
+
+	@property
+	def face_vertices(self) -> np.ndarray:
+		return self._face_vertices
+
+	@property
+	def uvs(self) -> np.ndarray:
+		return self._uvs
+
+	@property
+	def face_uvs(self) -> np.ndarray:
+		return self._face_uvs
+
+	@property
+	def edge_smooth(self) -> np.ndarray | None:
+		return self._edge_smooth
+
+	@property
+	def vertex_count(self) -> int:
+		return len(self._points)
+
+	@property
+	def face_count(self) -> int:
+		return len(self._face_counts)
+
+	@property
+	def face_offsets(self) -> np.ndarray:
+		"""
+		Returns the index of the first face vertex of each face.
+
+		:return: face offsets.
+		:rtype: np.ndarray
+		"""
+
+		if self._face_offsets is None:
+			self._face_offsets = np.zeros(len(self._face_counts), dtype=np.int64)
+			if len(self._face_counts):
+				np.cumsum(self._face_counts[:-1], out=self._face_offsets[1:])
+
+		return self._face_offsets
+
+	@property
+	def next_face_vertices(self) -> np.ndarray:
+		"""
+		Returns, for each face vertex, the index of the next face vertex within the same face.
+
+		:return: next face vertex indices.
+		:rtype: np.ndarray
+		"""
+
+		if self._next_face_vertices is None:
+			next_face_vertices = np.arange(1, len(self._face_vertices) + 1, dtype=np.int64)
+			offsets = self.face_offsets
+			valid = self._face_counts > 0
+			next_face_vertices[offsets[valid] + self._face_counts[valid] - 1] = offsets[valid]
+			self._next_face_vertices = next_face_vertices
+
+		return self._next_face_vertices
+
+	@property
+	def edge_vertices(self) -> np.ndarray:
+		"""
+		Returns the vertex indices of each edge, sorted in ascending order within each edge.
+
+		:return: array with shape (edge count, 2).
+		:rtype: np.ndarray
+		"""
+
+		if self._edge_vertices is None:
+			sides = self._face_sides()
+			self._edge_vertices = np.unique(sides, axis=0) if len(sides) else np.zeros((0, 2), dtype=np.int64)
+
+		return self._edge_vertices
+
+	@property
+	def edge_count(self) -> int:
+		return len(self.edge_vertices)
+
+	@property
+	def face_vertex_edges(self) -> np.ndarray:
+		"""
+		Returns, for each face vertex, the index of the edge between the face vertex and the next one.
+
+		:return: edge indices.
+		:rtype: np.ndarray
+		"""
+
+		if self._face_vertex_edges is None:
+			edge_keys = self._edge_keys(self.edge_vertices)
+			order = np.argsort(edge_keys)
+			sorted_keys = edge_keys[order]
+			side_keys = self._edge_keys(self._face_sides())
+			positions = np.clip(np.searchsorted(sorted_keys, side_keys), 0, max(len(sorted_keys) - 1, 0))
+			if len(sorted_keys) and not np.array_equal(sorted_keys[positions], side_keys):
+				raise ValueError(f'Mesh "{self._name}" edges do not match face vertices')
+			self._face_vertex_edges = order[positions] if len(sorted_keys) else np.zeros(0, dtype=np.int64)
+
+		return self._face_vertex_edges
+
+	@property
+	def edge_face_counts(self) -> np.ndarray:
+		"""
+		Returns the number of faces connected to each edge.
+
+		:return: connected face counts.
+		:rtype: np.ndarray
+		"""
+
+		if self._edge_face_counts is None:
+			self._edge_face_counts = np.bincount(self.face_vertex_edges, minlength=self.edge_count)
+
+		return self._edge_face_counts
+
+	def face_indices(self) -> np.ndarray:
+		"""
+		Returns, for each face vertex, the index of its face.
+
+		:return: face indices.
+		:rtype: np.ndarray
+		"""
+
+		return np.repeat(np.arange(self.face_count, dtype=np.int64), self._face_counts)
+
+	def vertex_valences(self) -> np.ndarray:
+		"""
+		Returns the number of edges connected to each vertex.
+
+		:return: vertex valences.
+		:rtype: np.ndarray
+		"""
+
+		return np.bincount(self.edge_vertices.ravel(), minlength=self.vertex_count)
+
+	def face_areas(self) -> np.ndarray:
+		"""
+		Returns the area of each face, computed with the Newell method so non-triangular faces are supported.
+
+		:return: face areas.
+		:rtype: np.ndarray
+		"""
+
+		if not self.face_count:
+			return np.zeros(0)
+
+		current_points = self._points[self._face_vertices]
+		next_points = self._points[self._face_vertices[self.next_face_vertices]]
+		crosses = np.cross(current_points, next_points)
+		normals = self._reduce_faces(np.add, crosses)
+
+		return 0.5 * np.linalg.norm(normals, axis=1)
+
+	def edge_lengths(self) -> np.ndarray:
+		"""
+		Returns the length of each edge.
+
+		:return: edge lengths.
+		:rtype: np.ndarray
+		"""
+
+		edges = self.edge_vertices
+		return np.linalg.norm(self._points[edges[:, 1]] - self._points[edges[:, 0]], axis=1)
+
+	def face_has_uvs(self) -> np.ndarray:
+		"""
+		Returns whether each face has UVs assigned to all its face vertices.
+
+		:return: boolean array.
+		:rtype: np.ndarray
+		"""
+
+		if not self.face_count:
+			return np.zeros(0, dtype=bool)
+
+		return self._reduce_faces(np.minimum, self._face_uvs) >= 0
+
+	def _face_sides(self) -> np.ndarray:
+		"""
+		Internal function that returns the sorted vertex indices of the side between each face vertex and the next one.
+
+		:return: array with shape (face vertex count, 2).
+		:rtype: np.ndarray
+		"""
+
+		sides = np.stack((self._face_vertices, self._face_vertices[self.next_face_vertices]), axis=1)
+		return np.sort(sides, axis=1)
+
+	def _edge_keys(self, edges: np.ndarray) -> np.ndarray:
+		"""
+		Internal function that returns a unique integer key for each given sorted edge.
+
+		:param np.ndarray edges: array with shape (edge count, 2).
+		:return: edge keys.
+		:rtype: np.ndarray
+		"""
+
+		return edges[:, 0] * max(self.vertex_count, 1) + edges[:, 1]
+
+	def _reduce_faces(self, ufunc: np.ufunc, values: np.ndarray) -> np.ndarray:
+		"""
+		Internal function that reduces given per face vertex values per face. Faces must have at least one vertex.
+
+		:param np.ufunc ufunc: reduction function.
+		:param np.ndarray values: per face vertex values.
+		:return: per face values.
+		:rtype: np.ndarray
+		"""
+
+		return ufunc.reduceat(values, self.face_offsets, axis=0)
+
+
+def triangles(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of triangular faces.
+
+	:param MeshData mesh: mesh to check.
+	:return: face indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.face_counts == 3)
+
+
+def ngons(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of faces with more than 4 vertices.
+
+	:param MeshData mesh: mesh to check.
+	:return: face indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.face_counts > 4)
+
+
+def open_edges(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of border edges, which are connected to a single face.
+
+	:param MeshData mesh: mesh to check.
+	:return: edge indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.edge_face_counts < 2)
+
+
+def non_manifold_edges(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of non-manifold edges, which are connected to more than two faces.
+
+	:param MeshData mesh: mesh to check.
+	:return: edge indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.edge_face_counts > 2)
+
+
+def poles(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of the vertices connected to more than POLE_VALENCE edges.
+
+	:param MeshData mesh: mesh to check.
+	:return: vertex indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.vertex_valences() > POLE_VALENCE)
+
+
+def hard_edges(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of the hard edges which are not on a border. If mesh has no edge smoothing data, no edges are
+	returned.
+
+	:param MeshData mesh: mesh to check.
+	:return: edge indices.
+	:rtype: np.ndarray
+	"""
+
+	if mesh.edge_smooth is None:
+		return np.zeros(0, dtype=np.int64)
+
+	return np.flatnonzero(~mesh.edge_smooth & (mesh.edge_face_counts != 1))
+
+
+def lamina(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of lamina faces, which share all their vertices with another face.
+
+	:param MeshData mesh: mesh to check.
+	:return: face indices.
+	:rtype: np.ndarray
+	"""
+
+	found_faces = []
+	offsets = mesh.face_offsets
+	for count in np.unique(mesh.face_counts):
+		faces = np.flatnonzero(mesh.face_counts == count)
+		if len(faces) < 2 or count == 0:
+			continue
+		face_vertices = np.sort(mesh.face_vertices[offsets[faces][:, None] + np.arange(count)], axis=1)
+		_, inverse, counts = np.unique(face_vertices, axis=0, return_inverse=True, return_counts=True)
+		found_faces.append(faces[counts[inverse.ravel()] > 1])
+
+	return np.sort(np.concatenate(found_faces)) if found_faces else np.zeros(0, dtype=np.int64)
+
+
+def zero_area_faces(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of faces whose area is almost zero.
+
+	:param MeshData mesh: mesh to check.
+	:return: face indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.face_areas() <= ZERO_TOLERANCE)
+
+
+def zero_length_edges(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of edges whose length is almost zero.
+
+	:param MeshData mesh: mesh to check.
+	:return: edge indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(mesh.edge_lengths() <= ZERO_TOLERANCE)
+
+
+def missing_uvs(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of faces without UVs.
+
+	:param MeshData mesh: mesh to check.
+	:return: face indices.
+	:rtype: np.ndarray
+	"""
+
+	return np.flatnonzero(~mesh.face_has_uvs())
+
+
+def uv_range(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of the UVs outside the valid UV range (0 <= U <= UV_MAX_U and 0 <= V).
+
+	:param MeshData mesh: mesh to check.
+	:return: UV indices.
+	:rtype: np.ndarray
+	"""
+
+	us, vs = mesh.uvs[:, 0], mesh.uvs[:, 1]
+	return np.flatnonzero((us < 0) | (us > UV_MAX_U) | (vs < 0))
+
+
+def cross_border(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of the faces whose UVs lay in more than one UV tile. Faces without UVs are ignored.
+
+	:param MeshData mesh: mesh to check.
+	:return: face indices.
+	:rtype: np.ndarray
+	"""
+
+	if not mesh.face_count or not len(mesh.uvs):
+		return np.zeros(0, dtype=np.int64)
+
+	has_uvs = mesh.face_has_uvs()
+	tiles = np.floor(mesh.uvs[np.maximum(mesh.face_uvs, 0)])
+	offsets = mesh.face_offsets
+	crossing = np.any(
+		np.maximum.reduceat(tiles, offsets, axis=0) != np.minimum.reduceat(tiles, offsets, axis=0), axis=1)
+
+	return np.flatnonzero(crossing & has_uvs)
+
+
+def on_border(mesh: MeshData) -> np.ndarray:
+	"""
+	Returns the indices of the UVs laying on a UV tile border.
+
+	:param MeshData mesh: mesh to check.
+	:return: UV indices.
+	:rtype: np.ndarray
+	"""
+
+	distances = np.abs(mesh.uvs - np.trunc(mesh.uvs))
+	return np.flatnonzero(np.any(distances < UV_BORDER_TOLERANCE, axis=1))
+
+
+# check name: (component type, check function)
+CHECKS = {
+	'triangles': ('f', triangles),
+	'ngons': ('f', ngons),
+	'open_edges': ('e', open_edges),
+	'non_manifold_edges': ('e', non_manifold_edges),
+	'poles': ('vtx', poles),
+	'hard_edges': ('e', hard_edges),
+	'lamina': ('f', lamina),
+	'zero_area_faces': ('f', zero_area_faces),
+	'zero_length_edges': ('e', zero_length_edges),
+	'missing_uvs': ('f', missing_uvs),
+	'uv_range': ('map', uv_range),
+	'cross_border': ('f', cross_border),
+	'on_border': ('map', on_border)
+}						# type: dict[str, tuple[str, Callable[[MeshData], np.ndarray]]]
+
+
+def component_type(check_name: str) -> str:
+	"""
+	Returns the type of the components returned by the check with given name.
+
+	:param str check_name: check name.
+	:return: component type ('f', 'e', 'vtx' or 'map').
+	:rtype: str
+	:raises KeyError: if no check with given name exists.
+	"""
+
+	return CHECKS[check_name][0]
+
+
+def validate(mesh: MeshData, check_names: Iterable[str] | None = None) -> dict[str, np.ndarray]:
+	"""
+	Evaluates given checks on the given mesh.
+
+	:param MeshData mesh: mesh to check.
+	:param Iterable[str] or None check_names: names of the checks to evaluate. If None, all checks are evaluated.
+	:return: dictionary with the indices of the invalid components of each check.
+	:rtype: dict[str, np.ndarray]
+	:raises KeyError: if a check with given name does not exist.
+	"""
+
+	check_names = list(CHECKS) if check_names is None else list(check_names)
+	return {check_name: CHECKS[check_name][1](mesh) for check_name in check_names}
+
+
+def component_names(mesh_name: str, component: str, indices: Iterable[int]) -> list[str]:
+	"""
+	Returns the component names of the given component indices.
+
+	:param str mesh_name: mesh name.
+	:param str component: component type ('f', 'e', 'vtx' or 'map').
+	:param Iterable[int] indices: component indices.
+	:return: component names.
+	:rtype: list[str]
+	"""
+
+	return [f'{mesh_name}.{component}[{index}]' for index in np.asarray(indices).tolist()]
+
+
+def validate_components(meshes: Iterable[MeshData], check_names: Iterable[str]) -> dict[str, list[str]]:
+	"""
+	Evaluates given checks on all given meshes and returns the names of the invalid components.
+
+	:param Iterable[MeshData] meshes: meshes to check.
+	:param Iterable[str] check_names: names of the checks to evaluate.
+	:return: dictionary with the invalid component names of each check.
+	:rtype: dict[str, list[str]]
+	"""
+
+	check_names = list(check_names)
+	results = {check_name: [] for check_name in check_names}
+	for mesh in meshes:
+		for check_name, indices in validate(mesh, check_names).items():
+			results[check_name].extend(component_names(mesh.name, component_type(check_name), indices))
+
+	return results
+
+
+def read_obj(file_path: str) -> list[MeshData]:
+	"""
+	Reads the meshes of the given OBJ file. Each object ("o" statement) is returned as a separated mesh.
+	Normals, materials and groups are ignored.
+
+	:param str file_path: OBJ file path.
+	:return: list of meshes.
+	:rtype: list[MeshData]
+	"""
+
+	check_numpy()
+
+	points, uvs = [], []
+	objects = []				# type: list[tuple[str, list[int], list[int], list[int]]]
+	current = None
+
+	with open(file_path, 'r') as obj_file:
+		for line in obj_file:
+			tokens = line.split()
+			if not tokens:
+				continue
+			key = tokens[0]
+			if key == 'v':
+				points.append([float(value) for value in tokens[1:4]])
+			elif key == 'vt':
+				uvs.append([float(value) for value in tokens[1:3]])
+			elif key == 'o':
+				current = (' '.join(tokens[1:]) or f'object{len(objects)}', [], [], [])
+				objects.append(current)
+			elif key == 'f':
+				if current is None:
+					current = ('object0', [], [], [])
+					objects.append(current)
+				face_vertices, face_uvs = [], []
+				for token in tokens[1:]:
+					indices = token.split('/')
+					vertex_index = int(indices[0])
+					face_vertices.append(vertex_index - 1 if vertex_index > 0 else len(points) + vertex_index)
+					uv_index = int(indices[1]) if len(indices) > 1 and indices[1] else 0
+					face_uvs.append(uv_index - 1 if uv_index > 0 else len(uvs) + uv_index if uv_index else -1)
+				current[1].append(len(face_vertices))
+				current[2].extend(face_vertices)
+				current[3].extend(face_uvs)
+
+	all_points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+	all_uvs = np.asarray(uvs, dtype=np.float64).reshape(-1, 2)
+	meshes = []
+	for name, face_counts, face_vertices, face_uvs in objects:
+		used_vertices, local_vertices = np.unique(np.asarray(face_vertices, dtype=np.int64), return_inverse=True)
+		face_uvs = np.asarray(face_uvs, dtype=np.int64)
+		has_uv = face_uvs >= 0
+		used_uvs, local_uvs = np.unique(face_uvs[has_uv], return_inverse=True)
+		local_face_uvs = np.full(len(face_uvs), -1, dtype=np.int64)
+		local_face_uvs[has_uv] = local_uvs.ravel()
+		meshes.append(MeshData(
+			name, all_points[used_vertices], face_counts, local_vertices.ravel(), uvs=all_uvs[used_uvs],
+			face_uvs=local_face_uvs))
+
+	return meshes
@@ -0,0 +1,161 @@
+"""
+Benchmark that measures updating a guide layer descriptor with the guides of a full body (spine, neck, head, arms with
+fingers, legs with toes and face guides), as done when guides are serialized back from the scene.
+
+Guide layer node lookups, which use node ID indexes, are compared against the previous behaviour, which walked all
+the layer guides for each lookup.
+
+Descriptors import Maya API modules, so this benchmark must be run with mayapy (no scene is needed).
+
+Usage:
+    mayapy bench_guide_update.py [--face-guides 150] [--iterations 20]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import copy
+import glob
+import time
+import argparse
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+    if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+        sys.path.append(_package_root)
+
+from tp.libs.rig.crit import consts
+from tp.libs.rig.crit.descriptors import layers
+
+
+class LinearGuideLayerDescriptor(layers.GuideLayerDescriptor):
+    """
+    Guide layer descriptor that looks up nodes walking all the layer guides, as guide layers did before node ID
+    indexes were added.
+    """
+
+    def has_node(self, node_id: str) -> bool:
+        return self.node(node_id) is not None
+
+    def node(self, node_id: str):
+        for found_node in layers.traverse_descriptor_layer_dag(self):
+            if found_node['id'] == node_id:
+                return found_node
+
+    def node_parent_id(self, node_id: str) -> str | None:
+        # previous update implementation did not need parent IDs
+        return None
+
+    def find_nodes(self, *node_ids: tuple):
+        results = [None] * len(node_ids)
+        for found_node in layers.traverse_descriptor_layer_dag(self):
+            node_id = found_node['id']
+            if node_id in node_ids:
+                results[node_ids.index(node_id)] = found_node
+        return results
+
+    def _index_node(self, node, parent_id: str | None):
+        pass
+
+    def _unindex_node(self, node):
+        pass
+
+
+def _guide(guide_id: str, translate: tuple[float, float, float], *children: dict) -> dict:
+    return {'id': guide_id, 'name': guide_id, 'translate': list(translate), 'children': list(children)}
+
+
+def _chain(prefix: str, count: int, start: tuple[float, float, float], step: tuple[float, float, float]) -> list[dict]:
+    """
+    Internal function that returns a list of guides with the given prefix, each one parented to the previous one.
+    """
+
+    guides = [_guide(
+        f'{prefix}{i:02d}', tuple(start[axis] + step[axis] * i for axis in range(3))) for i in range(count)]
+    for parent, child in zip(guides, guides[1:]):
+        parent['children'].append(child)
+    return guides
+
+
+def create_body_guides(face_guide_count: int) -> dict:
+    """
+    Returns the serialized guide layer data of a full body.
+
+    :param int face_guide_count: number of face guides parented to the head guide.
+    :return: guide layer data.
+    :rtype: dict
+    """
+
+    spine = _chain('spine', 6, (0.0, 100.0, 0.0), (0.0, 8.0, 0.0))
+    neck = _chain('neck', 3, (0.0, 150.0, 0.0), (0.0, 5.0, 0.0))
+    spine[-1]['children'].append(neck[0])
+    neck[-1]['children'].extend(_guide(
+        f'face{i:03d}', (i * 0.1, 165.0, 10.0)) for i in range(face_guide_count))
+    for side, sign in (('L', 1.0), ('R', -1.0)):
+        arm = _chain(f'arm_{side}_', 4, (sign * 10.0, 145.0, 0.0), (sign * 15.0, 0.0, 0.0))
+        arm[-1]['children'].extend(
+            _chain(f'finger{finger}_{side}_', 4, (sign * 70.0, 145.0, finger * 2.0), (sign * 3.0, 0.0, 0.0))[0]
+            for finger in range(5))
+        spine[-1]['children'].append(arm[0])
+        leg = _chain(f'leg_{side}_', 5, (sign * 10.0, 95.0, 0.0), (0.0, -22.0, 2.0))
+        leg[-1]['children'].extend(
+            _chain(f'toe{toe}_{side}_', 3, (sign * (8.0 + toe * 2.0), 2.0, 12.0), (0.0, 0.0, 2.0))[0]
+            for toe in range(5))
+        spine[0]['children'].append(leg[0])
+
+    return {
+        consts.DAG_DESCRIPTOR_KEY: [_guide('root', (0.0, 0.0, 0.0), spine[0])],
+        consts.SETTINGS_DESCRIPTOR_KEY: [],
+        consts.METADATA_DESCRIPTOR_KEY: []
+    }
+
+
+def _timed_updates(layer: layers.GuideLayerDescriptor, updates: list[dict]) -> float:
+    """
+    Internal function that returns the average time, in milliseconds, of updating the given layer with each one of the
+    given update data.
+    """
+
+    start = time.perf_counter()
+    for update_data in updates:
+        layer.update(update_data)
+        layer.guide('root')
+    return (time.perf_counter() - start) * 1000 / len(updates)
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    :param list[str] or None args: command line arguments.
+    :return: exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks full body guide layer updates')
+    parser.add_argument('--face-guides', type=int, default=150, help='number of face guides')
+    parser.add_argument('--iterations', type=int, default=20, help='number of times guides are updated')
+    parsed_args = parser.parse_args(args)
+
+    layer_data = create_body_guides(parsed_args.face_guides)
+
+    results = []
+    for name, layer_class in (
+            ('linear lookups', LinearGuideLayerDescriptor), ('indexed lookups', layers.GuideLayerDescriptor)):
+        layer = layer_class.from_data(copy.deepcopy(layer_data))
+        # update consumes its data (children are replaced by descriptors), so each update gets its own copy
+        updates = [copy.deepcopy(layer_data) for _ in range(parsed_args.iterations)]
+        results.append((name, layer.guide_count(), _timed_updates(layer, updates)))
+
+    print(f'average of {parsed_args.iterations} full body guide updates')
+    for name, guide_count, update_time in results:
+        print(f'  {name:>15}: {guide_count} guides, {update_time:8.2f} ms')
+    print(f'  speed up: {results[0][2] / results[1][2]:.1f}x')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -276,6 +276,7 @@ DEFAULT_BUILTIN_PRESET_NAME = 'crit'
 
 COMPONENTS_ENV_VAR_KEY = 'CRIT_COMPONENTS_PATHS'
 DESCRIPTORS_ENV_VAR_KEY = 'CRIT_DESCRIPTORS_PATHS'
+DESCRIPTORS_CACHE_ENV_VAR_KEY = 'CRIT_DESCRIPTORS_CACHE_PATH'
 TEMPLATES_ENV_VAR_KEY = 'CRIT_TEMPLATES_PATHS'
 GRAPHS_ENV_VAR_KEY = 'CRIT_GRAPHS_PATHS'
 
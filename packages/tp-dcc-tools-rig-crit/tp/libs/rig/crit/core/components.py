@@ -1,18 +1,17 @@
 from __future__ import annotations
 
 import os
-import copy
 import typing
 import inspect
 from typing import List, Dict
 
 from tp.core import log
-from tp.common.python import decorators, yamlio
+from tp.common.python import decorators
 from tp.common import plugin
 from tp.preferences.interfaces import crit
 
 from tp.libs.rig.crit import consts
-from tp.libs.rig.crit.core import errors, component
+from tp.libs.rig.crit.core import errors, component, descriptorcache
 from tp.libs.rig.crit.descriptors import component as descriptor_component
 
 logger = log.rigLogger
@@ -36,6 +35,7 @@ class ComponentsManager:
         self._components = {}
         self._descriptors = {}
         self._manager = None										# type: PluginFactory
+        self._descriptor_cache = descriptorcache.DescriptorCache()
         self._preferences_interface = crit.crit_interface()
 
     @property
@@ -49,10 +49,12 @@ class ComponentsManager:
     def refresh(self):
         """
         Refreshes registered components by clearing the manager and rediscovering the components again.
+        Only descriptor files that changed since last refresh are parsed again.
         """
 
         self._components.clear()
         self._descriptors.clear()
+        self._descriptor_cache.load()
         self._manager = plugin.PluginFactory(
             interface=component.Component, plugin_id='ID', name='CritComponentManager')
 
@@ -76,8 +78,11 @@ class ComponentsManager:
                     if descriptor_base_name in self._descriptors:
                         continue
                     descriptor_path = os.path.join(root, file_name)
-                    cache = self._load_descriptor_from_path(descriptor_path)
-                    self._descriptors[cache['type']] = {'path': descriptor_path, 'data': cache}
+                    compiled_data = self._descriptor_cache.compiled_descriptor(descriptor_path)
+                    cache = descriptorcache.descriptor_from_compiled(compiled_data)
+                    self._descriptors[cache['type']] = {
+                        'path': descriptor_path, 'data': cache, 'compiled': compiled_data}
+        self._descriptor_cache.save()
 
         for class_obj in self._manager.plugins('crit'):
             class_id = class_obj.ID if hasattr(class_obj, 'ID') else None
@@ -131,7 +136,7 @@ class ComponentsManager:
 
         try:
             descriptor_data = self._descriptors[self._components[component_type]['descriptor']]
-            return copy.deepcopy(descriptor_data['data'])
+            return descriptorcache.descriptor_from_compiled(descriptor_data['compiled'])
         except ValueError:
             logger.error(f'Failed to load component descriptor: {component_type}', exc_info=True)
             raise ValueError(f'Failed to load component descriptor: {component_type}')
@@ -195,18 +200,3 @@ class ComponentsManager:
         new_component = new_component(rig, meta=meta)
 
         return new_component
-
-    def _load_descriptor_from_path(self, descriptor_path: str) -> Dict | None:
-        """
-        Internal function that tries to load a component descriptor from given path.
-
-        :param str descriptor_path: absolute file path pointing to a descriptor file.
-        :return: descriptor contents or None if the descriptor is not valid.
-        :rtype: Dict or None
-        """
-
-        try:
-            return yamlio.read_file(descriptor_path)
-        except ValueError:
-            logger.error(f'Failed to load component descriptor: {descriptor_path}', exc_info=True)
-            raise ValueError(f'Failed to load component descriptor: {descriptor_path}')
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+import stat
+import pickle
+import marshal
+from typing import Dict, Tuple
+
+from tp.bootstrap import api as bootstrap
+from tp.core import log
+from tp.common.python import yamlio
+
+from tp.libs.rig.crit import consts
+
+logger = log.rigLogger
+
+# Version of the compiled cache file layout. Cache files with a different version are discarded.
+CACHE_VERSION = 2
+# compiled data prefixes. Pickled data is only kept in memory and it is never written into or read from disk
+_MARSHAL_PREFIX = b'm'
+_PICKLE_PREFIX = b'p'
+
+
+def default_cache_path() -> str:
+    """
+    Returns the path where the compiled descriptors cache file is stored: the tpDcc cache folder within current user
+    preferences folder. Path can be overridden using CRIT_DESCRIPTORS_CACHE_PATH environment variable.
+
+    :return: absolute compiled descriptors cache file path.
+    :rtype: str
+    """
+
+    cache_path = os.environ.get(consts.DESCRIPTORS_CACHE_ENV_VAR_KEY)
+    if cache_path:
+        return cache_path
+
+    package_manager = bootstrap.current_package_manager()
+    cache_folder = package_manager.cache_folder_path() if package_manager else os.path.expanduser(
+        os.path.join('~', 'tp', 'dcc', 'preferences', 'cache'))
+
+    return os.path.join(cache_folder, 'crit', 'descriptors.cache')
+
+
+def is_trusted_cache_file(cache_path: str) -> bool:
+    """
+    Returns whether given cache file can be trusted: it must be owned by current user and it must not be writable by
+    other users.
+
+    :param str cache_path: absolute cache file path.
+    :return: True if cache file can be loaded; False otherwise.
+    :rtype: bool
+    """
+
+    if not hasattr(os, 'getuid'):
+        return True
+
+    file_stat = os.stat(cache_path)
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class DescriptorCache:
+    """
+    Class that stores parsed component descriptors in a compiled (marshalled) form keyed by descriptor file path.
+    Each entry is validated against the file modification time and size, so only changed descriptor files are parsed.
+    """
+
+    def __init__(self, cache_path: str | None = None):
+        super().__init__()
+
+        self._cache_path = cache_path or default_cache_path()
+        self._entries = {}                                      # type: Dict[str, Tuple[int, int, bytes]]
+        self._visited = set()
+        self._dirty = False
+        self._loaded = False
+
+    @property
+    def cache_path(self) -> str:
+        return self._cache_path
+
+    def load(self):
+        """
+        Loads compiled descriptors from cache file. Invalid or outdated cache files are ignored.
+        """
+
+        self._entries.clear()
+        self._visited.clear()
+        self._dirty = False
+        self._loaded = True
+        if not os.path.isfile(self._cache_path):
+            return
+
+        try:
+            if not is_trusted_cache_file(self._cache_path):
+                logger.warning(
+                    f'Ignoring compiled descriptors cache not owned or writable by other users: {self._cache_path}')
+                return
+            with open(self._cache_path, 'rb') as cache_file:
+                version, entries = marshal.load(cache_file)
+            if version != CACHE_VERSION or not isinstance(entries, dict):
+                return
+            self._entries = {
+                path: entry for path, entry in entries.items() if isinstance(entry, tuple) and len(entry) == 3 and
+                isinstance(entry[2], bytes) and entry[2].startswith(_MARSHAL_PREFIX)}
+        except Exception:
+            logger.warning(f'Failed to load compiled descriptors cache: {self._cache_path}', exc_info=True)
+
+    def save(self):
+        """
+        Writes compiled descriptors into cache file. Entries for descriptor files that were not requested since last
+        load are discarded. File is written into a temporary file first so other sessions never read a partial cache.
+        """
+
+        stale_paths = [path for path in self._entries if path not in self._visited]
+        for stale_path in stale_paths:
+            del self._entries[stale_path]
+        if not self._dirty and not stale_paths:
+            return
+
+        # descriptors that can only be pickled are not persisted
+        entries = {path: entry for path, entry in self._entries.items() if entry[2].startswith(_MARSHAL_PREFIX)}
+        temp_path = f'{self._cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), mode=0o700, exist_ok=True)
+            file_descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(file_descriptor, 'wb') as cache_file:
+                marshal.dump((CACHE_VERSION, entries), cache_file)
+            os.replace(temp_path, self._cache_path)
+        except OSError:
+            logger.warning(f'Failed to save compiled descriptors cache: {self._cache_path}', exc_info=True)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        self._dirty = False
+
+    def compiled_descriptor(self, descriptor_path: str) -> bytes:
+        """
+        Returns the compiled data of the descriptor located in given path. Descriptor file is only parsed if it
+        changed since it was compiled.
+
+        :param str descriptor_path: absolute descriptor file path.
+        :return: compiled descriptor data.
+        :rtype: bytes
+        :raises ValueError: if descriptor file is not valid.
+        """
+
+        if not self._loaded:
+            self.load()
+
+        file_stat = os.stat(descriptor_path)
+        self._visited.add(descriptor_path)
+        entry = self._entries.get(descriptor_path)
+        if entry is not None and entry[0] == file_stat.st_mtime_ns and entry[1] == file_stat.st_size:
+            return entry[2]
+
+        try:
+            data = yamlio.read_file(descriptor_path)
+        except ValueError:
+            logger.error(f'Failed to load component descriptor: {descriptor_path}', exc_info=True)
+            raise ValueError(f'Failed to load component descriptor: {descriptor_path}')
+        compiled_data = compile_descriptor(data)
+        self._entries[descriptor_path] = (file_stat.st_mtime_ns, file_stat.st_size, compiled_data)
+        self._dirty = True
+
+        return compiled_data
+
+
+def compile_descriptor(data: Dict) -> bytes:
+    """
+    Returns the compiled data of the given descriptor. Descriptors are marshalled, which only supports plain data
+    containers; descriptors with other types (such as YAML timestamps) are pickled and kept only in memory.
+
+    :param Dict data: descriptor data.
+    :return: compiled descriptor data.
+    :rtype: bytes
+    """
+
+    try:
+        return _MARSHAL_PREFIX + marshal.dumps(data)
+    except ValueError:
+        return _PICKLE_PREFIX + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def descriptor_from_compiled(compiled_data: bytes) -> Dict:
+    """
+    Returns a new independent descriptor dictionary from given compiled data.
+    Unmarshalling is much faster than deep copying the parsed descriptor, and each call returns data that can be
+    freely modified by the caller.
+
+    :param bytes compiled_data: compiled descriptor data.
+    :return: descriptor data.
+    :rtype: Dict
+    """
+
+    if compiled_data.startswith(_MARSHAL_PREFIX):
+        return marshal.loads(compiled_data[1:])
+
+    return pickle.loads(compiled_data[1:])
@@ -32,6 +32,25 @@ def traverse_descriptor_layer_dag(layer_descriptor: LayerDescriptor) -> Iterator
             yield child
 
 
+def _iterate_node_hierarchy(
+        node: nodes.TransformDescriptor, parent_id: str | None) -> Iterator[Tuple[nodes.TransformDescriptor, str | None]]:
+    """
+    Depth first search generator function that walks given node and all its children without recursion.
+
+    :param nodes.TransformDescriptor node: node to walk.
+    :param str or None parent_id: ID of the node that contains given node.
+    :return: iterated tuples containing each node and the ID of the node that contains it.
+    :rtype: Iterator[Tuple[nodes.TransformDescriptor, str or None]]
+    """
+
+    stack = [(node, parent_id)]
+    while stack:
+        current_node, current_parent_id = stack.pop()
+        yield current_node, current_parent_id
+        current_id = current_node['id']
+        stack.extend((child, current_id) for child in reversed(current_node.get('children', list())))
+
+
 class LayerDescriptor(helpers.ObjectDict):
     """
     Base layer descriptor used as containers to organise a single CRIT rig structure.
@@ -52,6 +71,28 @@ class LayerDescriptor(helpers.ObjectDict):
 
         return cls()
 
+    def __setitem__(self, key: str, value: Any):
+        """
+        Overrides __setitem__ function to make sure node indexes are invalidated when the whole DAG is replaced.
+
+        :param str key: key to set.
+        :param Any value: value to set.
+        """
+
+        if key == consts.DAG_DESCRIPTOR_KEY:
+            self.invalidate_indexes()
+
+        super().__setitem__(key, value)
+
+    def invalidate_indexes(self):
+        """
+        Clears node ID and parent indexes. They will be rebuilt the next time a node is queried.
+        """
+
+        # indexes are stored within instance dictionary, so they are not serialized as descriptor data
+        self.__dict__['_node_index'] = None
+        self.__dict__['_parent_index'] = None
+
     def has_node(self, node_id: str) -> bool:
         """
         Returns whether DAG node with given ID exists within this layer.
@@ -61,7 +102,7 @@ class LayerDescriptor(helpers.ObjectDict):
         :rtype: bool
         """
 
-        return self.node(node_id) is not None
+        return node_id in self._node_indexes()[0]
 
     def node(self, node_id: str) -> nodes.TransformDescriptor:
         """
@@ -72,9 +113,18 @@ class LayerDescriptor(helpers.ObjectDict):
         :rtype: nodes.TransformDescriptor
         """
 
-        for found_node in traverse_descriptor_layer_dag(self):
-            if found_node['id'] == node_id:
-                return found_node
+        return self._node_indexes()[0].get(node_id)
+
+    def node_parent_id(self, node_id: str) -> str | None:
+        """
+        Returns the ID of the DAG node that contains the node with given ID.
+
+        :param str node_id: DAG node ID.
+        :return: parent DAG node ID. None if node is a top level node or does not exist.
+        :rtype: str or None
+        """
+
+        return self._node_indexes()[1].get(node_id)
 
     def iterate_nodes(self, include_root: bool = True) -> Iterator[nodes.TransformDescriptor]:
         """
@@ -98,13 +148,66 @@ class LayerDescriptor(helpers.ObjectDict):
         :return: List[nodes.TransformDescriptor or None]
         """
 
-        results = [None] * len(node_ids)
-        for found_node in traverse_descriptor_layer_dag(self):
-            node_id = found_node['id']
-            if node_id in node_ids:
-                results[node_ids.index(node_id)] = found_node
+        node_index = self._node_indexes()[0]
+        return [node_index.get(node_id) for node_id in node_ids]
 
-        return results
+    def _node_indexes(self) -> Tuple[Dict[str, nodes.TransformDescriptor], Dict[str, str | None]]:
+        """
+        Internal function that returns node ID and parent ID indexes, building them if necessary.
+
+        :return: tuple containing the ID to node index and the ID to parent ID index.
+        :rtype: Tuple[Dict[str, nodes.TransformDescriptor], Dict[str, str or None]]
+        """
+
+        node_index = self.__dict__.get('_node_index')
+        if node_index is None:
+            node_index, parent_index = {}, {}
+            for top_level_node in iter(self.get(consts.DAG_DESCRIPTOR_KEY, list())):
+                for found_node, parent_id in _iterate_node_hierarchy(top_level_node, None):
+                    # keep first traversed node if IDs are duplicated, as previous DAG traversal lookups did
+                    node_id = found_node['id']
+                    if node_id not in node_index:
+                        node_index[node_id] = found_node
+                        parent_index[node_id] = parent_id
+            self.__dict__['_node_index'] = node_index
+            self.__dict__['_parent_index'] = parent_index
+
+        return node_index, self.__dict__['_parent_index']
+
+    def _index_node(self, node: nodes.TransformDescriptor, parent_id: str | None):
+        """
+        Internal function that adds given node and all its children into node indexes. If indexes are not built yet,
+        nothing is done.
+
+        :param nodes.TransformDescriptor node: node to index.
+        :param str or None parent_id: ID of the node that contains given node.
+        """
+
+        node_index = self.__dict__.get('_node_index')
+        if node_index is None:
+            return
+
+        parent_index = self.__dict__['_parent_index']
+        for found_node, found_parent_id in _iterate_node_hierarchy(node, parent_id):
+            node_index[found_node['id']] = found_node
+            parent_index[found_node['id']] = found_parent_id
+
+    def _unindex_node(self, node: nodes.TransformDescriptor):
+        """
+        Internal function that removes given node and all its children from node indexes.
+
+        :param nodes.TransformDescriptor node: node to remove from indexes.
+        """
+
+        node_index = self.__dict__.get('_node_index')
+        if node_index is None:
+            return
+        parent_index = self.__dict__['_parent_index']
+        for found_node, _ in _iterate_node_hierarchy(node, None):
+            node_id = found_node['id']
+            if node_index.get(node_id) is found_node:
+                del node_index[node_id]
+                parent_index.pop(node_id, None)
 
 
 class GuideLayerDescriptor(LayerDescriptor):
@@ -160,11 +263,14 @@ class GuideLayerDescriptor(LayerDescriptor):
                 if children:
                     guide_descriptor['children'] = [nodes.GuideDescriptor.deserialize(i, guide_descriptor['id']) for i in children]
                 current_node.update(guide_descriptor)
+                self._index_node(current_node, self.node_parent_id(current_node['id']))
             else:
                 self.create_guide(**guide_descriptor)
         to_purge = [i for i in current_guides if i not in new_or_updated]
         if to_purge:
             self.delete_guides(*to_purge)
+        # guides children were replaced, so indexes are rebuilt to make sure dropped guides are not found anymore
+        self.invalidate_indexes()
 
         self[consts.METADATA_DESCRIPTOR_KEY] = [attributes.attribute_class_for_descriptor(s) for s in kwargs.get(
             consts.METADATA_DESCRIPTOR_KEY, [])] or self.get(consts.METADATA_DESCRIPTOR_KEY, [])
@@ -378,6 +484,7 @@ class GuideLayerDescriptor(LayerDescriptor):
             del current_parent.children[current_parent.children.index(child)]
         parent.children.append(child)
         child.parent = parent.id
+        self._index_node(child, parent.id)
 
         return True
 
@@ -394,16 +501,13 @@ class GuideLayerDescriptor(LayerDescriptor):
         parent = guide.get('parent', None)
         if parent is None:
             self.setdefault(consts.DAG_DESCRIPTOR_KEY, list()).append(guide)
+            self._index_node(guide, None)
             return True
 
-        parent_guide = None
-        child = None
-        for guide_descriptor in self.iterate_guides():
-            if guide_descriptor['id'] == parent:
-                parent_guide, child = guide_descriptor, guide
-                break
+        parent_guide = self.guide(parent)
         if parent_guide is not None:
-            parent_guide['children'].append(child)
+            parent_guide['children'].append(guide)
+            self._index_node(guide, parent)
 
         return True
 
@@ -418,16 +522,17 @@ class GuideLayerDescriptor(LayerDescriptor):
 
         root = self.guide('root')
         success = False
-        for found_guide in self.iterate_guides():
-            guide_id = found_guide.id
-            if guide_id not in guide_ids:
+        for guide_id in guide_ids:
+            found_guide = self.guide(guide_id)
+            if found_guide is None:
                 continue
-            guide_parent_id = found_guide.parent
+            guide_parent_id = self.node_parent_id(guide_id)
             guide_parent = self.guide(guide_parent_id) if guide_parent_id is not None else root
             if not guide_parent:
                 continue
             deleted = guide_parent.delete_child(guide_id)
             if deleted:
+                self._unindex_node(found_guide)
                 success = deleted
 
         return success
@@ -622,11 +727,13 @@ class InputLayerDescriptor(LayerDescriptor):
         input_descriptor['critType'] = 'input'
         if input_descriptor.parent is None:
             self[consts.DAG_DESCRIPTOR_KEY].append(input_descriptor)
+            self._index_node(input_descriptor, None)
             return
 
         for _input_descriptor in self.iterate_inputs():
             if _input_descriptor.id == input_descriptor.parent:
                 _input_descriptor.children.append(input_descriptor)
+                self._index_node(input_descriptor, _input_descriptor.id)
                 break
 
     def clear_inputs(self):
@@ -669,6 +776,9 @@ class OutputLayerDescriptor(LayerDescriptor):
             else:
                 self.create_output(**output_descriptor)
 
+        # output nodes children are replaced on update, so indexes are rebuilt on next lookup
+        self.invalidate_indexes()
+
     def iterate_outputs(self) -> Iterator[nodes.OutputDescriptor]:
         """
         Generator function that iterates over all output node descriptors.
@@ -730,11 +840,13 @@ class OutputLayerDescriptor(LayerDescriptor):
         output_descriptor['critType'] = 'output'
         if output_descriptor.parent is None:
             self[consts.DAG_DESCRIPTOR_KEY].append(output_descriptor)
+            self._index_node(output_descriptor, None)
             return
 
         for _output_descriptor in self.iterate_outputs():
             if _output_descriptor.id == output_descriptor.parent:
                 _output_descriptor.children.append(output_descriptor)
+                self._index_node(output_descriptor, _output_descriptor.id)
                 break
 
     def clear_outputs(self):
@@ -779,13 +891,7 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         :rtype: nodes.JointDescriptor or None
         """
 
-        found_joint_descriptor = None
-        for joint_descriptor in self.iterate_deform_joints():
-            if joint_descriptor.id == joint_id:
-                found_joint_descriptor = joint_descriptor
-                break
-
-        return found_joint_descriptor
+        return self.node(joint_id)
 
     def iterate_deform_joints(self) -> Iterator[nodes.JointDescriptor]:
         """
@@ -809,13 +915,7 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         :rtype: List[nodes.JointDescriptor or None]
         """
 
-        found_joint_descriptors = [None] * len(ids)
-        for joint_descriptor in self.iterate_deform_joints():
-            joint_id = joint_descriptor.id
-            if joint_id in ids:
-                found_joint_descriptors[ids.index(joint_id)] = joint_descriptor
-
-        return found_joint_descriptors
+        return self.find_nodes(*ids)
 
     def create_joint(self, **data: Dict) -> nodes.JointDescriptor:
         """
@@ -856,12 +956,13 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         joint_descriptor['critType'] = 'joint'
         if joint_descriptor.parent is None:
             self[consts.DAG_DESCRIPTOR_KEY].append(joint_descriptor)
+            self._index_node(joint_descriptor, None)
             return
 
-        for _joint_descriptor in self.iterate_deform_joints():
-            if _joint_descriptor.id == joint_descriptor.parent:
-                _joint_descriptor.children.append(joint_descriptor)
-                break
+        parent_joint_descriptor = self.joint(joint_descriptor.parent)
+        if parent_joint_descriptor is not None:
+            parent_joint_descriptor.children.append(joint_descriptor)
+            self._index_node(joint_descriptor, parent_joint_descriptor.id)
 
     def delete_joints(self, *joints_ids: Tuple[str]):
         """
@@ -871,14 +972,16 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         """
 
         top_level_nodes_to_delete = []
-        for joint_descriptor in self.iterate_deform_joints():
-            if joint_descriptor.id not in joints_ids:
+        for joint_id in joints_ids:
+            joint_descriptor = self.joint(joint_id)
+            if joint_descriptor is None:
                 continue
-            elif joint_descriptor.parent is None:
+            parent_id = self.node_parent_id(joint_id)
+            if parent_id is None:
                 top_level_nodes_to_delete.append(joint_descriptor)
-                continue
-            parent = self.joint(joint_descriptor.parent)
-            parent.delete_child(joint_descriptor.id)
+            else:
+                self.joint(parent_id).delete_child(joint_id)
+            self._unindex_node(joint_descriptor)
 
         for joint_descriptor in top_level_nodes_to_delete:
             self[consts.DAG_DESCRIPTOR_KEY].remove(joint_descriptor)
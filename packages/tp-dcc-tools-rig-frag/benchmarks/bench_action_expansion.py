@@ -0,0 +1,133 @@
+"""
+Benchmark that measures the time and memory needed to expand a build action proxy with many variants into build
+actions data, comparing shared read-only base data (BuildActionDataView) against copying the base data for each action
+(previous BuildActionProxy.iterate_actions behaviour).
+
+Expanded data is read the same way BuildActionData.deserialize reads it (every attribute is accessed) and is kept alive
+until the expansion ends, so retained memory is the memory all expanded actions need.
+
+Base data is copied as Maya metadata encoding does it (repr and literal evaluation), without the conversion of nodes,
+so Maya is not needed.
+
+Usage:
+    python bench_action_expansion.py [--variants 200] [--attributes 10] [--items 500] [--iterations 3]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import ast
+import glob
+import time
+import argparse
+import tracemalloc
+from typing import Any, Callable
+
+# tpDcc packages share the tp namespace, so all package roots must be importable
+_PACKAGES_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _package_root in sorted(glob.glob(os.path.join(_PACKAGES_PATH, '*', ''))):
+    if os.path.isdir(os.path.join(_package_root, 'tp')) and _package_root not in sys.path:
+        sys.path.append(_package_root)
+
+from tp.libs.rig.frag.core import action
+
+
+def create_data(attribute_count: int, item_count: int, variant_count: int) -> tuple[dict, list[dict]]:
+    """
+    Creates the serialized data of a build action proxy and of its variants.
+
+    :param int attribute_count: number of node list attributes within the base data.
+    :param int item_count: number of nodes within each node list attribute.
+    :param int variant_count: number of variants.
+    :return: tuple with the base data and the list of variants data.
+    :rtype: tuple[dict, list[dict]]
+    """
+
+    main_data = {'id': 'Bench.Action', 'settings': {'enabled': True, 'weights': [1.0] * item_count}}
+    for i in range(attribute_count):
+        main_data[f'nodes{i}'] = [f'|root|group{i}|node{j}' for j in range(item_count)]
+    variants_data = [{'side': f'variant{i}', 'index': i} for i in range(variant_count)]
+
+    return main_data, variants_data
+
+
+def _copy_data(data: Any) -> Any:
+    """
+    Internal function that copies given data as Maya metadata encoding does it.
+    """
+
+    return ast.literal_eval(repr(data))
+
+
+def expand_copied(main_data: dict, variants_data: list[dict]) -> list[dict]:
+    expanded = []
+    for variant_data in variants_data:
+        data = dict(variant_data)
+        data.update(_copy_data(main_data))
+        expanded.append({key: data[key] for key in data})
+    return expanded
+
+
+def expand_shared(main_data: dict, variants_data: list[dict]) -> list[dict]:
+    base_data = action.read_only_data(_copy_data(main_data))
+    expanded = []
+    for variant_data in variants_data:
+        data = action.BuildActionDataView(base_data, variant_data)
+        expanded.append({key: data[key] for key in data})
+    return expanded
+
+
+def _measure(function: Callable, iterations: int) -> tuple[float, float, float]:
+    """
+    Internal function that returns the average time, in milliseconds, of the given function and the retained and peak
+    memory, in megabytes, of its last call.
+    """
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    elapsed = (time.perf_counter() - start) * 1000 / iterations
+
+    tracemalloc.start()
+    result = function()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return elapsed, retained / (1024 * 1024), peak / (1024 * 1024)
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    :param list[str] or None args: command line arguments.
+    :return: exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks build action proxy expansion time and memory')
+    parser.add_argument('--variants', type=int, default=200, help='number of variants of the proxy')
+    parser.add_argument('--attributes', type=int, default=10, help='number of node list attributes')
+    parser.add_argument('--items', type=int, default=500, help='number of nodes within each node list attribute')
+    parser.add_argument('--iterations', type=int, default=3, help='number of times each expansion is repeated')
+    parsed_args = parser.parse_args(args)
+
+    main_data, variants_data = create_data(parsed_args.attributes, parsed_args.items, parsed_args.variants)
+
+    results = []
+    for name, expand in (('copy per action', expand_copied), ('shared read-only', expand_shared)):
+        results.append((name, *_measure(lambda: expand(main_data, variants_data), parsed_args.iterations)))
+
+    print(
+        f'{parsed_args.variants} actions, {parsed_args.attributes} attributes of {parsed_args.items} nodes, '
+        f'average of {parsed_args.iterations} iterations')
+    for name, elapsed, retained, peak in results:
+        print(f'  {name:>16}: {elapsed:9.1f} ms, retained {retained:8.1f} MB, peak {peak:8.1f} MB')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,7 +7,9 @@ import fnmatch
 import logging
 import importlib
 from typing import Any
+from typing import Callable
 from typing import Iterator
+from collections.abc import Mapping, MutableMapping
 from types import ModuleType
 
 from overrides import override
@@ -730,6 +732,167 @@ class BuildActionFileAttribute(BuildActionAttribute):
     class_attribute_type = BuildActionAttribute.Type.File
 
 
+def _read_only_method(name: str) -> Callable:
+    """
+    Internal function that returns a method that raises a TypeError, used to disable the modifier methods of
+    read-only containers.
+
+    :param str name: name of the disabled method.
+    :return: disabled method.
+    :rtype: Callable
+    """
+
+    def _method(self, *args, **kwargs):
+        raise TypeError(
+            f'"{self.__class__.__name__}" is shared by build actions and cannot be modified, '
+            f'use BuildActionDataView.mutable_value to get a modifiable copy ({name})')
+
+    _method.__name__ = name
+
+    return _method
+
+
+class ReadOnlyList(list):
+    """
+    List that cannot be modified. Is serialized and encoded as a list, and copies of it are regular lists.
+    """
+
+    def __reduce_ex__(self, protocol: int):
+        return list, (list(self),)
+
+
+class ReadOnlyDict(dict):
+    """
+    Dictionary that cannot be modified. Is serialized and encoded as a dictionary, and copies of it are regular
+    dictionaries.
+    """
+
+    def __reduce_ex__(self, protocol: int):
+        return dict, (dict(self),)
+
+
+class ReadOnlySet(set):
+    """
+    Set that cannot be modified. Is serialized and encoded as a set, and copies of it are regular sets.
+    """
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def __reduce_ex__(self, protocol: int):
+        return set, (set(self),)
+
+
+for _name in (
+        '__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop', 'remove', 'clear',
+        'sort', 'reverse'):
+    setattr(ReadOnlyList, _name, _read_only_method(_name))
+for _name in ('__setitem__', '__delitem__', '__ior__', 'pop', 'popitem', 'clear', 'update', 'setdefault'):
+    setattr(ReadOnlyDict, _name, _read_only_method(_name))
+for _name in (
+        '__ior__', '__iand__', '__isub__', '__ixor__', 'add', 'discard', 'remove', 'pop', 'clear', 'update',
+        'intersection_update', 'difference_update', 'symmetric_difference_update'):
+    setattr(ReadOnlySet, _name, _read_only_method(_name))
+
+
+def read_only_data(value: Any) -> Any:
+    """
+    Returns a read-only version of the given value, so it can be shared by several build actions. Lists, dictionaries
+    and sets are recursively converted into ReadOnlyList, ReadOnlyDict and ReadOnlySet instances.
+
+    :param Any value: value to convert.
+    :return: read-only value.
+    :rtype: Any
+    """
+
+    if isinstance(value, dict):
+        return ReadOnlyDict((k, read_only_data(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return ReadOnlyList(read_only_data(v) for v in value)
+    elif isinstance(value, set):
+        return ReadOnlySet(value)
+    elif isinstance(value, tuple):
+        return value.__class__(read_only_data(v) for v in value)
+
+    return value
+
+
+class BuildActionDataView(MutableMapping):
+    """
+    Mapping that exposes serialized build action data as the combination of shared base data and per action variant
+    data. As when build actions were created from a copy of the variant data updated with the base data, base values
+    take precedence over variant ones.
+    Base data is never modified and never copied by readers: it is expected to be read-only (see read_only_data), so
+    the same base data can be safely shared by all the actions expanded from a proxy. Values written into the view are
+    stored within the view (copy on write) and mutable_value returns a modifiable copy of a value.
+    """
+
+    def __init__(self, base_data: Mapping, variant_data: dict | None = None):
+        super().__init__()
+
+        self._base_data = base_data
+        self._variant_data = dict(variant_data or {})
+        self._written_data: dict[str, Any] = {}
+        self._deleted_keys: set[str] = set()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {dict(self)}>'
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._written_data:
+            return self._written_data[key]
+        if key in self._deleted_keys:
+            raise KeyError(key)
+        if key not in self._base_data:
+            return self._variant_data[key]
+        return self._base_data[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._written_data[key] = value
+        self._deleted_keys.discard(key)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self._written_data.pop(key, None)
+        self._deleted_keys.add(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._written_data or (
+            key not in self._deleted_keys and (key in self._base_data or key in self._variant_data))
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._variant_data:
+            if key in self._written_data or key not in self._deleted_keys:
+                yield key
+        for key in self._base_data:
+            if key not in self._variant_data and (key in self._written_data or key not in self._deleted_keys):
+                yield key
+        for key in self._written_data:
+            if key not in self._variant_data and key not in self._base_data:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def mutable_value(self, key: str) -> Any:
+        """
+        Returns a modifiable copy of the value with given key. Copy is stored within the view, so changes done to it
+        are visible through this view only.
+
+        :param str key: key of the value to copy.
+        :return: modifiable value.
+        :rtype: Any
+        :raises KeyError: if no value with given key exists.
+        """
+
+        value = self[key]
+        if isinstance(value, (ReadOnlyList, ReadOnlyDict, ReadOnlySet)):
+            value = self._written_data[key] = metadata.decode_metadata(metadata.encode_metadata(value))
+
+        return value
+
+
 class BuildActionData:
     """
     Class that holds attribute values for an action to be executed during a build step.
@@ -1215,6 +1378,22 @@ class BuildActionProxy(BuildActionData):
 
         self._variants.clear()
 
+    def num_actions(self) -> int:
+        """
+        Returns the number of build actions this proxy expands to, taking into account variants and mirroring, without
+        creating any build action.
+
+        :return: build actions count.
+        :rtype: int
+        """
+
+        if not self.is_action_id_valid() or self.is_missing_spec:
+            return 0
+
+        count = self.num_variants() if self.is_variant_action() else 1
+
+        return count * 2 if self.is_mirrored else count
+
     def iterate_actions(self, config: dict) -> Iterator[BuildAction]:
         """
         Returns a generator that yields all the build actions represented by this proxy.
@@ -1227,18 +1406,18 @@ class BuildActionProxy(BuildActionData):
         :raises Exception: if no build action spec for current action ID.
         """
 
-        def _copy_data(_data, _ref_node: str | None = None) -> dict:
-            """
-            Internal function that performs a deep copy of the given data.
-            """
-
-            return metadata.decode_metadata(metadata.encode_metadata(data), _ref_node)
-
         if not self.is_action_id_valid():
             raise Exception(f'BuildActionProxy has no action id: {self}')
         if self.is_missing_spec:
             raise Exception(f'Failed to find BuildActionSpec for: {self.action_id}')
 
+        # Base data is copied only once (through metadata encoding, so nodes are copied properly) and shared, as
+        # read-only data, by all generated actions. Variants are not part of the base data, because each action only
+        # needs its own one.
+        main_data = self.serialize()
+        main_data.pop('variants', None)
+        base_data = read_only_data(metadata.decode_metadata(metadata.encode_metadata(main_data)))
+
         if self.is_variant_action():
             # Warning if there are invariant base values set on variant attrs
             for attr_name in self._variant_attr_names:
@@ -1246,18 +1425,14 @@ class BuildActionProxy(BuildActionData):
                 if attr and attr.is_value_set():
                     logger.warning(f'Found invariant value for a variant attribute: {self.action_id}.{attr_name}')
 
-            # Create and yield new build actions for each variant
-            main_data = self.serialize()
+            # Create and yield new build actions for each variant, base values take precedence over variant ones
             for variant in self._variants:
                 # TODO: Update serialization to ensure variants only return data for the attributes they are supposed
                 # to modify
-                data = variant.serialize()
-                data.update(_copy_data(main_data))
-                new_action = BuildAction.from_data(data)
-                yield new_action
+                yield BuildAction.from_data(BuildActionDataView(base_data, variant.serialize()))
         else:
             # no variants, just create one action
-            yield BuildAction.from_data(_copy_data(self.serialize()))
+            yield BuildAction.from_data(BuildActionDataView(base_data))
 
         if self.is_mirrored:
             # Create a copy of this proxy, mirror values and run mirrored action's generator disabling mirroring first.
@@ -1308,6 +1483,27 @@ class BuildAction(BuildActionData):
 
         return attr.value()
 
+    @staticmethod
+    def from_data(data: Mapping) -> BuildAction:
+        """
+        Returns a new build action instance of the class registered for the action ID within given data.
+
+        :param Mapping data: serialized build action data.
+        :return: new build action instance.
+        :rtype: BuildAction
+        :raises Exception: if no build action spec is registered for the action ID.
+        """
+
+        action_id = data.get('id')
+        spec = BuildActionRegistry().find_action(action_id)
+        if spec is None:
+            raise Exception(f'Failed to find BuildActionSpec for: {action_id}')
+
+        new_action = spec.action_class()
+        new_action.deserialize(data)
+
+        return new_action
+
     def should_abort_on_error(self) -> bool:
         """
         Returns whether the build should be aborted if an error occurs while this action is running.
@@ -1991,6 +2187,16 @@ class BuildStep:
         for elem in self._action_proxy.iterate_actions(config):
             yield elem
 
+    def num_actions(self) -> int:
+        """
+        Returns the number of build actions this build step generates, without creating them.
+
+        :return: build actions count.
+        :rtype: int
+        """
+
+        return self._action_proxy.num_actions() if self._action_proxy else 0
+
     def serialize(self) -> serializer.UnsortableOrderedDict:
         """
         Returns this build step as a serialized dictionary object.
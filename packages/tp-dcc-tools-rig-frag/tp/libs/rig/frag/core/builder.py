@@ -12,7 +12,7 @@ from overrides import override
 
 from tp.core import log
 from tp.bootstrap import log as bootstrap_logger
-from tp.libs.rig.frag.core import blueprint, metadata, rig
+from tp.libs.rig.frag.core import blueprint, metadata, rig, tracing
 
 if typing.TYPE_CHECKING:
     from tp.libs.rig.frag.core.blueprint import BlueprintFile
@@ -26,10 +26,13 @@ class BlueprintBuilder:
     Blueprint Builder that handles the build of a blueprint into a full rig.
     """
 
-    def __init__(self, blueprint_file: BlueprintFile, debug: bool | None = None, log_dir: str | None = None):
+    def __init__(
+            self, blueprint_file: BlueprintFile, debug: bool | None = None, log_dir: str | None = None,
+            tracer: tracing.BuildTraceRecorder | None = None):
         super().__init__()
 
         self._blueprint_file = blueprint_file
+        self._tracer = tracer
         self._debug = debug if debug is not None else self.blueprint.setting(blueprint.BlueprintSettings.DebugBuild)
         self._builder_name = 'Builder'
         self._phase: str | None = None
@@ -123,6 +126,17 @@ class BlueprintBuilder:
 
         return self._current_build_step_path
 
+    @property
+    def tracer(self) -> tracing.BuildTraceRecorder | None:
+        """
+        Getter method that returns the trace recorder that records the performance of this build.
+
+        :return: build trace recorder.
+        :rtype: tracing.BuildTraceRecorder or None
+        """
+
+        return self._tracer
+
     @property
     def phase(self) -> str | None:
         """
@@ -214,6 +228,8 @@ class BlueprintBuilder:
         self._is_started = True
 
         self._start_time = time.time()
+        if self._tracer is not None:
+            self._tracer.begin_build(self._rig_name)
         start_message = self.start_build_log_message()
         if start_message:
             self._logger.info(start_message)
@@ -245,6 +261,21 @@ class BlueprintBuilder:
                 self._logger.error(str(err), exc_info=True)
         self._log_context.clear()
 
+    def action_count(self) -> int:
+        """
+        Returns the total number of build actions in the blueprint, without expanding them.
+
+        :return: build actions count.
+        :rtype: int
+        """
+
+        start_time = time.time()
+        count = sum(step.num_actions() for step in self.blueprint.root_step.iterate_children())
+        duration = time.time() - start_time
+        self._logger.info('Counted %d actions (%.03fs)', count, duration)
+
+        return count
+
     def build_generator(self) -> Iterator[dict]:
         """
         Main iterator for performing all build operations.
@@ -254,29 +285,13 @@ class BlueprintBuilder:
         :rtype: Iterator[dict]
         """
 
-        def _generate_all_actions() -> list[tuple[BuildStep, BuildAction, int]]:
-            """
-            Internal function that expaands all build actions to perform all build steps and their variants.
-
-            :return: list with tuples containing generated built step, its action and the result duration.
-            :rtype: list[tuple[BuildStep, BuildAction, int]]
-            """
-
-            start_time = time.time()
-            result = list(self.action_iterator())
-            end_time = time.time()
-            duration = end_time - start_time
-            self._logger.info('Generated {} actions (%.03fs)', len(result), duration)
-
-            return result
-
         self.clear_validate_results()
 
         yield dict(index=1, total=100, phase='setup', status='Retrieve Actions')
-        all_actions = _generate_all_actions()
-        action_count = len(all_actions)
+        action_count = self.action_count()
 
-        for index, (step, action, action_index) in enumerate(all_actions):
+        # actions are expanded lazily, so each one is only created right before it runs
+        for index, (step, action, action_index) in enumerate(self.action_iterator()):
             self._current_build_step_path = step.full_path()
             yield dict(index=index, total=action_count, phase='actions', status=self._current_build_step_path)
             action.builder = self
@@ -299,15 +314,22 @@ class BlueprintBuilder:
         """
 
         start_time = time.time()
+        if self._tracer is not None:
+            self._tracer.begin_action(step.full_path(), action.action_id, action_index)
         try:
             action.run()
         except Exception as err:
+            if self._tracer is not None:
+                self._tracer.end_action(failed=True)
             action.logger.error(str(err), exc_info=True)
             if action.should_abort_on_error():
                 self._logger.error(
                     'An error occurred, and this action returned True from `should_abort_on_error`, cancelling build')
                 self.cancel()
                 return
+        else:
+            if self._tracer is not None:
+                self._tracer.end_action()
         end_time = time.time()
         duration = end_time - start_time
 
@@ -595,6 +617,9 @@ class BlueprintBuilder:
         self._end_time = time.time()
         self._elapsed_time = self._end_time - self._start_time
 
+        if self._tracer is not None:
+            self._tracer.end_build()
+
 
 class BlueprintBuildLogHandler(logging.Handler):
     """
@@ -618,8 +643,10 @@ class BlueprintValidator(BlueprintBuilder):
     Blueprint builder that runs validation for all build steps within a blueprint.
     """
 
-    def __init__(self, blueprint_file: BlueprintFile, debug: bool | None = None, log_dir: str | None = None):
-        super().__init__(blueprint_file, debug=debug, log_dir=log_dir)
+    def __init__(
+            self, blueprint_file: BlueprintFile, debug: bool | None = None, log_dir: str | None = None,
+            tracer: tracing.BuildTraceRecorder | None = None):
+        super().__init__(blueprint_file, debug=debug, log_dir=log_dir, tracer=tracer)
 
         self._builder_name = 'Validator'
         self._progress_title = 'Validating Blueprint'
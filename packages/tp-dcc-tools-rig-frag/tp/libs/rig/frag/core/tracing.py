@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import io
+import os
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+from typing import Iterator, Any
+
+from tp.core import log
+
+logger = log.rigLogger
+
+
+class BuildActionTrace:
+    """
+    Class that holds the performance data of a single build action run.
+    """
+
+    def __init__(self, step_path: str, action_id: str, action_index: int, start: float):
+        super().__init__()
+
+        self.step_path = step_path
+        self.action_id = action_id
+        self.action_index = action_index
+        self.start = start
+        self.duration = 0.0
+        self.memory_delta = 0
+        self.memory_peak = 0
+        self.failed = False
+        self.profile: list[dict] = []
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} "{self.step_path}[{self.action_index}]" ({self.duration:.03f}s)>'
+
+    def serialize(self) -> dict:
+        """
+        Returns this action trace as a serialized dictionary.
+
+        :return: serialized action trace.
+        :rtype: dict
+        """
+
+        data = {
+            'step': self.step_path,
+            'id': self.action_id,
+            'index': self.action_index,
+            'start': self.start,
+            'duration': self.duration,
+            'memoryDelta': self.memory_delta,
+            'memoryPeak': self.memory_peak,
+            'failed': self.failed
+        }
+        if self.profile:
+            data['profile'] = self.profile
+
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict) -> BuildActionTrace:
+        """
+        Creates a new action trace from given serialized data.
+
+        :param dict data: serialized action trace.
+        :return: action trace instance.
+        :rtype: BuildActionTrace
+        """
+
+        new_trace = cls(data['step'], data.get('id', ''), data.get('index', 0), data.get('start', 0.0))
+        new_trace.duration = data.get('duration', 0.0)
+        new_trace.memory_delta = data.get('memoryDelta', 0)
+        new_trace.memory_peak = data.get('memoryPeak', 0)
+        new_trace.failed = data.get('failed', False)
+        new_trace.profile = data.get('profile', [])
+
+        return new_trace
+
+
+class BuildTraceRecorder:
+    """
+    Class that records structured performance traces of blueprint builds. It captures per action wall time and
+    memory deltas, and optionally a cProfile breakdown of each action.
+    Recorded traces can be exported to Chrome trace event format (chrome://tracing or Perfetto) or saved and compared
+    against other builds to find out which actions regressed.
+    """
+
+    def __init__(self, track_memory: bool = False, profile: bool = False, profile_limit: int = 20):
+        """
+        :param bool track_memory: whether to record Python memory allocation deltas per action using tracemalloc.
+        :param bool profile: whether to record a cProfile breakdown of each action.
+        :param int profile_limit: maximum number of functions stored per action profile.
+        """
+
+        super().__init__()
+
+        self._track_memory = track_memory
+        self._profile = profile
+        self._profile_limit = profile_limit
+        self._rig_name = ''
+        self._build_start = 0.0
+        self._build_duration = 0.0
+        self._actions: list[BuildActionTrace] = []
+        self._current: BuildActionTrace | None = None
+        self._profiler: cProfile.Profile | None = None
+        self._started_tracemalloc = False
+
+    @property
+    def rig_name(self) -> str:
+        return self._rig_name
+
+    @property
+    def duration(self) -> float:
+        return self._build_duration
+
+    @property
+    def actions(self) -> list[BuildActionTrace]:
+        return self._actions
+
+    def begin_build(self, rig_name: str = ''):
+        """
+        Starts recording a new build. Previously recorded data is discarded.
+
+        :param str rig_name: name of the rig being built.
+        """
+
+        self._rig_name = rig_name
+        self._actions = []
+        self._build_start = time.perf_counter()
+        self._build_duration = 0.0
+        if self._track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def end_build(self):
+        """
+        Stops recording current build.
+        """
+
+        if self._current is not None:
+            self.end_action(failed=True)
+        self._build_duration = time.perf_counter() - self._build_start
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def begin_action(self, step_path: str, action_id: str, action_index: int):
+        """
+        Starts recording the run of a build action.
+
+        :param str step_path: full path of the build step the action belongs to.
+        :param str action_id: ID of the build action.
+        :param int action_index: index of the action within its build step.
+        """
+
+        if self._current is not None:
+            self.end_action(failed=True)
+
+        self._current = BuildActionTrace(
+            step_path, action_id, action_index, time.perf_counter() - self._build_start)
+        if self._track_memory and tracemalloc.is_tracing():
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            self._current.memory_delta = tracemalloc.get_traced_memory()[0]
+        if self._profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def end_action(self, failed: bool = False):
+        """
+        Stops recording the current build action run.
+
+        :param bool failed: whether the action failed.
+        """
+
+        current = self._current
+        if current is None:
+            return
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            current.profile = self._profile_entries(self._profiler)
+            self._profiler = None
+        current.duration = time.perf_counter() - self._build_start - current.start
+        if self._track_memory and tracemalloc.is_tracing():
+            memory, peak = tracemalloc.get_traced_memory()
+            current.memory_peak = peak - current.memory_delta
+            current.memory_delta = memory - current.memory_delta
+        current.failed = failed
+        self._actions.append(current)
+        self._current = None
+
+    def step_stats(self) -> dict[str, dict]:
+        """
+        Returns the recorded data aggregated by build step path.
+
+        :return: dictionary mapping step paths with their count, total, max duration and memory delta.
+        :rtype: dict[str, dict]
+        """
+
+        return aggregate_actions(self._actions)
+
+    def serialize(self) -> dict:
+        """
+        Returns recorded build trace as a serialized dictionary.
+
+        :return: serialized build trace.
+        :rtype: dict
+        """
+
+        return {
+            'rigName': self._rig_name,
+            'duration': self._build_duration,
+            'actions': [action.serialize() for action in self._actions]
+        }
+
+    def save(self, file_path: str) -> str:
+        """
+        Saves recorded build trace into a JSON file that can be later loaded with `load_trace` to compare builds.
+
+        :param str file_path: absolute JSON file path.
+        :return: saved file path.
+        :rtype: str
+        """
+
+        with open(file_path, 'w') as trace_file:
+            json.dump(self.serialize(), trace_file)
+
+        return file_path
+
+    def export_chrome_trace(self, file_path: str) -> str:
+        """
+        Exports recorded build trace into Chrome trace event format JSON file.
+
+        :param str file_path: absolute JSON file path.
+        :return: exported file path.
+        :rtype: str
+        """
+
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0,
+             'args': {'name': f'Frag Build {self._rig_name}'}},
+            {'name': self._rig_name or 'Build', 'cat': 'build', 'ph': 'X', 'ts': 0,
+             'dur': int(self._build_duration * 1e6), 'pid': os.getpid(), 'tid': 0}
+        ]
+        for action in self._actions:
+            args = {'id': action.action_id, 'index': action.action_index, 'failed': action.failed}
+            if self._track_memory:
+                args['memoryDelta'] = action.memory_delta
+                args['memoryPeak'] = action.memory_peak
+            events.append({
+                'name': f'{action.step_path}[{action.action_index}]', 'cat': action.action_id or 'action', 'ph': 'X',
+                'ts': int(action.start * 1e6), 'dur': int(action.duration * 1e6), 'pid': os.getpid(), 'tid': 0,
+                'args': args})
+
+        with open(file_path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+        return file_path
+
+    def _profile_entries(self, profiler: cProfile.Profile) -> list[dict]:
+        """
+        Internal function that returns the most expensive functions recorded by given profiler.
+
+        :param cProfile.Profile profiler: profiler instance.
+        :return: list of function entries sorted by cumulative time.
+        :rtype: list[dict]
+        """
+
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        entries = []
+        for (file_name, line, function_name), (_, call_count, total_time, cumulative_time, _) in stats.stats.items():
+            entries.append({
+                'function': f'{os.path.basename(file_name)}:{line}({function_name})',
+                'calls': call_count,
+                'tottime': total_time,
+                'cumtime': cumulative_time
+            })
+        entries.sort(key=lambda entry: entry['cumtime'], reverse=True)
+
+        return entries[:self._profile_limit]
+
+
+def aggregate_actions(actions: list[BuildActionTrace]) -> dict[str, dict]:
+    """
+    Returns given action traces aggregated by build step path.
+
+    :param list[BuildActionTrace] actions: action traces to aggregate.
+    :return: dictionary mapping step paths with their count, total, max duration and memory delta.
+    :rtype: dict[str, dict]
+    """
+
+    stats = {}
+    for action in actions:
+        step_stats = stats.setdefault(action.step_path, {'count': 0, 'total': 0.0, 'max': 0.0, 'memory': 0})
+        step_stats['count'] += 1
+        step_stats['total'] += action.duration
+        step_stats['max'] = max(step_stats['max'], action.duration)
+        step_stats['memory'] += action.memory_delta
+
+    return stats
+
+
+def load_trace(file_path: str) -> BuildTraceRecorder:
+    """
+    Loads a build trace previously saved with `BuildTraceRecorder.save`.
+
+    :param str file_path: absolute JSON file path.
+    :return: build trace recorder containing loaded data.
+    :rtype: BuildTraceRecorder
+    """
+
+    with open(file_path, 'r') as trace_file:
+        data = json.load(trace_file)
+
+    recorder = BuildTraceRecorder()
+    recorder._rig_name = data.get('rigName', '')
+    recorder._build_duration = data.get('duration', 0.0)
+    recorder._actions = [BuildActionTrace.deserialize(action_data) for action_data in data.get('actions', [])]
+
+    return recorder
+
+
+def compare_traces(
+        base_trace: BuildTraceRecorder, new_trace: BuildTraceRecorder, threshold: float = 0.1,
+        min_duration: float = 0.01) -> list[dict]:
+    """
+    Compares two build traces step by step and returns the steps that regressed.
+
+    :param BuildTraceRecorder base_trace: reference build trace.
+    :param BuildTraceRecorder new_trace: build trace to compare against reference one.
+    :param float threshold: relative total time increase (0.1 == 10%) from which a step is considered a regression.
+    :param float min_duration: minimum time difference (in seconds) from which a step is considered a regression.
+    :return: list of regressed steps sorted by time difference. Steps that only exist in new build are included.
+    :rtype: list[dict]
+    """
+
+    base_stats = base_trace.step_stats()
+    new_stats = new_trace.step_stats()
+    regressions = []
+    for step_path, stats in new_stats.items():
+        base_step_stats = base_stats.get(step_path)
+        base_total = base_step_stats['total'] if base_step_stats else 0.0
+        delta = stats['total'] - base_total
+        if delta < min_duration:
+            continue
+        if base_step_stats and base_total > 0.0 and delta / base_total < threshold:
+            continue
+        regressions.append({
+            'step': step_path,
+            'base': base_total,
+            'new': stats['total'],
+            'delta': delta,
+            'baseCount': base_step_stats['count'] if base_step_stats else 0,
+            'newCount': stats['count']
+        })
+    regressions.sort(key=lambda regression: regression['delta'], reverse=True)
+
+    return regressions
+
+
+def iterate_comparison_report_lines(base_trace: BuildTraceRecorder, new_trace: BuildTraceRecorder) -> Iterator[str]:
+    """
+    Generator function that yields the lines of a compact comparison report between two build traces.
+
+    :param BuildTraceRecorder base_trace: reference build trace.
+    :param BuildTraceRecorder new_trace: build trace to compare against reference one.
+    :return: iterated report lines.
+    :rtype: Iterator[str]
+    """
+
+    base_stats = base_trace.step_stats()
+    new_stats = new_trace.step_stats()
+    yield f'Build: {base_trace.duration:.03f}s -> {new_trace.duration:.03f}s ' \
+          f'({new_trace.duration - base_trace.duration:+.03f}s)'
+    yield f'Actions: {len(base_trace.actions)} -> {len(new_trace.actions)}'
+
+    rows: list[tuple[float, str]] = []
+    for step_path in list(base_stats.keys()) + [path for path in new_stats if path not in base_stats]:
+        base_total = base_stats.get(step_path, {}).get('total', 0.0)
+        new_total = new_stats.get(step_path, {}).get('total', 0.0)
+        base_count = base_stats.get(step_path, {}).get('count', 0)
+        new_count = new_stats.get(step_path, {}).get('count', 0)
+        delta = new_total - base_total
+        rows.append((delta, f'{delta:+9.03f}s {base_total:9.03f}s -> {new_total:9.03f}s '
+                            f'[{base_count} -> {new_count}] {step_path}'))
+    rows.sort(key=lambda row: row[0], reverse=True)
+    for _, line in rows:
+        yield line
+
+
+def comparison_report(base_trace: BuildTraceRecorder, new_trace: BuildTraceRecorder) -> str:
+    """
+    Returns a compact comparison report between two build traces, with steps sorted from the most regressed one.
+
+    :param BuildTraceRecorder base_trace: reference build trace.
+    :param BuildTraceRecorder new_trace: build trace to compare against reference one.
+    :return: report text.
+    :rtype: str
+    """
+
+    return '\n'.join(iterate_comparison_report_lines(base_trace, new_trace))
+
+
+def check_regressions(base_file_path: str, new_file_path: str, **kwargs: Any) -> bool:
+    """
+    Compares two saved build traces and logs found regressions. Intended to be used from headless batch jobs.
+
+    :param str base_file_path: reference build trace file path.
+    :param str new_file_path: build trace file path to compare against reference one.
+    :param Any kwargs: keyword arguments passed to `compare_traces`.
+    :return: True if no regressions were found; False otherwise.
+    :rtype: bool
+    """
+
+    regressions = compare_traces(load_trace(base_file_path), load_trace(new_file_path), **kwargs)
+    for regression in regressions:
+        logger.warning(
+            f'Build step regressed: {regression["step"]} {regression["base"]:.03f}s -> {regression["new"]:.03f}s '
+            f'({regression["delta"]:+.03f}s)')
+
+    return not regressions
@@ -173,6 +173,39 @@ class Asset:
 
         return cls._INSTANCE
 
+    def reserve_new_skeleton_path(self) -> str:
+        """
+        Reserves the next skeleton file version on disk, so concurrent saves never get the same version.
+        Must be called when the skeleton file is saved, instead of using new_skeleton_path.
+
+        :return: reserved skeleton file path.
+        :rtype: str
+        """
+
+        return files.reserve_new_versioned_file(f'{self.name}_skeleton', self.skeleton, extension='ma', full_path=True)
+
+    def reserve_new_rig_path(self) -> str:
+        """
+        Reserves the next rig file version on disk, so concurrent saves never get the same version.
+        Must be called when the rig file is saved, instead of using new_rig_path.
+
+        :return: reserved rig file path.
+        :rtype: str
+        """
+
+        return files.reserve_new_versioned_file(f'{self.name}_rig', self.rig, extension='ma', full_path=True)
+
+    def reserve_new_build_path(self) -> str:
+        """
+        Reserves the next build file version on disk, so concurrent saves never get the same version.
+        Must be called when the build file is saved, instead of using new_build_path.
+
+        :return: reserved build file path.
+        :rtype: str
+        """
+
+        return files.reserve_new_versioned_file(f'{self.name}_build', self.build, extension='ma', full_path=True)
+
     def set_data(self, key: str, value: str):
         """
         Sets given pair key/value within project metadata file.
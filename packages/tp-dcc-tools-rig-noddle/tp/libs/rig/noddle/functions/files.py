@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 import shutil
+import time
+import threading
 
 from tp.core import log, dcc
 from tp.common.python import path
@@ -9,6 +11,9 @@ from tp.preferences.interfaces import noddle
 
 logger = log.rigLogger
 
+# Directories modified within this time window are always scanned again.
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
 
 def create_empty_scene(new_path: str) -> bool:
 	"""
@@ -36,6 +41,196 @@ def create_empty_scene(new_path: str) -> bool:
 	return True
 
 
+class VersionedFileStore:
+	"""
+	Class that indexes versioned files located within a directory by their base name and version. The expected
+	versioned file format is:
+		[FILE NAME][SPLIT CHAR][VERSION].[EXTENSION] -> MyRig.0000.ma.
+
+	Directory is scanned only once and it is only scanned again when its modification time changes (which happens
+	when files are added, removed or renamed).
+	"""
+
+	def __init__(self, directory: str, extension: str = '', split_char: str = '.'):
+		super().__init__()
+
+		self._directory = directory
+		self._extension = extension
+		self._split_char = split_char
+		self._mtime = None
+		self._files = {}
+		self._lock = threading.RLock()
+
+	@property
+	def directory(self) -> str:
+		return self._directory
+
+	def refresh(self, force: bool = False) -> bool:
+		"""
+		Scans again the directory if its contents changed since last scan.
+
+		:param bool force: whether to scan the directory even if its modification time did not change.
+		:return: True if the directory was scanned; False otherwise.
+		:rtype: bool
+		"""
+
+		with self._lock:
+			mtime = os.stat(self._directory).st_mtime_ns
+			if not force and mtime == self._mtime:
+				return False
+			files_dict = dict()
+			suffix = f'.{self._extension}' if self._extension else ''
+			with os.scandir(self._directory) as it:
+				for entry in it:
+					if not entry.is_file() or (suffix and not entry.name.endswith(suffix)):
+						continue
+					files_dict.setdefault(entry.name.split(self._split_char)[0], []).append(entry.name)
+			for value in files_dict.values():
+				value.sort()
+			self._files = files_dict
+			# directories modified right before the scan may change again without updating their modification time
+			# (coarse file system timestamps), so in that case we force a new scan on next query
+			self._mtime = mtime if time.time_ns() - mtime > _MTIME_GRANULARITY_NS else None
+
+		return True
+
+	def versioned_files(self) -> dict[str, list[str]]:
+		"""
+		Returns a dictionary containing all versioned files ordered by versions.
+
+		:return: dictionary containing file names as keys and a list of files with that version as values.
+		:rtype: dict[str, list[str]]
+		"""
+
+		with self._lock:
+			self.refresh()
+			return {key: list(value) for key, value in self._files.items()}
+
+	def versions(self, name: str) -> list[int]:
+		"""
+		Returns all the versions for the versioned file with given name.
+
+		:param str name: name of the versioned file.
+		:return: sorted list of versions.
+		:rtype: list[int]
+		"""
+
+		with self._lock:
+			self.refresh()
+			return [self._version_from_file_name(file_name) for file_name in self._files.get(name, [])]
+
+	def latest_file(self, name: str, full_path: bool = True) -> str | None:
+		"""
+		Returns the latest version of the versioned file with the given name.
+
+		:param str name: name of the versioned file to retrieve.
+		:param bool full_path: whether to return a relative path for the version file or an absolute path.
+		:return: latest versioned file path.
+		:rtype: str or None
+		"""
+
+		with self._lock:
+			self.refresh()
+			found_files = self._files.get(name)
+			if not found_files:
+				return None
+			return found_files[-1] if not full_path else path.join_path(self._directory, found_files[-1])
+
+	def new_versioned_file(self, name: str, full_path: bool = True) -> str:
+		"""
+		Returns the name for the new version file with given name.
+
+		:param str name: name of the versioned file whose next version we want to retrieve.
+		:param bool full_path: whether to return a relative path for the version file or an absolute path.
+		:return: new versioned file path.
+		:rtype: str
+		"""
+
+		with self._lock:
+			self.refresh()
+			found_files = self._files.get(name)
+			new_version = self._version_from_file_name(found_files[-1]) + 1 if found_files else 0
+			new_file_name = self._file_name(name, new_version)
+
+		return new_file_name if not full_path else path.join_path(self._directory, new_file_name)
+
+	def reserve_new_versioned_file(self, name: str, full_path: bool = True) -> str:
+		"""
+		Reserves the next version of the versioned file with given name by creating an empty file on disk.
+		File is created exclusively, so concurrent writers (even from other processes) never get the same version.
+
+		:param str name: name of the versioned file whose next version we want to reserve.
+		:param bool full_path: whether to return a relative path for the version file or an absolute path.
+		:return: reserved versioned file path.
+		:rtype: str
+		"""
+
+		with self._lock:
+			new_file_name = self.new_versioned_file(name, full_path=False)
+			new_version = self._version_from_file_name(new_file_name)
+			while True:
+				try:
+					file_descriptor = os.open(
+						path.join_path(self._directory, new_file_name), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+				except FileExistsError:
+					new_version += 1
+					new_file_name = self._file_name(name, new_version)
+					continue
+				os.close(file_descriptor)
+				break
+			self._files.setdefault(name, []).append(new_file_name)
+			self._files[name].sort()
+
+		return new_file_name if not full_path else path.join_path(self._directory, new_file_name)
+
+	def _file_name(self, name: str, version: int) -> str:
+		"""
+		Internal function that returns versioned file name for given name and version.
+
+		:param str name: versioned file name.
+		:param int version: version number.
+		:return: versioned file name.
+		:rtype: str
+		"""
+
+		return f'{name}{self._split_char}{str(version).zfill(4)}{self._split_char}{self._extension}'
+
+	def _version_from_file_name(self, file_name: str) -> int:
+		"""
+		Internal function that returns the version of the given versioned file name.
+
+		:param str file_name: versioned file name.
+		:return: version number.
+		:rtype: int
+		"""
+
+		return int(file_name.split(self._split_char)[-2])
+
+
+_STORES = {}							# type: dict[tuple[str, str, str], VersionedFileStore]
+_STORES_LOCK = threading.Lock()
+
+
+def versioned_file_store(directory: str, extension: str = '', split_char: str = '.') -> VersionedFileStore:
+	"""
+	Returns the shared versioned file store for the given directory.
+
+	:param str directory: path where versioned files are located.
+	:param str extension: optional filter extension for the versioned files to retrieve.
+	:param str split_char: character used to split the file name from the version sub string.
+	:return: versioned file store instance.
+	:rtype: VersionedFileStore
+	"""
+
+	key = (os.path.normpath(directory), extension, split_char)
+	with _STORES_LOCK:
+		store = _STORES.get(key)
+		if store is None:
+			store = _STORES[key] = VersionedFileStore(directory, extension=extension, split_char=split_char)
+
+	return store
+
+
 def versioned_files(directory: str, extension: str = '', split_char: str = '.') -> dict[str, list[str]]:
 	"""
 	Returns a dictionary containing all versioned files ordered by versions. The expected versioned file format is:
@@ -48,22 +243,7 @@ def versioned_files(directory: str, extension: str = '', split_char: str = '.')
 	:rtype: dict[str, list[str]]
 	"""
 
-	files_dict = dict()
-	all_files = [item for item in os.listdir(directory) if path.is_file(path.join_path(directory, item))]
-	if extension:
-		all_files = [item for item in all_files if item.endswith(f'.{extension}')]
-	for found_file in all_files:
-		split_file = found_file.split(split_char)[0]
-		if  split_file not in files_dict:
-			files_dict[split_file] = [found_file]
-		else:
-			files_dict[split_file].append(found_file)
-
-	# sort items for each key
-	for key, value in files_dict.items():
-		files_dict[key] = sorted(value)
-
-	return files_dict
+	return versioned_file_store(directory, extension=extension, split_char=split_char).versioned_files()
 
 
 def latest_file(
@@ -80,11 +260,8 @@ def latest_file(
 	:rtype: str or None
 	"""
 
-	files_dict = versioned_files(directory, extension=extension, split_char=split_char)
-	if name not in files_dict:
-		return None
-
-	return files_dict[name][-1] if not full_path else path.join_path(directory, files_dict[name][-1])
+	store = versioned_file_store(directory, extension=extension, split_char=split_char)
+	return store.latest_file(name, full_path=full_path)
 
 
 def new_versioned_file(
@@ -101,8 +278,44 @@ def new_versioned_file(
 	:rtype: str
 	"""
 
-	files_dict = versioned_files(directory, extension=extension, split_char=split_char)
-	new_version = int(files_dict[name][-1].split(split_char)[-2]) + 1 if name in files_dict else 0
-	new_file_name = f'{name}{split_char}{str(new_version).zfill(4)}{split_char}{extension}'
+	store = versioned_file_store(directory, extension=extension, split_char=split_char)
+	return store.new_versioned_file(name, full_path=full_path)
+
+
+def reserve_new_versioned_file(
+		name: str, directory: str, extension: str = '', full_path: bool = True, split_char: str = '.') -> str:
+	"""
+	Reserves the next version file with given name in the given directory by creating it on disk, so concurrent
+	writers never get the same version.
 
-	return new_file_name if not full_path else path.join_path(directory, new_file_name)
+	:param str str name: name of the versioned file whose next version we want to reserve.
+	:param str directory: directory where the versioned file is located.
+	:param str extension: optional filter extension for the versioned files to retrieve.
+	:param bool full_path: whether to return a relative path for the version file or an absolute path.
+	:param str split_char: character used to split the file name from the version sub string.
+	:return: reserved versioned file path.
+	:rtype: str
+	"""
+
+	store = versioned_file_store(directory, extension=extension, split_char=split_char)
+	return store.reserve_new_versioned_file(name, full_path=full_path)
+
+
+def release_versioned_file(file_path: str) -> bool:
+	"""
+	Releases a versioned file reserved with reserve_new_versioned_file function that was not written, by deleting it
+	if it is still empty.
+
+	:param str file_path: absolute reserved versioned file path.
+	:return: True if reserved file was deleted; False otherwise.
+	:rtype: bool
+	"""
+
+	try:
+		if os.path.getsize(file_path) != 0:
+			return False
+		os.remove(file_path)
+	except OSError:
+		return False
+
+	return True
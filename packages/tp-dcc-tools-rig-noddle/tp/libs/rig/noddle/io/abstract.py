@@ -31,7 +31,8 @@ class AbstractIOManager:
         if not self._asset:
             logger.error('Asset is not set!')
             raise RuntimeError
-        self._versioned_files = files.versioned_files(self.path, extension=self.EXTENSION)
+        self._file_store = files.versioned_file_store(self.path, extension=self.EXTENSION)
+        self._versioned_files = self._file_store.versioned_files()
 
     @decorators.abstractproperty
     def path(self) -> str:
@@ -66,6 +67,18 @@ class AbstractIOManager:
 
         pass
 
+    def reserve_new_file(self) -> str:
+        """
+        Reserves the new file version on disk, so concurrent exports never get the same version. Must be called when
+        the file is exported, instead of new_file. Reserved file should be released with files.release_versioned_file
+        if nothing is written into it.
+
+        :return: reserved new file version path.
+        :rtype: str
+        """
+
+        return self._file_store.reserve_new_versioned_file(self.base_name(), full_path=True)
+
     @decorators.abstractmethod
     def latest_file(self) -> str:
         """
@@ -85,6 +98,10 @@ class AbstractIOManager:
     def rig(self) -> Rig:
         return self._rig
 
+    @property
+    def file_store(self) -> files.VersionedFileStore:
+        return self._file_store
+
     @property
     def versioned_files(self) -> dict[str, list[str, str]]:
         return self._versioned_files
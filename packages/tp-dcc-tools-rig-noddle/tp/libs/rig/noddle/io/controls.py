@@ -48,8 +48,10 @@ class ControlsShapeManager(abstract.AbstractIOManager):
         for control_id, control in all_controls.items():
             data_dict[control_id] = control.serializeFromScene()['shape']
 
-        export_path = manager.new_file()
-        jsonio.write_to_file(data_dict, export_path)
+        export_path = manager.reserve_new_file()
+        if not jsonio.write_to_file(data_dict, export_path):
+            files.release_versioned_file(export_path)
+            return
         logger.info(f'Exported control shapes: "{export_path}"')
 
     @classmethod
@@ -10,7 +10,7 @@ from tp.maya import api
 from tp.libs.rig.skinner import core as skinner
 from tp.preferences.interfaces import noddle
 from tp.libs.rig.noddle.io import abstract
-from tp.libs.rig.noddle.functions import files, deformer
+from tp.libs.rig.noddle.functions import deformer
 
 logger = log.rigLogger
 
@@ -70,8 +70,7 @@ class SkinManager(abstract.AbstractIOManager):
 
     @override(check_signature=False)
     def latest_file(self, geometry_node: api.DagNode) -> str:
-        return files.latest_file(
-            self.base_name(geometry_node), directory=self.path, extension=self.EXTENSION, full_path=True)
+        return self.file_store.latest_file(self.base_name(geometry_node), full_path=True)
 
     def import_single(self, geometry_node: api.DagNode):
         """
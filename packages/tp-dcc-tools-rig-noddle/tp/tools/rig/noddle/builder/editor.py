@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import typing
 
 from overrides import override
@@ -8,6 +9,7 @@ from tp.core import log
 from tp.common.qt import api as qt
 from tp.common.nodegraph.core import graph
 from tp.libs.rig.noddle.core import asset
+from tp.libs.rig.noddle.functions import files
 
 logger = log.rigLogger
 
@@ -39,11 +41,19 @@ class NodeEditor(graph.NodeGraph):
             return False
 
         rig_filter = 'Rig Build (*.rig)'
-        file_path = qt.QFileDialog.getSaveFileName(
-            None, 'Save build graph to file', asset.Asset.get().new_build_path, rig_filter)[0]
+        new_build_path = asset.Asset.get().new_build_path
+        file_path = qt.QFileDialog.getSaveFileName(None, 'Save build graph to file', new_build_path, rig_filter)[0]
         if not file_path:
             return False
+        if os.path.normpath(file_path) != os.path.normpath(new_build_path):
+            self.save_to_file(file_path)
+            return True
+
+        # new build version is only reserved on disk when saving, so a concurrent save never gets the same version.
+        # Reserved file is released if the build could not be written into it.
+        file_path = asset.Asset.get().reserve_new_build_path()
         self.save_to_file(file_path)
+        files.release_versioned_file(file_path)
         return True
 
     @override